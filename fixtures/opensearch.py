@@ -4,15 +4,34 @@ from types import SimpleNamespace
 
 import pytest
 
-from learning_resources_search.connection import configure_connections
+from learning_resources_search.connection import (
+    clear_existing_aliases_cache,
+    configure_connections,
+)
 
 
 @pytest.fixture(autouse=True)
 def opensearch(mocker, settings):
     """Fixture for mocking opensearch"""
     settings.OPENSEARCH_URL = "test.opensearch"
+    settings.OPENSEARCH_SEARCH_CACHE_TTL = 0
+    settings.OPENSEARCH_FACET_CACHE_TTL = 0
+    settings.OPENSEARCH_SIMILAR_TOPICS_CACHE_TTL = 0
+    # the alias cache generation is shared through the redis cache
+    settings.CACHES = {
+        **settings.CACHES,
+        "redis": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "opensearch_test",
+        },
+    }
     mock_get_connection = mocker.patch(
         "opensearch_dsl.search.get_connection", autospec=True
     )
+    mocker.patch(
+        "learning_resources_search.api.get_conn",
+        return_value=mock_get_connection.return_value,
+    )
     configure_connections()
+    clear_existing_aliases_cache()
     return SimpleNamespace(conn=mock_get_connection.return_value)
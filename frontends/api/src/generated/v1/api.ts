@@ -106,6 +106,19 @@ export interface ArticleRequest {
    */
   title: string
 }
+/**
+ *
+ * @export
+ * @interface AutocompleteResponse
+ */
+export interface AutocompleteResponse {
+  /**
+   * Titles, course numbers, topics and instructors matching the text
+   * @type {Array<string>}
+   * @memberof AutocompleteResponse
+   */
+  suggestions: Array<string>
+}
 /**
  * Serializer class for course run ContentFiles
  * @export
@@ -1902,6 +1915,19 @@ export interface LearningResourceTopic {
    */
   channel_url: string | null
 }
+/**
+ *
+ * @export
+ * @interface LearningResourcesBatchSearchRequestRequest
+ */
+export interface LearningResourcesBatchSearchRequestRequest {
+  /**
+   * The params for each learning resource search to run
+   * @type {Array<LearningResourcesSearchRequestRequest>}
+   * @memberof LearningResourcesBatchSearchRequestRequest
+   */
+  searches: Array<LearningResourcesSearchRequestRequest>
+}
 /**
  *
  * @export
@@ -1926,6 +1952,12 @@ export interface LearningResourcesSearchRequestRequest {
    * @memberof LearningResourcesSearchRequestRequest
    */
   limit?: number
+  /**
+   * Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
+   * @type {string}
+   * @memberof LearningResourcesSearchRequestRequest
+   */
+  cursor?: string
   /**
    * The organization that offers the learning resource               * `mitx` - MITx * `ocw` - OCW * `bootcamps` - Bootcamps * `xpro` - xPRO * `csail` - CSAIL * `mitpe` - Professional Education * `see` - Sloan Executive Education * `scc` - Schwarzman College of Computing * `ctl` - Center for Transportation & Logistics
    * @type {Array<OfferedByEnum>}
@@ -1956,6 +1988,12 @@ export interface LearningResourcesSearchRequestRequest {
    * @memberof LearningResourcesSearchRequestRequest
    */
   sortby?: SortbyEnum
+  /**
+   *
+   * @type {ViewEnum}
+   * @memberof LearningResourcesSearchRequestRequest
+   */
+  view?: ViewEnum
   /**
    * The type of learning resource               * `course` - course * `program` - program * `learning_path` - learning path * `podcast` - podcast * `podcast_episode` - podcast episode * `video` - video * `video_playlist` - video playlist
    * @type {Array<LearningResourcesSearchRequestResourceTypeEnum>}
@@ -4906,6 +4944,19 @@ export const VideoResourceResourceTypeEnum = {
 export type VideoResourceResourceTypeEnum =
   (typeof VideoResourceResourceTypeEnum)[keyof typeof VideoResourceResourceTypeEnum]
 
+/**
+ * * `full` - full * `card` - card
+ * @export
+ * @enum {string}
+ */
+
+export const ViewEnum = {
+  Full: "full",
+  Card: "card",
+} as const
+
+export type ViewEnum = (typeof ViewEnum)[keyof typeof ViewEnum]
+
 /**
  * ArticlesApi - axios parameter creator
  * @export
@@ -5609,11 +5660,134 @@ export const ContentFileSearchApiAxiosParamCreator = function (
   configuration?: Configuration,
 ) {
   return {
+    /**
+     * Search for the content files of a learning resource. The search is routed to the shard holding the resource\&#39;s content files.
+     * @summary Search within a learning resource
+     * @param {number} resource_id
+     * @param {Array<ContentFileSearchResourceRetrieveAggregationsEnum>} [aggregations] Show resource counts by category
+     * @param {Array<string>} [content_feature_type] The feature type of the content file. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
+     * @param {Array<number>} [id] The id value for the content file
+     * @param {number} [limit] Number of results to return per page
+     * @param {Array<ContentFileSearchResourceRetrieveOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - OCW * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - Professional Education * &#x60;see&#x60; - Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics
+     * @param {number} [offset] The initial index from which to return the results
+     * @param {Array<ContentFileSearchResourceRetrievePlatformEnum>} [platform] The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - OCW * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - Professional Education * &#x60;see&#x60; - Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
+     * @param {string} [q] The search text
+     * @param {Array<number>} [run_id] The id value of the run that the content file belongs to
+     * @param {ContentFileSearchResourceRetrieveSortbyEnum} [sortby] if the parameter starts with \&#39;-\&#39; the sort is in descending order  * &#x60;id&#x60; - id * &#x60;-id&#x60; - -id * &#x60;resource_readable_id&#x60; - resource_readable_id * &#x60;-resource_readable_id&#x60; - -resource_readable_id
+     * @param {Array<string>} [topic] The topic name. To see a list of options go to api/v1/topics/
+     * @param {*} [options] Override http request option.
+     * @throws {RequiredError}
+     */
+    contentFileSearchResourceRetrieve: async (
+      resource_id: number,
+      aggregations?: Array<ContentFileSearchResourceRetrieveAggregationsEnum>,
+      content_feature_type?: Array<string>,
+      cursor?: string,
+      id?: Array<number>,
+      limit?: number,
+      offered_by?: Array<ContentFileSearchResourceRetrieveOfferedByEnum>,
+      offset?: number,
+      platform?: Array<ContentFileSearchResourceRetrievePlatformEnum>,
+      q?: string,
+      run_id?: Array<number>,
+      sortby?: ContentFileSearchResourceRetrieveSortbyEnum,
+      topic?: Array<string>,
+      options: RawAxiosRequestConfig = {},
+    ): Promise<RequestArgs> => {
+      // verify required parameter 'resource_id' is not null or undefined
+      assertParamExists(
+        "contentFileSearchResourceRetrieve",
+        "resource_id",
+        resource_id,
+      )
+      const localVarPath = `/api/v1/content_file_search/{resource_id}/`.replace(
+        `{${"resource_id"}}`,
+        encodeURIComponent(String(resource_id)),
+      )
+      // use dummy base URL string because the URL constructor only accepts absolute URLs.
+      const localVarUrlObj = new URL(localVarPath, DUMMY_BASE_URL)
+      let baseOptions
+      if (configuration) {
+        baseOptions = configuration.baseOptions
+      }
+
+      const localVarRequestOptions = {
+        method: "GET",
+        ...baseOptions,
+        ...options,
+      }
+      const localVarHeaderParameter = {} as any
+      const localVarQueryParameter = {} as any
+
+      if (aggregations) {
+        localVarQueryParameter["aggregations"] = aggregations
+      }
+
+      if (content_feature_type) {
+        localVarQueryParameter["content_feature_type"] = content_feature_type
+      }
+
+      if (cursor !== undefined) {
+        localVarQueryParameter["cursor"] = cursor
+      }
+
+      if (id) {
+        localVarQueryParameter["id"] = id
+      }
+
+      if (limit !== undefined) {
+        localVarQueryParameter["limit"] = limit
+      }
+
+      if (offered_by) {
+        localVarQueryParameter["offered_by"] = offered_by
+      }
+
+      if (offset !== undefined) {
+        localVarQueryParameter["offset"] = offset
+      }
+
+      if (platform) {
+        localVarQueryParameter["platform"] = platform
+      }
+
+      if (q !== undefined) {
+        localVarQueryParameter["q"] = q
+      }
+
+      if (run_id) {
+        localVarQueryParameter["run_id"] = run_id
+      }
+
+      if (sortby !== undefined) {
+        localVarQueryParameter["sortby"] = sortby
+      }
+
+      if (topic) {
+        localVarQueryParameter["topic"] = topic
+      }
+
+      setSearchParams(localVarUrlObj, localVarQueryParameter)
+      let headersFromBaseOptions =
+        baseOptions && baseOptions.headers ? baseOptions.headers : {}
+      localVarRequestOptions.headers = {
+        ...localVarHeaderParameter,
+        ...headersFromBaseOptions,
+        ...options.headers,
+      }
+
+      return {
+        url: toPathString(localVarUrlObj),
+        options: localVarRequestOptions,
+      }
+    },
     /**
      * Search for content files
      * @summary Search
      * @param {Array<ContentFileSearchRetrieveAggregationsEnum>} [aggregations] Show resource counts by category
      * @param {Array<string>} [content_feature_type] The feature type of the content file. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
      * @param {Array<number>} [id] The id value for the content file
      * @param {number} [limit] Number of results to return per page
      * @param {Array<ContentFileSearchRetrieveOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - OCW * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - Professional Education * &#x60;see&#x60; - Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics
@@ -5630,6 +5804,7 @@ export const ContentFileSearchApiAxiosParamCreator = function (
     contentFileSearchRetrieve: async (
       aggregations?: Array<ContentFileSearchRetrieveAggregationsEnum>,
       content_feature_type?: Array<string>,
+      cursor?: string,
       id?: Array<number>,
       limit?: number,
       offered_by?: Array<ContentFileSearchRetrieveOfferedByEnum>,
@@ -5666,6 +5841,10 @@ export const ContentFileSearchApiAxiosParamCreator = function (
         localVarQueryParameter["content_feature_type"] = content_feature_type
       }
 
+      if (cursor !== undefined) {
+        localVarQueryParameter["cursor"] = cursor
+      }
+
       if (id) {
         localVarQueryParameter["id"] = id
       }
@@ -5731,11 +5910,82 @@ export const ContentFileSearchApiFp = function (configuration?: Configuration) {
   const localVarAxiosParamCreator =
     ContentFileSearchApiAxiosParamCreator(configuration)
   return {
+    /**
+     * Search for the content files of a learning resource. The search is routed to the shard holding the resource\&#39;s content files.
+     * @summary Search within a learning resource
+     * @param {number} resource_id
+     * @param {Array<ContentFileSearchResourceRetrieveAggregationsEnum>} [aggregations] Show resource counts by category
+     * @param {Array<string>} [content_feature_type] The feature type of the content file. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
+     * @param {Array<number>} [id] The id value for the content file
+     * @param {number} [limit] Number of results to return per page
+     * @param {Array<ContentFileSearchResourceRetrieveOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - OCW * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - Professional Education * &#x60;see&#x60; - Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics
+     * @param {number} [offset] The initial index from which to return the results
+     * @param {Array<ContentFileSearchResourceRetrievePlatformEnum>} [platform] The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - OCW * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - Professional Education * &#x60;see&#x60; - Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
+     * @param {string} [q] The search text
+     * @param {Array<number>} [run_id] The id value of the run that the content file belongs to
+     * @param {ContentFileSearchResourceRetrieveSortbyEnum} [sortby] if the parameter starts with \&#39;-\&#39; the sort is in descending order  * &#x60;id&#x60; - id * &#x60;-id&#x60; - -id * &#x60;resource_readable_id&#x60; - resource_readable_id * &#x60;-resource_readable_id&#x60; - -resource_readable_id
+     * @param {Array<string>} [topic] The topic name. To see a list of options go to api/v1/topics/
+     * @param {*} [options] Override http request option.
+     * @throws {RequiredError}
+     */
+    async contentFileSearchResourceRetrieve(
+      resource_id: number,
+      aggregations?: Array<ContentFileSearchResourceRetrieveAggregationsEnum>,
+      content_feature_type?: Array<string>,
+      cursor?: string,
+      id?: Array<number>,
+      limit?: number,
+      offered_by?: Array<ContentFileSearchResourceRetrieveOfferedByEnum>,
+      offset?: number,
+      platform?: Array<ContentFileSearchResourceRetrievePlatformEnum>,
+      q?: string,
+      run_id?: Array<number>,
+      sortby?: ContentFileSearchResourceRetrieveSortbyEnum,
+      topic?: Array<string>,
+      options?: RawAxiosRequestConfig,
+    ): Promise<
+      (
+        axios?: AxiosInstance,
+        basePath?: string,
+      ) => AxiosPromise<ContentFileSearchResponse>
+    > {
+      const localVarAxiosArgs =
+        await localVarAxiosParamCreator.contentFileSearchResourceRetrieve(
+          resource_id,
+          aggregations,
+          content_feature_type,
+          cursor,
+          id,
+          limit,
+          offered_by,
+          offset,
+          platform,
+          q,
+          run_id,
+          sortby,
+          topic,
+          options,
+        )
+      const index = configuration?.serverIndex ?? 0
+      const operationBasePath =
+        operationServerMap[
+          "ContentFileSearchApi.contentFileSearchResourceRetrieve"
+        ]?.[index]?.url
+      return (axios, basePath) =>
+        createRequestFunction(
+          localVarAxiosArgs,
+          globalAxios,
+          BASE_PATH,
+          configuration,
+        )(axios, operationBasePath || basePath)
+    },
     /**
      * Search for content files
      * @summary Search
      * @param {Array<ContentFileSearchRetrieveAggregationsEnum>} [aggregations] Show resource counts by category
      * @param {Array<string>} [content_feature_type] The feature type of the content file. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
      * @param {Array<number>} [id] The id value for the content file
      * @param {number} [limit] Number of results to return per page
      * @param {Array<ContentFileSearchRetrieveOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - OCW * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - Professional Education * &#x60;see&#x60; - Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics
@@ -5752,6 +6002,7 @@ export const ContentFileSearchApiFp = function (configuration?: Configuration) {
     async contentFileSearchRetrieve(
       aggregations?: Array<ContentFileSearchRetrieveAggregationsEnum>,
       content_feature_type?: Array<string>,
+      cursor?: string,
       id?: Array<number>,
       limit?: number,
       offered_by?: Array<ContentFileSearchRetrieveOfferedByEnum>,
@@ -5773,6 +6024,7 @@ export const ContentFileSearchApiFp = function (configuration?: Configuration) {
         await localVarAxiosParamCreator.contentFileSearchRetrieve(
           aggregations,
           content_feature_type,
+          cursor,
           id,
           limit,
           offered_by,
@@ -5812,6 +6064,36 @@ export const ContentFileSearchApiFactory = function (
 ) {
   const localVarFp = ContentFileSearchApiFp(configuration)
   return {
+    /**
+     * Search for the content files of a learning resource. The search is routed to the shard holding the resource\&#39;s content files.
+     * @summary Search within a learning resource
+     * @param {ContentFileSearchApiContentFileSearchResourceRetrieveRequest} requestParameters Request parameters.
+     * @param {*} [options] Override http request option.
+     * @throws {RequiredError}
+     */
+    contentFileSearchResourceRetrieve(
+      requestParameters: ContentFileSearchApiContentFileSearchResourceRetrieveRequest,
+      options?: RawAxiosRequestConfig,
+    ): AxiosPromise<ContentFileSearchResponse> {
+      return localVarFp
+        .contentFileSearchResourceRetrieve(
+          requestParameters.resource_id,
+          requestParameters.aggregations,
+          requestParameters.content_feature_type,
+          requestParameters.cursor,
+          requestParameters.id,
+          requestParameters.limit,
+          requestParameters.offered_by,
+          requestParameters.offset,
+          requestParameters.platform,
+          requestParameters.q,
+          requestParameters.run_id,
+          requestParameters.sortby,
+          requestParameters.topic,
+          options,
+        )
+        .then((request) => request(axios, basePath))
+    },
     /**
      * Search for content files
      * @summary Search
@@ -5827,6 +6109,7 @@ export const ContentFileSearchApiFactory = function (
         .contentFileSearchRetrieve(
           requestParameters.aggregations,
           requestParameters.content_feature_type,
+          requestParameters.cursor,
           requestParameters.id,
           requestParameters.limit,
           requestParameters.offered_by,
@@ -5845,112 +6128,249 @@ export const ContentFileSearchApiFactory = function (
 }
 
 /**
- * Request parameters for contentFileSearchRetrieve operation in ContentFileSearchApi.
+ * Request parameters for contentFileSearchResourceRetrieve operation in ContentFileSearchApi.
  * @export
- * @interface ContentFileSearchApiContentFileSearchRetrieveRequest
+ * @interface ContentFileSearchApiContentFileSearchResourceRetrieveRequest
  */
-export interface ContentFileSearchApiContentFileSearchRetrieveRequest {
+export interface ContentFileSearchApiContentFileSearchResourceRetrieveRequest {
+  /**
+   *
+   * @type {number}
+   * @memberof ContentFileSearchApiContentFileSearchResourceRetrieve
+   */
+  readonly resource_id: number
+
   /**
    * Show resource counts by category
    * @type {Array<'topic' | 'content_feature_type' | 'platform' | 'offered_by'>}
-   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   * @memberof ContentFileSearchApiContentFileSearchResourceRetrieve
    */
-  readonly aggregations?: Array<ContentFileSearchRetrieveAggregationsEnum>
+  readonly aggregations?: Array<ContentFileSearchResourceRetrieveAggregationsEnum>
 
   /**
    * The feature type of the content file. Possible options are at api/v1/course_features/
    * @type {Array<string>}
-   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   * @memberof ContentFileSearchApiContentFileSearchResourceRetrieve
    */
   readonly content_feature_type?: Array<string>
 
+  /**
+   * Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
+   * @type {string}
+   * @memberof ContentFileSearchApiContentFileSearchResourceRetrieve
+   */
+  readonly cursor?: string
+
   /**
    * The id value for the content file
    * @type {Array<number>}
-   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   * @memberof ContentFileSearchApiContentFileSearchResourceRetrieve
    */
   readonly id?: Array<number>
 
   /**
    * Number of results to return per page
    * @type {number}
-   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   * @memberof ContentFileSearchApiContentFileSearchResourceRetrieve
    */
   readonly limit?: number
 
   /**
    * The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - OCW * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - Professional Education * &#x60;see&#x60; - Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics
    * @type {Array<'mitx' | 'ocw' | 'bootcamps' | 'xpro' | 'csail' | 'mitpe' | 'see' | 'scc' | 'ctl'>}
-   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   * @memberof ContentFileSearchApiContentFileSearchResourceRetrieve
    */
-  readonly offered_by?: Array<ContentFileSearchRetrieveOfferedByEnum>
+  readonly offered_by?: Array<ContentFileSearchResourceRetrieveOfferedByEnum>
 
   /**
    * The initial index from which to return the results
    * @type {number}
-   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   * @memberof ContentFileSearchApiContentFileSearchResourceRetrieve
    */
   readonly offset?: number
 
   /**
    * The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - OCW * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - Professional Education * &#x60;see&#x60; - Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
    * @type {Array<'edx' | 'ocw' | 'oll' | 'mitxonline' | 'bootcamps' | 'xpro' | 'csail' | 'mitpe' | 'see' | 'scc' | 'ctl' | 'whu' | 'susskind' | 'globalalumni' | 'simplilearn' | 'emeritus' | 'podcast' | 'youtube'>}
-   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   * @memberof ContentFileSearchApiContentFileSearchResourceRetrieve
    */
-  readonly platform?: Array<ContentFileSearchRetrievePlatformEnum>
+  readonly platform?: Array<ContentFileSearchResourceRetrievePlatformEnum>
 
   /**
    * The search text
    * @type {string}
-   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   * @memberof ContentFileSearchApiContentFileSearchResourceRetrieve
    */
   readonly q?: string
 
-  /**
-   * The id value of the parent learning resource for the content file
-   * @type {Array<number>}
-   * @memberof ContentFileSearchApiContentFileSearchRetrieve
-   */
-  readonly resource_id?: Array<number>
-
   /**
    * The id value of the run that the content file belongs to
    * @type {Array<number>}
-   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   * @memberof ContentFileSearchApiContentFileSearchResourceRetrieve
    */
   readonly run_id?: Array<number>
 
   /**
    * if the parameter starts with \&#39;-\&#39; the sort is in descending order  * &#x60;id&#x60; - id * &#x60;-id&#x60; - -id * &#x60;resource_readable_id&#x60; - resource_readable_id * &#x60;-resource_readable_id&#x60; - -resource_readable_id
    * @type {'id' | '-id' | 'resource_readable_id' | '-resource_readable_id'}
-   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   * @memberof ContentFileSearchApiContentFileSearchResourceRetrieve
    */
-  readonly sortby?: ContentFileSearchRetrieveSortbyEnum
+  readonly sortby?: ContentFileSearchResourceRetrieveSortbyEnum
 
   /**
    * The topic name. To see a list of options go to api/v1/topics/
    * @type {Array<string>}
-   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   * @memberof ContentFileSearchApiContentFileSearchResourceRetrieve
    */
   readonly topic?: Array<string>
 }
 
 /**
- * ContentFileSearchApi - object-oriented interface
+ * Request parameters for contentFileSearchRetrieve operation in ContentFileSearchApi.
  * @export
- * @class ContentFileSearchApi
- * @extends {BaseAPI}
+ * @interface ContentFileSearchApiContentFileSearchRetrieveRequest
  */
-export class ContentFileSearchApi extends BaseAPI {
+export interface ContentFileSearchApiContentFileSearchRetrieveRequest {
   /**
-   * Search for content files
-   * @summary Search
-   * @param {ContentFileSearchApiContentFileSearchRetrieveRequest} requestParameters Request parameters.
-   * @param {*} [options] Override http request option.
-   * @throws {RequiredError}
-   * @memberof ContentFileSearchApi
-   */
-  public contentFileSearchRetrieve(
+   * Show resource counts by category
+   * @type {Array<'topic' | 'content_feature_type' | 'platform' | 'offered_by'>}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly aggregations?: Array<ContentFileSearchRetrieveAggregationsEnum>
+
+  /**
+   * The feature type of the content file. Possible options are at api/v1/course_features/
+   * @type {Array<string>}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly content_feature_type?: Array<string>
+
+  /**
+   * Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
+   * @type {string}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly cursor?: string
+
+  /**
+   * The id value for the content file
+   * @type {Array<number>}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly id?: Array<number>
+
+  /**
+   * Number of results to return per page
+   * @type {number}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly limit?: number
+
+  /**
+   * The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - OCW * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - Professional Education * &#x60;see&#x60; - Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics
+   * @type {Array<'mitx' | 'ocw' | 'bootcamps' | 'xpro' | 'csail' | 'mitpe' | 'see' | 'scc' | 'ctl'>}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly offered_by?: Array<ContentFileSearchRetrieveOfferedByEnum>
+
+  /**
+   * The initial index from which to return the results
+   * @type {number}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly offset?: number
+
+  /**
+   * The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - OCW * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - Professional Education * &#x60;see&#x60; - Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
+   * @type {Array<'edx' | 'ocw' | 'oll' | 'mitxonline' | 'bootcamps' | 'xpro' | 'csail' | 'mitpe' | 'see' | 'scc' | 'ctl' | 'whu' | 'susskind' | 'globalalumni' | 'simplilearn' | 'emeritus' | 'podcast' | 'youtube'>}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly platform?: Array<ContentFileSearchRetrievePlatformEnum>
+
+  /**
+   * The search text
+   * @type {string}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly q?: string
+
+  /**
+   * The id value of the parent learning resource for the content file
+   * @type {Array<number>}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly resource_id?: Array<number>
+
+  /**
+   * The id value of the run that the content file belongs to
+   * @type {Array<number>}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly run_id?: Array<number>
+
+  /**
+   * if the parameter starts with \&#39;-\&#39; the sort is in descending order  * &#x60;id&#x60; - id * &#x60;-id&#x60; - -id * &#x60;resource_readable_id&#x60; - resource_readable_id * &#x60;-resource_readable_id&#x60; - -resource_readable_id
+   * @type {'id' | '-id' | 'resource_readable_id' | '-resource_readable_id'}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly sortby?: ContentFileSearchRetrieveSortbyEnum
+
+  /**
+   * The topic name. To see a list of options go to api/v1/topics/
+   * @type {Array<string>}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly topic?: Array<string>
+}
+
+/**
+ * ContentFileSearchApi - object-oriented interface
+ * @export
+ * @class ContentFileSearchApi
+ * @extends {BaseAPI}
+ */
+export class ContentFileSearchApi extends BaseAPI {
+  /**
+   * Search for the content files of a learning resource. The search is routed to the shard holding the resource\&#39;s content files.
+   * @summary Search within a learning resource
+   * @param {ContentFileSearchApiContentFileSearchResourceRetrieveRequest} requestParameters Request parameters.
+   * @param {*} [options] Override http request option.
+   * @throws {RequiredError}
+   * @memberof ContentFileSearchApi
+   */
+  public contentFileSearchResourceRetrieve(
+    requestParameters: ContentFileSearchApiContentFileSearchResourceRetrieveRequest,
+    options?: RawAxiosRequestConfig,
+  ) {
+    return ContentFileSearchApiFp(this.configuration)
+      .contentFileSearchResourceRetrieve(
+        requestParameters.resource_id,
+        requestParameters.aggregations,
+        requestParameters.content_feature_type,
+        requestParameters.cursor,
+        requestParameters.id,
+        requestParameters.limit,
+        requestParameters.offered_by,
+        requestParameters.offset,
+        requestParameters.platform,
+        requestParameters.q,
+        requestParameters.run_id,
+        requestParameters.sortby,
+        requestParameters.topic,
+        options,
+      )
+      .then((request) => request(this.axios, this.basePath))
+  }
+
+  /**
+   * Search for content files
+   * @summary Search
+   * @param {ContentFileSearchApiContentFileSearchRetrieveRequest} requestParameters Request parameters.
+   * @param {*} [options] Override http request option.
+   * @throws {RequiredError}
+   * @memberof ContentFileSearchApi
+   */
+  public contentFileSearchRetrieve(
     requestParameters: ContentFileSearchApiContentFileSearchRetrieveRequest = {},
     options?: RawAxiosRequestConfig,
   ) {
@@ -5958,6 +6378,7 @@ export class ContentFileSearchApi extends BaseAPI {
       .contentFileSearchRetrieve(
         requestParameters.aggregations,
         requestParameters.content_feature_type,
+        requestParameters.cursor,
         requestParameters.id,
         requestParameters.limit,
         requestParameters.offered_by,
@@ -5974,6 +6395,69 @@ export class ContentFileSearchApi extends BaseAPI {
   }
 }
 
+/**
+ * @export
+ */
+export const ContentFileSearchResourceRetrieveAggregationsEnum = {
+  Topic: "topic",
+  ContentFeatureType: "content_feature_type",
+  Platform: "platform",
+  OfferedBy: "offered_by",
+} as const
+export type ContentFileSearchResourceRetrieveAggregationsEnum =
+  (typeof ContentFileSearchResourceRetrieveAggregationsEnum)[keyof typeof ContentFileSearchResourceRetrieveAggregationsEnum]
+/**
+ * @export
+ */
+export const ContentFileSearchResourceRetrieveOfferedByEnum = {
+  Mitx: "mitx",
+  Ocw: "ocw",
+  Bootcamps: "bootcamps",
+  Xpro: "xpro",
+  Csail: "csail",
+  Mitpe: "mitpe",
+  See: "see",
+  Scc: "scc",
+  Ctl: "ctl",
+} as const
+export type ContentFileSearchResourceRetrieveOfferedByEnum =
+  (typeof ContentFileSearchResourceRetrieveOfferedByEnum)[keyof typeof ContentFileSearchResourceRetrieveOfferedByEnum]
+/**
+ * @export
+ */
+export const ContentFileSearchResourceRetrievePlatformEnum = {
+  Edx: "edx",
+  Ocw: "ocw",
+  Oll: "oll",
+  Mitxonline: "mitxonline",
+  Bootcamps: "bootcamps",
+  Xpro: "xpro",
+  Csail: "csail",
+  Mitpe: "mitpe",
+  See: "see",
+  Scc: "scc",
+  Ctl: "ctl",
+  Whu: "whu",
+  Susskind: "susskind",
+  Globalalumni: "globalalumni",
+  Simplilearn: "simplilearn",
+  Emeritus: "emeritus",
+  Podcast: "podcast",
+  Youtube: "youtube",
+} as const
+export type ContentFileSearchResourceRetrievePlatformEnum =
+  (typeof ContentFileSearchResourceRetrievePlatformEnum)[keyof typeof ContentFileSearchResourceRetrievePlatformEnum]
+/**
+ * @export
+ */
+export const ContentFileSearchResourceRetrieveSortbyEnum = {
+  Id: "id",
+  Id2: "-id",
+  ResourceReadableId: "resource_readable_id",
+  ResourceReadableId2: "-resource_readable_id",
+} as const
+export type ContentFileSearchResourceRetrieveSortbyEnum =
+  (typeof ContentFileSearchResourceRetrieveSortbyEnum)[keyof typeof ContentFileSearchResourceRetrieveSortbyEnum]
 /**
  * @export
  */
@@ -10486,12 +10970,120 @@ export const LearningResourcesSearchApiAxiosParamCreator = function (
   configuration?: Configuration,
 ) {
   return {
+    /**
+     * Suggest learning resource titles, course numbers, topics and instructors starting with some text
+     * @summary Autocomplete
+     * @param {string} q The text to autocomplete, matched as a prefix
+     * @param {number} [limit] Number of suggestions to return
+     * @param {*} [options] Override http request option.
+     * @throws {RequiredError}
+     */
+    learningResourcesSearchAutocompleteRetrieve: async (
+      q: string,
+      limit?: number,
+      options: RawAxiosRequestConfig = {},
+    ): Promise<RequestArgs> => {
+      // verify required parameter 'q' is not null or undefined
+      assertParamExists("learningResourcesSearchAutocompleteRetrieve", "q", q)
+      const localVarPath = `/api/v1/learning_resources_search/autocomplete/`
+      // use dummy base URL string because the URL constructor only accepts absolute URLs.
+      const localVarUrlObj = new URL(localVarPath, DUMMY_BASE_URL)
+      let baseOptions
+      if (configuration) {
+        baseOptions = configuration.baseOptions
+      }
+
+      const localVarRequestOptions = {
+        method: "GET",
+        ...baseOptions,
+        ...options,
+      }
+      const localVarHeaderParameter = {} as any
+      const localVarQueryParameter = {} as any
+
+      if (limit !== undefined) {
+        localVarQueryParameter["limit"] = limit
+      }
+
+      if (q !== undefined) {
+        localVarQueryParameter["q"] = q
+      }
+
+      setSearchParams(localVarUrlObj, localVarQueryParameter)
+      let headersFromBaseOptions =
+        baseOptions && baseOptions.headers ? baseOptions.headers : {}
+      localVarRequestOptions.headers = {
+        ...localVarHeaderParameter,
+        ...headersFromBaseOptions,
+        ...options.headers,
+      }
+
+      return {
+        url: toPathString(localVarUrlObj),
+        options: localVarRequestOptions,
+      }
+    },
+    /**
+     * Run each search with one multisearch request. The results have no next/previous links, pages are requested from the search endpoint.
+     * @summary Batch search
+     * @param {LearningResourcesBatchSearchRequestRequest} LearningResourcesBatchSearchRequestRequest
+     * @param {*} [options] Override http request option.
+     * @throws {RequiredError}
+     */
+    learningResourcesSearchBatchCreate: async (
+      LearningResourcesBatchSearchRequestRequest: LearningResourcesBatchSearchRequestRequest,
+      options: RawAxiosRequestConfig = {},
+    ): Promise<RequestArgs> => {
+      // verify required parameter 'LearningResourcesBatchSearchRequestRequest' is not null or undefined
+      assertParamExists(
+        "learningResourcesSearchBatchCreate",
+        "LearningResourcesBatchSearchRequestRequest",
+        LearningResourcesBatchSearchRequestRequest,
+      )
+      const localVarPath = `/api/v1/learning_resources_search/batch/`
+      // use dummy base URL string because the URL constructor only accepts absolute URLs.
+      const localVarUrlObj = new URL(localVarPath, DUMMY_BASE_URL)
+      let baseOptions
+      if (configuration) {
+        baseOptions = configuration.baseOptions
+      }
+
+      const localVarRequestOptions = {
+        method: "POST",
+        ...baseOptions,
+        ...options,
+      }
+      const localVarHeaderParameter = {} as any
+      const localVarQueryParameter = {} as any
+
+      localVarHeaderParameter["Content-Type"] = "application/json"
+
+      setSearchParams(localVarUrlObj, localVarQueryParameter)
+      let headersFromBaseOptions =
+        baseOptions && baseOptions.headers ? baseOptions.headers : {}
+      localVarRequestOptions.headers = {
+        ...localVarHeaderParameter,
+        ...headersFromBaseOptions,
+        ...options.headers,
+      }
+      localVarRequestOptions.data = serializeDataIfNeeded(
+        LearningResourcesBatchSearchRequestRequest,
+        localVarRequestOptions,
+        configuration,
+      )
+
+      return {
+        url: toPathString(localVarUrlObj),
+        options: localVarRequestOptions,
+      }
+    },
     /**
      * Search for learning resources
      * @summary Search
      * @param {Array<LearningResourcesSearchRetrieveAggregationsEnum>} [aggregations] Show resource counts by category
      * @param {boolean | null} [certification] True if the learning resource offers a certificate
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
      * @param {Array<LearningResourcesSearchRetrieveDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Sloan School of Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Studies and Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Health Sciences and Technology * &#x60;IDS&#x60; - Institute for Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;RES&#x60; - Supplemental Resources * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [free]
      * @param {Array<number>} [id] The id value for the learning resource
@@ -10506,6 +11098,7 @@ export const LearningResourcesSearchApiAxiosParamCreator = function (
      * @param {Array<LearningResourcesSearchRetrieveResourceTypeEnum>} [resource_type] The type of learning resource               * &#x60;course&#x60; - course * &#x60;program&#x60; - program * &#x60;learning_path&#x60; - learning path * &#x60;podcast&#x60; - podcast * &#x60;podcast_episode&#x60; - podcast episode * &#x60;video&#x60; - video * &#x60;video_playlist&#x60; - video playlist
      * @param {LearningResourcesSearchRetrieveSortbyEnum} [sortby] If the parameter starts with \&#39;-\&#39; the sort is in descending order  * &#x60;id&#x60; - Object ID ascending * &#x60;-id&#x60; - Object ID descending * &#x60;readable_id&#x60; - Readable ID ascending * &#x60;-readable_id&#x60; - Readable ID descending * &#x60;last_modified&#x60; - Last Modified Date ascending * &#x60;-last_modified&#x60; - Last Modified Date descending * &#x60;new&#x60; - Newest resources first * &#x60;start_date&#x60; - Start Date ascending * &#x60;-start_date&#x60; - Start Date descending * &#x60;mitcoursenumber&#x60; - MIT course number ascending * &#x60;-mitcoursenumber&#x60; - MIT course number descending * &#x60;views&#x60; - Popularity ascending * &#x60;-views&#x60; - Popularity descending * &#x60;upcoming&#x60; - Next start date ascending
      * @param {Array<string>} [topic] The topic name. To see a list of options go to api/v1/topics/
+     * @param {LearningResourcesSearchRetrieveViewEnum} [view] The fields to return for each result. card only returns the fields the result cards render  * &#x60;full&#x60; - full * &#x60;card&#x60; - card
      * @param {*} [options] Override http request option.
      * @throws {RequiredError}
      */
@@ -10513,6 +11106,7 @@ export const LearningResourcesSearchApiAxiosParamCreator = function (
       aggregations?: Array<LearningResourcesSearchRetrieveAggregationsEnum>,
       certification?: boolean | null,
       course_feature?: Array<string>,
+      cursor?: string,
       department?: Array<LearningResourcesSearchRetrieveDepartmentEnum>,
       free?: boolean | null,
       id?: Array<number>,
@@ -10527,6 +11121,7 @@ export const LearningResourcesSearchApiAxiosParamCreator = function (
       resource_type?: Array<LearningResourcesSearchRetrieveResourceTypeEnum>,
       sortby?: LearningResourcesSearchRetrieveSortbyEnum,
       topic?: Array<string>,
+      view?: LearningResourcesSearchRetrieveViewEnum,
       options: RawAxiosRequestConfig = {},
     ): Promise<RequestArgs> => {
       const localVarPath = `/api/v1/learning_resources_search/`
@@ -10557,6 +11152,10 @@ export const LearningResourcesSearchApiAxiosParamCreator = function (
         localVarQueryParameter["course_feature"] = course_feature
       }
 
+      if (cursor !== undefined) {
+        localVarQueryParameter["cursor"] = cursor
+      }
+
       if (department) {
         localVarQueryParameter["department"] = department
       }
@@ -10613,6 +11212,10 @@ export const LearningResourcesSearchApiAxiosParamCreator = function (
         localVarQueryParameter["topic"] = topic
       }
 
+      if (view !== undefined) {
+        localVarQueryParameter["view"] = view
+      }
+
       setSearchParams(localVarUrlObj, localVarQueryParameter)
       let headersFromBaseOptions =
         baseOptions && baseOptions.headers ? baseOptions.headers : {}
@@ -10640,12 +11243,84 @@ export const LearningResourcesSearchApiFp = function (
   const localVarAxiosParamCreator =
     LearningResourcesSearchApiAxiosParamCreator(configuration)
   return {
+    /**
+     * Suggest learning resource titles, course numbers, topics and instructors starting with some text
+     * @summary Autocomplete
+     * @param {string} q The text to autocomplete, matched as a prefix
+     * @param {number} [limit] Number of suggestions to return
+     * @param {*} [options] Override http request option.
+     * @throws {RequiredError}
+     */
+    async learningResourcesSearchAutocompleteRetrieve(
+      q: string,
+      limit?: number,
+      options?: RawAxiosRequestConfig,
+    ): Promise<
+      (
+        axios?: AxiosInstance,
+        basePath?: string,
+      ) => AxiosPromise<AutocompleteResponse>
+    > {
+      const localVarAxiosArgs =
+        await localVarAxiosParamCreator.learningResourcesSearchAutocompleteRetrieve(
+          q,
+          limit,
+          options,
+        )
+      const index = configuration?.serverIndex ?? 0
+      const operationBasePath =
+        operationServerMap[
+          "LearningResourcesSearchApi.learningResourcesSearchAutocompleteRetrieve"
+        ]?.[index]?.url
+      return (axios, basePath) =>
+        createRequestFunction(
+          localVarAxiosArgs,
+          globalAxios,
+          BASE_PATH,
+          configuration,
+        )(axios, operationBasePath || basePath)
+    },
+    /**
+     * Run each search with one multisearch request. The results have no next/previous links, pages are requested from the search endpoint.
+     * @summary Batch search
+     * @param {LearningResourcesBatchSearchRequestRequest} LearningResourcesBatchSearchRequestRequest
+     * @param {*} [options] Override http request option.
+     * @throws {RequiredError}
+     */
+    async learningResourcesSearchBatchCreate(
+      LearningResourcesBatchSearchRequestRequest: LearningResourcesBatchSearchRequestRequest,
+      options?: RawAxiosRequestConfig,
+    ): Promise<
+      (
+        axios?: AxiosInstance,
+        basePath?: string,
+      ) => AxiosPromise<Array<LearningResourceSearchResponse>>
+    > {
+      const localVarAxiosArgs =
+        await localVarAxiosParamCreator.learningResourcesSearchBatchCreate(
+          LearningResourcesBatchSearchRequestRequest,
+          options,
+        )
+      const index = configuration?.serverIndex ?? 0
+      const operationBasePath =
+        operationServerMap[
+          "LearningResourcesSearchApi.learningResourcesSearchBatchCreate"
+        ]?.[index]?.url
+      return (axios, basePath) =>
+        createRequestFunction(
+          localVarAxiosArgs,
+          globalAxios,
+          BASE_PATH,
+          configuration,
+        )(axios, operationBasePath || basePath)
+    },
     /**
      * Search for learning resources
      * @summary Search
      * @param {Array<LearningResourcesSearchRetrieveAggregationsEnum>} [aggregations] Show resource counts by category
      * @param {boolean | null} [certification] True if the learning resource offers a certificate
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
      * @param {Array<LearningResourcesSearchRetrieveDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Sloan School of Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Studies and Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Health Sciences and Technology * &#x60;IDS&#x60; - Institute for Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;RES&#x60; - Supplemental Resources * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [free]
      * @param {Array<number>} [id] The id value for the learning resource
@@ -10660,6 +11335,7 @@ export const LearningResourcesSearchApiFp = function (
      * @param {Array<LearningResourcesSearchRetrieveResourceTypeEnum>} [resource_type] The type of learning resource               * &#x60;course&#x60; - course * &#x60;program&#x60; - program * &#x60;learning_path&#x60; - learning path * &#x60;podcast&#x60; - podcast * &#x60;podcast_episode&#x60; - podcast episode * &#x60;video&#x60; - video * &#x60;video_playlist&#x60; - video playlist
      * @param {LearningResourcesSearchRetrieveSortbyEnum} [sortby] If the parameter starts with \&#39;-\&#39; the sort is in descending order  * &#x60;id&#x60; - Object ID ascending * &#x60;-id&#x60; - Object ID descending * &#x60;readable_id&#x60; - Readable ID ascending * &#x60;-readable_id&#x60; - Readable ID descending * &#x60;last_modified&#x60; - Last Modified Date ascending * &#x60;-last_modified&#x60; - Last Modified Date descending * &#x60;new&#x60; - Newest resources first * &#x60;start_date&#x60; - Start Date ascending * &#x60;-start_date&#x60; - Start Date descending * &#x60;mitcoursenumber&#x60; - MIT course number ascending * &#x60;-mitcoursenumber&#x60; - MIT course number descending * &#x60;views&#x60; - Popularity ascending * &#x60;-views&#x60; - Popularity descending * &#x60;upcoming&#x60; - Next start date ascending
      * @param {Array<string>} [topic] The topic name. To see a list of options go to api/v1/topics/
+     * @param {LearningResourcesSearchRetrieveViewEnum} [view] The fields to return for each result. card only returns the fields the result cards render  * &#x60;full&#x60; - full * &#x60;card&#x60; - card
      * @param {*} [options] Override http request option.
      * @throws {RequiredError}
      */
@@ -10667,6 +11343,7 @@ export const LearningResourcesSearchApiFp = function (
       aggregations?: Array<LearningResourcesSearchRetrieveAggregationsEnum>,
       certification?: boolean | null,
       course_feature?: Array<string>,
+      cursor?: string,
       department?: Array<LearningResourcesSearchRetrieveDepartmentEnum>,
       free?: boolean | null,
       id?: Array<number>,
@@ -10681,6 +11358,7 @@ export const LearningResourcesSearchApiFp = function (
       resource_type?: Array<LearningResourcesSearchRetrieveResourceTypeEnum>,
       sortby?: LearningResourcesSearchRetrieveSortbyEnum,
       topic?: Array<string>,
+      view?: LearningResourcesSearchRetrieveViewEnum,
       options?: RawAxiosRequestConfig,
     ): Promise<
       (
@@ -10693,6 +11371,7 @@ export const LearningResourcesSearchApiFp = function (
           aggregations,
           certification,
           course_feature,
+          cursor,
           department,
           free,
           id,
@@ -10707,6 +11386,7 @@ export const LearningResourcesSearchApiFp = function (
           resource_type,
           sortby,
           topic,
+          view,
           options,
         )
       const index = configuration?.serverIndex ?? 0
@@ -10736,6 +11416,43 @@ export const LearningResourcesSearchApiFactory = function (
 ) {
   const localVarFp = LearningResourcesSearchApiFp(configuration)
   return {
+    /**
+     * Suggest learning resource titles, course numbers, topics and instructors starting with some text
+     * @summary Autocomplete
+     * @param {LearningResourcesSearchApiLearningResourcesSearchAutocompleteRetrieveRequest} requestParameters Request parameters.
+     * @param {*} [options] Override http request option.
+     * @throws {RequiredError}
+     */
+    learningResourcesSearchAutocompleteRetrieve(
+      requestParameters: LearningResourcesSearchApiLearningResourcesSearchAutocompleteRetrieveRequest,
+      options?: RawAxiosRequestConfig,
+    ): AxiosPromise<AutocompleteResponse> {
+      return localVarFp
+        .learningResourcesSearchAutocompleteRetrieve(
+          requestParameters.q,
+          requestParameters.limit,
+          options,
+        )
+        .then((request) => request(axios, basePath))
+    },
+    /**
+     * Run each search with one multisearch request. The results have no next/previous links, pages are requested from the search endpoint.
+     * @summary Batch search
+     * @param {LearningResourcesSearchApiLearningResourcesSearchBatchCreateRequest} requestParameters Request parameters.
+     * @param {*} [options] Override http request option.
+     * @throws {RequiredError}
+     */
+    learningResourcesSearchBatchCreate(
+      requestParameters: LearningResourcesSearchApiLearningResourcesSearchBatchCreateRequest,
+      options?: RawAxiosRequestConfig,
+    ): AxiosPromise<Array<LearningResourceSearchResponse>> {
+      return localVarFp
+        .learningResourcesSearchBatchCreate(
+          requestParameters.LearningResourcesBatchSearchRequestRequest,
+          options,
+        )
+        .then((request) => request(axios, basePath))
+    },
     /**
      * Search for learning resources
      * @summary Search
@@ -10752,6 +11469,7 @@ export const LearningResourcesSearchApiFactory = function (
           requestParameters.aggregations,
           requestParameters.certification,
           requestParameters.course_feature,
+          requestParameters.cursor,
           requestParameters.department,
           requestParameters.free,
           requestParameters.id,
@@ -10766,6 +11484,7 @@ export const LearningResourcesSearchApiFactory = function (
           requestParameters.resource_type,
           requestParameters.sortby,
           requestParameters.topic,
+          requestParameters.view,
           options,
         )
         .then((request) => request(axios, basePath))
@@ -10773,6 +11492,41 @@ export const LearningResourcesSearchApiFactory = function (
   }
 }
 
+/**
+ * Request parameters for learningResourcesSearchAutocompleteRetrieve operation in LearningResourcesSearchApi.
+ * @export
+ * @interface LearningResourcesSearchApiLearningResourcesSearchAutocompleteRetrieveRequest
+ */
+export interface LearningResourcesSearchApiLearningResourcesSearchAutocompleteRetrieveRequest {
+  /**
+   * The text to autocomplete, matched as a prefix
+   * @type {string}
+   * @memberof LearningResourcesSearchApiLearningResourcesSearchAutocompleteRetrieve
+   */
+  readonly q: string
+
+  /**
+   * Number of suggestions to return
+   * @type {number}
+   * @memberof LearningResourcesSearchApiLearningResourcesSearchAutocompleteRetrieve
+   */
+  readonly limit?: number
+}
+
+/**
+ * Request parameters for learningResourcesSearchBatchCreate operation in LearningResourcesSearchApi.
+ * @export
+ * @interface LearningResourcesSearchApiLearningResourcesSearchBatchCreateRequest
+ */
+export interface LearningResourcesSearchApiLearningResourcesSearchBatchCreateRequest {
+  /**
+   *
+   * @type {LearningResourcesBatchSearchRequestRequest}
+   * @memberof LearningResourcesSearchApiLearningResourcesSearchBatchCreate
+   */
+  readonly LearningResourcesBatchSearchRequestRequest: LearningResourcesBatchSearchRequestRequest
+}
+
 /**
  * Request parameters for learningResourcesSearchRetrieve operation in LearningResourcesSearchApi.
  * @export
@@ -10800,6 +11554,13 @@ export interface LearningResourcesSearchApiLearningResourcesSearchRetrieveReques
    */
   readonly course_feature?: Array<string>
 
+  /**
+   * Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
+   * @type {string}
+   * @memberof LearningResourcesSearchApiLearningResourcesSearchRetrieve
+   */
+  readonly cursor?: string
+
   /**
    * The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Sloan School of Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Studies and Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Health Sciences and Technology * &#x60;IDS&#x60; - Institute for Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;RES&#x60; - Supplemental Resources * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
    * @type {Array<'1' | '2' | '3' | '4' | '5' | '6' | '7' | '8' | '9' | '10' | '11' | '12' | '14' | '15' | '16' | '17' | '18' | '20' | '21A' | '21G' | '21H' | '21L' | '21M' | '22' | '24' | 'CC' | 'CMS-W' | 'EC' | 'ES' | 'ESD' | 'HST' | 'IDS' | 'MAS' | 'PE' | 'RES' | 'STS' | 'WGS'>}
@@ -10897,6 +11658,13 @@ export interface LearningResourcesSearchApiLearningResourcesSearchRetrieveReques
    * @memberof LearningResourcesSearchApiLearningResourcesSearchRetrieve
    */
   readonly topic?: Array<string>
+
+  /**
+   * The fields to return for each result. card only returns the fields the result cards render  * &#x60;full&#x60; - full * &#x60;card&#x60; - card
+   * @type {'full' | 'card'}
+   * @memberof LearningResourcesSearchApiLearningResourcesSearchRetrieve
+   */
+  readonly view?: LearningResourcesSearchRetrieveViewEnum
 }
 
 /**
@@ -10906,6 +11674,47 @@ export interface LearningResourcesSearchApiLearningResourcesSearchRetrieveReques
  * @extends {BaseAPI}
  */
 export class LearningResourcesSearchApi extends BaseAPI {
+  /**
+   * Suggest learning resource titles, course numbers, topics and instructors starting with some text
+   * @summary Autocomplete
+   * @param {LearningResourcesSearchApiLearningResourcesSearchAutocompleteRetrieveRequest} requestParameters Request parameters.
+   * @param {*} [options] Override http request option.
+   * @throws {RequiredError}
+   * @memberof LearningResourcesSearchApi
+   */
+  public learningResourcesSearchAutocompleteRetrieve(
+    requestParameters: LearningResourcesSearchApiLearningResourcesSearchAutocompleteRetrieveRequest,
+    options?: RawAxiosRequestConfig,
+  ) {
+    return LearningResourcesSearchApiFp(this.configuration)
+      .learningResourcesSearchAutocompleteRetrieve(
+        requestParameters.q,
+        requestParameters.limit,
+        options,
+      )
+      .then((request) => request(this.axios, this.basePath))
+  }
+
+  /**
+   * Run each search with one multisearch request. The results have no next/previous links, pages are requested from the search endpoint.
+   * @summary Batch search
+   * @param {LearningResourcesSearchApiLearningResourcesSearchBatchCreateRequest} requestParameters Request parameters.
+   * @param {*} [options] Override http request option.
+   * @throws {RequiredError}
+   * @memberof LearningResourcesSearchApi
+   */
+  public learningResourcesSearchBatchCreate(
+    requestParameters: LearningResourcesSearchApiLearningResourcesSearchBatchCreateRequest,
+    options?: RawAxiosRequestConfig,
+  ) {
+    return LearningResourcesSearchApiFp(this.configuration)
+      .learningResourcesSearchBatchCreate(
+        requestParameters.LearningResourcesBatchSearchRequestRequest,
+        options,
+      )
+      .then((request) => request(this.axios, this.basePath))
+  }
+
   /**
    * Search for learning resources
    * @summary Search
@@ -10923,6 +11732,7 @@ export class LearningResourcesSearchApi extends BaseAPI {
         requestParameters.aggregations,
         requestParameters.certification,
         requestParameters.course_feature,
+        requestParameters.cursor,
         requestParameters.department,
         requestParameters.free,
         requestParameters.id,
@@ -10937,6 +11747,7 @@ export class LearningResourcesSearchApi extends BaseAPI {
         requestParameters.resource_type,
         requestParameters.sortby,
         requestParameters.topic,
+        requestParameters.view,
         options,
       )
       .then((request) => request(this.axios, this.basePath))
@@ -11105,6 +11916,15 @@ export const LearningResourcesSearchRetrieveSortbyEnum = {
 } as const
 export type LearningResourcesSearchRetrieveSortbyEnum =
   (typeof LearningResourcesSearchRetrieveSortbyEnum)[keyof typeof LearningResourcesSearchRetrieveSortbyEnum]
+/**
+ * @export
+ */
+export const LearningResourcesSearchRetrieveViewEnum = {
+  Full: "full",
+  Card: "card",
+} as const
+export type LearningResourcesSearchRetrieveViewEnum =
+  (typeof LearningResourcesSearchRetrieveViewEnum)[keyof typeof LearningResourcesSearchRetrieveViewEnum]
 
 /**
  * LearningResourcesUserSubscriptionApi - axios parameter creator
@@ -11120,6 +11940,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
      * @param {Array<LearningResourcesUserSubscriptionCheckListAggregationsEnum>} [aggregations] Show resource counts by category
      * @param {boolean | null} [certification] True if the learning resource offers a certificate
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
      * @param {Array<LearningResourcesUserSubscriptionCheckListDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Sloan School of Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Studies and Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Health Sciences and Technology * &#x60;IDS&#x60; - Institute for Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;RES&#x60; - Supplemental Resources * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [free]
      * @param {Array<number>} [id] The id value for the learning resource
@@ -11134,6 +11955,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
      * @param {Array<LearningResourcesUserSubscriptionCheckListResourceTypeEnum>} [resource_type] The type of learning resource               * &#x60;course&#x60; - course * &#x60;program&#x60; - program * &#x60;learning_path&#x60; - learning path * &#x60;podcast&#x60; - podcast * &#x60;podcast_episode&#x60; - podcast episode * &#x60;video&#x60; - video * &#x60;video_playlist&#x60; - video playlist
      * @param {LearningResourcesUserSubscriptionCheckListSortbyEnum} [sortby] If the parameter starts with \&#39;-\&#39; the sort is in descending order  * &#x60;id&#x60; - Object ID ascending * &#x60;-id&#x60; - Object ID descending * &#x60;readable_id&#x60; - Readable ID ascending * &#x60;-readable_id&#x60; - Readable ID descending * &#x60;last_modified&#x60; - Last Modified Date ascending * &#x60;-last_modified&#x60; - Last Modified Date descending * &#x60;new&#x60; - Newest resources first * &#x60;start_date&#x60; - Start Date ascending * &#x60;-start_date&#x60; - Start Date descending * &#x60;mitcoursenumber&#x60; - MIT course number ascending * &#x60;-mitcoursenumber&#x60; - MIT course number descending * &#x60;views&#x60; - Popularity ascending * &#x60;-views&#x60; - Popularity descending * &#x60;upcoming&#x60; - Next start date ascending
      * @param {Array<string>} [topic] The topic name. To see a list of options go to api/v1/topics/
+     * @param {LearningResourcesUserSubscriptionCheckListViewEnum} [view] The fields to return for each result. card only returns the fields the result cards render  * &#x60;full&#x60; - full * &#x60;card&#x60; - card
      * @param {*} [options] Override http request option.
      * @throws {RequiredError}
      */
@@ -11141,6 +11963,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
       aggregations?: Array<LearningResourcesUserSubscriptionCheckListAggregationsEnum>,
       certification?: boolean | null,
       course_feature?: Array<string>,
+      cursor?: string,
       department?: Array<LearningResourcesUserSubscriptionCheckListDepartmentEnum>,
       free?: boolean | null,
       id?: Array<number>,
@@ -11155,6 +11978,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
       resource_type?: Array<LearningResourcesUserSubscriptionCheckListResourceTypeEnum>,
       sortby?: LearningResourcesUserSubscriptionCheckListSortbyEnum,
       topic?: Array<string>,
+      view?: LearningResourcesUserSubscriptionCheckListViewEnum,
       options: RawAxiosRequestConfig = {},
     ): Promise<RequestArgs> => {
       const localVarPath = `/api/v1/learning_resources_user_subscription/check/`
@@ -11185,6 +12009,10 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
         localVarQueryParameter["course_feature"] = course_feature
       }
 
+      if (cursor !== undefined) {
+        localVarQueryParameter["cursor"] = cursor
+      }
+
       if (department) {
         localVarQueryParameter["department"] = department
       }
@@ -11241,6 +12069,10 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
         localVarQueryParameter["topic"] = topic
       }
 
+      if (view !== undefined) {
+        localVarQueryParameter["view"] = view
+      }
+
       setSearchParams(localVarUrlObj, localVarQueryParameter)
       let headersFromBaseOptions =
         baseOptions && baseOptions.headers ? baseOptions.headers : {}
@@ -11261,6 +12093,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
      * @param {Array<LearningResourcesUserSubscriptionListAggregationsEnum>} [aggregations] Show resource counts by category
      * @param {boolean | null} [certification] True if the learning resource offers a certificate
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
      * @param {Array<LearningResourcesUserSubscriptionListDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Sloan School of Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Studies and Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Health Sciences and Technology * &#x60;IDS&#x60; - Institute for Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;RES&#x60; - Supplemental Resources * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [free]
      * @param {Array<number>} [id] The id value for the learning resource
@@ -11275,6 +12108,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
      * @param {Array<LearningResourcesUserSubscriptionListResourceTypeEnum>} [resource_type] The type of learning resource               * &#x60;course&#x60; - course * &#x60;program&#x60; - program * &#x60;learning_path&#x60; - learning path * &#x60;podcast&#x60; - podcast * &#x60;podcast_episode&#x60; - podcast episode * &#x60;video&#x60; - video * &#x60;video_playlist&#x60; - video playlist
      * @param {LearningResourcesUserSubscriptionListSortbyEnum} [sortby] If the parameter starts with \&#39;-\&#39; the sort is in descending order  * &#x60;id&#x60; - Object ID ascending * &#x60;-id&#x60; - Object ID descending * &#x60;readable_id&#x60; - Readable ID ascending * &#x60;-readable_id&#x60; - Readable ID descending * &#x60;last_modified&#x60; - Last Modified Date ascending * &#x60;-last_modified&#x60; - Last Modified Date descending * &#x60;new&#x60; - Newest resources first * &#x60;start_date&#x60; - Start Date ascending * &#x60;-start_date&#x60; - Start Date descending * &#x60;mitcoursenumber&#x60; - MIT course number ascending * &#x60;-mitcoursenumber&#x60; - MIT course number descending * &#x60;views&#x60; - Popularity ascending * &#x60;-views&#x60; - Popularity descending * &#x60;upcoming&#x60; - Next start date ascending
      * @param {Array<string>} [topic] The topic name. To see a list of options go to api/v1/topics/
+     * @param {LearningResourcesUserSubscriptionListViewEnum} [view] The fields to return for each result. card only returns the fields the result cards render  * &#x60;full&#x60; - full * &#x60;card&#x60; - card
      * @param {*} [options] Override http request option.
      * @throws {RequiredError}
      */
@@ -11282,6 +12116,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
       aggregations?: Array<LearningResourcesUserSubscriptionListAggregationsEnum>,
       certification?: boolean | null,
       course_feature?: Array<string>,
+      cursor?: string,
       department?: Array<LearningResourcesUserSubscriptionListDepartmentEnum>,
       free?: boolean | null,
       id?: Array<number>,
@@ -11296,6 +12131,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
       resource_type?: Array<LearningResourcesUserSubscriptionListResourceTypeEnum>,
       sortby?: LearningResourcesUserSubscriptionListSortbyEnum,
       topic?: Array<string>,
+      view?: LearningResourcesUserSubscriptionListViewEnum,
       options: RawAxiosRequestConfig = {},
     ): Promise<RequestArgs> => {
       const localVarPath = `/api/v1/learning_resources_user_subscription/`
@@ -11326,6 +12162,10 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
         localVarQueryParameter["course_feature"] = course_feature
       }
 
+      if (cursor !== undefined) {
+        localVarQueryParameter["cursor"] = cursor
+      }
+
       if (department) {
         localVarQueryParameter["department"] = department
       }
@@ -11382,6 +12222,10 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
         localVarQueryParameter["topic"] = topic
       }
 
+      if (view !== undefined) {
+        localVarQueryParameter["view"] = view
+      }
+
       setSearchParams(localVarUrlObj, localVarQueryParameter)
       let headersFromBaseOptions =
         baseOptions && baseOptions.headers ? baseOptions.headers : {}
@@ -11402,6 +12246,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateAggregationsEnum>} [aggregations] Show resource counts by category
      * @param {boolean | null} [certification] True if the learning resource offers a certificate
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Sloan School of Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Studies and Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Health Sciences and Technology * &#x60;IDS&#x60; - Institute for Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;RES&#x60; - Supplemental Resources * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [free]
      * @param {Array<number>} [id] The id value for the learning resource
@@ -11416,6 +12261,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateResourceTypeEnum>} [resource_type] The type of learning resource               * &#x60;course&#x60; - course * &#x60;program&#x60; - program * &#x60;learning_path&#x60; - learning path * &#x60;podcast&#x60; - podcast * &#x60;podcast_episode&#x60; - podcast episode * &#x60;video&#x60; - video * &#x60;video_playlist&#x60; - video playlist
      * @param {LearningResourcesUserSubscriptionSubscribeCreateSortbyEnum} [sortby] If the parameter starts with \&#39;-\&#39; the sort is in descending order  * &#x60;id&#x60; - Object ID ascending * &#x60;-id&#x60; - Object ID descending * &#x60;readable_id&#x60; - Readable ID ascending * &#x60;-readable_id&#x60; - Readable ID descending * &#x60;last_modified&#x60; - Last Modified Date ascending * &#x60;-last_modified&#x60; - Last Modified Date descending * &#x60;new&#x60; - Newest resources first * &#x60;start_date&#x60; - Start Date ascending * &#x60;-start_date&#x60; - Start Date descending * &#x60;mitcoursenumber&#x60; - MIT course number ascending * &#x60;-mitcoursenumber&#x60; - MIT course number descending * &#x60;views&#x60; - Popularity ascending * &#x60;-views&#x60; - Popularity descending * &#x60;upcoming&#x60; - Next start date ascending
      * @param {Array<string>} [topic] The topic name. To see a list of options go to api/v1/topics/
+     * @param {LearningResourcesUserSubscriptionSubscribeCreateViewEnum} [view] The fields to return for each result. card only returns the fields the result cards render  * &#x60;full&#x60; - full * &#x60;card&#x60; - card
      * @param {LearningResourcesSearchRequestRequest} [LearningResourcesSearchRequestRequest]
      * @param {*} [options] Override http request option.
      * @throws {RequiredError}
@@ -11424,6 +12270,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
       aggregations?: Array<LearningResourcesUserSubscriptionSubscribeCreateAggregationsEnum>,
       certification?: boolean | null,
       course_feature?: Array<string>,
+      cursor?: string,
       department?: Array<LearningResourcesUserSubscriptionSubscribeCreateDepartmentEnum>,
       free?: boolean | null,
       id?: Array<number>,
@@ -11438,6 +12285,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
       resource_type?: Array<LearningResourcesUserSubscriptionSubscribeCreateResourceTypeEnum>,
       sortby?: LearningResourcesUserSubscriptionSubscribeCreateSortbyEnum,
       topic?: Array<string>,
+      view?: LearningResourcesUserSubscriptionSubscribeCreateViewEnum,
       LearningResourcesSearchRequestRequest?: LearningResourcesSearchRequestRequest,
       options: RawAxiosRequestConfig = {},
     ): Promise<RequestArgs> => {
@@ -11469,6 +12317,10 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
         localVarQueryParameter["course_feature"] = course_feature
       }
 
+      if (cursor !== undefined) {
+        localVarQueryParameter["cursor"] = cursor
+      }
+
       if (department) {
         localVarQueryParameter["department"] = department
       }
@@ -11525,6 +12377,10 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
         localVarQueryParameter["topic"] = topic
       }
 
+      if (view !== undefined) {
+        localVarQueryParameter["view"] = view
+      }
+
       localVarHeaderParameter["Content-Type"] = "application/json"
 
       setSearchParams(localVarUrlObj, localVarQueryParameter)
@@ -11616,6 +12472,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
      * @param {Array<LearningResourcesUserSubscriptionCheckListAggregationsEnum>} [aggregations] Show resource counts by category
      * @param {boolean | null} [certification] True if the learning resource offers a certificate
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
      * @param {Array<LearningResourcesUserSubscriptionCheckListDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Sloan School of Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Studies and Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Health Sciences and Technology * &#x60;IDS&#x60; - Institute for Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;RES&#x60; - Supplemental Resources * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [free]
      * @param {Array<number>} [id] The id value for the learning resource
@@ -11630,6 +12487,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
      * @param {Array<LearningResourcesUserSubscriptionCheckListResourceTypeEnum>} [resource_type] The type of learning resource               * &#x60;course&#x60; - course * &#x60;program&#x60; - program * &#x60;learning_path&#x60; - learning path * &#x60;podcast&#x60; - podcast * &#x60;podcast_episode&#x60; - podcast episode * &#x60;video&#x60; - video * &#x60;video_playlist&#x60; - video playlist
      * @param {LearningResourcesUserSubscriptionCheckListSortbyEnum} [sortby] If the parameter starts with \&#39;-\&#39; the sort is in descending order  * &#x60;id&#x60; - Object ID ascending * &#x60;-id&#x60; - Object ID descending * &#x60;readable_id&#x60; - Readable ID ascending * &#x60;-readable_id&#x60; - Readable ID descending * &#x60;last_modified&#x60; - Last Modified Date ascending * &#x60;-last_modified&#x60; - Last Modified Date descending * &#x60;new&#x60; - Newest resources first * &#x60;start_date&#x60; - Start Date ascending * &#x60;-start_date&#x60; - Start Date descending * &#x60;mitcoursenumber&#x60; - MIT course number ascending * &#x60;-mitcoursenumber&#x60; - MIT course number descending * &#x60;views&#x60; - Popularity ascending * &#x60;-views&#x60; - Popularity descending * &#x60;upcoming&#x60; - Next start date ascending
      * @param {Array<string>} [topic] The topic name. To see a list of options go to api/v1/topics/
+     * @param {LearningResourcesUserSubscriptionCheckListViewEnum} [view] The fields to return for each result. card only returns the fields the result cards render  * &#x60;full&#x60; - full * &#x60;card&#x60; - card
      * @param {*} [options] Override http request option.
      * @throws {RequiredError}
      */
@@ -11637,6 +12495,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
       aggregations?: Array<LearningResourcesUserSubscriptionCheckListAggregationsEnum>,
       certification?: boolean | null,
       course_feature?: Array<string>,
+      cursor?: string,
       department?: Array<LearningResourcesUserSubscriptionCheckListDepartmentEnum>,
       free?: boolean | null,
       id?: Array<number>,
@@ -11651,6 +12510,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
       resource_type?: Array<LearningResourcesUserSubscriptionCheckListResourceTypeEnum>,
       sortby?: LearningResourcesUserSubscriptionCheckListSortbyEnum,
       topic?: Array<string>,
+      view?: LearningResourcesUserSubscriptionCheckListViewEnum,
       options?: RawAxiosRequestConfig,
     ): Promise<
       (
@@ -11663,6 +12523,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
           aggregations,
           certification,
           course_feature,
+          cursor,
           department,
           free,
           id,
@@ -11677,6 +12538,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
           resource_type,
           sortby,
           topic,
+          view,
           options,
         )
       const index = configuration?.serverIndex ?? 0
@@ -11698,6 +12560,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
      * @param {Array<LearningResourcesUserSubscriptionListAggregationsEnum>} [aggregations] Show resource counts by category
      * @param {boolean | null} [certification] True if the learning resource offers a certificate
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
      * @param {Array<LearningResourcesUserSubscriptionListDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Sloan School of Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Studies and Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Health Sciences and Technology * &#x60;IDS&#x60; - Institute for Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;RES&#x60; - Supplemental Resources * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [free]
      * @param {Array<number>} [id] The id value for the learning resource
@@ -11712,6 +12575,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
      * @param {Array<LearningResourcesUserSubscriptionListResourceTypeEnum>} [resource_type] The type of learning resource               * &#x60;course&#x60; - course * &#x60;program&#x60; - program * &#x60;learning_path&#x60; - learning path * &#x60;podcast&#x60; - podcast * &#x60;podcast_episode&#x60; - podcast episode * &#x60;video&#x60; - video * &#x60;video_playlist&#x60; - video playlist
      * @param {LearningResourcesUserSubscriptionListSortbyEnum} [sortby] If the parameter starts with \&#39;-\&#39; the sort is in descending order  * &#x60;id&#x60; - Object ID ascending * &#x60;-id&#x60; - Object ID descending * &#x60;readable_id&#x60; - Readable ID ascending * &#x60;-readable_id&#x60; - Readable ID descending * &#x60;last_modified&#x60; - Last Modified Date ascending * &#x60;-last_modified&#x60; - Last Modified Date descending * &#x60;new&#x60; - Newest resources first * &#x60;start_date&#x60; - Start Date ascending * &#x60;-start_date&#x60; - Start Date descending * &#x60;mitcoursenumber&#x60; - MIT course number ascending * &#x60;-mitcoursenumber&#x60; - MIT course number descending * &#x60;views&#x60; - Popularity ascending * &#x60;-views&#x60; - Popularity descending * &#x60;upcoming&#x60; - Next start date ascending
      * @param {Array<string>} [topic] The topic name. To see a list of options go to api/v1/topics/
+     * @param {LearningResourcesUserSubscriptionListViewEnum} [view] The fields to return for each result. card only returns the fields the result cards render  * &#x60;full&#x60; - full * &#x60;card&#x60; - card
      * @param {*} [options] Override http request option.
      * @throws {RequiredError}
      */
@@ -11719,6 +12583,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
       aggregations?: Array<LearningResourcesUserSubscriptionListAggregationsEnum>,
       certification?: boolean | null,
       course_feature?: Array<string>,
+      cursor?: string,
       department?: Array<LearningResourcesUserSubscriptionListDepartmentEnum>,
       free?: boolean | null,
       id?: Array<number>,
@@ -11733,6 +12598,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
       resource_type?: Array<LearningResourcesUserSubscriptionListResourceTypeEnum>,
       sortby?: LearningResourcesUserSubscriptionListSortbyEnum,
       topic?: Array<string>,
+      view?: LearningResourcesUserSubscriptionListViewEnum,
       options?: RawAxiosRequestConfig,
     ): Promise<
       (
@@ -11745,6 +12611,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
           aggregations,
           certification,
           course_feature,
+          cursor,
           department,
           free,
           id,
@@ -11759,6 +12626,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
           resource_type,
           sortby,
           topic,
+          view,
           options,
         )
       const index = configuration?.serverIndex ?? 0
@@ -11780,6 +12648,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateAggregationsEnum>} [aggregations] Show resource counts by category
      * @param {boolean | null} [certification] True if the learning resource offers a certificate
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Sloan School of Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Studies and Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Health Sciences and Technology * &#x60;IDS&#x60; - Institute for Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;RES&#x60; - Supplemental Resources * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [free]
      * @param {Array<number>} [id] The id value for the learning resource
@@ -11794,6 +12663,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateResourceTypeEnum>} [resource_type] The type of learning resource               * &#x60;course&#x60; - course * &#x60;program&#x60; - program * &#x60;learning_path&#x60; - learning path * &#x60;podcast&#x60; - podcast * &#x60;podcast_episode&#x60; - podcast episode * &#x60;video&#x60; - video * &#x60;video_playlist&#x60; - video playlist
      * @param {LearningResourcesUserSubscriptionSubscribeCreateSortbyEnum} [sortby] If the parameter starts with \&#39;-\&#39; the sort is in descending order  * &#x60;id&#x60; - Object ID ascending * &#x60;-id&#x60; - Object ID descending * &#x60;readable_id&#x60; - Readable ID ascending * &#x60;-readable_id&#x60; - Readable ID descending * &#x60;last_modified&#x60; - Last Modified Date ascending * &#x60;-last_modified&#x60; - Last Modified Date descending * &#x60;new&#x60; - Newest resources first * &#x60;start_date&#x60; - Start Date ascending * &#x60;-start_date&#x60; - Start Date descending * &#x60;mitcoursenumber&#x60; - MIT course number ascending * &#x60;-mitcoursenumber&#x60; - MIT course number descending * &#x60;views&#x60; - Popularity ascending * &#x60;-views&#x60; - Popularity descending * &#x60;upcoming&#x60; - Next start date ascending
      * @param {Array<string>} [topic] The topic name. To see a list of options go to api/v1/topics/
+     * @param {LearningResourcesUserSubscriptionSubscribeCreateViewEnum} [view] The fields to return for each result. card only returns the fields the result cards render  * &#x60;full&#x60; - full * &#x60;card&#x60; - card
      * @param {LearningResourcesSearchRequestRequest} [LearningResourcesSearchRequestRequest]
      * @param {*} [options] Override http request option.
      * @throws {RequiredError}
@@ -11802,6 +12672,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
       aggregations?: Array<LearningResourcesUserSubscriptionSubscribeCreateAggregationsEnum>,
       certification?: boolean | null,
       course_feature?: Array<string>,
+      cursor?: string,
       department?: Array<LearningResourcesUserSubscriptionSubscribeCreateDepartmentEnum>,
       free?: boolean | null,
       id?: Array<number>,
@@ -11816,6 +12687,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
       resource_type?: Array<LearningResourcesUserSubscriptionSubscribeCreateResourceTypeEnum>,
       sortby?: LearningResourcesUserSubscriptionSubscribeCreateSortbyEnum,
       topic?: Array<string>,
+      view?: LearningResourcesUserSubscriptionSubscribeCreateViewEnum,
       LearningResourcesSearchRequestRequest?: LearningResourcesSearchRequestRequest,
       options?: RawAxiosRequestConfig,
     ): Promise<
@@ -11826,6 +12698,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
           aggregations,
           certification,
           course_feature,
+          cursor,
           department,
           free,
           id,
@@ -11840,6 +12713,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
           resource_type,
           sortby,
           topic,
+          view,
           LearningResourcesSearchRequestRequest,
           options,
         )
@@ -11917,6 +12791,7 @@ export const LearningResourcesUserSubscriptionApiFactory = function (
           requestParameters.aggregations,
           requestParameters.certification,
           requestParameters.course_feature,
+          requestParameters.cursor,
           requestParameters.department,
           requestParameters.free,
           requestParameters.id,
@@ -11931,6 +12806,7 @@ export const LearningResourcesUserSubscriptionApiFactory = function (
           requestParameters.resource_type,
           requestParameters.sortby,
           requestParameters.topic,
+          requestParameters.view,
           options,
         )
         .then((request) => request(axios, basePath))
@@ -11951,6 +12827,7 @@ export const LearningResourcesUserSubscriptionApiFactory = function (
           requestParameters.aggregations,
           requestParameters.certification,
           requestParameters.course_feature,
+          requestParameters.cursor,
           requestParameters.department,
           requestParameters.free,
           requestParameters.id,
@@ -11965,6 +12842,7 @@ export const LearningResourcesUserSubscriptionApiFactory = function (
           requestParameters.resource_type,
           requestParameters.sortby,
           requestParameters.topic,
+          requestParameters.view,
           options,
         )
         .then((request) => request(axios, basePath))
@@ -11985,6 +12863,7 @@ export const LearningResourcesUserSubscriptionApiFactory = function (
           requestParameters.aggregations,
           requestParameters.certification,
           requestParameters.course_feature,
+          requestParameters.cursor,
           requestParameters.department,
           requestParameters.free,
           requestParameters.id,
@@ -11999,6 +12878,7 @@ export const LearningResourcesUserSubscriptionApiFactory = function (
           requestParameters.resource_type,
           requestParameters.sortby,
           requestParameters.topic,
+          requestParameters.view,
           requestParameters.LearningResourcesSearchRequestRequest,
           options,
         )
@@ -12052,6 +12932,13 @@ export interface LearningResourcesUserSubscriptionApiLearningResourcesUserSubscr
    */
   readonly course_feature?: Array<string>
 
+  /**
+   * Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
+   * @type {string}
+   * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionCheckList
+   */
+  readonly cursor?: string
+
   /**
    * The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Sloan School of Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Studies and Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Health Sciences and Technology * &#x60;IDS&#x60; - Institute for Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;RES&#x60; - Supplemental Resources * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
    * @type {Array<'1' | '2' | '3' | '4' | '5' | '6' | '7' | '8' | '9' | '10' | '11' | '12' | '14' | '15' | '16' | '17' | '18' | '20' | '21A' | '21G' | '21H' | '21L' | '21M' | '22' | '24' | 'CC' | 'CMS-W' | 'EC' | 'ES' | 'ESD' | 'HST' | 'IDS' | 'MAS' | 'PE' | 'RES' | 'STS' | 'WGS'>}
@@ -12149,6 +13036,13 @@ export interface LearningResourcesUserSubscriptionApiLearningResourcesUserSubscr
    * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionCheckList
    */
   readonly topic?: Array<string>
+
+  /**
+   * The fields to return for each result. card only returns the fields the result cards render  * &#x60;full&#x60; - full * &#x60;card&#x60; - card
+   * @type {'full' | 'card'}
+   * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionCheckList
+   */
+  readonly view?: LearningResourcesUserSubscriptionCheckListViewEnum
 }
 
 /**
@@ -12178,6 +13072,13 @@ export interface LearningResourcesUserSubscriptionApiLearningResourcesUserSubscr
    */
   readonly course_feature?: Array<string>
 
+  /**
+   * Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
+   * @type {string}
+   * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionList
+   */
+  readonly cursor?: string
+
   /**
    * The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Sloan School of Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Studies and Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Health Sciences and Technology * &#x60;IDS&#x60; - Institute for Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;RES&#x60; - Supplemental Resources * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
    * @type {Array<'1' | '2' | '3' | '4' | '5' | '6' | '7' | '8' | '9' | '10' | '11' | '12' | '14' | '15' | '16' | '17' | '18' | '20' | '21A' | '21G' | '21H' | '21L' | '21M' | '22' | '24' | 'CC' | 'CMS-W' | 'EC' | 'ES' | 'ESD' | 'HST' | 'IDS' | 'MAS' | 'PE' | 'RES' | 'STS' | 'WGS'>}
@@ -12275,6 +13176,13 @@ export interface LearningResourcesUserSubscriptionApiLearningResourcesUserSubscr
    * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionList
    */
   readonly topic?: Array<string>
+
+  /**
+   * The fields to return for each result. card only returns the fields the result cards render  * &#x60;full&#x60; - full * &#x60;card&#x60; - card
+   * @type {'full' | 'card'}
+   * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionList
+   */
+  readonly view?: LearningResourcesUserSubscriptionListViewEnum
 }
 
 /**
@@ -12304,6 +13212,13 @@ export interface LearningResourcesUserSubscriptionApiLearningResourcesUserSubscr
    */
   readonly course_feature?: Array<string>
 
+  /**
+   * Cursor for paging through all results at a constant cost per page. Pass an empty cursor for the first page and follow the next url after that. offset is ignored when a cursor is given
+   * @type {string}
+   * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionSubscribeCreate
+   */
+  readonly cursor?: string
+
   /**
    * The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Sloan School of Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Studies and Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Health Sciences and Technology * &#x60;IDS&#x60; - Institute for Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;RES&#x60; - Supplemental Resources * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
    * @type {Array<'1' | '2' | '3' | '4' | '5' | '6' | '7' | '8' | '9' | '10' | '11' | '12' | '14' | '15' | '16' | '17' | '18' | '20' | '21A' | '21G' | '21H' | '21L' | '21M' | '22' | '24' | 'CC' | 'CMS-W' | 'EC' | 'ES' | 'ESD' | 'HST' | 'IDS' | 'MAS' | 'PE' | 'RES' | 'STS' | 'WGS'>}
@@ -12402,6 +13317,13 @@ export interface LearningResourcesUserSubscriptionApiLearningResourcesUserSubscr
    */
   readonly topic?: Array<string>
 
+  /**
+   * The fields to return for each result. card only returns the fields the result cards render  * &#x60;full&#x60; - full * &#x60;card&#x60; - card
+   * @type {'full' | 'card'}
+   * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionSubscribeCreate
+   */
+  readonly view?: LearningResourcesUserSubscriptionSubscribeCreateViewEnum
+
   /**
    *
    * @type {LearningResourcesSearchRequestRequest}
@@ -12448,6 +13370,7 @@ export class LearningResourcesUserSubscriptionApi extends BaseAPI {
         requestParameters.aggregations,
         requestParameters.certification,
         requestParameters.course_feature,
+        requestParameters.cursor,
         requestParameters.department,
         requestParameters.free,
         requestParameters.id,
@@ -12462,6 +13385,7 @@ export class LearningResourcesUserSubscriptionApi extends BaseAPI {
         requestParameters.resource_type,
         requestParameters.sortby,
         requestParameters.topic,
+        requestParameters.view,
         options,
       )
       .then((request) => request(this.axios, this.basePath))
@@ -12484,6 +13408,7 @@ export class LearningResourcesUserSubscriptionApi extends BaseAPI {
         requestParameters.aggregations,
         requestParameters.certification,
         requestParameters.course_feature,
+        requestParameters.cursor,
         requestParameters.department,
         requestParameters.free,
         requestParameters.id,
@@ -12498,6 +13423,7 @@ export class LearningResourcesUserSubscriptionApi extends BaseAPI {
         requestParameters.resource_type,
         requestParameters.sortby,
         requestParameters.topic,
+        requestParameters.view,
         options,
       )
       .then((request) => request(this.axios, this.basePath))
@@ -12520,6 +13446,7 @@ export class LearningResourcesUserSubscriptionApi extends BaseAPI {
         requestParameters.aggregations,
         requestParameters.certification,
         requestParameters.course_feature,
+        requestParameters.cursor,
         requestParameters.department,
         requestParameters.free,
         requestParameters.id,
@@ -12534,6 +13461,7 @@ export class LearningResourcesUserSubscriptionApi extends BaseAPI {
         requestParameters.resource_type,
         requestParameters.sortby,
         requestParameters.topic,
+        requestParameters.view,
         requestParameters.LearningResourcesSearchRequestRequest,
         options,
       )
@@ -12726,6 +13654,15 @@ export type LearningResourcesUserSubscriptionCheckListSortbyEnum =
 /**
  * @export
  */
+export const LearningResourcesUserSubscriptionCheckListViewEnum = {
+  Full: "full",
+  Card: "card",
+} as const
+export type LearningResourcesUserSubscriptionCheckListViewEnum =
+  (typeof LearningResourcesUserSubscriptionCheckListViewEnum)[keyof typeof LearningResourcesUserSubscriptionCheckListViewEnum]
+/**
+ * @export
+ */
 export const LearningResourcesUserSubscriptionListAggregationsEnum = {
   ResourceType: "resource_type",
   Certification: "certification",
@@ -12888,6 +13825,15 @@ export type LearningResourcesUserSubscriptionListSortbyEnum =
 /**
  * @export
  */
+export const LearningResourcesUserSubscriptionListViewEnum = {
+  Full: "full",
+  Card: "card",
+} as const
+export type LearningResourcesUserSubscriptionListViewEnum =
+  (typeof LearningResourcesUserSubscriptionListViewEnum)[keyof typeof LearningResourcesUserSubscriptionListViewEnum]
+/**
+ * @export
+ */
 export const LearningResourcesUserSubscriptionSubscribeCreateAggregationsEnum =
   {
     ResourceType: "resource_type",
@@ -13050,6 +13996,15 @@ export const LearningResourcesUserSubscriptionSubscribeCreateSortbyEnum = {
 } as const
 export type LearningResourcesUserSubscriptionSubscribeCreateSortbyEnum =
   (typeof LearningResourcesUserSubscriptionSubscribeCreateSortbyEnum)[keyof typeof LearningResourcesUserSubscriptionSubscribeCreateSortbyEnum]
+/**
+ * @export
+ */
+export const LearningResourcesUserSubscriptionSubscribeCreateViewEnum = {
+  Full: "full",
+  Card: "card",
+} as const
+export type LearningResourcesUserSubscriptionSubscribeCreateViewEnum =
+  (typeof LearningResourcesUserSubscriptionSubscribeCreateViewEnum)[keyof typeof LearningResourcesUserSubscriptionSubscribeCreateViewEnum]
 
 /**
  * LearningpathsApi - axios parameter creator
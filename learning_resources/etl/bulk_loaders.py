@@ -0,0 +1,1119 @@
+"""Set-based loaders for batches of courses, programs and content files"""
+
+import dataclasses
+import json
+import logging
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from learning_resources.constants import (
+    LearningResourceFormat,
+    LearningResourceRelationTypes,
+    LearningResourceType,
+)
+from learning_resources.etl.constants import (
+    READABLE_ID_FIELD,
+    CourseLoaderConfig,
+    ProgramLoaderConfig,
+)
+from learning_resources.etl.utils import lookup_tables_version, resource_checksum
+from learning_resources.models import (
+    ContentFile,
+    Course,
+    LearningResource,
+    LearningResourceContentTag,
+    LearningResourceDepartment,
+    LearningResourceImage,
+    LearningResourceInstructor,
+    LearningResourceOfferor,
+    LearningResourcePlatform,
+    LearningResourceRun,
+    LearningResourceTopic,
+    Program,
+)
+from learning_resources.utils import (
+    bulk_resources_unpublished_actions,
+    bulk_resources_upserted_actions,
+)
+from main.utils import now_in_utc
+
+log = logging.getLogger(__name__)
+
+INSTRUCTOR_FIELDS = ["first_name", "last_name"]
+
+
+@dataclasses.dataclass
+class ResourceLoad:
+    """The data for one course or program in a batch, split up by table"""
+
+    readable_id: str
+    platform_code: str
+    resource_data: dict
+    runs_data: list[dict]
+    topics_data: list[dict] | None
+    offered_by_data: dict | None
+    image_data: dict | None
+    departments_data: list[str] | None
+    content_tags_data: list[str] | None = None
+    course_data: dict | None = None
+    duplicate_readable_id: str | None = None
+    unique_field: str = READABLE_ID_FIELD
+    courses: list["ResourceLoad"] = dataclasses.field(default_factory=list)
+    resource: LearningResource | None = None
+
+    @property
+    def key(self):
+        """The platform and readable_id the resource is stored under"""
+        return (self.platform_code, self.readable_id)
+
+
+def parse_course(
+    resource_data: dict,
+    blocklist: list[str],
+    duplicates: list[dict],
+    lookups_version: str | None = None,
+) -> ResourceLoad:
+    """
+    Split up the data for a course the same way load_course does
+
+    Args:
+        resource_data (dict): a dict of course data values
+        blocklist (list of str): list of course ids not to load
+        duplicates (list of dict): list of duplicate course data
+        lookups_version (str): the lookup_tables_version, looked up if not given
+
+    Returns:
+        ResourceLoad: the course data
+    """
+    etl_checksum = resource_checksum(
+        resource_data, blocklist, duplicates, lookups_version
+    )
+    platform_code = resource_data.pop("platform")
+    runs_data = resource_data.pop("runs", [])
+    topics_data = resource_data.pop("topics", None)
+    offered_by_data = resource_data.pop("offered_by", None)
+    image_data = resource_data.pop("image", None)
+    course_data = resource_data.pop("course", None)
+    departments_data = resource_data.pop("departments", [])
+    content_tags_data = resource_data.pop("content_tags", [])
+    resource_data.setdefault("learning_format", [LearningResourceFormat.online.name])
+
+    readable_id = resource_data.pop("readable_id")
+    if readable_id in blocklist or not runs_data:
+        resource_data["published"] = False
+
+    deduplicated_course_id = next(
+        (
+            record["course_id"]
+            for record in duplicates
+            if readable_id in record["duplicate_course_ids"]
+        ),
+        None,
+    )
+    unique_field = resource_data.pop("unique_field", READABLE_ID_FIELD)
+    resource_data["etl_checksum"] = etl_checksum
+    log.info(
+        "Loading course: %s:%s=%s",
+        readable_id,
+        unique_field,
+        resource_data.get(unique_field),
+    )
+    return ResourceLoad(
+        readable_id=deduplicated_course_id or readable_id,
+        platform_code=platform_code,
+        resource_data=resource_data,
+        runs_data=runs_data,
+        topics_data=topics_data,
+        offered_by_data=offered_by_data,
+        image_data=image_data,
+        departments_data=departments_data,
+        content_tags_data=content_tags_data,
+        course_data=course_data,
+        # like load_course, this includes a course with no duplicates itself
+        duplicate_readable_id=(
+            readable_id if readable_id != deduplicated_course_id else None
+        ),
+        unique_field=unique_field,
+    )
+
+
+def parse_program(
+    program_data: dict,
+    blocklist: list[str],
+    duplicates: list[dict],
+    lookups_version: str | None = None,
+) -> ResourceLoad:
+    """
+    Split up the data for a program and its courses the same way load_program does
+
+    Args:
+        program_data (dict): a dict of program data values
+        blocklist (list of str): list of course ids not to load
+        duplicates (list of dict): list of duplicate course data
+        lookups_version (str): the lookup_tables_version, looked up if not given
+
+    Returns:
+        ResourceLoad: the program data
+    """
+    if lookups_version is None:
+        lookups_version = lookup_tables_version()
+    program_data["etl_checksum"] = resource_checksum(
+        program_data, blocklist, duplicates, lookups_version
+    )
+    readable_id = program_data.pop("readable_id")
+    courses_data = program_data.pop("courses")
+    topics_data = program_data.pop("topics", [])
+    runs_data = program_data.pop("runs", [])
+    offered_by_data = program_data.pop("offered_by", None)
+    departments_data = program_data.pop("departments", None)
+    image_data = program_data.pop("image", None)
+    platform_code = program_data.pop("platform")
+    program_data.setdefault("learning_format", [LearningResourceFormat.online.name])
+    return ResourceLoad(
+        readable_id=readable_id,
+        platform_code=platform_code,
+        resource_data=program_data,
+        runs_data=runs_data,
+        topics_data=topics_data,
+        offered_by_data=offered_by_data,
+        image_data=image_data,
+        departments_data=departments_data,
+        content_tags_data=None,
+        courses=[
+            parse_course(course_data, blocklist, duplicates, lookups_version)
+            for course_data in courses_data
+            # skip courses that don't define a readable_id
+            if course_data.get("readable_id", None)
+        ],
+    )
+
+
+def _update_fields(instance, data: dict) -> set[str]:
+    """
+    Set field values on a model instance
+
+    Args:
+        instance (Model): the model instance
+        data (dict): the field values, keyed by field name or attname
+
+    Returns:
+        set of str: the attnames of the fields whose values changed
+    """
+    changed = set()
+    for name, value in data.items():
+        field = instance._meta.get_field(name)  # noqa: SLF001
+        value = field.to_python(value)  # noqa: PLW2901
+        if instance.pk is None or getattr(instance, field.attname) != value:
+            setattr(instance, field.attname, value)
+            changed.add(field.attname)
+    return changed
+
+
+def _field_values(instance) -> dict:
+    """Get the values of the concrete fields of a model instance, keyed by attname"""
+    return {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields  # noqa: SLF001
+    }
+
+
+def _bulk_update(model, changed: dict):
+    """
+    Save the changed fields of existing model instances with one query per batch
+
+    Args:
+        model (type): the model class
+        changed (dict): the changed attnames, keyed by model instance
+    """
+    instances = [instance for instance, fields in changed.items() if fields]
+    if not instances:
+        return
+    now = now_in_utc()
+    for instance in instances:
+        instance.updated_on = now
+    fields = set().union(*changed.values())
+    model.objects.bulk_update(instances, [*sorted(fields), "updated_on"])
+
+
+def _set_m2m(related, targets: dict, through_defaults: dict | None = None):
+    """
+    Set a many-to-many relation for many objects at once, with the same result as
+    calling set() on each of them
+
+    Args:
+        related (ManyToManyDescriptor): the relation, e.g. LearningResource.topics
+        targets (dict): the ids of the related objects, keyed by object id
+        through_defaults (dict): values for the other fields of new through rows
+    """
+    if not targets:
+        return
+    through = related.through
+    source = f"{related.field.m2m_field_name()}_id"
+    target = f"{related.field.m2m_reverse_field_name()}_id"
+    targets = {
+        source_id: list(dict.fromkeys(target_ids))
+        for source_id, target_ids in targets.items()
+    }
+
+    existing = defaultdict(set)
+    stale = []
+    for pk, source_id, target_id in through.objects.filter(
+        **{f"{source}__in": targets}
+    ).values_list("pk", source, target):
+        if target_id in targets[source_id]:
+            existing[source_id].add(target_id)
+        else:
+            stale.append(pk)
+    if stale:
+        through.objects.filter(pk__in=stale).delete()
+    through.objects.bulk_create(
+        [
+            through(
+                **{source: source_id, target: target_id}, **(through_defaults or {})
+            )
+            for source_id, target_ids in targets.items()
+            for target_id in target_ids
+            if target_id not in existing[source_id]
+        ]
+    )
+
+
+def _get_or_create_content_tags(names: set[str]) -> dict:
+    """
+    Get or create content tags by name. Tags created by a concurrent load in the
+    meantime are read back instead of failing on the unique name.
+
+    Args:
+        names (set of str): the content tag names
+
+    Returns:
+        dict: the LearningResourceContentTags, keyed by name
+    """
+    tags = LearningResourceContentTag.objects.in_bulk(names, field_name="name")
+    new_names = names - tags.keys()
+    if new_names:
+        LearningResourceContentTag.objects.bulk_create(
+            [LearningResourceContentTag(name=name) for name in new_names],
+            ignore_conflicts=True,
+        )
+        tags.update(
+            LearningResourceContentTag.objects.in_bulk(new_names, field_name="name")
+        )
+    return tags
+
+
+def _instructor_full_name(instructor_data: dict) -> str:
+    """Get the full name of an instructor the same way load_instructors does"""
+    return (
+        instructor_data.get("full_name", "")
+        or f"{instructor_data.get('first_name') or ''} "
+        f"{instructor_data.get('last_name') or ''}"
+    ).strip()
+
+
+def _image_key(image_data: dict) -> tuple:
+    """Get the fields an image is looked up by in load_image"""
+    return (
+        image_data.get("url"),
+        image_data.get("description"),
+        image_data.get("alt"),
+    )
+
+
+class LearningResourceBulkLoader:
+    """
+    Load a batch of courses or programs with a fixed number of queries, leaving
+    the database the way calling load_course or load_program on each would.
+
+    Lookup tables are loaded once per batch. Resources and runs are diffed against
+    the existing rows and written with bulk_create/bulk_update, and many-to-many
+    relations are set with one delete and one insert per relation.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self, resource_type, loads, platforms, *, prune, skip_unchanged
+    ):
+        """
+        Set up a loader, skipping the loads for unknown platforms
+
+        Args:
+            resource_type (str): the resource type of the loads
+            loads (list of ResourceLoad): the resources to load
+            platforms (dict): the LearningResourcePlatforms, keyed by code
+            prune (bool): whether to unpublish runs missing from the data
+            skip_unchanged (bool): whether to skip resources whose data matches
+                the checksum stored when they were last loaded
+        """
+        self.resource_type = resource_type
+        self.prune = prune
+        self.skip_unchanged = skip_unchanged
+        self.platforms = platforms
+        self.loads = [load for load in loads if self._has_platform(load)]
+        self.published = {}
+        self.created_ids = set()
+        self.unchanged_ids = set()
+        self.unpublished_ids = defaultdict(set)
+
+    def _has_platform(self, load):
+        """Log an error like the single loaders do if the platform doesn't exist"""
+        if load.platform_code in self.platforms:
+            return True
+        log.exception(
+            "Platform %s is null or not in database: %s",
+            load.platform_code,
+            json.dumps(
+                load.duplicate_readable_id or load.readable_id
+                if self.resource_type == LearningResourceType.course.name
+                else load.resource_data
+            ),
+        )
+        return False
+
+    def load(self):
+        """
+        Write the batch to the database, one wave of distinct resources at a time
+        so that resources which appear more than once are loaded in order
+
+        Returns:
+            list of LearningResource: the loaded resources, in the order of the loads
+        """
+        loads = self._skip_unchanged() if self.skip_unchanged else self.loads
+        self._load_lookups(loads)
+        waves = []
+        occurrences = defaultdict(int)
+        for load in loads:
+            if occurrences[load.key] == len(waves):
+                waves.append([])
+            waves[occurrences[load.key]].append(load)
+            occurrences[load.key] += 1
+        for wave in waves:
+            self._load_wave(wave)
+        return [load.resource for load in self.loads]
+
+    def _skip_unchanged(self):
+        """
+        Set the resource of each load whose data matches the checksum stored when
+        the resource was last loaded, like load_course and load_program do
+
+        Returns:
+            list of ResourceLoad: the loads that need to be written
+        """
+        keys = {load.key for load in self.loads}
+        resources = {
+            (resource.platform_id, resource.readable_id): resource
+            for resource in LearningResource.objects.filter(
+                resource_type=self.resource_type,
+                platform_id__in={platform for platform, _ in keys},
+                readable_id__in={readable_id for _, readable_id in keys},
+                etl_checksum__isnull=False,
+            )
+        }
+        changed_keys = set()
+        changed_loads = []
+        for load in self.loads:
+            resource = resources.get(load.key)
+            if (
+                load.key not in changed_keys
+                and resource
+                and resource.etl_checksum == load.resource_data["etl_checksum"]
+            ):
+                log.debug("%s %s is unchanged, skipping", *load.key)
+                load.resource = resource
+                self.unchanged_ids.add(resource.id)
+            else:
+                changed_keys.add(load.key)
+                changed_loads.append(load)
+        return changed_loads
+
+    def _load_lookups(self, loads):
+        """Load the lookup tables, creating the tags, instructors and images needed"""
+        self.offerors = list(LearningResourceOfferor.objects.order_by("code"))
+        self.topic_ids = {}
+        self.topic_parents = {}
+        for topic_id, name, parent_id in LearningResourceTopic.objects.order_by(
+            "id"
+        ).values_list("id", "name", "parent_id"):
+            self.topic_ids.setdefault(name, topic_id)
+            self.topic_parents[topic_id] = parent_id
+        department_ids = {
+            department_id
+            for load in loads
+            for department_id in load.departments_data or []
+        }
+        missing_ids = department_ids - set(
+            LearningResourceDepartment.objects.filter(
+                department_id__in=department_ids
+            ).values_list("department_id", flat=True)
+        )
+        if missing_ids:
+            msg = f"LearningResourceDepartments {sorted(missing_ids)} do not exist"
+            raise LearningResourceDepartment.DoesNotExist(msg)
+        self.content_tags = self._load_content_tags(loads)
+        self.instructors = self._load_instructors(loads)
+        self.images = self._load_images(loads)
+
+    def _load_content_tags(self, loads):
+        """Get or create the content tags of the batch, keyed by name"""
+        return _get_or_create_content_tags(
+            {name for load in loads for name in load.content_tags_data or []}
+        )
+
+    def _load_instructors(self, loads):
+        """
+        Update or create the instructors of the batch, keyed by full name.
+        Instructors created by a concurrent load in the meantime are read back
+        and updated instead of failing on the unique full name.
+        """
+        values = {}
+        for load in loads:
+            for run_data in load.runs_data:
+                for instructor_data in run_data.get("instructors", []):
+                    full_name = _instructor_full_name(instructor_data)
+                    if full_name:
+                        values.setdefault(full_name, {}).update(
+                            {
+                                key: value
+                                for key, value in instructor_data.items()
+                                if value and key in INSTRUCTOR_FIELDS
+                            }
+                        )
+        instructors = LearningResourceInstructor.objects.in_bulk(
+            values, field_name="full_name"
+        )
+        changed = {}
+        new_instructors = []
+        for full_name, instructor_values in values.items():
+            instructor = instructors.get(full_name)
+            if instructor is None:
+                new_instructors.append(
+                    LearningResourceInstructor(full_name=full_name, **instructor_values)
+                )
+            else:
+                changed[instructor] = _update_fields(instructor, instructor_values)
+        if new_instructors:
+            LearningResourceInstructor.objects.bulk_create(
+                new_instructors, ignore_conflicts=True
+            )
+            for full_name, instructor in LearningResourceInstructor.objects.in_bulk(
+                [instructor.full_name for instructor in new_instructors],
+                field_name="full_name",
+            ).items():
+                instructors[full_name] = instructor
+                changed[instructor] = _update_fields(instructor, values[full_name])
+        _bulk_update(LearningResourceInstructor, changed)
+        return instructors
+
+    def _load_images(self, loads):
+        """Get or create the images of the batch, keyed by url, description and alt"""
+        keys = {
+            _image_key(image_data)
+            for load in loads
+            for image_data in [
+                load.image_data,
+                *[run_data.get("image") for run_data in load.runs_data],
+            ]
+            if image_data
+        }
+        images = {}
+        for image in LearningResourceImage.objects.filter(
+            url__in={key[0] for key in keys}
+        ).order_by("id"):
+            images.setdefault((image.url, image.description, image.alt), image)
+        new_images = LearningResourceImage.objects.bulk_create(
+            [
+                LearningResourceImage(url=url, description=description, alt=alt)
+                for url, description, alt in keys
+                if (url, description, alt) not in images
+            ]
+        )
+        for image in new_images:
+            images[(image.url, image.description, image.alt)] = image
+        return images
+
+    def _image_id(self, image_data):
+        """Get the id of the image for some image data, if any"""
+        return self.images[_image_key(image_data)].id if image_data else None
+
+    def _offeror_code(self, offered_by_data):
+        """Get the code of the offeror matching some offered_by data, if any"""
+        if offered_by_data is None:
+            return None
+        return next(
+            (
+                offeror.code
+                for offeror in self.offerors
+                if all(
+                    getattr(offeror, key) == value
+                    for key, value in offered_by_data.items()
+                )
+            ),
+            None,
+        )
+
+    def _topic_ids(self, load):
+        """Get the ids of the topics named in the data, skipping unknown ones"""
+        topic_ids = []
+        for topic_data in load.topics_data:
+            topic_id = self.topic_ids.get(topic_data["name"])
+            if topic_id:
+                topic_ids.append(topic_id)
+            else:
+                log.warning(
+                    "Skipped adding topic %s to resource %s",
+                    topic_data["name"],
+                    load.resource,
+                )
+        return topic_ids
+
+    def _with_parent_topics(self, topic_ids):
+        """Add the ancestors of some topics to them"""
+        topic_ids = list(topic_ids)
+        for topic_id in topic_ids:
+            parent_id = self.topic_parents.get(topic_id)
+            if parent_id and parent_id not in topic_ids:
+                topic_ids.append(parent_id)
+        return topic_ids
+
+    def _load_wave(self, loads):
+        """
+        Load resources with distinct keys
+
+        Args:
+            loads (list of ResourceLoad): the resources to load
+        """
+        is_course = self.resource_type == LearningResourceType.course.name
+        keys = {load.key for load in loads}
+        # every existing row a load might change, so that each is changed in memory
+        # by the loads in order and then saved once
+        instances = {
+            resource.id: resource
+            for resource in LearningResource.objects.select_for_update().filter(
+                resource_type=self.resource_type,
+                platform_id__in={platform for platform, _ in keys},
+                readable_id__in={readable_id for _, readable_id in keys},
+            )
+        }
+        duplicates = {}
+        if is_course:
+            duplicates, candidates = self._load_unpublish_candidates(loads)
+            for resource in [*duplicates.values(), *candidates]:
+                instances.setdefault(resource.id, resource)
+            duplicates = {
+                key: instances[resource.id] for key, resource in duplicates.items()
+            }
+        original_values = {
+            resource.id: _field_values(resource) for resource in instances.values()
+        }
+        resources = {
+            (resource.platform_id, resource.readable_id): resource
+            for resource in instances.values()
+            if resource.resource_type == self.resource_type
+        }
+        new_resources = []
+
+        for load in loads:
+            for resource in self._duplicates(
+                load, duplicates, [*instances.values(), *new_resources]
+            ):
+                self._unpublish(resource, keys)
+
+            resource = resources.get(load.key)
+            if resource is None:
+                resource = LearningResource(
+                    readable_id=load.readable_id,
+                    platform_id=load.platform_code,
+                    resource_type=self.resource_type,
+                )
+                resources[load.key] = resource
+                new_resources.append(resource)
+            _update_fields(
+                resource,
+                {
+                    **load.resource_data,
+                    "offered_by_id": self._offeror_code(load.offered_by_data),
+                    "image_id": self._image_id(load.image_data),
+                },
+            )
+            load.resource = resource
+
+        LearningResource.objects.bulk_create(new_resources)
+        _bulk_update(
+            LearningResource,
+            {
+                resource: {
+                    name
+                    for name, value in _field_values(resource).items()
+                    if value != original_values[resource.id][name]
+                }
+                for resource in instances.values()
+            },
+        )
+        self.created_ids.update(resource.id for resource in new_resources)
+
+        self._load_runs(loads, instances)
+        self._load_next_start_dates(loads)
+        self._load_relations(loads, is_course=is_course)
+        for load in loads:
+            self.published[load.resource.id] = load.resource.published
+
+    def _load_unpublish_candidates(self, loads):
+        """
+        Load the existing resources that loading courses could unpublish: the
+        duplicates being replaced and the courses sharing a unique field value
+
+        Args:
+            loads (list of ResourceLoad): the course loads
+
+        Returns:
+            tuple of (dict, list): the duplicates keyed by platform and readable_id,
+                and the unique field candidates
+        """
+        platform_codes = {load.platform_code for load in loads}
+        duplicates = {}
+        duplicate_ids = {
+            load.duplicate_readable_id for load in loads if load.duplicate_readable_id
+        }
+        if duplicate_ids:
+            for resource in (
+                LearningResource.objects.select_for_update()
+                .filter(platform_id__in=platform_codes, readable_id__in=duplicate_ids)
+                .order_by("id")
+            ):
+                duplicates.setdefault(
+                    (resource.platform_id, resource.readable_id), resource
+                )
+
+        unique_values = defaultdict(set)
+        for load in loads:
+            if load.unique_field != READABLE_ID_FIELD:
+                unique_values[load.unique_field].add(
+                    load.resource_data.get(load.unique_field)
+                )
+        candidates = [
+            resource
+            for field, values in unique_values.items()
+            for resource in LearningResource.objects.select_for_update().filter(
+                **{f"{field}__in": values},
+                platform_id__in=platform_codes,
+                resource_type=self.resource_type,
+            )
+        ]
+        return duplicates, candidates
+
+    def _duplicates(self, load, duplicates, resources):
+        """
+        Get the resources that load_course would unpublish before loading a course:
+        the duplicate it replaces, and the other courses sharing its unique field value
+
+        Args:
+            load (ResourceLoad): the course load
+            duplicates (dict): the duplicates, keyed by platform and readable_id
+            resources (list of LearningResource): the resources as loaded so far
+
+        Returns:
+            list of LearningResource: the resources to unpublish
+        """
+        unpublish = []
+        if load.duplicate_readable_id:
+            duplicate = duplicates.get((load.platform_code, load.duplicate_readable_id))
+            if duplicate:
+                unpublish.append(duplicate)
+        if load.unique_field != READABLE_ID_FIELD:
+            value = load.resource_data.get(load.unique_field)
+            unpublish.extend(
+                resource
+                for resource in resources
+                if resource.platform_id == load.platform_code
+                and resource.resource_type == self.resource_type
+                and getattr(resource, load.unique_field) == value
+                and resource.readable_id != load.readable_id
+            )
+        return unpublish
+
+    def _unpublish(self, resource, keys):
+        """
+        Unpublish a resource found to be a duplicate of one being loaded
+
+        Args:
+            resource (LearningResource): the resource to unpublish
+            keys (set of tuple): the keys of the resources being loaded
+        """
+        resource.published = False
+        resource.etl_checksum = None
+        if (
+            resource.resource_type != self.resource_type
+            or (resource.platform_id, resource.readable_id) not in keys
+        ):
+            self.unpublished_ids[resource.resource_type].add(resource.id)
+
+    def _load_runs(self, loads, instances):
+        """
+        Update or create the runs of the resources, and set their instructors
+
+        Args:
+            loads (list of ResourceLoad): the loads, with their saved resources
+            instances (dict): the resources which existed before the batch, by id
+        """
+        existing_runs = defaultdict(dict)
+        for run in LearningResourceRun.objects.select_for_update().filter(
+            learning_resource_id__in=[
+                load.resource.id for load in loads if load.resource.id in instances
+            ]
+        ):
+            existing_runs[run.learning_resource_id][run.run_id] = run
+        changed = {}
+        new_runs = []
+        instructors = []
+
+        for load in loads:
+            runs = existing_runs[load.resource.id]
+            run_ids = []
+            for run_data in load.runs_data:
+                run_id = run_data.pop("run_id")
+                image_data = run_data.pop("image", None)
+                instructors_data = run_data.pop("instructors", [])
+                run = runs.get(run_id)
+                if run is None:
+                    run = LearningResourceRun(
+                        learning_resource=load.resource, run_id=run_id
+                    )
+                    runs[run_id] = run
+                    new_runs.append(run)
+                fields = _update_fields(
+                    run, {**run_data, "image_id": self._image_id(image_data)}
+                )
+                if run.id:
+                    changed[run] = changed.get(run, set()) | fields
+                instructors.append(
+                    (
+                        run,
+                        [
+                            self.instructors[full_name].id
+                            for full_name in map(
+                                _instructor_full_name, instructors_data
+                            )
+                            if full_name
+                        ],
+                    )
+                )
+                run_ids.append(run_id)
+
+            if self.prune:
+                # mark runs no longer included here as unpublished
+                for run_id, run in runs.items():
+                    if run_id not in run_ids and run.published:
+                        run.published = False
+                        changed.setdefault(run, set()).add("published")
+
+        LearningResourceRun.objects.bulk_create(new_runs)
+        _bulk_update(LearningResourceRun, changed)
+        _set_m2m(
+            LearningResourceRun.instructors,
+            {run.id: instructor_ids for run, instructor_ids in instructors},
+        )
+
+    def _load_next_start_dates(self, loads):
+        """
+        Set the next start date of the resources from their saved runs
+
+        Args:
+            loads (list of ResourceLoad): the loads, with their saved resources
+        """
+        next_start_dates = dict(
+            LearningResourceRun.objects.filter(
+                learning_resource_id__in=[load.resource.id for load in loads],
+                published=True,
+                start_date__gt=timezone.now(),
+            )
+            .values("learning_resource_id")
+            .annotate(next_start_date=Min("start_date"))
+            .values_list("learning_resource_id", "next_start_date")
+        )
+        _bulk_update(
+            LearningResource,
+            {
+                load.resource: _update_fields(
+                    load.resource,
+                    {"next_start_date": next_start_dates.get(load.resource.id)},
+                )
+                for load in loads
+            },
+        )
+
+    def _load_relations(self, loads, *, is_course):
+        """
+        Set the topics, departments, content tags and children of the resources, and
+        create their Course or Program rows
+
+        Args:
+            loads (list of ResourceLoad): the loads, with their saved resources
+            is_course (bool): whether the loads are courses
+        """
+        resource_ids = [load.resource.id for load in loads]
+        topics = {
+            load.resource.id: self._topic_ids(load)
+            for load in loads
+            if load.topics_data is not None
+        }
+        if is_course:
+            missing_ids = [
+                resource_id for resource_id in resource_ids if resource_id not in topics
+            ]
+            for resource_id, topic_id in LearningResource.topics.through.objects.filter(
+                learningresource_id__in=missing_ids
+            ).values_list("learningresource_id", "learningresourcetopic_id"):
+                topics.setdefault(resource_id, []).append(topic_id)
+            topics = {
+                resource_id: self._with_parent_topics(topic_ids)
+                for resource_id, topic_ids in topics.items()
+            }
+        _set_m2m(LearningResource.topics, topics)
+
+        _set_m2m(
+            LearningResource.departments,
+            {
+                load.resource.id: load.departments_data
+                for load in loads
+                if load.departments_data
+            },
+        )
+        _set_m2m(
+            LearningResource.content_tags,
+            {
+                load.resource.id: [
+                    self.content_tags[name].id for name in load.content_tags_data
+                ]
+                for load in loads
+                if load.content_tags_data is not None
+            },
+        )
+
+        model = Course if is_course else Program
+        existing_ids = set(
+            model.objects.filter(learning_resource_id__in=resource_ids).values_list(
+                "learning_resource_id", flat=True
+            )
+        )
+        model.objects.bulk_create(
+            [
+                model(learning_resource=load.resource, **(load.course_data or {}))
+                for load in loads
+                if load.resource.id not in existing_ids
+            ]
+        )
+        if not is_course:
+            _set_m2m(
+                LearningResource.resources,
+                {
+                    load.resource.id: [
+                        course.resource.id for course in load.courses if course.resource
+                    ]
+                    for load in loads
+                },
+                through_defaults={
+                    "relation_type": LearningResourceRelationTypes.PROGRAM_COURSES
+                },
+            )
+
+    def counts(self):
+        """
+        Count the new, changed and unchanged resources in the batch
+
+        Returns:
+            Counter: the number of resources of each kind
+        """
+        loaded_ids = set(self.published)
+        return Counter(
+            new=len(self.created_ids),
+            changed=len(loaded_ids - self.created_ids),
+            unchanged=len(self.unchanged_ids - loaded_ids),
+        )
+
+    def update_index(self):
+        """
+        Upsert or remove the loaded resources from the search index, with one
+        hook call per resource type
+        """
+        for resource_id, published in self.published.items():
+            if not published and resource_id not in self.created_ids:
+                self.unpublished_ids[self.resource_type].add(resource_id)
+        for resource_type, resource_ids in self.unpublished_ids.items():
+            bulk_resources_unpublished_actions(sorted(resource_ids), resource_type)
+        upserted_ids = sorted(
+            resource_id
+            for resource_id, published in self.published.items()
+            if published
+        )
+        if upserted_ids:
+            bulk_resources_upserted_actions(
+                upserted_ids,
+                self.resource_type,
+                [
+                    resource_id
+                    for resource_id in upserted_ids
+                    if resource_id in self.created_ids
+                ],
+            )
+
+
+def bulk_load_courses(
+    courses_data: list[dict],
+    blocklist: list[str],
+    duplicates: list[dict],
+    *,
+    config=CourseLoaderConfig(),
+    summary: Counter | None = None,
+) -> list[LearningResource]:
+    """
+    Load a batch of courses in one transaction
+
+    Args:
+        courses_data (list of dict): the course data values
+        blocklist (list of str): list of course ids not to load
+        duplicates (list of dict): list of duplicate course data
+        config (CourseLoaderConfig): configuration on how to load the courses
+        summary (Counter): if given, updated with the new, changed and
+            unchanged course counts
+
+    Returns:
+        list of LearningResource: the created/updated courses
+    """
+    lookups_version = lookup_tables_version()
+    loader = LearningResourceBulkLoader(
+        LearningResourceType.course.name,
+        [
+            parse_course(course_data, blocklist, duplicates, lookups_version)
+            for course_data in courses_data
+        ],
+        LearningResourcePlatform.objects.in_bulk(),
+        prune=config.prune,
+        skip_unchanged=config.skip_unchanged,
+    )
+    with transaction.atomic():
+        courses = loader.load()
+    loader.update_index()
+    if summary is not None:
+        summary.update(loader.counts())
+    return courses
+
+
+def bulk_load_programs(
+    programs_data: list[dict],
+    blocklist: list[str],
+    duplicates: list[dict],
+    *,
+    config=ProgramLoaderConfig(),
+    summary: Counter | None = None,
+) -> list[LearningResource]:
+    """
+    Load a batch of programs and their courses in one transaction
+
+    Args:
+        programs_data (list of dict): the program data values
+        blocklist (list of str): list of course ids not to load
+        duplicates (list of dict): list of duplicate course data
+        config (ProgramLoaderConfig): configuration on how to load the programs
+        summary (Counter): if given, updated with the new, changed and
+            unchanged program counts
+
+    Returns:
+        list of LearningResource: the created/updated programs
+    """
+    platforms = LearningResourcePlatform.objects.in_bulk()
+    lookups_version = lookup_tables_version()
+    program_loader = LearningResourceBulkLoader(
+        LearningResourceType.program.name,
+        [
+            parse_program(program_data, blocklist, duplicates, lookups_version)
+            for program_data in programs_data
+        ],
+        platforms,
+        prune=config.prune,
+        skip_unchanged=config.skip_unchanged,
+    )
+    course_loader = LearningResourceBulkLoader(
+        LearningResourceType.course.name,
+        [course for program in program_loader.loads for course in program.courses],
+        platforms,
+        prune=config.courses.prune,
+        skip_unchanged=config.courses.skip_unchanged,
+    )
+    with transaction.atomic():
+        course_loader.load()
+        programs = program_loader.load()
+    course_loader.update_index()
+    program_loader.update_index()
+    if summary is not None:
+        summary.update(program_loader.counts())
+    return programs
+
+
+def bulk_load_content_files(
+    course_run: LearningResourceRun, content_files_data: list[dict]
+) -> list[int]:
+    """
+    Load a batch of content files for a course run in one transaction, with the
+    same result as calling load_content_file on each of them
+
+    Args:
+        course_run (LearningResourceRun): the run the content files belong to
+        content_files_data (list of dict): the content file data values
+
+    Returns:
+        list of int: the ids of the created/updated content files, in order
+    """
+    files_data = {}
+    tags_data = {}
+    for content_file_data in content_files_data:
+        file_data = {**content_file_data}
+        key = file_data.get("key")
+        tags_data[key] = file_data.pop("content_tags", [])
+        files_data[key] = file_data
+
+    content_files = {
+        content_file.key: content_file
+        for content_file in ContentFile.objects.filter(
+            run=course_run, key__in=files_data
+        )
+    }
+    new_files = []
+    changed = {}
+    for key, file_data in files_data.items():
+        content_file = content_files.get(key) or ContentFile(run=course_run)
+        fields = _update_fields(content_file, file_data)
+        if content_file.pk is None:
+            content_files[key] = content_file
+            new_files.append(content_file)
+        else:
+            changed[content_file] = fields
+
+    with transaction.atomic():
+        tags = _get_or_create_content_tags(
+            {name for names in tags_data.values() for name in names or []}
+        )
+        ContentFile.objects.bulk_create(new_files)
+        _bulk_update(ContentFile, changed)
+        # load_content_file saved every file, and OCW compares updated_on
+        # with the S3 LastModified of a file to decide whether to reparse it
+        ContentFile.objects.filter(
+            id__in=[
+                content_file.id
+                for content_file, fields in changed.items()
+                if not fields
+            ]
+        ).update(updated_on=now_in_utc())
+        _set_m2m(
+            ContentFile.content_tags,
+            {
+                content_files[key].id: [tags[name].id for name in names]
+                for key, names in tags_data.items()
+                if names is not None
+            },
+        )
+    return [
+        content_files[content_file_data.get("key")].id
+        for content_file_data in content_files_data
+    ]
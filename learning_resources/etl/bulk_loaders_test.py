@@ -0,0 +1,505 @@
+"""Tests for the set-based ETL loaders"""
+
+# pylint: disable=redefined-outer-name
+from collections import Counter
+from contextlib import contextmanager
+from copy import deepcopy
+from datetime import timedelta
+
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from learning_resources.constants import LearningResourceType
+from learning_resources.etl.bulk_loaders import (
+    bulk_load_content_files,
+    bulk_load_courses,
+    bulk_load_programs,
+)
+from learning_resources.etl.constants import CourseLoaderConfig, ProgramLoaderConfig
+from learning_resources.etl.loaders import (
+    load_content_file,
+    load_course,
+    load_program,
+)
+from learning_resources.factories import (
+    ContentFileFactory,
+    CourseFactory,
+    LearningResourceContentTagFactory,
+    LearningResourceDepartmentFactory,
+    LearningResourceOfferorFactory,
+    LearningResourcePlatformFactory,
+    LearningResourceRunFactory,
+    LearningResourceTopicFactory,
+)
+from learning_resources.models import (
+    ContentFile,
+    LearningResource,
+    LearningResourceContentTag,
+    LearningResourceInstructor,
+)
+from main.utils import now_in_utc
+
+pytestmark = pytest.mark.django_db
+
+
+class Rollback(Exception):  # noqa: N818
+    """Raised to roll back a savepoint"""
+
+
+@pytest.fixture(autouse=True)
+def mock_plugin_manager(mocker):
+    """Mock the plugin manager used by the index hooks"""
+    return mocker.patch("learning_resources.utils.get_plugin_manager").return_value
+
+
+@pytest.fixture()
+def platform():
+    """Return a platform for the loaded resources"""
+    return LearningResourcePlatformFactory.create()
+
+
+def _courses_data(platform, count=3):
+    """Return course data for a new course, an existing course and a duplicate"""
+    offeror = LearningResourceOfferorFactory.create()
+    parent_topic = LearningResourceTopicFactory.create()
+    topic = LearningResourceTopicFactory.create(parent=parent_topic)
+    department = LearningResourceDepartmentFactory.create()
+    existing = CourseFactory.create(
+        platform=platform.code, learning_resource__runs=[]
+    ).learning_resource
+    LearningResourceRunFactory.create(learning_resource=existing, published=True)
+    duplicate = CourseFactory.create(platform=platform.code).learning_resource
+    same_url = CourseFactory.create(platform=platform.code).learning_resource
+    start_date = now_in_utc() + timedelta(days=10)
+    courses_data = [
+        {
+            "readable_id": f"course-{index}",
+            "platform": platform.code,
+            "title": f"Course {index}",
+            "url": f"https://test.edu/course-{index}",
+            "published": True,
+            "offered_by": {"name": offeror.name},
+            "image": {"url": "https://test.edu/image.jpg", "alt": "alt"},
+            "topics": [{"name": topic.name}, {"name": "missing"}],
+            "departments": [department.department_id],
+            "content_tags": ["tag1", f"tag-{index}"],
+            "runs": [
+                {
+                    "run_id": f"course-{index}-run-{run}",
+                    "title": f"Run {run}",
+                    "published": True,
+                    "start_date": start_date + timedelta(days=run),
+                    "instructors": [
+                        {"first_name": "Jane", "last_name": "Doe"},
+                        {"full_name": f"Instructor {index}"},
+                    ],
+                }
+                for run in range(2)
+            ],
+        }
+        for index in range(count)
+    ]
+    courses_data.extend(
+        [
+            {
+                "readable_id": existing.readable_id,
+                "platform": platform.code,
+                "title": "Updated title",
+                "published": True,
+                "runs": [{"run_id": "new-run", "published": True}],
+            },
+            {
+                "readable_id": "deduplicated",
+                "platform": platform.code,
+                "title": "Deduplicated course",
+                "published": True,
+                "runs": [{"run_id": "dedup-run", "published": True}],
+            },
+            {
+                "readable_id": "unique-url",
+                "platform": platform.code,
+                "title": "Course with a unique url",
+                "url": same_url.url,
+                "unique_field": "url",
+                "published": True,
+                "runs": [{"run_id": "url-run", "published": True}],
+            },
+            {
+                "readable_id": "blocklisted",
+                "platform": platform.code,
+                "title": "Blocklisted course",
+                "published": True,
+                "runs": [{"run_id": "blocked-run", "published": True}],
+            },
+            {"readable_id": "no-runs", "platform": platform.code, "runs": []},
+            {"readable_id": "bad-platform", "platform": "bad", "runs": []},
+        ]
+    )
+    duplicates = [
+        {
+            "course_id": "deduplicated",
+            "duplicate_course_ids": ["deduplicated", duplicate.readable_id],
+        }
+    ]
+    return courses_data, ["blocklisted"], duplicates
+
+
+def _snapshot():
+    """Return the loaded resources in a form that doesn't depend on their ids"""
+    return {
+        (resource.platform_id, resource.readable_id): {
+            "title": resource.title,
+            "url": resource.url,
+            "published": resource.published,
+            "learning_format": resource.learning_format,
+            "next_start_date": resource.next_start_date,
+            "etl_checksum": resource.etl_checksum,
+            "offered_by": resource.offered_by_id,
+            "image": resource.image and (resource.image.url, resource.image.alt),
+            "topics": sorted(topic.name for topic in resource.topics.all()),
+            "departments": sorted(
+                department.department_id for department in resource.departments.all()
+            ),
+            "content_tags": sorted(tag.name for tag in resource.content_tags.all()),
+            "has_course": hasattr(resource, "course"),
+            "has_program": hasattr(resource, "program"),
+            "children": sorted(
+                (relation.child.readable_id, relation.relation_type)
+                for relation in resource.children.all()
+            ),
+            "runs": sorted(
+                (
+                    run.run_id,
+                    run.title,
+                    run.published,
+                    run.start_date,
+                    tuple(
+                        sorted(
+                            instructor.full_name for instructor in run.instructors.all()
+                        )
+                    ),
+                )
+                for run in resource.runs.all()
+            ),
+        }
+        for resource in LearningResource.objects.all()
+    } | {
+        "instructors": sorted(
+            LearningResourceInstructor.objects.values_list(
+                "full_name", "first_name", "last_name"
+            )
+        )
+    }
+
+
+@contextmanager
+def _rolled_back():
+    """Roll back whatever the block writes to the database"""
+    try:
+        with transaction.atomic():
+            yield
+            raise Rollback  # noqa: TRY301
+    except Rollback:
+        pass
+
+
+def _sequential_snapshot(load, items, *args, **kwargs):
+    """Load items one at a time, then roll back and return what the database held"""
+    with _rolled_back():
+        for item in deepcopy(items):
+            load(item, *args, **kwargs)
+        snapshot = _snapshot()
+    return snapshot  # noqa: RET504
+
+
+@pytest.mark.parametrize("prune", [True, False])
+def test_bulk_load_courses(mock_plugin_manager, platform, prune):
+    """bulk_load_courses should leave the database the same as load_course does"""
+    courses_data, blocklist, duplicates = _courses_data(platform)
+    readable_ids = [course_data["readable_id"] for course_data in courses_data[:-1]]
+    config = CourseLoaderConfig(prune=prune)
+    expected = _sequential_snapshot(
+        load_course, courses_data, blocklist, duplicates, config=config
+    )
+    mock_plugin_manager.reset_mock()
+
+    resources = bulk_load_courses(courses_data, blocklist, duplicates, config=config)
+
+    assert _snapshot() == expected
+    assert [resource.readable_id for resource in resources] == readable_ids
+    hook = mock_plugin_manager.hook
+    hook.bulk_resources_upserted.assert_called_once()
+    upserted = hook.bulk_resources_upserted.call_args.kwargs
+    assert upserted["resource_type"] == LearningResourceType.course.name
+    assert sorted(upserted["resource_ids"]) == sorted(
+        resource.id for resource in resources if resource.published
+    )
+    assert sorted(upserted["percolate_ids"]) == sorted(
+        resource.id
+        for resource in resources
+        # the existing course is the only one that isn't new
+        if resource.published and resource.readable_id != readable_ids[3]
+    )
+    hook.bulk_resources_unpublished.assert_called_once()
+    hook.resource_upserted.assert_not_called()
+
+
+def test_bulk_load_courses_repeated(platform):
+    """A course that appears twice in a batch should end up with the last data"""
+    courses_data = [
+        {
+            "readable_id": "repeated",
+            "platform": platform.code,
+            "title": title,
+            "published": True,
+            "runs": [{"run_id": title, "published": True}],
+        }
+        for title in ["first", "second"]
+    ]
+    expected = _sequential_snapshot(load_course, courses_data, [], [])
+
+    bulk_load_courses(courses_data, [], [])
+
+    assert _snapshot() == expected
+
+
+def test_bulk_load_courses_unchanged(mock_plugin_manager, platform):
+    """Courses whose data hasn't changed since they were loaded should be skipped"""
+    courses_data = [
+        {
+            "readable_id": f"course-{index}",
+            "platform": platform.code,
+            "title": f"Course {index}",
+            "published": True,
+            "runs": [{"run_id": f"run-{index}", "published": True}],
+        }
+        for index in range(3)
+    ]
+    summary = Counter()
+    bulk_load_courses(deepcopy(courses_data[:2]), [], [], summary=summary)
+    assert summary == Counter(new=2, changed=0, unchanged=0)
+    mock_plugin_manager.reset_mock()
+
+    courses_data[1]["title"] = "New title"
+    summary = Counter()
+    resources = bulk_load_courses(deepcopy(courses_data), [], [], summary=summary)
+
+    assert summary == Counter(new=1, changed=1, unchanged=1)
+    assert [resource.readable_id for resource in resources] == [
+        "course-0",
+        "course-1",
+        "course-2",
+    ]
+    assert resources[1].title == "New title"
+    mock_plugin_manager.hook.bulk_resources_upserted.assert_called_once_with(
+        resource_ids=sorted([resources[1].id, resources[2].id]),
+        resource_type=LearningResourceType.course.name,
+        percolate_ids=[resources[2].id],
+    )
+
+    summary = Counter()
+    bulk_load_courses(
+        deepcopy(courses_data),
+        [],
+        [],
+        config=CourseLoaderConfig(skip_unchanged=False),
+        summary=summary,
+    )
+    assert summary == Counter(new=0, changed=3, unchanged=0)
+
+
+def test_bulk_load_courses_queries(platform):
+    """The number of queries for a batch shouldn't depend on the batch size"""
+    query_counts = []
+    for count in [2, 10]:
+        with _rolled_back():
+            courses_data, blocklist, duplicates = _courses_data(platform, count)
+            with CaptureQueriesContext(connection) as context:
+                bulk_load_courses(courses_data, blocklist, duplicates)
+        query_counts.append(len(context.captured_queries))
+    assert query_counts[0] == query_counts[1]
+
+
+def test_bulk_load_courses_concurrent_lookups(mocker, platform):
+    """Tags and instructors created by a concurrent load shouldn't fail the batch"""
+    for model, values in [
+        (LearningResourceContentTag, {"name": "tag1"}),
+        (LearningResourceInstructor, {"full_name": "Jane Doe"}),
+    ]:
+
+        def concurrent_bulk_create(
+            objs,
+            model=model,
+            values=values,
+            bulk_create=model.objects.bulk_create,
+            **kwargs,
+        ):
+            """Create a conflicting row first, the way a concurrent load would"""
+            model.objects.create(**values)
+            return bulk_create(objs, **kwargs)
+
+        mocker.patch.object(
+            model.objects, "bulk_create", side_effect=concurrent_bulk_create
+        )
+    courses_data, blocklist, duplicates = _courses_data(platform)
+
+    bulk_load_courses(courses_data, blocklist, duplicates)
+
+    resource = LearningResource.objects.get(readable_id="course-0")
+    assert sorted(tag.name for tag in resource.content_tags.all()) == [
+        "tag-0",
+        "tag1",
+    ]
+    instructor = LearningResourceInstructor.objects.get(full_name="Jane Doe")
+    assert (instructor.first_name, instructor.last_name) == ("Jane", "Doe")
+    assert instructor.runs.count() == 6
+
+
+def test_bulk_load_courses_missing_department(platform):
+    """A department that doesn't exist should fail the batch like load_course does"""
+    with pytest.raises(Exception, match="do not exist"):
+        bulk_load_courses(
+            [
+                {
+                    "readable_id": "course",
+                    "platform": platform.code,
+                    "departments": ["missing"],
+                    "runs": [],
+                }
+            ],
+            [],
+            [],
+        )
+    assert not LearningResource.objects.exists()
+
+
+@pytest.mark.parametrize("prune", [True, False])
+def test_bulk_load_programs(mock_plugin_manager, platform, prune):
+    """bulk_load_programs should leave the database the same as load_program does"""
+    courses_data, blocklist, duplicates = _courses_data(platform)
+    retired = CourseFactory.create(platform=platform.code).learning_resource
+    existing_program = LearningResource.objects.create(
+        platform=platform,
+        readable_id="program-0",
+        resource_type=LearningResourceType.program.name,
+        title="Program 0",
+        published=True,
+    )
+    existing_program.resources.add(
+        retired,
+        through_defaults={"relation_type": "PROGRAM_COURSES"},
+    )
+    programs_data = [
+        {
+            "readable_id": f"program-{index}",
+            "platform": platform.code,
+            "title": f"Program {index}",
+            "published": True,
+            "image": {"url": "https://test.edu/program.jpg"},
+            "runs": [{"run_id": f"program-{index}-run", "published": True}],
+            "courses": [*courses_data[index::2], {"platform": platform.code}],
+        }
+        for index in range(2)
+    ]
+    config = ProgramLoaderConfig(prune=prune, courses=CourseLoaderConfig(prune=prune))
+    expected = _sequential_snapshot(
+        load_program, programs_data, blocklist, duplicates, config=config
+    )
+    mock_plugin_manager.reset_mock()
+
+    programs = bulk_load_programs(programs_data, blocklist, duplicates, config=config)
+
+    assert _snapshot() == expected
+    assert [program.readable_id for program in programs] == ["program-0", "program-1"]
+    upserted_types = [
+        call.kwargs["resource_type"]
+        for call in mock_plugin_manager.hook.bulk_resources_upserted.call_args_list
+    ]
+    assert upserted_types == [
+        LearningResourceType.course.name,
+        LearningResourceType.program.name,
+    ]
+
+
+def _content_files_data(run, count=3):
+    """Return content file data for new files, a changed file and an unchanged file"""
+    changed = ContentFileFactory.create(
+        run=run,
+        key="changed",
+        content_tags=[LearningResourceContentTagFactory.create(name="old")],
+    )
+    unchanged = ContentFileFactory.create(run=run, key="unchanged")
+    return [
+        *[
+            {
+                "key": f"file-{index}",
+                "title": f"File {index}",
+                "content": f"Content {index}",
+                "checksum": f"checksum-{index}",
+                "published": True,
+                "content_tags": ["tag1", f"tag-{index}"],
+            }
+            for index in range(count)
+        ],
+        {
+            "key": changed.key,
+            "content": "New content",
+            "content_tags": ["tag1", "new"],
+        },
+        {
+            "key": unchanged.key,
+            "title": unchanged.title,
+            "published": True,
+            "content_tags": None,
+        },
+        {"key": "no-tags", "title": "File without tags"},
+    ]
+
+
+def _content_files_snapshot():
+    """Return the loaded content files in a form that doesn't depend on their ids"""
+    return {
+        content_file.key: {
+            "title": content_file.title,
+            "content": content_file.content,
+            "checksum": content_file.checksum,
+            "published": content_file.published,
+            "content_tags": sorted(tag.name for tag in content_file.content_tags.all()),
+        }
+        for content_file in ContentFile.objects.all()
+    }
+
+
+def test_bulk_load_content_files():
+    """bulk_load_content_files should leave the database the same as load_content_file does"""
+    run = LearningResourceRunFactory.create()
+    content_files_data = _content_files_data(run)
+    with _rolled_back():
+        for content_file_data in deepcopy(content_files_data):
+            load_content_file(run, content_file_data)
+        expected = _content_files_snapshot()
+    unchanged = ContentFile.objects.get(key="unchanged")
+
+    content_file_ids = bulk_load_content_files(run, content_files_data)
+
+    assert _content_files_snapshot() == expected
+    assert content_file_ids == [
+        ContentFile.objects.get(run=run, key=content_file_data["key"]).id
+        for content_file_data in content_files_data
+    ]
+    assert ContentFile.objects.get(key="unchanged").updated_on > unchanged.updated_on
+    assert "content_tags" in content_files_data[0]
+
+
+def test_bulk_load_content_files_queries():
+    """The number of queries for a batch shouldn't depend on the batch size"""
+    query_counts = []
+    for count in [2, 10]:
+        with _rolled_back():
+            run = LearningResourceRunFactory.create()
+            content_files_data = _content_files_data(run, count)
+            with CaptureQueriesContext(connection) as context:
+                bulk_load_content_files(run, content_files_data)
+        query_counts.append(len(context.captured_queries))
+    assert query_counts[0] == query_counts[1]
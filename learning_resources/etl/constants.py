@@ -26,18 +26,19 @@ LearningResourceRunLoaderConfig = namedtuple(  # noqa: PYI024
 
 CourseLoaderConfig = namedtuple(  # noqa: PYI024
     "CourseLoaderConfig",
-    ["prune", "offered_by", "runs"],
-    defaults=[True, OfferedByLoaderConfig(), LearningResourceRunLoaderConfig()],
+    ["prune", "offered_by", "runs", "skip_unchanged"],
+    defaults=[True, OfferedByLoaderConfig(), LearningResourceRunLoaderConfig(), True],
 )
 
 ProgramLoaderConfig = namedtuple(  # noqa: PYI024
     "ProgramLoaderConfig",
-    ["prune", "courses", "offered_by", "runs"],
+    ["prune", "courses", "offered_by", "runs", "skip_unchanged"],
     defaults=[
         True,
         CourseLoaderConfig(),
         OfferedByLoaderConfig(),
         LearningResourceRunLoaderConfig(),
+        True,
     ],
 )
 
@@ -2,17 +2,24 @@
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+from django.conf import settings
+
 from learning_resources.etl.constants import ETLSource
 from learning_resources.etl.loaders import load_content_files
 from learning_resources.etl.utils import (
     calc_checksum,
+    documents_from_olx,
+    extract_olx,
     get_learning_course_bucket,
-    transform_content_files,
+    transform_documents,
 )
 from learning_resources.models import LearningResourceRun
+from main.utils import prefetch
 
 log = logging.getLogger(__name__)
 
@@ -62,12 +69,137 @@ def get_most_recent_course_archives(
         return []
 
 
+@dataclass
+class CourseArchive:
+    """An edx course archive for a run, as it moves through the sync pipeline"""
+
+    key: str
+    run: LearningResourceRun
+    tempdir: TemporaryDirectory | None = None
+    checksum: str | None = None
+    olx_path: str | None = None
+
+    @property
+    def path(self) -> Path:
+        """The path the archive is downloaded to"""
+        return Path(self.tempdir.name, self.key.split("/")[-1])
+
+    @property
+    def extract_path(self) -> Path:
+        """The path the archive is extracted to"""
+        return Path(self.tempdir.name, "olx")
+
+
+def get_archive_run(
+    etl_source: str, ids: list[int], key: str, s3_prefix: str
+) -> LearningResourceRun | None:
+    """
+    Get the published run that an edx course archive belongs to
+
+    Args:
+        etl_source(str): The edx ETL source
+        ids(list of int): list of course ids to process
+        key(str): The S3 key of the archive
+        s3_prefix(str): path prefix to include in regex for S3
+
+    Returns:
+        LearningResourceRun: The run for the archive, if any
+    """
+    matches = re.search(rf"{s3_prefix}/(.+)\.tar\.gz$", key)
+    run_id = matches.group(1)
+    runs = LearningResourceRun.objects.filter(
+        learning_resource__etl_source=etl_source,
+        learning_resource_id__in=ids,
+        published=True,
+    )
+    if etl_source == ETLSource.mit_edx.name:
+        # Additional processing of run ids and tarfile names,
+        # because edx data is a mess of id/file formats
+        run_id = run_id.strip(  # noqa: B005
+            "-course-prod-analytics.xml"
+        )  # suffix on edx tar file basename
+        potential_run_ids = rf"{run_id.replace('-', '.').replace('+', '.')}"
+        runs = runs.filter(run_id__iregex=potential_run_ids)
+    else:
+        runs = runs.filter(run_id=run_id)
+    return runs.first()
+
+
+def download_archive(bucket, archive: CourseArchive) -> CourseArchive:
+    """
+    Download a course archive to a temporary directory and checksum it.
+    This runs on the download threads, so it doesn't touch the database.
+
+    Args:
+        bucket(s3.Bucket): The bucket with the archive
+        archive(CourseArchive): The archive to download
+
+    Returns:
+        CourseArchive: The downloaded archive
+    """
+    archive.tempdir = TemporaryDirectory()
+    try:
+        # boto3 clients are thread safe, unlike resources
+        bucket.meta.client.download_file(bucket.name, archive.key, str(archive.path))
+        archive.checksum = calc_checksum(archive.path)
+    except:
+        archive.tempdir.cleanup()
+        raise
+    return archive
+
+
+def extract_archive(archive: CourseArchive) -> CourseArchive | None:
+    """
+    Untar a course archive next to it, then delete the tarball. The OLX stays
+    on disk until it has been loaded, so its documents can be read one at a time.
+    This runs on the extract threads, so it doesn't touch the database.
+
+    Args:
+        archive(CourseArchive): The downloaded archive
+
+    Returns:
+        CourseArchive: The extracted archive, or None if it couldn't be extracted
+    """
+    try:
+        archive.extract_path.mkdir()
+        archive.olx_path = extract_olx(archive.path, str(archive.extract_path))
+        archive.path.unlink()
+    except:  # noqa: E722
+        log.exception("Error ingesting OLX content data for %s", archive.key)
+        archive.tempdir.cleanup()
+        return None
+    return archive
+
+
+def is_archive_changed(archive: CourseArchive) -> bool:
+    """
+    Check whether an archive differs from the one last synced for its run,
+    deleting it if it doesn't
+
+    Args:
+        archive(CourseArchive): The downloaded archive
+
+    Returns:
+        bool: True if the archive needs to be synced
+    """
+    if archive.run.checksum == archive.checksum:
+        archive.tempdir.cleanup()
+        return False
+    return True
+
+
 def sync_edx_course_files(
     etl_source: str, ids: list[int], keys: list[str], s3_prefix: str | None = None
 ):
     """
     Sync all edx course run files for a list of course ids to database
 
+    Archives go through a pipeline of thread pools: downloading them, extracting
+    their OLX, and passing the OLX documents to tika. Each stage only runs as far
+    ahead of the database writes as it has workers, and documents are read from
+    the extracted OLX as they are loaded, so memory stays flat however many
+    archives there are and however large they are.
+
     Args:
         etl_source(str): The edx ETL source
         ids(list of int): list of course ids to process
@@ -77,37 +209,56 @@ def sync_edx_course_files(
     bucket = get_learning_course_bucket(etl_source)
     if s3_prefix is None:
         s3_prefix = "courses"
+    archives = []
     for key in keys:
-        matches = re.search(rf"{s3_prefix}/(.+)\.tar\.gz$", key)
-        run_id = matches.group(1)
-        runs = LearningResourceRun.objects.filter(
-            learning_resource__etl_source=etl_source,
-            learning_resource_id__in=ids,
-            published=True,
+        run = get_archive_run(etl_source, ids, key, s3_prefix)
+        if run:
+            archives.append(CourseArchive(key=key, run=run))
+
+    download_workers = settings.EDX_CONTENT_DOWNLOAD_WORKERS
+    extract_workers = settings.EDX_CONTENT_EXTRACT_WORKERS
+    tika_workers = settings.EDX_CONTENT_TIKA_WORKERS
+    with (
+        ThreadPoolExecutor(download_workers) as download_executor,
+        ThreadPoolExecutor(extract_workers) as extract_executor,
+        ThreadPoolExecutor(tika_workers) as tika_executor,
+    ):
+        downloads = prefetch(
+            (
+                download_executor.submit(download_archive, bucket, archive)
+                for archive in archives
+            ),
+            size=download_workers,
         )
-        if etl_source == ETLSource.mit_edx.name:
-            # Additional processing of run ids and tarfile names,
-            # because edx data is a mess of id/file formats
-            run_id = run_id.strip(  # noqa: B005
-                "-course-prod-analytics.xml"
-            )  # suffix on edx tar file basename
-            potential_run_ids = rf"{run_id.replace('-', '.').replace('+', '.')}"
-            runs = runs.filter(run_id__iregex=potential_run_ids)
-        else:
-            runs = runs.filter(run_id=run_id)
-        run = runs.first()
-
-        if not run:
-            continue
-        with TemporaryDirectory() as export_tempdir:
-            course_tarpath = Path(export_tempdir, key.split("/")[-1])
-            bucket.download_file(key, course_tarpath)
-            checksum = calc_checksum(course_tarpath)
-            if run.checksum == checksum:
+        changed_archives = (
+            archive
+            for archive in (future.result() for future in downloads)
+            if is_archive_changed(archive)
+        )
+        extracts = prefetch(
+            (
+                extract_executor.submit(extract_archive, archive)
+                for archive in changed_archives
+            ),
+            size=extract_workers,
+        )
+        for future in extracts:
+            archive = future.result()
+            if archive is None:
                 continue
             try:
-                load_content_files(run, transform_content_files(course_tarpath, run))
-                run.checksum = checksum
-                run.save()
+                load_content_files(
+                    archive.run,
+                    transform_documents(
+                        documents_from_olx(archive.olx_path),
+                        archive.run,
+                        executor=tika_executor,
+                        prefetch_size=tika_workers,
+                    ),
+                )
+                archive.run.checksum = archive.checksum
+                archive.run.save()
             except:  # noqa: E722
-                log.exception("Error ingesting OLX content data for %s", key)
+                log.exception("Error ingesting OLX content data for %s", archive.key)
+            finally:
+                archive.tempdir.cleanup()
@@ -11,6 +11,7 @@ from learning_resources.etl.edx_shared import (
     get_most_recent_course_archives,
     sync_edx_course_files,
 )
+from learning_resources.etl.utils import calc_checksum, documents_from_olx
 from learning_resources.factories import CourseFactory, LearningResourceRunFactory
 from learning_resources.models import LearningResourceRun
 
@@ -30,6 +31,7 @@ def test_sync_edx_course_files(  # noqa: PLR0913
     mock_mitxonline_learning_bucket,
     mock_xpro_learning_bucket,
     mocker,
+    settings,
     platform,
     s3_prefix,
     published,
@@ -42,10 +44,22 @@ def test_sync_edx_course_files(  # noqa: PLR0913
     )
     mock_log = mocker.patch("learning_resources.etl.utils.log.exception")
     fake_data = '{"key": "data"}'
+    transformed_documents = []
+
+    def transform_documents(documents, run, **kwargs):
+        """Read the documents while the OLX is extracted"""
+        transformed_documents.append(list(documents))
+        return fake_data
+
     mock_transform = mocker.patch(
-        "learning_resources.etl.edx_shared.transform_content_files",
-        return_value=fake_data,
+        "learning_resources.etl.edx_shared.transform_documents",
+        side_effect=transform_documents,
     )
+    mock_documents = mocker.patch(
+        "learning_resources.etl.edx_shared.documents_from_olx",
+        wraps=documents_from_olx,
+    )
+    settings.EDX_CONTENT_TIKA_WORKERS = 3
     run_ids = ("course-v1:MITxT+8.01.3x+3T2022", "course-v1:MITxT+8.01.4x+3T2022")
     course_ids = []
     bucket = (
@@ -77,16 +91,52 @@ def test_sync_edx_course_files(  # noqa: PLR0913
     assert mock_transform.call_count == (2 if published else 0)
     assert mock_load_content_files.call_count == (2 if published else 0)
     if published:
-        assert (
-            str(mock_transform.call_args[0][0]).endswith(f"{run_ids[1]}.tar.gz") is True
-        )
         for run_id in run_ids:
-            mock_load_content_files.assert_any_call(
-                LearningResourceRun.objects.get(run_id=run_id), fake_data
+            run = LearningResourceRun.objects.get(run_id=run_id)
+            mock_transform.assert_any_call(
+                mocker.ANY, run, executor=mocker.ANY, prefetch_size=3
             )
+            mock_load_content_files.assert_any_call(run, fake_data)
+            assert run.checksum == calc_checksum(f"test_json/{run_id}.tar.gz")
+        for documents in transformed_documents:
+            assert len(documents) > 0
+            assert {"key", "checksum"} <= set(documents[0][1])
+        for call in mock_documents.call_args_list:
+            assert not Path(call.args[0]).exists()
     mock_log.assert_not_called()
 
 
+def test_sync_edx_course_files_unchanged(mock_mitxonline_learning_bucket, mocker):
+    """An archive with the same checksum as the last one synced should be skipped"""
+    run_id = "course-v1:MITxT+8.01.3x+3T2022"
+    archive_path = f"test_json/{run_id}.tar.gz"
+    run = LearningResourceRunFactory.create(
+        run_id=run_id,
+        checksum=calc_checksum(archive_path),
+        learning_resource=CourseFactory.create(
+            platform=PlatformType.mitxonline.name,
+            etl_source=PlatformType.mitxonline.name,
+        ).learning_resource,
+    )
+    bucket = mock_mitxonline_learning_bucket.bucket
+    key = f"20220101/courses/{run_id}.tar.gz"
+    with Path.open(Path(archive_path), "rb") as infile:
+        bucket.put_object(Key=key, Body=infile.read(), ACL="public-read")
+    mocker.patch(
+        "learning_resources.etl.edx_shared.get_learning_course_bucket",
+        return_value=bucket,
+    )
+    mock_extract = mocker.patch("learning_resources.etl.edx_shared.extract_archive")
+    mock_load_content_files = mocker.patch(
+        "learning_resources.etl.edx_shared.load_content_files", autospec=True
+    )
+    sync_edx_course_files(
+        PlatformType.mitxonline.name, [run.learning_resource.id], [key]
+    )
+    mock_extract.assert_not_called()
+    mock_load_content_files.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "platform", [PlatformType.mitxonline.name, PlatformType.xpro.name]
 )
@@ -120,7 +170,7 @@ def test_sync_edx_course_files_invalid_tarfile(
         return_value=[],
     )
     mocker.patch(
-        "learning_resources.etl.edx_shared.transform_content_files",
+        "learning_resources.etl.edx_shared.extract_olx",
         side_effect=CalledProcessError(0, ""),
     )
     mock_log = mocker.patch("learning_resources.etl.edx_shared.log.exception")
@@ -211,13 +261,14 @@ def test_sync_edx_course_files_error(
     fake_data = '{"key": "data"}'
     mock_log = mocker.patch("learning_resources.etl.edx_shared.log.exception")
     mock_transform = mocker.patch(
-        "learning_resources.etl.edx_shared.transform_content_files",
+        "learning_resources.etl.edx_shared.transform_documents",
         return_value=fake_data,
     )
     sync_edx_course_files(platform, [run.learning_resource.id], [key])
     assert mock_transform.call_count == 1
-    assert str(mock_transform.call_args[0][0]).endswith(f"{run.run_id}.tar.gz") is True
     mock_load_content_files.assert_called_once_with(run, fake_data)
+    run.refresh_from_db()
+    assert run.checksum is None
     assert mock_log.call_args[0][0].startswith("Error ingesting OLX content data for ")
 
 
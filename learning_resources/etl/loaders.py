@@ -3,7 +3,9 @@
 import datetime
 import json
 import logging
+from collections import Counter
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.db.models import Q
@@ -15,13 +17,18 @@ from learning_resources.constants import (
     LearningResourceType,
     PlatformType,
 )
+from learning_resources.etl.bulk_loaders import (
+    bulk_load_content_files,
+    bulk_load_courses,
+    bulk_load_programs,
+)
 from learning_resources.etl.constants import (
     READABLE_ID_FIELD,
     CourseLoaderConfig,
     ProgramLoaderConfig,
 )
 from learning_resources.etl.exceptions import ExtractException
-from learning_resources.etl.utils import most_common_topics
+from learning_resources.etl.utils import most_common_topics, resource_checksum
 from learning_resources.models import (
     ContentFile,
     Course,
@@ -45,6 +52,7 @@ from learning_resources.models import (
 from learning_resources.utils import (
     add_parent_topics_to_learning_resource,
     bulk_resources_unpublished_actions,
+    bulk_similar_topics_action,
     load_course_blocklist,
     load_course_duplicates,
     resource_run_unpublished_actions,
@@ -53,6 +61,7 @@ from learning_resources.utils import (
     resource_upserted_actions,
     similar_topics_action,
 )
+from main.utils import chunks
 
 log = logging.getLogger()
 
@@ -73,6 +82,70 @@ def update_index(learning_resource, newly_created):
         resource_upserted_actions(learning_resource, percolate=newly_created)
 
 
+def log_load_summary(etl_source: str, resource_type: str, summary: Counter):
+    """
+    Log how many of the resources loaded for an ETL source were new, changed
+    and unchanged
+
+    Args:
+        etl_source (str): The ETL source of the resources
+        resource_type (str): The resource type of the resources
+        summary (Counter): The new, changed and unchanged counts
+    """
+    log.info(
+        "Loaded %s %ss: %d new, %d changed, %d unchanged",
+        etl_source,
+        resource_type,
+        summary["new"],
+        summary["changed"],
+        summary["unchanged"],
+    )
+
+
+def get_unchanged_resource(
+    platform: LearningResourcePlatform,
+    readable_id: str,
+    resource_type: str,
+    etl_checksum: str,
+) -> LearningResource | None:
+    """
+    Get the resource if it was last loaded from data with the same checksum,
+    in which case loading it again can be skipped
+
+    Args:
+        platform (LearningResourcePlatform): the platform of the resource
+        readable_id (str): the readable_id of the resource
+        resource_type (str): the resource type of the resource
+        etl_checksum (str): the checksum of the data being loaded
+
+    Returns:
+        LearningResource: the unchanged resource, if any
+    """
+    resource = LearningResource.objects.filter(
+        readable_id=readable_id,
+        platform=platform,
+        resource_type=resource_type,
+        etl_checksum=etl_checksum,
+    ).first()
+    if resource:
+        log.info("%s %s is unchanged, skipping", resource_type, readable_id)
+    return resource
+
+
+def unpublish_duplicate(resource: LearningResource):
+    """
+    Unpublish a resource that duplicates one being loaded, clearing its checksum
+    so that it is loaded again if it comes back
+
+    Args:
+        resource (LearningResource): the duplicate resource
+    """
+    resource.published = False
+    resource.etl_checksum = None
+    resource.save()
+    resource_unpublished_actions(resource)
+
+
 def load_topics(resource, topics_data):
     """
     Load the topics for a resource into the database.
@@ -264,6 +337,7 @@ def load_course(
         Course:
             the created/updated course
     """
+    etl_checksum = resource_checksum(resource_data, blocklist, duplicates)
     platform_name = resource_data.pop("platform")
     runs_data = resource_data.pop("runs", [])
     topics_data = resource_data.pop("topics", None)
@@ -286,6 +360,8 @@ def load_course(
         ),
         None,
     )
+    resource_id = deduplicated_course_id or readable_id
+    resource_data["etl_checksum"] = etl_checksum
 
     with transaction.atomic():
         platform = LearningResourcePlatform.objects.filter(code=platform_name).first()
@@ -297,14 +373,20 @@ def load_course(
             )
             return None
 
-        if readable_id != deduplicated_course_id:
-            duplicate_resource = LearningResource.objects.filter(
+        unchanged_resource = config.skip_unchanged and get_unchanged_resource(
+            platform, resource_id, LearningResourceType.course.name, etl_checksum
+        )
+        if unchanged_resource:
+            return unchanged_resource
+
+        duplicate_resource = (
+            readable_id != deduplicated_course_id
+            and LearningResource.objects.filter(
                 platform=platform, readable_id=readable_id
             ).first()
-            if duplicate_resource:
-                duplicate_resource.published = False
-                duplicate_resource.save()
-                resource_unpublished_actions(duplicate_resource)
+        )
+        if duplicate_resource:
+            unpublish_duplicate(duplicate_resource)
 
         unique_field_name = resource_data.pop("unique_field", READABLE_ID_FIELD)
         unique_field_value = resource_data.get(unique_field_name)
@@ -315,7 +397,6 @@ def load_course(
             unique_field_name,
             unique_field_value,
         )
-        resource_id = deduplicated_course_id or readable_id
         if unique_field_name != READABLE_ID_FIELD:
             # Some dupes may result, so we need to unpublish resources
             # with matching unique values and different readable_ids
@@ -324,9 +405,7 @@ def load_course(
                 platform=platform,
                 resource_type=LearningResourceType.course.name,
             ).exclude(readable_id=resource_id):
-                resource.published = False
-                resource.save()
-                resource_unpublished_actions(resource)
+                unpublish_duplicate(resource)
         (
             learning_resource,
             created,
@@ -370,7 +449,8 @@ def load_courses(
     etl_source: str, courses_data: list[dict], *, config=CourseLoaderConfig()
 ) -> list[LearningResource]:
     """
-    Load a list of courses
+    Load a list of courses, in batches of ETL_LOADER_BATCH_SIZE loaded with
+    set-based queries by bulk_load_courses
 
     Args:
         etl_source (str): The ETL source of the course data
@@ -385,24 +465,32 @@ def load_courses(
     blocklist = load_course_blocklist()
     duplicates = load_course_duplicates(etl_source)
 
-    courses_list = list(courses_data or [])
-
-    courses = [
-        course
-        for course in [
-            load_course(course, blocklist, duplicates, config=config)
-            for course in courses_list
-        ]
-        if course is not None
-    ]
+    courses = []
+    summary = Counter()
+    for courses_chunk in chunks(
+        courses_data or [], chunk_size=settings.ETL_LOADER_BATCH_SIZE
+    ):
+        courses.extend(
+            bulk_load_courses(
+                courses_chunk, blocklist, duplicates, config=config, summary=summary
+            )
+        )
+    log_load_summary(etl_source, LearningResourceType.course.name, summary)
 
     if courses and config.prune:
-        for learning_resource in LearningResource.objects.filter(
-            etl_source=etl_source, resource_type=LearningResourceType.course.name
-        ).exclude(id__in=[learning_resource.id for learning_resource in courses]):
-            learning_resource.published = False
-            learning_resource.save()
-            resource_unpublished_actions(learning_resource)
+        courses_to_unpublish = LearningResource.objects.filter(
+            etl_source=etl_source,
+            resource_type=LearningResourceType.course.name,
+            published=True,
+        ).exclude(id__in=[learning_resource.id for learning_resource in courses])
+        unpublished_ids = list(courses_to_unpublish.values_list("id", flat=True))
+        if unpublished_ids:
+            LearningResource.objects.filter(id__in=unpublished_ids).update(
+                published=False, etl_checksum=None
+            )
+            bulk_resources_unpublished_actions(
+                unpublished_ids, LearningResourceType.course.name
+            )
 
     return courses
 
@@ -433,6 +521,9 @@ def load_program(
     """
     # pylint: disable=too-many-locals
 
+    program_data["etl_checksum"] = resource_checksum(
+        program_data, blocklist, duplicates
+    )
     readable_id = program_data.pop("readable_id")
     courses_data = program_data.pop("courses")
     topics_data = program_data.pop("topics", [])
@@ -454,6 +545,14 @@ def load_program(
                 json.dumps(program_data),
             )
             return None
+        unchanged_resource = config.skip_unchanged and get_unchanged_resource(
+            platform,
+            readable_id,
+            LearningResourceType.program.name,
+            program_data["etl_checksum"],
+        )
+        if unchanged_resource:
+            return unchanged_resource
         (
             learning_resource,
             created,  # pylint: disable=unused-variable
@@ -511,18 +610,25 @@ def load_program(
 def load_programs(
     etl_source: str, programs_data: list[dict], *, config=ProgramLoaderConfig()
 ) -> list[LearningResource]:
-    """Load a list of programs"""
+    """
+    Load a list of programs and their courses, in batches of ETL_LOADER_BATCH_SIZE
+    loaded with set-based queries by bulk_load_programs
+    """
     blocklist = load_course_blocklist()
     duplicates = load_course_duplicates(etl_source)
 
-    return [
-        program
-        for program in [
-            load_program(program_data, blocklist, duplicates, config=config)
-            for program_data in programs_data
-        ]
-        if program is not None
-    ]
+    programs = []
+    summary = Counter()
+    for programs_chunk in chunks(
+        programs_data or [], chunk_size=settings.ETL_LOADER_BATCH_SIZE
+    ):
+        programs.extend(
+            bulk_load_programs(
+                programs_chunk, blocklist, duplicates, config=config, summary=summary
+            )
+        )
+    log_load_summary(etl_source, LearningResourceType.program.name, summary)
+    return programs
 
 
 def load_content_file(
@@ -557,7 +663,9 @@ def load_content_files(
     course_run: LearningResourceRun, content_files_data: list[dict]
 ) -> list[int]:
     """
-    Sync all content files for a course run to database and S3 if not present in DB
+    Sync all content files for a course run to database and S3 if not present in DB,
+    in batches of ETL_LOADER_BATCH_SIZE loaded with set-based queries by
+    bulk_load_content_files
 
     Args:
         course_run (LearningResourceRun): a course run
@@ -568,10 +676,24 @@ def load_content_files(
 
     """
     if course_run.learning_resource.resource_type == LearningResourceType.course.name:
-        content_files_ids = [
-            load_content_file(course_run, content_file)
-            for content_file in content_files_data
-        ]
+        content_files_ids = []
+        for content_files_chunk in chunks(
+            content_files_data, chunk_size=settings.ETL_LOADER_BATCH_SIZE
+        ):
+            try:
+                content_files_ids.extend(
+                    bulk_load_content_files(course_run, content_files_chunk)
+                )
+            except:  # noqa: E722
+                log.exception(
+                    "ERROR syncing a batch of course files for run %d,"
+                    " loading them one at a time",
+                    course_run.id,
+                )
+                content_files_ids.extend(
+                    load_content_file(course_run, content_file)
+                    for content_file in content_files_chunk
+                )
 
         if course_run.published:
             resource_run_upserted_actions(course_run)
@@ -723,6 +845,48 @@ def load_podcasts(podcasts_data: list[dict]) -> list[LearningResource]:
     return podcast_resources
 
 
+def _similar_topics_resource(video_data: dict) -> LearningResource:
+    """
+    Build an unsaved LearningResource with the text fields similar topics are
+    based on
+
+    Args:
+        video_data (dict): the video data
+
+    Returns:
+        LearningResource: the unsaved resource
+    """
+    return LearningResource(
+        title=video_data.get("title"),
+        description=video_data.get("description"),
+        full_description=video_data.get("full_description"),
+    )
+
+
+def load_similar_topics(videos_data: list[dict]) -> list[dict]:
+    """
+    Get copies of the video data where the videos which have no topics get
+    similar topics, looked up for all of the videos at once
+
+    Args:
+        videos_data (list of dict): the video data
+
+    Returns:
+        list of dict: the copied video data, in the same order
+    """
+    videos_data = [{**video_data} for video_data in videos_data]
+    missing_topics = [
+        video_data for video_data in videos_data if not video_data.get("topics")
+    ]
+    if missing_topics:
+        topics_lists = bulk_similar_topics_action(
+            [_similar_topics_resource(video_data) for video_data in missing_topics]
+        )
+        for video_data, topics in zip(missing_topics, topics_lists):
+            video_data["topics"] = topics
+    return videos_data
+
+
 def load_video(video_data: dict) -> LearningResource:
     """
     Load a video into the database
@@ -740,6 +904,9 @@ def load_video(video_data: dict) -> LearningResource:
     offered_by_data = video_data.pop("offered_by", None)
     video_fields = video_data.pop("video", {})
     image_data = video_data.pop("image", None)
+    if not topics_data:
+        # Look up the topics before the transaction, it's a search request
+        topics_data = similar_topics_action(_similar_topics_resource(video_data))
     with transaction.atomic():
         (
             learning_resource,
@@ -754,8 +921,6 @@ def load_video(video_data: dict) -> LearningResource:
             learning_resource=learning_resource, defaults=video_fields
         )
         load_image(learning_resource, image_data)
-        if not topics_data:
-            topics_data = similar_topics_action(learning_resource)
         load_topics(learning_resource, topics_data)
         load_offered_by(learning_resource, offered_by_data)
 
@@ -869,7 +1034,24 @@ def load_video_channel(video_channel_data: dict) -> VideoChannel:
         VideoChannel: the updated or created video channel
     """
     channel_id = video_channel_data.pop("channel_id")
-    playlists_data = video_channel_data.pop("playlists", [])
+    playlists_data = [
+        {**playlist_data, "videos": list(playlist_data.get("videos", []))}
+        for playlist_data in video_channel_data.pop("playlists", [])
+    ]
+    # Look up similar topics for the whole channel before locking it
+    videos_data = iter(
+        load_similar_topics(
+            [
+                video_data
+                for playlist_data in playlists_data
+                for video_data in playlist_data["videos"]
+            ]
+        )
+    )
+    for playlist_data in playlists_data:
+        playlist_data["videos"] = [
+            next(videos_data) for _ in range(len(playlist_data["videos"]))
+        ]
 
     with transaction.atomic():
         video_channel, _ = VideoChannel.objects.select_for_update().update_or_create(
@@ -1,6 +1,7 @@
 """Tests for ETL loaders"""
 
 import json
+from copy import deepcopy
 from datetime import timedelta
 
 # pylint: disable=redefined-outer-name,too-many-locals,too-many-lines
@@ -41,6 +42,7 @@ from learning_resources.etl.loaders import (
     load_run,
     load_topics,
     load_video,
+    load_video_channel,
     load_video_channels,
     load_videos,
 )
@@ -410,6 +412,71 @@ def test_load_course(  # noqa: PLR0913
         assert getattr(result, key) == value, f"Property {key} should equal {value}"
 
 
+@pytest.mark.parametrize("skip_unchanged", [True, False])
+def test_load_course_unchanged(mock_upsert_tasks, skip_unchanged):
+    """load_course should skip a course whose data hasn't changed since it was loaded"""
+    platform = LearningResourcePlatformFactory.create()
+    course_data = {
+        "readable_id": "course1",
+        "platform": platform.code,
+        "title": "Course title",
+        "published": True,
+        "runs": [{"run_id": "run1", "title": "Run title", "published": True}],
+    }
+    config = CourseLoaderConfig(skip_unchanged=skip_unchanged)
+    resource = load_course(deepcopy(course_data), [], [], config=config)
+    assert resource.etl_checksum is not None
+    resource.title = "Edited title"
+    resource.save()
+    mock_upsert_tasks.upsert_learning_resource.reset_mock()
+
+    result = load_course(deepcopy(course_data), [], [], config=config)
+    assert result == resource
+    result.refresh_from_db()
+    if skip_unchanged:
+        assert result.title == "Edited title"
+        mock_upsert_tasks.upsert_learning_resource.assert_not_called()
+    else:
+        assert result.title == "Course title"
+        mock_upsert_tasks.upsert_learning_resource.assert_called_once_with(result.id)
+
+    result = load_course(
+        {**deepcopy(course_data), "title": "New title"}, [], [], config=config
+    )
+    result.refresh_from_db()
+    assert result.title == "New title"
+    assert result.etl_checksum != resource.etl_checksum
+
+
+def test_load_program_unchanged(mock_upsert_tasks):
+    """load_program should skip a program whose data hasn't changed since it was loaded"""
+    platform = LearningResourcePlatformFactory.create()
+    program_data = {
+        "readable_id": "program1",
+        "platform": platform.code,
+        "title": "Program title",
+        "runs": [{"run_id": "run1", "title": "Run title"}],
+        "courses": [
+            {
+                "readable_id": "course1",
+                "platform": platform.code,
+                "title": "Course title",
+                "runs": [{"run_id": "run1", "title": "Run title"}],
+            }
+        ],
+    }
+    resource = load_program(deepcopy(program_data), [], [])
+    mock_upsert_tasks.upsert_learning_resource.reset_mock()
+
+    assert load_program(deepcopy(program_data), [], []) == resource
+    mock_upsert_tasks.upsert_learning_resource.assert_not_called()
+
+    blocklisted = load_program(deepcopy(program_data), ["course1"], [])
+    assert blocklisted == resource
+    assert blocklisted.etl_checksum != resource.etl_checksum
+    assert blocklisted.children.first().child.published is False
+
+
 def test_load_course_bad_platform(mocker):
     """A bad platform should log an exception and not create the course"""
     mock_log = mocker.patch("learning_resources.etl.loaders.log.exception")
@@ -708,64 +775,80 @@ def test_load_offered_bys(
 
 
 @pytest.mark.parametrize("prune", [True, False])
-def test_load_courses(mocker, mock_blocklist, mock_duplicates, prune):
-    """Test that load_courses calls the expected functions"""
-
+def test_load_courses(mocker, settings, mock_blocklist, mock_duplicates, prune):
+    """Test that load_courses loads the courses in batches and unpublishes the rest"""
+    settings.ETL_LOADER_BATCH_SIZE = 2
     course_to_unpublish = CourseFactory.create(etl_source=ETLSource.xpro.name)
     courses = CourseFactory.create_batch(3, etl_source=ETLSource.xpro.name)
+    resources = [course.learning_resource for course in courses]
 
-    courses_data = [
-        {"readable_id": course.learning_resource.readable_id} for course in courses
-    ]
+    courses_data = [{"readable_id": resource.readable_id} for resource in resources]
 
-    mock_load_course = mocker.patch(
-        "learning_resources.etl.loaders.load_course",
+    mock_bulk_load_courses = mocker.patch(
+        "learning_resources.etl.loaders.bulk_load_courses",
         autospec=True,
-        side_effect=[course.learning_resource for course in courses],
+        side_effect=[resources[:2], resources[2:]],
+    )
+    mock_unpublished_actions = mocker.patch(
+        "learning_resources.etl.loaders.bulk_resources_unpublished_actions"
     )
     config = CourseLoaderConfig(prune=prune)
-    load_courses(ETLSource.xpro.name, courses_data, config=config)
-    assert mock_load_course.call_count == len(courses)
-    for course_data in courses_data:
-        mock_load_course.assert_any_call(
-            course_data,
+    assert load_courses(ETLSource.xpro.name, courses_data, config=config) == resources
+    assert mock_bulk_load_courses.call_count == 2
+    for courses_chunk in [courses_data[:2], courses_data[2:]]:
+        mock_bulk_load_courses.assert_any_call(
+            courses_chunk,
             mock_blocklist.return_value,
             mock_duplicates.return_value,
             config=config,
+            summary=mocker.ANY,
         )
     mock_blocklist.assert_called_once_with()
     mock_duplicates.assert_called_once_with(ETLSource.xpro.name)
     course_to_unpublish.refresh_from_db()
     assert course_to_unpublish.learning_resource.published is not prune
+    if prune:
+        mock_unpublished_actions.assert_called_once_with(
+            [course_to_unpublish.learning_resource.id],
+            LearningResourceType.course.name,
+        )
+    else:
+        mock_unpublished_actions.assert_not_called()
 
 
-def test_load_programs(mocker, mock_blocklist, mock_duplicates):
-    """Test that load_programs calls the expected functions"""
-    program_data = [{"courses": [{"platform": "a"}, {}]}]
-    mock_load_program = mocker.patch(
-        "learning_resources.etl.loaders.load_program", autospec=True
+def test_load_programs(mocker, settings, mock_blocklist, mock_duplicates):
+    """Test that load_programs loads the programs in batches"""
+    settings.ETL_LOADER_BATCH_SIZE = 1
+    programs_data = [
+        {"courses": [{"platform": "a"}, {}]},
+        {"courses": [{"platform": "b"}]},
+    ]
+    mock_bulk_load_programs = mocker.patch(
+        "learning_resources.etl.loaders.bulk_load_programs",
+        autospec=True,
+        side_effect=[["program1"], ["program2"]],
     )
-    load_programs("mitx", program_data)
-    assert mock_load_program.call_count == len(program_data)
+    assert load_programs("mitx", programs_data) == ["program1", "program2"]
+    assert [call.args[0] for call in mock_bulk_load_programs.call_args_list] == [
+        [programs_data[0]],
+        [programs_data[1]],
+    ]
     mock_blocklist.assert_called_once()
     mock_duplicates.assert_called_once_with("mitx")
 
 
 @pytest.mark.parametrize("is_published", [True, False])
-def test_load_content_files(mocker, is_published):
+def test_load_content_files(mocker, settings, is_published):
     """Test that load_content_files calls the expected functions"""
     course = CourseFactory.create()
     course_run = LearningResourceRunFactory.create(
         published=is_published, learning_resource=course.learning_resource
     )
 
-    returned_content_file_id = 1
-
-    content_data = [{"a": "b"}, {"a": "c"}]
-    mock_load_content_file = mocker.patch(
-        "learning_resources.etl.loaders.load_content_file",
-        return_value=returned_content_file_id,
-        autospec=True,
+    content_data = [{"a": "b"}, {"a": "c"}, {"a": "d"}]
+    mock_bulk_load = mocker.patch(
+        "learning_resources.etl.loaders.bulk_load_content_files",
+        side_effect=lambda run, chunk: [1] * len(chunk),  # noqa: ARG005
     )
     mock_bulk_index = mocker.patch(
         "learning_resources.etl.loaders.resource_run_upserted_actions",
@@ -774,12 +857,40 @@ def test_load_content_files(mocker, is_published):
         "learning_resources.etl.loaders.resource_run_unpublished_actions",
         autospec=True,
     )
-    load_content_files(course_run, content_data)
-    assert mock_load_content_file.call_count == len(content_data)
+    settings.ETL_LOADER_BATCH_SIZE = 2
+    assert load_content_files(course_run, iter(content_data)) == [1, 1, 1]
+    assert [call.args for call in mock_bulk_load.call_args_list] == [
+        (course_run, content_data[:2]),
+        (course_run, content_data[2:]),
+    ]
     assert mock_bulk_index.call_count == (1 if is_published else 0)
     assert mock_bulk_delete.call_count == (0 if is_published else 1)
 
 
+def test_load_content_files_batch_error(mocker):
+    """A batch that fails to load should be loaded one content file at a time"""
+    course_run = LearningResourceRunFactory.create(
+        learning_resource=CourseFactory.create().learning_resource
+    )
+    mocker.patch("learning_resources.etl.loaders.resource_run_upserted_actions")
+    mocker.patch("learning_resources.etl.loaders.resource_run_unpublished_actions")
+    mock_log = mocker.patch("learning_resources.etl.loaders.log.exception")
+    content_data = [
+        {"key": "good", "content": "text"},
+        {"key": "bad", "bad": "data"},
+    ]
+
+    assert load_content_files(course_run, content_data) == [
+        ContentFile.objects.get(key="good").id,
+        None,
+    ]
+    mock_log.assert_any_call(
+        "ERROR syncing a batch of course files for run %d,"
+        " loading them one at a time",
+        course_run.id,
+    )
+
+
 def test_load_content_file():
     """Test that load_content_file saves a ContentFile object"""
     learning_resource_run = LearningResourceRunFactory.create()
@@ -1087,6 +1198,10 @@ def test_load_video(mocker, video_exists, is_published, pass_topics):
     assert result.published == is_published
 
     assert mock_similar_topics_action.call_count == (0 if pass_topics else 1)
+    if not pass_topics:
+        similar_resource = mock_similar_topics_action.call_args.args[0]
+        assert similar_resource.title == video_resource.title
+        assert similar_resource.description == video_resource.description
     assert list(result.topics.values_list("name", flat=True).order_by("name")) == [
         topic["name"] for topic in expected_topics
     ]
@@ -1223,6 +1338,59 @@ def test_load_video_channels():
         assert result.playlists.count() == 1
 
 
+def test_load_video_channel_similar_topics(mocker):
+    """load_video_channel should look up similar topics for all its videos at once"""
+    expected_topics = [{"name": "Biology"}]
+    LearningResourceTopicFactory.create(name="Biology")
+    mock_bulk_similar_topics_action = mocker.patch(
+        "learning_resources.etl.loaders.bulk_similar_topics_action",
+        return_value=[expected_topics],
+    )
+    mock_similar_topics_action = mocker.patch(
+        "learning_resources.etl.loaders.similar_topics_action"
+    )
+    channel_data = model_to_dict(VideoChannelFactory.build())
+    playlist = VideoPlaylistFactory.build()
+    video_resources = [video.learning_resource for video in VideoFactory.build_batch(2)]
+    videos_data = [
+        {
+            **model_to_dict(video, exclude=non_transformable_attributes),
+            "platform": PlatformType.youtube.name,
+            "offered_by": None,
+        }
+        for video in video_resources
+    ]
+    videos_data[1]["topics"] = [{"name": "Physics"}]
+    LearningResourceTopicFactory.create(name="Physics")
+    channel_data["playlists"] = (
+        playlist_data
+        for playlist_data in [
+            {
+                "playlist_id": playlist.learning_resource.readable_id,
+                "platform": PlatformType.youtube.name,
+                "videos": iter(videos_data),
+            }
+        ]
+    )
+
+    original_videos_data = deepcopy(videos_data)
+
+    load_video_channel(channel_data)
+
+    # the caller's video data is left alone
+    assert videos_data == original_videos_data
+    mock_similar_topics_action.assert_not_called()
+    mock_bulk_similar_topics_action.assert_called_once()
+    [similar_resource] = mock_bulk_similar_topics_action.call_args.args[0]
+    assert similar_resource.title == video_resources[0].title
+    for video_resource, topic_name in zip(video_resources, ["Biology", "Physics"]):
+        assert list(
+            LearningResource.objects.get(
+                readable_id=video_resource.readable_id
+            ).topics.values_list("name", flat=True)
+        ) == [topic_name]
+
+
 def test_load_video_channels_error(mocker):
     """Test that an error doesn't fail the entire operation"""
 
@@ -26,7 +26,7 @@ from learning_resources.constants import (
 )
 from learning_resources.etl.constants import ETLSource
 from learning_resources.etl.utils import (
-    extract_text_metadata,
+    extract_text_metadata_cached,
     generate_course_numbers_json,
     get_content_type,
     transform_levels,
@@ -156,9 +156,8 @@ def get_file_content(
             try:
                 s3_body = s3_obj["Body"].read() if s3_obj else None
                 if s3_body:
-                    content_json = extract_text_metadata(
-                        s3_body,
-                        other_headers={"Content-Type": mime_type} if mime_type else {},
+                    content_json = extract_text_metadata_cached(
+                        s3_body, mime_type=mime_type, force_overwrite=force_overwrite
                     )
             except (ClientError, ReadTimeout, JSONDecodeError):
                 log.exception("Could not parse text for %s", file_s3_path)
@@ -38,7 +38,7 @@ def test_transform_content_files(settings, mocker, base_ocw_url):
     setup_s3_ocw(settings)
     s3_resource = boto3.resource("s3")
     mocker.patch(
-        "learning_resources.etl.ocw.extract_text_metadata",
+        "learning_resources.etl.ocw.extract_text_metadata_cached",
         return_value={"content": "TEXT"},
     )
 
@@ -133,7 +133,7 @@ def test_transform_content_file_needs_text_update(
     setup_s3_ocw(settings)
     s3_resource = boto3.resource("s3")
     mock_tika = mocker.patch(
-        "learning_resources.etl.ocw.extract_text_metadata",
+        "learning_resources.etl.ocw.extract_text_metadata_cached",
         return_value={"content": "TEXT"},
     )
     s3_resource_object = s3_resource.Object(
@@ -157,6 +157,7 @@ def test_transform_content_file_needs_text_update(
 
     if overwrite or modified_after_last_import:
         mock_tika.assert_called_once()
+        assert mock_tika.call_args.kwargs["force_overwrite"] is overwrite
 
         assert content_data["content"] == "TEXT"
     else:
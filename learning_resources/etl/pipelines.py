@@ -131,7 +131,12 @@ def ocw_courses_etl(
             )
             if data:
                 ocw_course_data = ocw.transform_course(data)
-                course_resource = loaders.load_course(ocw_course_data, [], [])
+                course_resource = loaders.load_course(
+                    ocw_course_data,
+                    [],
+                    [],
+                    config=CourseLoaderConfig(skip_unchanged=not force_overwrite),
+                )
                 if course_resource and not skip_content_files:
                     loaders.load_content_files(
                         course_resource.runs.filter(published=True).first(),
@@ -196,7 +196,7 @@ def test_ocw_courses_etl(settings, mocker, skip_content_files):
     setup_s3_ocw(settings)
 
     mocker.patch(
-        "learning_resources.etl.ocw.extract_text_metadata",
+        "learning_resources.etl.ocw.extract_text_metadata_cached",
         return_value={"content": "TEXT"},
     )
     mocker.patch("learning_resources.etl.pipelines.loaders.resource_upserted_actions")
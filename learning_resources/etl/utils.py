@@ -8,9 +8,11 @@ import os
 import re
 import uuid
 from collections import Counter
-from collections.abc import Generator
-from datetime import UTC, datetime
+from collections.abc import Generator, Iterable
+from concurrent.futures import Executor, Future
+from datetime import UTC, datetime, timedelta
 from hashlib import md5
+from http import HTTPStatus
 from itertools import chain
 from pathlib import Path
 from subprocess import check_call
@@ -20,6 +22,7 @@ import boto3
 import rapidjson
 import requests
 from django.conf import settings
+from django.db.models import Count, F, Max, Sum
 from django.utils.functional import SimpleLazyObject
 from django.utils.text import slugify
 from tika import parser as tika_parser
@@ -43,11 +46,15 @@ from learning_resources.etl.constants import (
     ETLSource,
 )
 from learning_resources.models import (
+    ContentExtraction,
     ContentFile,
     Course,
     LearningResource,
+    LearningResourceOfferor,
     LearningResourceRun,
+    LearningResourceTopic,
 )
+from main.utils import chunks, now_in_utc, prefetch
 
 log = logging.getLogger(__name__)
 
@@ -172,6 +179,151 @@ def extract_text_metadata(data, *, other_headers=None):
     return tika_parser.from_buffer(data, requestOptions=request_options)
 
 
+def get_cached_extraction(checksum: str | None, mime_type: str | None) -> dict | None:
+    """
+    Return the tika output cached for file data, and record the cache hit
+
+    Args:
+        checksum (str): The md5 checksum of the file data
+        mime_type (str): The mime type the file data is sent to tika with
+
+    Returns:
+        dict: The cached tika output, or None if it isn't cached
+    """
+    if not settings.TIKA_EXTRACTION_CACHE_ENABLED or not checksum:
+        return None
+    extraction = ContentExtraction.objects.filter(
+        checksum=checksum,
+        mime_type=mime_type or "",
+        ocr_strategy=settings.TIKA_OCR_STRATEGY or "",
+    ).first()
+    if extraction is None:
+        return None
+    ContentExtraction.objects.filter(id=extraction.id).update(
+        hits=F("hits") + 1, last_used_on=now_in_utc()
+    )
+    return {
+        "status": HTTPStatus.OK,
+        "content": extraction.content,
+        "metadata": extraction.metadata,
+    }
+
+
+def cache_extraction(
+    checksum: str | None, mime_type: str | None, tika_output: dict | None
+):
+    """
+    Save the tika output for file data to the extraction cache, unless tika
+    failed to parse it
+
+    Args:
+        checksum (str): The md5 checksum of the file data
+        mime_type (str): The mime type the file data was sent to tika with
+        tika_output (dict): The output returned by tika
+    """
+    if (
+        not settings.TIKA_EXTRACTION_CACHE_ENABLED
+        or not checksum
+        or not tika_output
+        or tika_output.get("status") != HTTPStatus.OK
+        or tika_output.get("content") is None
+    ):
+        return
+    content = tika_output["content"]
+    ContentExtraction.objects.update_or_create(
+        checksum=checksum,
+        mime_type=mime_type or "",
+        ocr_strategy=settings.TIKA_OCR_STRATEGY or "",
+        defaults={
+            "content": content,
+            "metadata": tika_output.get("metadata") or {},
+            "size": len(content.encode("utf-8")),
+            "last_used_on": now_in_utc(),
+        },
+    )
+
+
+def extract_text_metadata_cached(data, *, mime_type=None, force_overwrite=False):
+    """
+    Use tika to extract text content from file data, unless the extraction
+    cache already has the output for the same data and mime type
+
+    Args:
+        data (str or bytes): File contents
+        mime_type (str): The mime type of the file
+        force_overwrite (bool): Call tika and replace the cached output, if any
+
+    Returns:
+         dict: metadata returned by tika, including content
+    """
+    if not data:
+        return None
+    checksum = md5(  # noqa: S324
+        data if isinstance(data, bytes) else data.encode("utf-8")
+    ).hexdigest()
+    tika_output = (
+        None if force_overwrite else get_cached_extraction(checksum, mime_type)
+    )
+    if tika_output is None:
+        tika_output = extract_text_metadata(
+            data, other_headers={"Content-Type": mime_type} if mime_type else {}
+        )
+        cache_extraction(checksum, mime_type, tika_output)
+    return tika_output
+
+
+def evict_extraction_cache(
+    *, max_age_days: int | None = None, max_size: int | None = None
+) -> int:
+    """
+    Delete extraction cache entries that haven't been used for max_age_days,
+    then the least recently used entries until the cache fits in max_size
+
+    Args:
+        max_age_days (int): Maximum days since an entry was last used
+        max_size (int): Maximum total bytes of extracted content
+
+    Returns:
+        int: The number of entries deleted
+    """
+    deleted = 0
+    if max_age_days is not None:
+        deleted, _ = ContentExtraction.objects.filter(
+            last_used_on__lt=now_in_utc() - timedelta(days=max_age_days)
+        ).delete()
+    if max_size is not None:
+        total_size = 0
+        evicted_ids = []
+        for extraction_id, size in ContentExtraction.objects.order_by(
+            "-last_used_on", "-id"
+        ).values_list("id", "size"):
+            total_size += size
+            if total_size > max_size:
+                evicted_ids.append(extraction_id)
+        for ids in chunks(evicted_ids, chunk_size=settings.ETL_LOADER_BATCH_SIZE):
+            count, _ = ContentExtraction.objects.filter(id__in=ids).delete()
+            deleted += count
+    return deleted
+
+
+def extraction_cache_stats() -> dict:
+    """
+    Return the size and hit ratio of the extraction cache. Each entry was
+    created by a cache miss, so the ratio covers the entries still cached.
+
+    Returns:
+        dict: The entries, total size, hits and hit ratio of the cache
+    """
+    stats = ContentExtraction.objects.aggregate(
+        entries=Count("id"), size=Sum("size"), hits=Sum("hits")
+    )
+    stats["size"] = stats["size"] or 0
+    stats["hits"] = stats["hits"] or 0
+    lookups = stats["hits"] + stats["entries"]
+    stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+    return stats
+
+
 def extract_text_from_url(url, *, mime_type=None):
     """
     Retrieve data from a URL and parse it with tika
@@ -390,6 +542,144 @@ def documents_from_olx(
                 )
 
 
+def extract_olx(course_tarpath: Path, destdir: str) -> str:
+    """
+    Extract an edx course tarball
+
+    Args:
+        course_tarpath (str): The path to the tarball which contains the OLX
+        destdir (str): The empty directory to extract the tarball to
+
+    Returns:
+        str: The path to the directory with the OLX data
+    """
+    check_call(["tar", "xf", course_tarpath], cwd=destdir)  # noqa: S603,S607
+    return glob.glob(destdir + "/*")[0]  # noqa: PTH207
+
+
+def documents_from_tarball(course_tarpath: Path) -> Generator[tuple, None, None]:
+    """
+    Extract an edx course tarball and the documents in its OLX
+
+    Args:
+        course_tarpath (str): The path to the tarball which contains the OLX
+
+    Yields:
+        tuple: A list of (bytes of content, metadata)
+    """
+    basedir = course_tarpath.name.split(".")[0]
+    with TemporaryDirectory(prefix=basedir) as inner_tempdir:
+        yield from documents_from_olx(extract_olx(course_tarpath, inner_tempdir))
+
+
+def transform_document(tika_output: dict | None, metadata: dict) -> dict | None:
+    """
+    Return the content fields for an OLX document from its tika output
+
+    Args:
+        tika_output (dict): The tika output for the document content
+        metadata (dict): The document metadata
+
+    Returns:
+        dict: The content fields for the document, or None if tika didn't respond
+    """
+    if tika_output is None:
+        log.info("No tika response for %s", metadata["key"])
+        return None
+
+    tika_content = tika_output.get("content") or ""
+    tika_metadata = tika_output.get("metadata") or {}
+    return {
+        "content": tika_content.strip(),
+        "content_title": (metadata.get("title") or tika_metadata.get("title") or "")[
+            : get_max_contentfile_length("content_title")
+        ],
+        "content_author": (tika_metadata.get("Author") or "")[
+            : get_max_contentfile_length("content_author")
+        ],
+        "content_language": (tika_metadata.get("language") or "")[
+            : get_max_contentfile_length("content_language")
+        ],
+    }
+
+
+def transform_documents(
+    documents: Iterable[tuple],
+    run: LearningResourceRun,
+    *,
+    executor: Executor | None = None,
+    prefetch_size: int = 0,
+) -> Generator[dict, None, None]:
+    """
+    Pass new and changed OLX documents to tika, then return JSON documents with
+    the transformed content inside them, in the order of the documents. The
+    checksums and content of the run's existing files are loaded up front.
+
+    Args:
+        documents (iterable of tuple): The (bytes of content, metadata) of the documents
+        run (LearningResourceRun): The run associated with the content files
+        executor (Executor): If given, the executor to make the tika requests with
+        prefetch_size (int): How many tika requests to keep in flight ahead of
+            the document being yielded, when an executor is given
+
+    Yields:
+        dict: content from file
+    """
+
+    content_fields = [
+        "content",
+        "content_title",
+        "content_author",
+        "content_language",
+    ]
+    existing_files = {
+        existing_file["key"]: existing_file
+        for existing_file in ContentFile.objects.filter(run=run).values(
+            "key", "checksum", *content_fields
+        )
+    }
+
+    def _transform(document, metadata):
+        existing_file = existing_files.get(metadata["key"])
+        if existing_file and existing_file["checksum"] == metadata.get("checksum"):
+            return metadata, {field: existing_file[field] for field in content_fields}
+        mime_type = metadata.get("mime_type")
+        tika_output = get_cached_extraction(metadata.get("checksum"), mime_type)
+        if tika_output is None:
+            other_headers = {"Content-Type": mime_type} if mime_type else {}
+            if executor is not None:
+                return metadata, executor.submit(
+                    extract_text_metadata, document, other_headers=other_headers
+                )
+            tika_output = extract_text_metadata(document, other_headers=other_headers)
+            cache_extraction(metadata.get("checksum"), mime_type, tika_output)
+        return metadata, transform_document(tika_output, metadata)
+
+    for metadata, content_dict in prefetch(
+        (_transform(document, metadata) for document, metadata in documents),
+        size=prefetch_size if executor else 0,
+    ):
+        if isinstance(content_dict, Future):
+            # the cache is written here so that the tika threads don't need
+            # database connections of their own
+            tika_output = content_dict.result()
+            cache_extraction(
+                metadata.get("checksum"), metadata.get("mime_type"), tika_output
+            )
+            content_dict = transform_document(tika_output, metadata)  # noqa: PLW2901
+        if content_dict is None:
+            continue
+        yield (
+            {
+                "key": metadata["key"],
+                "published": True,
+                "content_type": metadata["content_type"],
+                "checksum": metadata.get("checksum"),
+                **content_dict,
+            }
+        )
+
+
 def transform_content_files(
     course_tarpath: Path, run: LearningResourceRun
 ) -> Generator[dict, None, None]:
@@ -403,58 +693,7 @@ def transform_content_files(
     Yields:
         dict: content from file
     """
-    basedir = course_tarpath.name.split(".")[0]
-    with TemporaryDirectory(prefix=basedir) as inner_tempdir:
-        check_call(["tar", "xf", course_tarpath], cwd=inner_tempdir)  # noqa: S603,S607
-        olx_path = glob.glob(inner_tempdir + "/*")[0]  # noqa: PTH207
-        for document, metadata in documents_from_olx(olx_path):
-            key = metadata["key"]
-            content_type = metadata["content_type"]
-            mime_type = metadata.get("mime_type")
-
-            existing_content = ContentFile.objects.filter(key=key, run=run).first()
-            if not existing_content or existing_content.checksum != metadata.get(
-                "checksum"
-            ):
-                tika_output = extract_text_metadata(
-                    document,
-                    other_headers={"Content-Type": mime_type} if mime_type else {},
-                )
-
-                if tika_output is None:
-                    log.info("No tika response for %s", key)
-                    continue
-
-                tika_content = tika_output.get("content") or ""
-                tika_metadata = tika_output.get("metadata") or {}
-                content_dict = {
-                    "content": tika_content.strip(),
-                    "content_title": (
-                        metadata.get("title") or tika_metadata.get("title") or ""
-                    )[: get_max_contentfile_length("content_title")],
-                    "content_author": (tika_metadata.get("Author") or "")[
-                        : get_max_contentfile_length("content_author")
-                    ],
-                    "content_language": (tika_metadata.get("language") or "")[
-                        : get_max_contentfile_length("content_language")
-                    ],
-                }
-            else:
-                content_dict = {
-                    "content": existing_content.content,
-                    "content_title": existing_content.content_title,
-                    "content_author": existing_content.content_author,
-                    "content_language": existing_content.content_language,
-                }
-            yield (
-                {
-                    "key": key,
-                    "published": True,
-                    "content_type": content_type,
-                    "checksum": metadata.get("checksum"),
-                    **content_dict,
-                }
-            )
+    yield from transform_documents(documents_from_tarball(course_tarpath), run)
 
 
 def get_learning_course_bucket_name(etl_source: str) -> str:
@@ -512,6 +751,75 @@ def calc_checksum(filename) -> str:
     return hash_md5.hexdigest()
 
 
+def lookup_tables_version() -> str:
+    """
+    Return a version of the topics and offerors that resources are matched to by
+    name when they are loaded, which changes whenever one of them is added,
+    changed or deleted
+
+    Returns:
+        str: The version of the lookup tables
+    """
+    return ",".join(
+        "{count}:{updated_on}".format(
+            **model.objects.aggregate(count=Count("pk"), updated_on=Max("updated_on"))
+        )
+        for model in [LearningResourceTopic, LearningResourceOfferor]
+    )
+
+
+def resource_checksum(
+    resource_data: dict,
+    blocklist: list[str],
+    duplicates: list[dict],
+    lookups_version: str | None = None,
+) -> str:
+    """
+    Return the md5 checksum of the transformed data for a course or program,
+    so that loading the same data again can be skipped. The checksum covers
+    the blocklist entries and duplicate records for the resource and its courses,
+    and the version of the topics and offerors, since those change how it is loaded.
+
+    Args:
+        resource_data(dict): The transformed resource data, including runs
+        blocklist(list of str): list of course ids not to load
+        duplicates(list of dict): list of duplicate course data
+        lookups_version(str): The lookup_tables_version, looked up if not given
+
+    Returns:
+        str: The md5 checksum of the data
+    """
+    if lookups_version is None:
+        lookups_version = lookup_tables_version()
+    readable_ids = {
+        readable_id
+        for readable_id in [
+            resource_data.get("readable_id"),
+            *[
+                course_data.get("readable_id")
+                for course_data in resource_data.get("courses", [])
+            ],
+        ]
+        if readable_id
+    }
+    return md5(  # noqa: S324
+        rapidjson.dumps(
+            {
+                "data": resource_data,
+                "blocklisted": sorted(readable_ids.intersection(blocklist)),
+                "duplicates": [
+                    record
+                    for record in duplicates
+                    if readable_ids.intersection(record["duplicate_course_ids"])
+                ],
+                "lookups": lookups_version,
+            },
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+    ).hexdigest()
+
+
 def get_content_type(file_type: str) -> str:
     """
     Return the appropriate content type for a file type
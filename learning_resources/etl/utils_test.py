@@ -2,6 +2,7 @@
 
 import datetime
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 from random import randrange
 from subprocess import check_call
 from tempfile import TemporaryDirectory
@@ -28,7 +29,9 @@ from learning_resources.factories import (
     LearningResourceRunFactory,
     LearningResourceTopicFactory,
 )
+from learning_resources.models import ContentExtraction
 from learning_resources.serializers import LearningResourceSerializer
+from main.utils import now_in_utc
 
 pytestmark = pytest.mark.django_db
 
@@ -265,6 +268,219 @@ def test_transform_content_files(mocker, has_metadata, matching_checksum):
     assert documents_mock.called is True
 
 
+@pytest.mark.parametrize("use_executor", [True, False])
+def test_transform_documents(mocker, use_executor):
+    """transform_documents should pass new and changed documents to tika, in order"""
+    run = LearningResourceRunFactory.create(published=True)
+    ContentFileFactory.create(
+        run=run, key="unchanged", checksum="checksum-unchanged", content="existing text"
+    )
+    documents = [
+        (
+            f"text for {key}",
+            {
+                "key": key,
+                "content_type": CONTENT_TYPE_FILE,
+                "checksum": f"checksum-{key}",
+            },
+        )
+        for key in ["new", "unchanged", "no_tika", "other"]
+    ]
+    extract_mock = mocker.patch(
+        "learning_resources.etl.utils.extract_text_metadata",
+        side_effect=lambda document, **kwargs: (  # noqa: ARG005
+            None
+            if "no_tika" in document
+            else {"status": 200, "content": f" {document} "}
+        ),
+    )
+    with ThreadPoolExecutor(2) as executor:
+        content = list(
+            utils.transform_documents(
+                documents,
+                run,
+                executor=executor if use_executor else None,
+                prefetch_size=2,
+            )
+        )
+    assert [(item["key"], item["content"]) for item in content] == [
+        ("new", "text for new"),
+        ("unchanged", "existing text"),
+        ("other", "text for other"),
+    ]
+    assert extract_mock.call_count == 3
+    assert sorted(ContentExtraction.objects.values_list("checksum", flat=True)) == [
+        "checksum-new",
+        "checksum-other",
+    ]
+
+
+@pytest.mark.parametrize("use_executor", [True, False])
+def test_transform_documents_cached(mocker, settings, use_executor):
+    """transform_documents should use cached tika output for new documents"""
+    run = LearningResourceRunFactory.create(published=True)
+    ContentExtraction.objects.create(
+        checksum="checksum",
+        mime_type="text/html",
+        ocr_strategy=settings.TIKA_OCR_STRATEGY,
+        content=" cached text ",
+    )
+    extract_mock = mocker.patch("learning_resources.etl.utils.extract_text_metadata")
+    documents = [
+        (
+            "text",
+            {
+                "key": key,
+                "content_type": CONTENT_TYPE_FILE,
+                "mime_type": "text/html",
+                "checksum": "checksum",
+            },
+        )
+        for key in ["first", "second"]
+    ]
+    with ThreadPoolExecutor(2) as executor:
+        content = list(
+            utils.transform_documents(
+                documents, run, executor=executor if use_executor else None
+            )
+        )
+    assert [item["content"] for item in content] == ["cached text", "cached text"]
+    extract_mock.assert_not_called()
+    assert ContentExtraction.objects.get().hits == 2
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_extract_text_metadata_cached(mocker, settings, enabled):
+    """extract_text_metadata_cached should only call tika for uncached data"""
+    settings.TIKA_EXTRACTION_CACHE_ENABLED = enabled
+    tika_output = {
+        "status": 200,
+        "content": "Extracted text",
+        "metadata": {"Author": "MIT"},
+    }
+    extract_mock = mocker.patch(
+        "learning_resources.etl.utils.extract_text_metadata", return_value=tika_output
+    )
+
+    for data, mime_type in [
+        (b"data", "application/pdf"),
+        (b"data", "application/pdf"),
+        ("data", "application/pdf"),
+        (b"data", None),
+    ]:
+        assert (
+            utils.extract_text_metadata_cached(data, mime_type=mime_type) == tika_output
+        )
+
+    assert utils.extract_text_metadata_cached(b"", mime_type=None) is None
+    if enabled:
+        assert extract_mock.call_count == 2
+        extract_mock.assert_any_call(
+            b"data", other_headers={"Content-Type": "application/pdf"}
+        )
+        extract_mock.assert_any_call(b"data", other_headers={})
+        extraction = ContentExtraction.objects.get(mime_type="application/pdf")
+        assert extraction.checksum == "8d777f385d3dfec8815d20f7496026dc"
+        assert extraction.size == 14
+        assert extraction.hits == 2
+    else:
+        assert extract_mock.call_count == 4
+        assert not ContentExtraction.objects.exists()
+
+
+@pytest.mark.parametrize(
+    "tika_output",
+    [
+        None,
+        {"status": 422, "content": None, "metadata": None},
+        {"status": 500, "content": "Error", "metadata": None},
+        {"status": 200, "content": None, "metadata": {}},
+    ],
+)
+def test_cache_extraction_failed_output(tika_output):
+    """cache_extraction shouldn't cache a missing or failed tika response"""
+    utils.cache_extraction("checksum", "application/pdf", tika_output)
+    assert not ContentExtraction.objects.exists()
+
+
+def test_extract_text_metadata_cached_ocr_strategy(mocker, settings):
+    """The extraction cache should be separate for each tika OCR strategy"""
+    settings.TIKA_EXTRACTION_CACHE_ENABLED = True
+    extract_mock = mocker.patch(
+        "learning_resources.etl.utils.extract_text_metadata",
+        side_effect=lambda data, **kwargs: {  # noqa: ARG005
+            "status": 200,
+            "content": settings.TIKA_OCR_STRATEGY,
+        },
+    )
+    for ocr_strategy in ["no_ocr", "ocr_only", "no_ocr"]:
+        settings.TIKA_OCR_STRATEGY = ocr_strategy
+        assert utils.extract_text_metadata_cached(b"data")["content"] == ocr_strategy
+    assert extract_mock.call_count == 2
+    assert sorted(ContentExtraction.objects.values_list("ocr_strategy", flat=True)) == [
+        "no_ocr",
+        "ocr_only",
+    ]
+
+
+def test_extract_text_metadata_cached_force_overwrite(mocker, settings):
+    """extract_text_metadata_cached should call tika and recache with force_overwrite"""
+    settings.TIKA_EXTRACTION_CACHE_ENABLED = True
+    ContentExtraction.objects.create(
+        checksum="8d777f385d3dfec8815d20f7496026dc",
+        ocr_strategy=settings.TIKA_OCR_STRATEGY,
+        content="stale text",
+    )
+    extract_mock = mocker.patch(
+        "learning_resources.etl.utils.extract_text_metadata",
+        return_value={"status": 200, "content": "new text", "metadata": {}},
+    )
+    assert (
+        utils.extract_text_metadata_cached(b"data", force_overwrite=True)["content"]
+        == "new text"
+    )
+    extract_mock.assert_called_once_with(b"data", other_headers={})
+    assert ContentExtraction.objects.get().content == "new text"
+
+
+def test_evict_extraction_cache():
+    """evict_extraction_cache should delete old and least recently used entries"""
+    now = now_in_utc()
+    for checksum, days, size in [
+        ("stale", 100, 10),
+        ("oldest", 20, 10),
+        ("older", 10, 10),
+        ("newest", 1, 10),
+    ]:
+        ContentExtraction.objects.create(checksum=checksum, size=size, hits=1)
+        # last_used_on is set automatically when an entry is created
+        ContentExtraction.objects.filter(checksum=checksum).update(
+            last_used_on=now - datetime.timedelta(days=days)
+        )
+
+    assert utils.extraction_cache_stats() == {
+        "entries": 4,
+        "size": 40,
+        "hits": 4,
+        "hit_ratio": 0.5,
+    }
+    assert utils.evict_extraction_cache(max_age_days=30, max_size=25) == 2
+    assert sorted(ContentExtraction.objects.values_list("checksum", flat=True)) == [
+        "newest",
+        "older",
+    ]
+
+
+def test_extraction_cache_stats_empty():
+    """extraction_cache_stats should handle an empty cache"""
+    assert utils.extraction_cache_stats() == {
+        "entries": 0,
+        "size": 0,
+        "hits": 0,
+        "hit_ratio": 0.0,
+    }
+
+
 def test_documents_from_olx():
     """Test for documents_from_olx"""
     parsed_documents = get_olx_test_docs()
@@ -433,3 +649,40 @@ def test_parse_certification(offered_by, availability, has_cert):
         )
         == has_cert
     )
+
+
+def test_resource_checksum():
+    """resource_checksum should change with the data and the blocklist/duplicates that affect it"""
+    course_data = {"readable_id": "course1", "runs": [{"run_id": "run1"}]}
+    program_data = {"readable_id": "program1", "courses": [course_data]}
+    unrelated_duplicates = [{"course_id": "other", "duplicate_course_ids": ["other"]}]
+    duplicates = [{"course_id": "course1", "duplicate_course_ids": ["course1"]}]
+    for data in [course_data, program_data]:
+        checksum = utils.resource_checksum(data, [], [])
+        assert checksum == utils.resource_checksum(
+            {**data}, ["other"], unrelated_duplicates
+        )
+        assert checksum != utils.resource_checksum(data, ["course1"], [])
+        assert checksum != utils.resource_checksum(data, [], duplicates)
+    assert utils.resource_checksum(course_data, [], []) != utils.resource_checksum(
+        {**course_data, "runs": [{"run_id": "run2"}]}, [], []
+    )
+
+
+def test_resource_checksum_lookup_tables():
+    """resource_checksum should change when the topics or offerors change"""
+    course_data = {"readable_id": "course1", "topics": [{"name": "Physics"}]}
+    checksums = [utils.resource_checksum(course_data, [], [])]
+    topic = LearningResourceTopicFactory.create(name="Physics")
+    checksums.append(utils.resource_checksum(course_data, [], []))
+    offeror = LearningResourceOfferorFactory.create()
+    checksums.append(utils.resource_checksum(course_data, [], []))
+    offeror.name = "Renamed"
+    offeror.save()
+    checksums.append(utils.resource_checksum(course_data, [], []))
+    topic.delete()
+    checksums.append(utils.resource_checksum(course_data, [], []))
+    assert len(set(checksums)) == len(checksums)
+    assert utils.resource_checksum(
+        course_data, [], [], utils.lookup_tables_version()
+    ) == utils.resource_checksum(course_data, [], [])
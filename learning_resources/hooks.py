@@ -32,6 +32,10 @@ class LearningResourceHooks:
     def resource_upserted(self, resource, percolate):
         """Trigger actions after a learning resource is created or updated"""
 
+    @hookspec
+    def bulk_resources_upserted(self, resource_ids, resource_type, percolate_ids):
+        """Trigger actions after multiple learning resources are created or updated"""
+
     @hookspec
     def resource_unpublished(self, resource):
         """Trigger actions after a learning resource is unpublished"""
@@ -40,6 +44,10 @@ class LearningResourceHooks:
     def resource_similar_topics(self, resource) -> list[dict]:
         """Get similar topics for a learning resource"""
 
+    @hookspec
+    def bulk_resources_similar_topics(self, resources) -> list[list[dict]]:
+        """Get similar topics for multiple learning resources"""
+
     @hookspec
     def bulk_resources_unpublished(self, resource_ids, resource_type):
         """Trigger actions after multiple learning resources are unpublished"""
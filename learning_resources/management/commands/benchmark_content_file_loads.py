@@ -0,0 +1,166 @@
+"""Management command to compare the speed of the content file loaders"""
+
+from hashlib import md5
+from time import perf_counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from learning_resources.constants import CONTENT_TYPE_FILE, LearningResourceType
+from learning_resources.etl.bulk_loaders import bulk_load_content_files
+from learning_resources.etl.loaders import load_content_file
+from learning_resources.etl.utils import transform_documents
+from learning_resources.models import (
+    ContentFile,
+    LearningResource,
+    LearningResourceRun,
+)
+from main.utils import chunks
+
+
+class QueryCounter:
+    """Count the queries made on a connection, without keeping them"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):  # noqa: PLR0913
+        """Count and run the query"""
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def synthetic_documents(count):
+    """
+    Return documents shaped like the ones read from an OLX archive
+
+    Args:
+        count(int): The number of documents in the archive
+
+    Returns:
+        list of tuple: The (content, metadata) of the documents
+    """
+    documents = []
+    for index in range(count):
+        content = f"Synthetic document {index}. " * 50
+        documents.append(
+            (
+                content,
+                {
+                    "key": f"document_{index}_synthetic.html",
+                    "content_type": CONTENT_TYPE_FILE,
+                    "mime_type": "text/html",
+                    "checksum": md5(content.encode("utf-8")).hexdigest(),  # noqa: S324
+                },
+            )
+        )
+    return documents
+
+
+def content_file_data(document, metadata):
+    """Return the content file data transform_documents yields for a document"""
+    return {
+        "key": metadata["key"],
+        "published": True,
+        "content_type": metadata["content_type"],
+        "checksum": metadata["checksum"],
+        "content": document,
+        "content_title": "",
+        "content_author": "",
+        "content_language": "",
+    }
+
+
+def load_one_at_a_time(run, documents, batch_size):  # noqa: ARG001
+    """
+    Check and load the documents with queries for each document, the way
+    transform_content_files and load_content_files used to
+    """
+    for document, metadata in documents:
+        data = content_file_data(document, metadata)
+        existing = ContentFile.objects.filter(key=metadata["key"], run=run).first()
+        if existing and existing.checksum == metadata["checksum"]:
+            data["content"] = existing.content
+        load_content_file(run, data)
+
+
+def load_in_bulk(run, documents, batch_size):
+    """
+    Check and load the documents with the preloaded checksums of
+    transform_documents and the set-based queries of bulk_load_content_files.
+    Documents that aren't loaded yet skip transform_documents, to leave tika out.
+    """
+    if ContentFile.objects.filter(run=run).exists():
+        content_files_data = transform_documents(documents, run)
+    else:
+        content_files_data = (
+            content_file_data(document, metadata) for document, metadata in documents
+        )
+    for content_files_chunk in chunks(content_files_data, chunk_size=batch_size):
+        bulk_load_content_files(run, content_files_chunk)
+
+
+class Command(BaseCommand):
+    """Compare the speed of the content file loaders"""
+
+    help = (
+        "Compare the time and queries to load a synthetic OLX archive one"
+        " content file at a time against the set-based loader. Nothing is saved."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            dest="count",
+            type=int,
+            default=5000,
+            help="The number of files in the synthetic archive",
+        )
+        parser.add_argument(
+            "--batch-size",
+            dest="batch_size",
+            type=int,
+            default=settings.ETL_LOADER_BATCH_SIZE,
+            help="The number of content files to load at a time",
+        )
+        super().add_arguments(parser)
+
+    def benchmark(self, name, load, documents, batch_size):
+        """Load the archive twice, as a new and an unchanged archive, then roll back"""
+        elapsed = 0
+        with transaction.atomic():
+            resource = LearningResource.objects.create(
+                readable_id="content-file-benchmark",
+                title="Content file benchmark",
+                resource_type=LearningResourceType.course.name,
+            )
+            run = LearningResourceRun.objects.create(
+                learning_resource=resource, run_id="content-file-benchmark"
+            )
+            for archive in ["new", "unchanged"]:
+                queries = QueryCounter()
+                with connection.execute_wrapper(queries):
+                    start = perf_counter()
+                    load(run, documents, batch_size)
+                    archive_elapsed = perf_counter() - start
+                self.stdout.write(
+                    f"{name}, {archive} archive: {len(documents)} files in"
+                    f" {archive_elapsed:.2f}s,"
+                    f" {len(documents) / archive_elapsed:.1f} files/sec,"
+                    f" {queries.count} queries"
+                )
+                elapsed += archive_elapsed
+            transaction.set_rollback(True)
+        return elapsed
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        """Load the same synthetic archive with both loaders"""
+        documents = synthetic_documents(options["count"])
+        one_at_a_time_elapsed = self.benchmark(
+            "One at a time", load_one_at_a_time, documents, options["batch_size"]
+        )
+        bulk_elapsed = self.benchmark(
+            "Set-based", load_in_bulk, documents, options["batch_size"]
+        )
+        self.stdout.write(f"Speedup: {one_at_a_time_elapsed / bulk_elapsed:.1f}x")
@@ -0,0 +1,40 @@
+"""Management command for evicting entries from the tika extraction cache"""
+
+from django.core.management import BaseCommand
+
+from learning_resources.etl.utils import extraction_cache_stats
+from learning_resources.tasks import evict_tika_extraction_cache
+
+
+class Command(BaseCommand):
+    """Evict stale entries from the tika extraction cache"""
+
+    help = "Evict stale entries from the tika extraction cache and report its hit ratio"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-age-days",
+            dest="max_age_days",
+            default=None,
+            type=int,
+            help="Evict entries that haven't been used for this many days",
+        )
+        parser.add_argument(
+            "--max-size-mb",
+            dest="max_size_mb",
+            default=None,
+            type=int,
+            help="Evict the least recently used entries beyond this many megabytes",
+        )
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        """Evict stale entries from the tika extraction cache"""
+        evicted = evict_tika_extraction_cache(
+            max_age_days=options["max_age_days"], max_size_mb=options["max_size_mb"]
+        )
+        stats = extraction_cache_stats()
+        self.stdout.write(
+            f"Evicted {evicted} entries, {stats['entries']} entries "
+            f"({stats['size']} bytes) remain with a hit ratio of "
+            f"{stats['hit_ratio']:.2f}"
+        )
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.11 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_resources", "0049_alter_learning_format"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="learningresource",
+            name="etl_checksum",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+    ]
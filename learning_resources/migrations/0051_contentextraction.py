@@ -0,0 +1,45 @@
+# Generated by Django 4.2.11 on 2026-10-17 04:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_resources", "0050_learningresource_etl_checksum"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContentExtraction",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_on", models.DateTimeField(auto_now=True)),
+                ("checksum", models.CharField(max_length=32)),
+                ("mime_type", models.CharField(blank=True, default="", max_length=128)),
+                (
+                    "ocr_strategy",
+                    models.CharField(blank=True, default="", max_length=64),
+                ),
+                ("content", models.TextField(blank=True, default="")),
+                ("metadata", models.JSONField(blank=True, default=dict)),
+                ("size", models.PositiveIntegerField(default=0)),
+                ("hits", models.PositiveIntegerField(default=0)),
+                (
+                    "last_used_on",
+                    models.DateTimeField(auto_now_add=True, db_index=True),
+                ),
+            ],
+            options={
+                "unique_together": {("checksum", "mime_type", "ocr_strategy")},
+            },
+        ),
+    ]
@@ -213,6 +213,7 @@ class LearningResource(TimestampedModel):
     etl_source = models.CharField(max_length=12, default="")
     professional = models.BooleanField(default=False)
     next_start_date = models.DateTimeField(null=True, blank=True, db_index=True)
+    etl_checksum = models.CharField(max_length=32, null=True, blank=True)  # noqa: DJ001
 
     @property
     def audience(self) -> str | None:
@@ -410,6 +411,24 @@ class ContentFile(TimestampedModel):
         verbose_name = "contentfile"
 
 
+class ContentExtraction(TimestampedModel):
+    """
+    Text and metadata extracted by tika from a file, keyed by the file checksum
+    """
+
+    checksum = models.CharField(max_length=32)
+    mime_type = models.CharField(max_length=128, blank=True, default="")
+    ocr_strategy = models.CharField(max_length=64, blank=True, default="")
+    content = models.TextField(blank=True, default="")
+    metadata = JSONField(default=dict, blank=True)
+    size = models.PositiveIntegerField(default=0)
+    hits = models.PositiveIntegerField(default=0)
+    last_used_on = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        unique_together = (("checksum", "mime_type", "ocr_strategy"),)
+
+
 class UserList(TimestampedModel):
     """
     Similar in concept to a LearningPath: a list of learning resources.
@@ -503,7 +503,13 @@ class LearningResourceBaseSerializer(serializers.ModelSerializer, WriteableTopic
     class Meta:
         model = models.LearningResource
         read_only_fields = ["professional", "views"]
-        exclude = ["content_tags", "resources", "etl_source", *COMMON_IGNORED_FIELDS]
+        exclude = [
+            "content_tags",
+            "resources",
+            "etl_source",
+            "etl_checksum",
+            *COMMON_IGNORED_FIELDS,
+        ]
 
 
 class ProgramResourceSerializer(LearningResourceBaseSerializer):
@@ -591,7 +597,13 @@ class LearningPathResourceSerializer(LearningResourceBaseSerializer):
 
     class Meta:
         model = models.LearningResource
-        exclude = ["content_tags", "resources", "etl_source", *COMMON_IGNORED_FIELDS]
+        exclude = [
+            "content_tags",
+            "resources",
+            "etl_source",
+            "etl_checksum",
+            *COMMON_IGNORED_FIELDS,
+        ]
         read_only_fields = ["platform", "offered_by", "readable_id"]
 
 
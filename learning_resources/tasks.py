@@ -19,7 +19,11 @@ from learning_resources.etl.edx_shared import (
 )
 from learning_resources.etl.loaders import load_next_start_date
 from learning_resources.etl.pipelines import ocw_courses_etl
-from learning_resources.etl.utils import get_learning_course_bucket_name
+from learning_resources.etl.utils import (
+    evict_extraction_cache,
+    extraction_cache_stats,
+    get_learning_course_bucket_name,
+)
 from learning_resources.models import LearningResource
 from learning_resources.utils import load_course_blocklist
 from main.celery import app
@@ -315,3 +319,35 @@ def get_learning_resource_views():
     """Load learning resource views from the PostHog ETL."""
 
     pipelines.posthog_etl()
+
+
+@app.task
+def evict_tika_extraction_cache(*, max_age_days=None, max_size_mb=None):
+    """
+    Evict stale and least recently used entries from the tika extraction cache
+
+    Args:
+        max_age_days (int or None): Maximum days since an entry was last used,
+            defaults to TIKA_EXTRACTION_CACHE_MAX_AGE_DAYS
+        max_size_mb (int or None): Maximum size of the cache in megabytes,
+            defaults to TIKA_EXTRACTION_CACHE_MAX_SIZE_MB
+
+    Returns:
+        int: The number of entries evicted
+    """
+    if max_age_days is None:
+        max_age_days = settings.TIKA_EXTRACTION_CACHE_MAX_AGE_DAYS
+    if max_size_mb is None:
+        max_size_mb = settings.TIKA_EXTRACTION_CACHE_MAX_SIZE_MB
+    stats = extraction_cache_stats()
+    log.info(
+        "Tika extraction cache has %d entries, %d bytes, hit ratio %.2f",
+        stats["entries"],
+        stats["size"],
+        stats["hit_ratio"],
+    )
+    evicted = evict_extraction_cache(
+        max_age_days=max_age_days, max_size=max_size_mb * 1024 * 1024
+    )
+    log.info("Evicted %d tika extraction cache entries", evicted)
+    return evicted
@@ -334,3 +334,24 @@ def test_update_next_start_date(mocker):
     )
     update_next_start_date()
     mock_load_next_start_date.assert_called_once_with(learning_resource)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected_args"),
+    [
+        ({}, (180, 2048)),
+        ({"max_age_days": 10, "max_size_mb": 5}, (10, 5)),
+        ({"max_age_days": 0, "max_size_mb": 0}, (0, 0)),
+    ],
+)
+def test_evict_tika_extraction_cache(mocker, settings, kwargs, expected_args):
+    """evict_tika_extraction_cache should evict entries using the configured limits"""
+    settings.TIKA_EXTRACTION_CACHE_MAX_AGE_DAYS = 180
+    settings.TIKA_EXTRACTION_CACHE_MAX_SIZE_MB = 2048
+    mock_evict = mocker.patch(
+        "learning_resources.tasks.evict_extraction_cache", return_value=3
+    )
+    assert tasks.evict_tika_extraction_cache.delay(**kwargs).get() == 3
+    mock_evict.assert_called_once_with(
+        max_age_days=expected_args[0], max_size=expected_args[1] * 1024 * 1024
+    )
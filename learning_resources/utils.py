@@ -345,6 +345,21 @@ def resource_upserted_actions(resource: LearningResource, percolate):
     hook.resource_upserted(resource=resource, percolate=percolate)
 
 
+def bulk_resources_upserted_actions(
+    resource_ids: list[int], resource_type: str, percolate_ids: list[int]
+):
+    """
+    Trigger plugins when multiple LearningResources are created or updated
+    """
+    pm = get_plugin_manager()
+    hook = pm.hook
+    hook.bulk_resources_upserted(
+        resource_ids=resource_ids,
+        resource_type=resource_type,
+        percolate_ids=percolate_ids,
+    )
+
+
 def resource_unpublished_actions(resource: LearningResource):
     """
     Trigger plugins when a LearningResource is removed/unpublished
@@ -365,6 +380,16 @@ def similar_topics_action(resource: LearningResource) -> dict:
     return topics[0] if topics else []
 
 
+def bulk_similar_topics_action(resources: list[LearningResource]) -> list[list[dict]]:
+    """
+    Trigger plugin to get similar topics for multiple resources at once
+    """
+    pm = get_plugin_manager()
+    hook = pm.hook
+    topics = hook.bulk_resources_similar_topics(resources=resources)
+    return topics[0] if topics else [[] for _ in resources]
+
+
 def resource_delete_actions(resource: LearningResource):
     """
     Trigger plugin to handle learning resource deletion
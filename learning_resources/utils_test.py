@@ -192,6 +192,16 @@ def test_resource_upserted_actions(mock_plugin_manager, fixture_resource):
     )
 
 
+def test_bulk_resources_upserted_actions(mock_plugin_manager):
+    """
+    bulk_resources_upserted_actions function should trigger plugin hook's bulk_resources_upserted function
+    """
+    utils.bulk_resources_upserted_actions([1, 2, 3], "course", [3])
+    mock_plugin_manager.hook.bulk_resources_upserted.assert_called_once_with(
+        resource_ids=[1, 2, 3], resource_type="course", percolate_ids=[3]
+    )
+
+
 def test_similar_topics_action(mock_plugin_manager, fixture_resource) -> dict:
     """
     similar_topics_action should trigger plugin hook's resource_similar_topics function
@@ -204,6 +214,18 @@ def test_similar_topics_action(mock_plugin_manager, fixture_resource) -> dict:
     )
 
 
+def test_bulk_similar_topics_action(mock_plugin_manager, fixture_resource):
+    """
+    bulk_similar_topics_action should trigger plugin hook's bulk_resources_similar_topics function
+    """
+    mock_topics = [[{"name": "Biology"}, {"name": "Chemistry"}]]
+    mock_plugin_manager.hook.bulk_resources_similar_topics.return_value = [mock_topics]
+    assert utils.bulk_similar_topics_action([fixture_resource]) == mock_topics
+    mock_plugin_manager.hook.bulk_resources_similar_topics.assert_called_once_with(
+        resources=[fixture_resource]
+    )
+
+
 def test_resource_unpublished_actions(mock_plugin_manager, fixture_resource):
     """
     resource_unpublished_actions function should trigger plugin hook's resource_unpublished function
@@ -14,3 +14,13 @@ class PercolateQueryAdmin(admin.ModelAdmin):
 
 
 admin.site.register(models.PercolateQuery, PercolateQueryAdmin)
+
+
+class IndexingWatermarkAdmin(admin.ModelAdmin):
+    """IndexingWatermark Admin"""
+
+    model = models.IndexingWatermark
+    list_display = ("object_type", "indexed_at")
+
+
+admin.site.register(models.IndexingWatermark, IndexingWatermarkAdmin)
@@ -1,22 +1,35 @@
 """API for general search-related functionality"""
 
+import base64
+import hashlib
+import json
+import logging
 import re
+import threading
 from collections import Counter
+from contextlib import contextmanager
 
-from opensearch_dsl import Search
+from django.conf import settings
+from django.core.cache import caches
+from opensearch_dsl import MultiSearch, Q, Search
 from opensearch_dsl.query import MoreLikeThis, Percolate
+from opensearchpy.exceptions import RequestError
 
 from learning_resources.constants import LEARNING_RESOURCE_SORTBY_OPTIONS
-from learning_resources.models import LearningResource
+from learning_resources.models import LearningResource, LearningResourceRun
 from learning_resources_search.connection import (
+    get_conn,
     get_default_alias_name,
 )
 from learning_resources_search.constants import (
+    AUTOCOMPLETE_FIELD,
+    CARD_VIEW,
     CONTENT_FILE_TYPE,
     COURSE_QUERY_FIELDS,
     COURSE_TYPE,
     DEPARTMENT_QUERY_FIELDS,
     LEARNING_RESOURCE,
+    LEARNING_RESOURCE_CARD_FIELDS,
     LEARNING_RESOURCE_QUERY_FIELDS,
     LEARNING_RESOURCE_SEARCH_FILTERS,
     LEARNING_RESOURCE_TYPES,
@@ -27,14 +40,35 @@ from learning_resources_search.constants import (
     TOPICS_QUERY_FIELDS,
 )
 from learning_resources_search.models import PercolateQuery
+from learning_resources_search.timing import (
+    CACHE_PHASE,
+    CONSTRUCT_PHASE,
+    OPENSEARCH_PHASE,
+    SUGGEST_PHASE,
+    SearchTimer,
+)
 from learning_resources_search.utils import (
     adjust_search_for_percolator,
     document_percolated_actions,
 )
+from main.utils import chunks
+
+log = logging.getLogger(__name__)
 
 LEARN_SUGGEST_FIELDS = ["title.trigram", "description.trigram"]
 COURSENUM_SORT_FIELD = "course.course_numbers.sort_coursenum"
 DEFAULT_SORT = "-created_on"
+SEARCH_TEXT_PLACEHOLDER = "__search_text__"
+SEARCH_CACHE_PREFIX = "learn_search"
+SEARCH_CACHE_GENERATION_KEY = f"{SEARCH_CACHE_PREFIX}_generation"
+SEARCH_CACHE_HITS_KEY = f"{SEARCH_CACHE_PREFIX}_hits"
+SEARCH_CACHE_MISSES_KEY = f"{SEARCH_CACHE_PREFIX}_misses"
+FACET_CACHE_IGNORED_PARAMS = ("offset", "sortby", "view")
+SIMILAR_TOPICS_CACHE_PREFIX = "similar_topics"
+AUTOCOMPLETE_CACHE_ENDPOINT = "autocomplete"
+SIMILAR_TOPICS_MSEARCH_CHUNK_SIZE = 100
+# Makes the sort order total, so search_after never skips or repeats a hit
+CURSOR_TIEBREAK_SORT = {"id": "asc"}
 
 
 def gen_content_file_id(content_file_id):
@@ -385,7 +419,12 @@ def generate_suggest_clause(text):
 
 
 def generate_aggregation_clause(
-    aggregation_name: str, path: str, _current_path_length=1
+    aggregation_name: str,
+    path: str,
+    _current_path_length=1,
+    *,
+    size=10000,
+    reverse_nested=True,
 ):
     """
     Generate a search aggregation clause for a search query.
@@ -393,6 +432,8 @@ def generate_aggregation_clause(
     Args:
         aggregation_name (str): name of aggregation
         path (str): Search index on which to aggregate
+        size (int): The maximum number of buckets to return
+        reverse_nested (bool): Whether to count the root documents of nested buckets
 
     Returns:
         An OpenSearch query clause for use in aggregation.
@@ -404,8 +445,8 @@ def generate_aggregation_clause(
     current_path = ".".join(path_pieces[0:_current_path_length])
 
     if current_path == path:
-        bucket_agg = {"terms": {"field": path, "size": 10000}}
-        if _current_path_length == 1:
+        bucket_agg = {"terms": {"field": path, "size": size}}
+        if _current_path_length == 1 or not reverse_nested:
             return bucket_agg
         else:
             # In case of nested aggregations, use reverse_nested to return the
@@ -421,7 +462,11 @@ def generate_aggregation_clause(
         "nested": {"path": current_path},
         "aggs": {
             aggregation_name: generate_aggregation_clause(
-                aggregation_name, path, _current_path_length + 1
+                aggregation_name,
+                path,
+                _current_path_length + 1,
+                size=size,
+                reverse_nested=reverse_nested,
             )
         },
     }
@@ -429,7 +474,9 @@ def generate_aggregation_clause(
 
 def generate_aggregation_clauses(search_params, filter_clauses):
     """
-    Return the aggregations for the query
+    Return the aggregations for the query. Facet-only searches use a smaller bucket
+    size, and skip reverse_nested for nested values which can't repeat within a
+    document.
 
     Args:
         search_params (dict): the query parameters for the search
@@ -438,12 +485,23 @@ def generate_aggregation_clauses(search_params, filter_clauses):
         dict: dictionary with the opensearch aggregation clause
     """
     aggregation_clauses = {}
+    facets_only = is_facet_search(search_params)
     if search_params.get("aggregations"):
         for aggregation in search_params.get("aggregations"):
             # Each aggregation clause contains a filter which includes all the filters
             # except it's own
-            path = LEARNING_RESOURCE_SEARCH_FILTERS[aggregation].path
-            unfiltered_aggs = generate_aggregation_clause(aggregation, path)
+            filter_config = LEARNING_RESOURCE_SEARCH_FILTERS[aggregation]
+            if facets_only:
+                unfiltered_aggs = generate_aggregation_clause(
+                    aggregation,
+                    filter_config.path,
+                    size=settings.OPENSEARCH_FACET_BUCKET_SIZE,
+                    reverse_nested=not filter_config.unique_per_document,
+                )
+            else:
+                unfiltered_aggs = generate_aggregation_clause(
+                    aggregation, filter_config.path
+                )
             other_filters = [
                 filter_clauses[key] for key in filter_clauses if key != aggregation
             ]
@@ -481,7 +539,7 @@ def adjust_original_query_for_percolate(query):
     Remove keys that are irrelevent when storing original queries
     for percolate uniqueness such as "limit" and "offset"
     """
-    for key in ["limit", "offset", "sortby"]:
+    for key in ["limit", "offset", "sortby", "cursor", "view"]:
         query.pop(key, None)
     return order_params(query)
 
@@ -506,94 +564,805 @@ def percolate_matches_for_document(document_id):
         )
 
 
-def construct_search(search_params):
+def percolate_matches_for_documents(document_ids):
     """
-    Construct a learning resources search based on the query
+    Percolate matching queries for a batch of learning resources with a single
+    multi-search request and call signal handler with the matches of each resource
+
+    Args:
+        document_ids(list of int): The learning resource ids
 
+    Returns:
+        dict: The matched percolate query ids, keyed by learning resource id
+    """
+    resources = list(
+        LearningResource.objects.filter(id__in=document_ids, published=True).order_by(
+            "id"
+        )
+    )
+    if not resources:
+        return {}
+    multi_search = MultiSearch()
+    for resource in resources:
+        multi_search = multi_search.add(
+            Search().query(
+                Percolate(
+                    field="query",
+                    index=get_default_alias_name(resource.resource_type),
+                    id=str(resource.id),
+                )
+            )
+        )
+    responses = multi_search.execute(raise_on_error=False)
+
+    matches = {}
+    for resource, results in zip(resources, responses):
+        if results is None:
+            log.error("Unable to percolate document %i", resource.id)
+            continue
+        percolate_ids = [int(result.id) for result in results.hits]
+        if percolate_ids:
+            matches[resource.id] = percolate_ids
+
+    if matches:
+        percolate_queries = PercolateQuery.objects.in_bulk(
+            {percolate_id for ids in matches.values() for percolate_id in ids}
+        )
+        for resource in resources:
+            if resource.id in matches:
+                document_percolated_actions(
+                    resource,
+                    [
+                        percolate_queries[percolate_id]
+                        for percolate_id in matches[resource.id]
+                        if percolate_id in percolate_queries
+                    ],
+                )
+    return matches
+
+
+def _compile_text_template(generate_clause, *, quoted=False, is_query=True):
+    """
+    Precompile a clause that only depends on the search text into a frozen
+    JSON template, so requests only need to substitute the text into it.
 
     Args:
-        search_params (dict): The opensearch query params returned from
-        LearningResourcesSearchRequestSerializer
+        generate_clause (function): function that generates the clause for a text
+        quoted (bool): whether the template is for a quoted (query_string) search
+        is_query (bool): whether the clause is a query
 
     Returns:
-        opensearch_dsl.Search: an opensearch search instance
+        tuple: the JSON template, the pattern matching its placeholders, and
+            the placeholder for the text as-is (the other is for uppercased text)
     """
+    text = f'"{SEARCH_TEXT_PLACEHOLDER}"' if quoted else SEARCH_TEXT_PLACEHOLDER
+    placeholder = json.dumps(text)[1:-1]
+    upper_placeholder = json.dumps(text.upper())[1:-1]
+    clause = generate_clause(text)
+    if is_query:
+        # Serialize the query the same way opensearch_dsl would
+        clause = Q(clause).to_dict()
+    return (
+        json.dumps(clause),
+        re.compile(f"{re.escape(placeholder)}|{re.escape(upper_placeholder)}"),
+        placeholder,
+    )
 
-    if (
-        not search_params.get("resource_type")
-        and search_params.get("endpoint") != CONTENT_FILE_TYPE
-    ):
-        search_params["resource_type"] = list(LEARNING_RESOURCE_TYPES)
 
-    indexes = relevant_indexes(
-        search_params.get("resource_type"),
-        search_params.get("aggregations"),
-        search_params.get("endpoint"),
+def render_text_template(compiled_template, text):
+    """
+    Substitute the search text into a template made by _compile_text_template
+
+    Args:
+        compiled_template (tuple): the output of _compile_text_template
+        text (string): the search text
+
+    Returns:
+        dict: the clause for the search text
+    """
+    template, pattern, placeholder = compiled_template
+    escaped = json.dumps(text)[1:-1]
+    escaped_upper = json.dumps(text.upper())[1:-1]
+    return json.loads(
+        pattern.sub(
+            lambda match: escaped if match.group() == placeholder else escaped_upper,
+            template,
+        )
     )
 
-    search = Search(index=",".join(indexes))
 
-    search = search.source(fields={"excludes": SOURCE_EXCLUDED_FIELDS})
+TEXT_CLAUSE_TEMPLATES = {
+    (endpoint, quoted): _compile_text_template(generate_clause, quoted=quoted)
+    for endpoint, generate_clause in (
+        (CONTENT_FILE_TYPE, generate_content_file_text_clause),
+        (LEARNING_RESOURCE, generate_learning_resources_text_clause),
+    )
+    for quoted in (False, True)
+}
+SUGGEST_CLAUSE_TEMPLATE = _compile_text_template(
+    generate_suggest_clause, is_query=False
+)
 
-    if search_params.get("offset"):
-        search = search.extra(from_=search_params.get("offset"))
 
-    if search_params.get("limit"):
-        search = search.extra(size=search_params.get("limit"))
+def encode_search_cursor(sort_values):
+    """
+    Encode the sort values of the last hit of a page into a cursor
+
+    Args:
+        sort_values (list): the sort values of the hit
+    Returns:
+        str: the cursor
+    """
+    return (
+        base64.urlsafe_b64encode(
+            json.dumps(sort_values, separators=(",", ":")).encode()
+        )
+        .decode()
+        .rstrip("=")
+    )
+
+
+def decode_search_cursor(cursor):
+    """
+    Decode a cursor made by encode_search_cursor
+
+    Args:
+        cursor (str): the cursor, empty for the first page
+    Returns:
+        list or None: the sort values to search after
+    Raises:
+        ValueError: if the cursor is invalid
+    """
+    if not cursor:
+        return None
+    padding = "=" * (-len(cursor) % 4)
+    sort_values = json.loads(base64.urlsafe_b64decode(f"{cursor}{padding}".encode()))
+    if not isinstance(sort_values, list):
+        msg = "Cursor must encode a list of sort values"
+        raise ValueError(msg)  # noqa: TRY004
+    return sort_values
+
+
+def _generate_body_sort(search_params):
+    """
+    Return the sort for a search request body, serialized the same way as
+    opensearch_dsl.Search.sort() would
 
+    Args:
+        search_params (dict): the search params
+    Returns:
+        dict or String or None: the sort clause, if any
+    """
+    sort = None
     if search_params.get("sortby"):
         sort = generate_sort_clause(search_params)
-        search = search.sort(sort)
     elif not search_params.get("q"):
-        search = search.sort(DEFAULT_SORT)
+        sort = DEFAULT_SORT
+    if isinstance(sort, str) and sort.startswith("-"):
+        return {sort[1:]: {"order": "desc"}}
+    return sort
+
+
+def is_facet_search(search_params):
+    """
+    Return whether a search only needs aggregations and no hits (limit=0)
+
+    Args:
+        search_params (dict): the search params
+    Returns:
+        bool: True if the search is for facets only
+    """
+    return search_params.get("limit") == 0
+
+
+def _search_text(search_params):
+    """
+    Return the search text with curly quotes replaced by straight ones
+
+    Args:
+        search_params (dict): the search params
+    Returns:
+        str: the search text
+    """
+    return re.sub("[\u201c\u201d]", '"', search_params.get("q"))
+
 
-    if search_params.get("endpoint") == CONTENT_FILE_TYPE:
+def _generate_body_query(search_params, *, facets_only=False):
+    """
+    Return the query part of a search request body
+
+    Args:
+        search_params (dict): the search params
+        facets_only (bool): whether the search is for facets only, in which
+            case the text query is not scored
+    Returns:
+        dict: the query clause
+    """
+    endpoint = search_params.get("endpoint")
+    if endpoint == CONTENT_FILE_TYPE:
         query_type_query = {"exists": {"field": "content_type"}}
     else:
         query_type_query = {"exists": {"field": "resource_type"}}
 
-    if search_params.get("q"):
-        text = re.sub("[\u201c\u201d]", '"', search_params.get("q"))
-        if search_params.get("endpoint") == CONTENT_FILE_TYPE:
-            text_query = generate_content_file_text_clause(text)
-        else:
-            text_query = generate_learning_resources_text_clause(text)
+    if not search_params.get("q"):
+        return {"query": query_type_query}
+
+    text = _search_text(search_params)
+    quoted = text.startswith('"') and text.endswith('"')
+    text_query = render_text_template(
+        TEXT_CLAUSE_TEMPLATES[
+            (
+                CONTENT_FILE_TYPE
+                if endpoint == CONTENT_FILE_TYPE
+                else LEARNING_RESOURCE,
+                quoted,
+            )
+        ],
+        text,
+    )
+    if facets_only:
+        # The should clauses only affect scoring, matching is done by the filter
+        text_query["bool"].pop("should", None)
+        return {"query": {"bool": {"filter": [text_query, query_type_query]}}}
 
-        suggest = generate_suggest_clause(text)
-        search = search.query("bool", must=[text_query], filter=query_type_query)
-        search = search.extra(suggest=suggest)
-    else:
-        search = search.query(query_type_query)
+    return {"query": {"bool": {"must": [text_query], "filter": [query_type_query]}}}
 
-    filter_clauses = generate_filter_clauses(search_params)
 
-    search = search.post_filter("bool", must=list(filter_clauses.values()))
+def needs_suggestions(search_params, response):
+    """
+    Return whether a text search found few enough hits that spelling
+    suggestions should be shown for it
 
-    if search_params.get("aggregations"):
-        aggregation_clauses = generate_aggregation_clauses(
-            search_params, filter_clauses
+    Args:
+        search_params (dict): the search params
+        response (dict): the opensearch response dict for the search
+    Returns:
+        bool: True if suggestions should be requested for the search text
+    """
+    if not search_params.get("q") or is_facet_search(search_params):
+        return False
+    total = response.get("hits", {}).get("total", 0)
+    if isinstance(total, dict):
+        total = total.get("value", 0)
+    return total <= settings.OPENSEARCH_MAX_SUGGEST_HITS
+
+
+def construct_suggest_body(search_params):
+    """
+    Construct the request body for the spelling suggestions of a search, which
+    are only requested when the search itself returns few or no hits
+
+    Args:
+        search_params (dict): the search params
+    Returns:
+        dict: the opensearch request body dict
+    """
+    return {
+        "size": 0,
+        "suggest": render_text_template(
+            SUGGEST_CLAUSE_TEMPLATE, _search_text(search_params)
+        ),
+    }
+
+
+def construct_search_body(search_params):
+    """
+    Construct the indexes and request body for a learning resources search from
+    the precompiled query templates
+
+
+    Args:
+        search_params (dict): The opensearch query params returned from
+        LearningResourcesSearchRequestSerializer
+
+    Returns:
+        tuple: the list of index names and the opensearch request body dict
+    """
+
+    endpoint = search_params.get("endpoint")
+    if not search_params.get("resource_type") and endpoint != CONTENT_FILE_TYPE:
+        search_params["resource_type"] = list(LEARNING_RESOURCE_TYPES)
+
+    indexes = list(
+        relevant_indexes(
+            search_params.get("resource_type"),
+            search_params.get("aggregations"),
+            endpoint,
         )
-        search = search.extra(aggs=aggregation_clauses)
+    )
+
+    facets_only = is_facet_search(search_params)
+    body = _generate_body_query(search_params, facets_only=facets_only)
+
+    filter_clauses = generate_filter_clauses(search_params)
+    body["post_filter"] = {
+        "bool": {"must": list(filter_clauses.values())} if filter_clauses else {}
+    }
+
+    if search_params.get("aggregations"):
+        body["aggs"] = generate_aggregation_clauses(search_params, filter_clauses)
+
+    if facets_only:
+        # No hits are returned, so there's nothing to sort or fetch
+        body["size"] = 0
+        return indexes, body
+
+    sort = _generate_body_sort(search_params)
+    if "cursor" in search_params:
+        body["sort"] = [sort or "_score", CURSOR_TIEBREAK_SORT]
+        search_after = decode_search_cursor(search_params["cursor"])
+        if search_after:
+            body["search_after"] = search_after
+    else:
+        if sort:
+            body["sort"] = [sort]
+
+        if search_params.get("offset"):
+            body["from"] = search_params.get("offset")
+
+    if search_params.get("limit"):
+        body["size"] = search_params.get("limit")
+
+    if search_params.get("view") == CARD_VIEW:
+        body["_source"] = {"includes": LEARNING_RESOURCE_CARD_FIELDS}
+    else:
+        body["_source"] = {"excludes": SOURCE_EXCLUDED_FIELDS}
+
+    return indexes, body
+
+
+def get_search_routing(search_params):
+    """
+    Get the routing for a content file search filtered to particular learning
+    resources or runs. Content files are indexed with the id of their learning
+    resource as routing, so the search only needs to go to the shards holding
+    those resources' content files.
+
+    Args:
+        search_params (dict): The search params
+
+    Returns:
+        str or None: the comma-separated routing values, if the search can be routed
+    """
+    if search_params.get("endpoint") != CONTENT_FILE_TYPE:
+        return None
+    resource_ids = search_params.get("resource_id")
+    if not resource_ids and search_params.get("run_id"):
+        resource_ids = LearningResourceRun.objects.filter(
+            id__in=search_params["run_id"]
+        ).values_list("learning_resource_id", flat=True)
+    if not resource_ids:
+        return None
+    return ",".join(str(resource_id) for resource_id in sorted(set(resource_ids)))
+
+
+def construct_search(search_params):
+    """
+    Construct a learning resources search based on the query
+
+
+    Args:
+        search_params (dict): The opensearch query params returned from
+        LearningResourcesSearchRequestSerializer
+
+    Returns:
+        opensearch_dsl.Search: an opensearch search instance
+    """
+    search = _search_from_body(*construct_search_body(search_params))
+    routing = get_search_routing(search_params)
+    return search.params(routing=routing) if routing else search
+
+
+def _search_from_body(indexes, body):
+    """
+    Build an opensearch_dsl.Search for a request body
+
+    Args:
+        indexes (list of str): the index names
+        body (dict): the opensearch request body dict
+
+    Returns:
+        opensearch_dsl.Search: an opensearch search instance
+    """
+    # suggest and aggs are passed through as-is, the same way they are sent
+    # by execute_learn_search
+    extra = {key: body.pop(key) for key in ("suggest", "aggs") if key in body}
+    search = Search(index=",".join(indexes)).update_from_dict(body)
+    return search.extra(**extra) if extra else search
+
+
+def _incr_search_cache_counter(cache, key):
+    """Increment a search cache counter, creating it if it doesn't exist yet"""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
 
-    return search
+def get_search_cache_key(search_params):
+    """
+    Get the search cache key for a set of search params. The key includes the
+    current cache generation so entries go stale whenever the indexes change.
 
+    Args:
+        search_params (dict): The validated search params
 
-def execute_learn_search(search_params):
+    Returns:
+        str: The cache key
     """
-    Execute a learning resources search based on the query
+    generation = caches["redis"].get_or_set(
+        SEARCH_CACHE_GENERATION_KEY, 0, timeout=None
+    )
+    digest = hashlib.sha256(
+        json.dumps(order_params(search_params), default=str).encode()
+    ).hexdigest()
+    return f"{SEARCH_CACHE_PREFIX}:{generation}:{digest}"
+
+
+_deferred_generation_bump = threading.local()
+
+
+def bump_search_cache_generation():
+    """
+    Invalidate all cached search responses by incrementing the cache generation,
+    or at the end of the defer_search_cache_generation_bump block this is run in
+    """
+    if not (
+        settings.OPENSEARCH_SEARCH_CACHE_TTL or settings.OPENSEARCH_FACET_CACHE_TTL
+    ):
+        return
+    if getattr(_deferred_generation_bump, "pending", None) is not None:
+        _deferred_generation_bump.pending = True
+        return
+    try:
+        _incr_search_cache_counter(caches["redis"], SEARCH_CACHE_GENERATION_KEY)
+    except Exception:
+        log.exception("Unable to bump the search cache generation")
+
+
+@contextmanager
+def defer_search_cache_generation_bump():
+    """
+    Bump the search cache generation once at the end of a block which changes the
+    indexes several times, instead of after each change
+    """
+    if getattr(_deferred_generation_bump, "pending", None) is not None:
+        # Already deferred by an enclosing block
+        yield
+        return
+    _deferred_generation_bump.pending = False
+    try:
+        yield
+    finally:
+        pending = _deferred_generation_bump.pending
+        _deferred_generation_bump.pending = None
+        if pending:
+            bump_search_cache_generation()
+
+
+def get_search_cache_stats():
+    """
+    Get the search cache hit and miss counters
+
+    Returns:
+        dict: The number of search cache hits and misses
+    """
+    counters = caches["redis"].get_many(
+        [SEARCH_CACHE_HITS_KEY, SEARCH_CACHE_MISSES_KEY]
+    )
+    return {
+        "hits": counters.get(SEARCH_CACHE_HITS_KEY, 0),
+        "misses": counters.get(SEARCH_CACHE_MISSES_KEY, 0),
+    }
+
+
+def _search_cache_params(search_params):
+    """
+    Get how long to cache the response to a search, and the params to key it by
+
+    Args:
+        search_params (dict): The validated search params
+
+    Returns:
+        tuple: the cache timeout in seconds and the params for the cache key
+    """
+    if is_facet_search(search_params):
+        # Paging and sorting don't affect facets, so leave them out of the key
+        return settings.OPENSEARCH_FACET_CACHE_TTL, {
+            key: value
+            for key, value in search_params.items()
+            if key not in FACET_CACHE_IGNORED_PARAMS
+        }
+    return settings.OPENSEARCH_SEARCH_CACHE_TTL, search_params
+
+
+def _execute_uncached_learn_search(search_params, timer):
+    """Construct and execute a search without the search cache"""
+    with timer.phase(CONSTRUCT_PHASE):
+        indexes, body = construct_search_body(search_params)
+        routing = get_search_routing(search_params)
+    params = {"routing": routing} if routing else {}
+    timer.query = {"index": indexes, "body": body, **params}
+
+    with timer.phase(OPENSEARCH_PHASE):
+        response = get_conn().search(body=body, index=indexes, **params)
+    timer.record_opensearch_response(response)
+
+    if needs_suggestions(search_params, response):
+        with timer.phase(SUGGEST_PHASE):
+            suggest_response = get_conn().search(
+                body=construct_suggest_body(search_params), index=indexes, **params
+            )
+        response["suggest"] = suggest_response.get("suggest", {})
+    return response
+
+
+def execute_learn_search(search_params, timer=None):
+    """
+    Execute a learning resources search based on the query. Responses are cached
+    per normalized search params for OPENSEARCH_SEARCH_CACHE_TTL seconds, or
+    OPENSEARCH_FACET_CACHE_TTL seconds for facet-only searches, and the cache is
+    skipped if that setting is 0 or the cache is unavailable.
 
 
     Args:
         search_params (dict): The opensearch query params returned from
         LearningResourcesSearchRequestSerializer
+        timer (SearchTimer): Optional timer to record the search phases with
 
     Returns:
         dict: The opensearch response dict
     """
+    timer = timer or SearchTimer()
+    timeout, cache_params = _search_cache_params(search_params)
+    if not timeout:
+        return _execute_uncached_learn_search(search_params, timer)
+
+    cache = caches["redis"]
+    try:
+        with timer.phase(CACHE_PHASE):
+            cache_key = get_search_cache_key(cache_params)
+            response = cache.get(cache_key)
+            if response is not None:
+                _incr_search_cache_counter(cache, SEARCH_CACHE_HITS_KEY)
+    except Exception:
+        log.exception("Unable to read from the search cache")
+        return _execute_uncached_learn_search(search_params, timer)
+
+    if response is not None:
+        return response
+
+    response = _execute_uncached_learn_search(search_params, timer)
+    try:
+        with timer.phase(CACHE_PHASE):
+            cache.set(cache_key, response, timeout=timeout)
+            _incr_search_cache_counter(cache, SEARCH_CACHE_MISSES_KEY)
+    except Exception:
+        log.exception("Unable to write to the search cache")
+    return response
+
+
+def execute_learn_searches(search_params_list, timer=None):
+    """
+    Execute several learning resources searches with one multisearch request.
+    Responses are cached the same way as execute_learn_search, and only the
+    searches which aren't cached are sent to OpenSearch.
+
+    Args:
+        search_params_list (list of dict): The opensearch query params returned
+        from LearningResourcesSearchRequestSerializer, for each search
+        timer (SearchTimer): Optional timer to record the search phases with
+
+    Returns:
+        list of dict: The opensearch response dicts, in the same order, with an
+        error dict in place of the response of a search that failed
+    """
+    timer = timer or SearchTimer()
+    cache = caches["redis"]
+    responses = [None] * len(search_params_list)
+    cache_keys = _get_cached_search_responses(
+        search_params_list, responses, cache, timer
+    )
+
+    uncached = [idx for idx, response in enumerate(responses) if response is None]
+    if not uncached:
+        return responses
+
+    multi_search = MultiSearch()
+    indexes = {}
+    with timer.phase(CONSTRUCT_PHASE):
+        for idx in uncached:
+            indexes[idx], body = construct_search_body(search_params_list[idx])
+            multi_search = multi_search.add(_search_from_body(indexes[idx], body))
+    timer.query = multi_search.to_dict()
+
+    with timer.phase(OPENSEARCH_PHASE):
+        results = multi_search.execute(raise_on_error=False)
+    succeeded = _add_search_results(responses, uncached, results, indexes)
+    for idx in uncached:
+        if idx not in succeeded:
+            cache_keys.pop(idx, None)
+    # The searches run in parallel, so the slowest one is the time spent searching
+    timer.record_opensearch_response(
+        {"took": max((responses[idx].get("took", 0) for idx in succeeded), default=0)}
+    )
+    _add_suggestions(search_params_list, responses, succeeded, indexes, timer)
+
+    try:
+        with timer.phase(CACHE_PHASE):
+            for idx, (cache_key, timeout) in cache_keys.items():
+                cache.set(cache_key, responses[idx], timeout=timeout)
+                _incr_search_cache_counter(cache, SEARCH_CACHE_MISSES_KEY)
+    except Exception:
+        log.exception("Unable to write to the search cache")
+    return responses
+
+
+def _get_cached_search_responses(search_params_list, responses, cache, timer):
+    """
+    Fill in the responses of the searches of a batch which are cached
+
+    Args:
+        search_params_list (list of dict): The search params for each search
+        responses (list of dict): The opensearch response dicts, in order
+        cache (BaseCache): The search cache
+        timer (SearchTimer): The timer to record the cache phase with
+
+    Returns:
+        dict: The (cache key, timeout) of the cacheable searches which weren't
+        cached, keyed by position
+    """
+    cache_keys = {}
+    for idx, search_params in enumerate(search_params_list):
+        timeout, cache_params = _search_cache_params(search_params)
+        if not timeout:
+            continue
+        try:
+            with timer.phase(CACHE_PHASE):
+                cache_key = get_search_cache_key(cache_params)
+                responses[idx] = cache.get(cache_key)
+                if responses[idx] is not None:
+                    _incr_search_cache_counter(cache, SEARCH_CACHE_HITS_KEY)
+        except Exception:
+            log.exception("Unable to read from the search cache")
+            continue
+        if responses[idx] is None:
+            cache_keys[idx] = (cache_key, timeout)
+    return cache_keys
+
+
+def _add_search_results(responses, uncached, results, indexes):
+    """
+    Add the results of the searches of a batch sent to OpenSearch to their
+    responses, or an error for the searches that failed
+
+    Args:
+        responses (list of dict): The opensearch response dicts, in order
+        uncached (list of int): The positions of the searches sent to OpenSearch
+        results (list of Response): The multisearch results, None if failed
+        indexes (dict): The index names searched, keyed by position
+
+    Returns:
+        list of int: The positions of the searches that succeeded
+    """
+    succeeded = []
+    for idx, result in zip(uncached, results):
+        if result is None:
+            log.error("Unable to run search %i of a batch on %s", idx, indexes[idx])
+            responses[idx] = {"error": "Unable to run search"}
+        else:
+            responses[idx] = result.to_dict()
+            succeeded.append(idx)
+    return succeeded
+
+
+def _add_suggestions(search_params_list, responses, uncached, indexes, timer):
+    """
+    Request the spelling suggestions for the searches of a batch which need
+    them with one multisearch request, and add them to their responses
+
+    Args:
+        search_params_list (list of dict): The search params for each search
+        responses (list of dict): The opensearch response dicts, in the same order
+        uncached (list of int): The positions of the searches sent to OpenSearch
+        indexes (dict): The index names searched, keyed by position
+        timer (SearchTimer): The timer to record the suggest phase with
+    """
+    suggested = [
+        idx
+        for idx in uncached
+        if needs_suggestions(search_params_list[idx], responses[idx])
+    ]
+    if not suggested:
+        return
+    multi_search = MultiSearch()
+    for idx in suggested:
+        multi_search = multi_search.add(
+            _search_from_body(
+                indexes[idx], construct_suggest_body(search_params_list[idx])
+            )
+        )
+    with timer.phase(SUGGEST_PHASE):
+        results = multi_search.execute(raise_on_error=False)
+    for idx, result in zip(suggested, results):
+        if result is None:
+            log.warning("Unable to get search suggestions for %s", indexes[idx])
+            continue
+        responses[idx]["suggest"] = result.to_dict().get("suggest", {})
+
+
+def execute_autocomplete(text, limit, timer=None):
+    """
+    Get the titles, course numbers, topics and instructors of learning
+    resources which start with the text. Suggestions are cached for
+    OPENSEARCH_SEARCH_CACHE_TTL seconds, the same as search responses.
 
-    search = construct_search(search_params)
+    Args:
+        text (str): The text to autocomplete
+        limit (int): The maximum number of suggestions
+        timer (SearchTimer): Optional timer to record the phases with
 
-    return search.execute().to_dict()
+    Returns:
+        list of str: The suggestions, best first, or an empty list if the indexes
+            were created before the autocomplete field was mapped for completion
+    """
+    timer = timer or SearchTimer()
+    cache = caches["redis"]
+    timeout = settings.OPENSEARCH_SEARCH_CACHE_TTL
+    cache_key = None
+    if timeout:
+        try:
+            with timer.phase(CACHE_PHASE):
+                cache_key = get_search_cache_key(
+                    {"endpoint": AUTOCOMPLETE_CACHE_ENDPOINT, "q": text, "limit": limit}
+                )
+                suggestions = cache.get(cache_key)
+        except Exception:
+            log.exception("Unable to read from the search cache")
+            cache_key = None
+        else:
+            if suggestions is not None:
+                return suggestions
+
+    body = {
+        "_source": False,
+        "suggest": {
+            AUTOCOMPLETE_FIELD: {
+                "prefix": text,
+                "completion": {
+                    "field": AUTOCOMPLETE_FIELD,
+                    "size": limit,
+                    "skip_duplicates": True,
+                },
+            }
+        },
+    }
+    indexes = [get_default_alias_name(index) for index in LEARNING_RESOURCE_TYPES]
+    timer.query = {"index": indexes, "body": body}
+    try:
+        with timer.phase(OPENSEARCH_PHASE):
+            response = get_conn().search(body=body, index=indexes)
+    except RequestError:
+        # Indexes created before autocomplete was added map it dynamically as an
+        # object until they are recreated
+        log.warning(
+            "Unable to autocomplete, %s is not a completion field", AUTOCOMPLETE_FIELD
+        )
+        return []
+    timer.record_opensearch_response(response)
+    suggestions = [
+        option["text"]
+        for entry in response.get("suggest", {}).get(AUTOCOMPLETE_FIELD, [])
+        for option in entry["options"]
+    ]
+
+    if cache_key:
+        try:
+            with timer.phase(CACHE_PHASE):
+                cache.set(cache_key, suggestions, timeout=timeout)
+        except Exception:
+            log.exception("Unable to write to the search cache")
+    return suggestions
 
 
 def subscribe_user_to_search_query(user, search_params):
@@ -688,25 +1457,20 @@ def user_subscribed_to_query(user, search_params):
     )
 
 
-def get_similar_topics(
-    value_doc: dict, num_topics: int, min_term_freq: int, min_doc_freq: int
-) -> list[str]:
+def _similar_topics_search(value_doc: dict, min_term_freq: int, min_doc_freq: int):
     """
-    Get a list of similar topics based on text values
+    Build a MoreLikeThis search for the topics of courses similar to a text doc
 
     Args:
         value_doc (dict):
             a document representing the data fields we want to search with
-        num_topics (int):
-            number of topics to return
         min_term_freq (int):
             minimum times a term needs to show up in input
         min_doc_freq (int):
             minimum times a term needs to show up in docs
 
     Returns:
-        list of str:
-            list of topic values
+        Search: the MoreLikeThis search
     """
     indexes = relevant_indexes([COURSE_TYPE], [], endpoint=LEARNING_RESOURCE)
     search = Search(index=",".join(indexes))
@@ -724,11 +1488,131 @@ def get_similar_topics(
             min_doc_freq=min_doc_freq,
         )
     )
-    search = search.source(includes="topics")
+    return search.source(includes="topics")
 
-    response = search.execute()
 
-    topics = [topic.to_dict()["name"] for hit in response.hits for topic in hit.topics]
+def get_similar_topics_cache_key(
+    value_doc: dict, num_topics: int, min_term_freq: int, min_doc_freq: int
+) -> str:
+    """
+    Get the cache key for the similar topics of a text doc, based on a hash of
+    its content and the query params
 
-    counter = Counter(topics)
-    return list(dict(counter.most_common(num_topics)).keys())
+    Args:
+        value_doc (dict):
+            a document representing the data fields we want to search with
+        num_topics (int):
+            number of topics to return
+        min_term_freq (int):
+            minimum times a term needs to show up in input
+        min_doc_freq (int):
+            minimum times a term needs to show up in docs
+
+    Returns:
+        str: The cache key
+    """
+    digest = hashlib.sha256(
+        json.dumps(
+            [value_doc, num_topics, min_term_freq, min_doc_freq],
+            sort_keys=True,
+            default=str,
+        ).encode()
+    ).hexdigest()
+    return f"{SIMILAR_TOPICS_CACHE_PREFIX}:{digest}"
+
+
+def get_similar_topics_bulk(
+    value_docs: list[dict], num_topics: int, min_term_freq: int, min_doc_freq: int
+) -> list[list[str]]:
+    """
+    Get lists of similar topics for many text docs at once. Results are cached by
+    content hash for OPENSEARCH_SIMILAR_TOPICS_CACHE_TTL seconds, and the
+    uncached docs are searched with one multisearch request per chunk.
+
+    Args:
+        value_docs (list of dict):
+            documents representing the data fields we want to search with
+        num_topics (int):
+            number of topics to return per document
+        min_term_freq (int):
+            minimum times a term needs to show up in input
+        min_doc_freq (int):
+            minimum times a term needs to show up in docs
+
+    Returns:
+        list of list of str:
+            lists of topic values, in the same order as value_docs
+    """
+    keys = [
+        get_similar_topics_cache_key(value_doc, num_topics, min_term_freq, min_doc_freq)
+        for value_doc in value_docs
+    ]
+    timeout = settings.OPENSEARCH_SIMILAR_TOPICS_CACHE_TTL
+    cache = caches["redis"]
+    topics_by_key = {}
+    if timeout:
+        try:
+            topics_by_key = cache.get_many(set(keys))
+        except Exception:
+            log.exception("Unable to read from the similar topics cache")
+
+    uncached_docs = {
+        key: value_doc
+        for key, value_doc in zip(keys, value_docs)
+        if key not in topics_by_key
+    }
+    searched_topics = {}
+    for docs_chunk in chunks(
+        list(uncached_docs.items()), chunk_size=SIMILAR_TOPICS_MSEARCH_CHUNK_SIZE
+    ):
+        multi_search = MultiSearch()
+        for _, value_doc in docs_chunk:
+            multi_search = multi_search.add(
+                _similar_topics_search(value_doc, min_term_freq, min_doc_freq)
+            )
+        responses = list(multi_search.execute(raise_on_error=False))
+        for idx, (key, value_doc) in enumerate(docs_chunk):
+            response = responses[idx] if idx < len(responses) else None
+            if response is None:
+                log.error("Unable to get similar topics for %s", value_doc)
+                topics_by_key[key] = []
+                continue
+            topics = [
+                topic.to_dict()["name"] for hit in response.hits for topic in hit.topics
+            ]
+            searched_topics[key] = list(
+                dict(Counter(topics).most_common(num_topics)).keys()
+            )
+
+    if timeout and searched_topics:
+        try:
+            cache.set_many(searched_topics, timeout=timeout)
+        except Exception:
+            log.exception("Unable to write to the similar topics cache")
+    topics_by_key.update(searched_topics)
+    return [topics_by_key[key] for key in keys]
+
+
+def get_similar_topics(
+    value_doc: dict, num_topics: int, min_term_freq: int, min_doc_freq: int
+) -> list[str]:
+    """
+    Get a list of similar topics based on text values
+
+    Args:
+        value_doc (dict):
+            a document representing the data fields we want to search with
+        num_topics (int):
+            number of topics to return
+        min_term_freq (int):
+            minimum times a term needs to show up in input
+        min_doc_freq (int):
+            minimum times a term needs to show up in docs
+
+    Returns:
+        list of str:
+            list of topic values
+    """
+    return get_similar_topics_bulk(
+        [value_doc], num_topics, min_term_freq, min_doc_freq
+    )[0]
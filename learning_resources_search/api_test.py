@@ -3,14 +3,29 @@
 from unittest.mock import Mock
 
 import pytest
-from opensearch_dsl import response
+from django.core.cache import caches
+from opensearch_dsl import Q, response
 from opensearch_dsl.query import Percolate
+from opensearchpy.exceptions import RequestError
 
-from learning_resources.factories import LearningResourceFactory
+from learning_resources.factories import (
+    LearningResourceFactory,
+    LearningResourceRunFactory,
+)
 from learning_resources_search.api import (
+    SEARCH_CACHE_GENERATION_KEY,
+    SUGGEST_CLAUSE_TEMPLATE,
+    TEXT_CLAUSE_TEMPLATES,
     Search,
+    bump_search_cache_generation,
     construct_search,
+    construct_search_body,
+    decode_search_cursor,
+    defer_search_cache_generation_bump,
+    encode_search_cursor,
+    execute_autocomplete,
     execute_learn_search,
+    execute_learn_searches,
     generate_aggregation_clause,
     generate_aggregation_clauses,
     generate_content_file_text_clause,
@@ -19,17 +34,27 @@ from learning_resources_search.api import (
     generate_learning_resources_text_clause,
     generate_sort_clause,
     generate_suggest_clause,
+    get_search_cache_stats,
+    get_search_routing,
     get_similar_topics,
+    get_similar_topics_bulk,
+    get_similar_topics_cache_key,
     percolate_matches_for_document,
+    percolate_matches_for_documents,
     relevant_indexes,
+    render_text_template,
 )
 from learning_resources_search.constants import (
     CONTENT_FILE_TYPE,
     COURSE_TYPE,
     LEARNING_RESOURCE,
+    LEARNING_RESOURCE_CARD_FIELDS,
+    LEARNING_RESOURCE_TYPES,
+    SOURCE_EXCLUDED_FIELDS,
 )
 from learning_resources_search.factories import PercolateQueryFactory
 from learning_resources_search.models import PercolateQuery
+from learning_resources_search.timing import SearchTimer
 
 
 def os_topic(topic_name) -> Mock:
@@ -911,6 +936,40 @@ def test_generate_aggregation_clauses_when_there_is_no_filter():
     assert generate_aggregation_clauses(params, {}) == result
 
 
+def test_generate_aggregation_clauses_facets_only(settings):
+    """
+    Facet-only searches should use the facet bucket size, and only count the root
+    documents of nested values which can repeat within a document
+    """
+    settings.OPENSEARCH_FACET_BUCKET_SIZE = 500
+    params = {"aggregations": ["offered_by", "level"], "limit": 0}
+    result = {
+        "offered_by": {
+            "aggs": {
+                "offered_by": {
+                    "terms": {"field": "offered_by.code", "size": 500},
+                }
+            },
+            "nested": {"path": "offered_by"},
+        },
+        "level": {
+            "nested": {"path": "runs"},
+            "aggs": {
+                "level": {
+                    "nested": {"path": "runs.level"},
+                    "aggs": {
+                        "level": {
+                            "terms": {"field": "runs.level.code", "size": 500},
+                            "aggs": {"root": {"reverse_nested": {}}},
+                        }
+                    },
+                }
+            },
+        },
+    }
+    assert generate_aggregation_clauses(params, {}) == result
+
+
 def test_generate_aggregation_clause_single_not_nested():
     assert generate_aggregation_clause("agg_a", "a") == {
         "terms": {"field": "a", "size": 10000}
@@ -1334,45 +1393,6 @@ def test_execute_learn_search_for_learning_resource_query(opensearch):
         "sort": [{"readable_id": {"order": "desc"}}],
         "from": 1,
         "size": 1,
-        "suggest": {
-            "text": "math",
-            "title.trigram": {
-                "phrase": {
-                    "field": "title.trigram",
-                    "size": 5,
-                    "gram_size": 1,
-                    "confidence": 0.0001,
-                    "max_errors": 3,
-                    "collate": {
-                        "query": {
-                            "source": {
-                                "match_phrase": {"{{field_name}}": "{{suggestion}}"}
-                            }
-                        },
-                        "params": {"field_name": "title.trigram"},
-                        "prune": True,
-                    },
-                }
-            },
-            "description.trigram": {
-                "phrase": {
-                    "field": "description.trigram",
-                    "size": 5,
-                    "gram_size": 1,
-                    "confidence": 0.0001,
-                    "max_errors": 3,
-                    "collate": {
-                        "query": {
-                            "source": {
-                                "match_phrase": {"{{field_name}}": "{{suggestion}}"}
-                            }
-                        },
-                        "params": {"field_name": "description.trigram"},
-                        "prune": True,
-                    },
-                }
-            },
-        },
         "aggs": {
             "offered_by": {
                 "aggs": {
@@ -1424,6 +1444,7 @@ def test_execute_learn_search_for_learning_resource_query(opensearch):
         },
         "_source": {
             "excludes": [
+                "autocomplete",
                 "created_on",
                 "course.course_numbers.sort_coursenum",
                 "course.course_numbers.primary",
@@ -1551,45 +1572,6 @@ def test_execute_learn_search_for_content_file_query(opensearch):
         },
         "from": 1,
         "size": 1,
-        "suggest": {
-            "text": "math",
-            "title.trigram": {
-                "phrase": {
-                    "field": "title.trigram",
-                    "size": 5,
-                    "gram_size": 1,
-                    "confidence": 0.0001,
-                    "max_errors": 3,
-                    "collate": {
-                        "query": {
-                            "source": {
-                                "match_phrase": {"{{field_name}}": "{{suggestion}}"}
-                            }
-                        },
-                        "params": {"field_name": "title.trigram"},
-                        "prune": True,
-                    },
-                }
-            },
-            "description.trigram": {
-                "phrase": {
-                    "field": "description.trigram",
-                    "size": 5,
-                    "gram_size": 1,
-                    "confidence": 0.0001,
-                    "max_errors": 3,
-                    "collate": {
-                        "query": {
-                            "source": {
-                                "match_phrase": {"{{field_name}}": "{{suggestion}}"}
-                            }
-                        },
-                        "params": {"field_name": "description.trigram"},
-                        "prune": True,
-                    },
-                }
-            },
-        },
         "aggs": {
             "offered_by": {
                 "aggs": {
@@ -1627,6 +1609,7 @@ def test_execute_learn_search_for_content_file_query(opensearch):
         },
         "_source": {
             "excludes": [
+                "autocomplete",
                 "created_on",
                 "course.course_numbers.sort_coursenum",
                 "course.course_numbers.primary",
@@ -1644,67 +1627,666 @@ def test_execute_learn_search_for_content_file_query(opensearch):
     )
 
 
-def test_get_similar_topics(settings, opensearch):
-    """Test get_similar_topics makes a query for similar document topics"""
-    input_doc = {"title": "title text", "description": "description text"}
+@pytest.mark.parametrize(
+    "text",
+    ["math", '"exact phrase"', '"', 'back\\slash "quote" é 中文', "__search_text__"],
+)
+@pytest.mark.parametrize(
+    ("endpoint", "generate_clause"),
+    [
+        (LEARNING_RESOURCE, generate_learning_resources_text_clause),
+        (CONTENT_FILE_TYPE, generate_content_file_text_clause),
+    ],
+)
+def test_render_text_template(endpoint, generate_clause, text):
+    """The precompiled text templates should match the generated clauses"""
+    quoted = text.startswith('"') and text.endswith('"')
+    assert (
+        render_text_template(TEXT_CLAUSE_TEMPLATES[(endpoint, quoted)], text)
+        == Q(generate_clause(text)).to_dict()
+    )
+    assert render_text_template(SUGGEST_CLAUSE_TEMPLATE, text) == (
+        generate_suggest_clause(text)
+    )
 
-    # topic d is least popular and should not show up, order does not matter
+
+@pytest.fixture()
+def search_cache(settings):
+    """Enable the search cache, backed by a local memory cache"""
+    settings.OPENSEARCH_SEARCH_CACHE_TTL = 60
+    settings.CACHES = {
+        **settings.CACHES,
+        "redis": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "search_cache_test",
+        },
+    }
+    caches["redis"].clear()
+    return caches["redis"]
+
+
+def test_execute_learn_search_timer(opensearch):
+    """execute_learn_search should record its phases and query on the timer"""
+    opensearch.conn.search.return_value = {
+        "took": 3,
+        "hits": {"total": {"value": 10}, "hits": []},
+    }
+    timer = SearchTimer()
+    execute_learn_search({"q": "math", "endpoint": LEARNING_RESOURCE}, timer=timer)
+    assert set(timer.timings) == {"construct", "opensearch", "took", "network"}
+    assert timer.timings["took"] == 3
+    assert timer.query == {
+        "index": opensearch.conn.search.call_args.kwargs["index"],
+        "body": opensearch.conn.search.call_args.kwargs["body"],
+    }
+
+
+@pytest.mark.usefixtures("search_cache")
+def test_execute_learn_search_cached(opensearch):
+    """Identical search params should be served from the cache until the generation changes"""
+    opensearch.conn.search.return_value = {
+        "hits": {"total": {"value": 10, "relation": "eq"}}
+    }
+    search_params = {
+        "q": "math",
+        "resource_type": ["program", "course"],
+        "endpoint": LEARNING_RESOURCE,
+    }
+    reordered_params = {
+        "endpoint": LEARNING_RESOURCE,
+        "resource_type": ["course", "program"],
+        "q": "math",
+    }
+
+    first = execute_learn_search(search_params)
+    assert execute_learn_search(reordered_params) == first
+    assert opensearch.conn.search.call_count == 1
+    assert get_search_cache_stats() == {"hits": 1, "misses": 1}
+
+    execute_learn_search({**search_params, "q": "physics"})
+    assert opensearch.conn.search.call_count == 2
+
+    bump_search_cache_generation()
+    execute_learn_search(search_params)
+    assert opensearch.conn.search.call_count == 3
+    assert get_search_cache_stats() == {"hits": 1, "misses": 3}
+
+
+@pytest.mark.parametrize("q", [None, "math"])
+@pytest.mark.parametrize("sortby", [None, "-readable_id"])
+@pytest.mark.parametrize("search_after", [None, [1.5, 20]])
+def test_construct_search_body_cursor(q, sortby, search_after):
+    """Searches with a cursor should use search_after with a tiebreak sort"""
+    search_params = {"endpoint": LEARNING_RESOURCE, "offset": 30, "limit": 10}
+    if q:
+        search_params["q"] = q
+    if sortby:
+        search_params["sortby"] = sortby
+    _, offset_body = construct_search_body(search_params.copy())
+    _, body = construct_search_body(
+        {
+            **search_params,
+            "cursor": encode_search_cursor(search_after) if search_after else "",
+        }
+    )
+
+    assert "from" not in body
+    assert body["size"] == 10
+    assert body["query"] == offset_body["query"]
+    assert body["sort"] == [
+        offset_body["sort"][0] if "sort" in offset_body else "_score",
+        {"id": "asc"},
+    ]
+    if search_after:
+        assert body["search_after"] == search_after
+    else:
+        assert "search_after" not in body
+
+
+def test_decode_search_cursor():
+    """decode_search_cursor should reverse encode_search_cursor and reject bad cursors"""
+    assert decode_search_cursor("") is None
+    assert decode_search_cursor(encode_search_cursor([1.5, "a", 3])) == [1.5, "a", 3]
+    for cursor in ["!!!", encode_search_cursor({"a": 1})]:
+        with pytest.raises(ValueError):  # noqa: PT011
+            decode_search_cursor(cursor)
+
+
+@pytest.mark.parametrize("q", [None, "math"])
+def test_construct_search_body_facets_only(q):
+    """Facet-only searches should skip hits, scoring, suggestions and sorting"""
+    search_params = {
+        "aggregations": ["offered_by"],
+        "resource_type": ["course"],
+        "limit": 0,
+        "offset": 20,
+        "sortby": "-readable_id",
+        "endpoint": LEARNING_RESOURCE,
+    }
+    if q:
+        search_params["q"] = q
+    _, full_body = construct_search_body({**search_params, "limit": 10})
+    _, body = construct_search_body(search_params)
+
+    assert body["size"] == 0
+    for key in ("suggest", "sort", "from", "_source"):
+        assert key not in body
+    assert body["aggs"] == generate_aggregation_clauses(
+        search_params, generate_filter_clauses(search_params)
+    )
+    assert body["aggs"] != full_body["aggs"]
+    assert body["post_filter"] == full_body["post_filter"]
+    if q:
+        text_query, query_type_query = body["query"]["bool"]["filter"]
+        assert "should" not in text_query["bool"]
+        assert (
+            text_query["bool"]["filter"]
+            == full_body["query"]["bool"]["must"][0]["bool"]["filter"]
+        )
+        assert query_type_query == {"exists": {"field": "resource_type"}}
+    else:
+        assert body["query"] == full_body["query"]
+
+
+@pytest.mark.parametrize("view", [None, "full", "card"])
+def test_construct_search_body_view(view):
+    """Searches with view=card should only fetch the fields the result cards render"""
+    search_params = {"q": "math", "endpoint": LEARNING_RESOURCE}
+    if view:
+        search_params["view"] = view
+    _, body = construct_search_body(search_params)
+    if view == "card":
+        assert body["_source"] == {"includes": LEARNING_RESOURCE_CARD_FIELDS}
+    else:
+        assert body["_source"] == {"excludes": SOURCE_EXCLUDED_FIELDS}
+
+
+@pytest.mark.usefixtures("search_cache")
+def test_execute_learn_searches(opensearch):
+    """
+    execute_learn_searches should run the uncached searches with one multisearch
+    request and return the responses in order
+    """
+
+    def search_response(total):
+        return {"took": total, "hits": {"total": {"value": total}, "hits": []}}
+
+    def searches():
+        # construct_search fills in default params, so build them for each call
+        return [
+            {"q": "math", "endpoint": LEARNING_RESOURCE},
+            {"resource_type": ["course"], "limit": 6, "endpoint": LEARNING_RESOURCE},
+        ]
+
+    opensearch.conn.msearch.return_value = {
+        "responses": [search_response(5), search_response(2)]
+    }
+    timer = SearchTimer()
+    assert execute_learn_searches(searches(), timer=timer) == [
+        search_response(5),
+        search_response(2),
+    ]
+    body = opensearch.conn.msearch.call_args.kwargs["body"]
+    assert body == timer.query
+    assert body[1::2] == [
+        construct_search(search_params).to_dict() for search_params in searches()
+    ]
+    assert timer.timings["took"] == 5
+
+    opensearch.conn.msearch.reset_mock()
+    opensearch.conn.msearch.return_value = {"responses": [search_response(3)]}
+    assert execute_learn_searches(
+        [{"q": "physics", "endpoint": LEARNING_RESOURCE}, *searches()]
+    ) == [search_response(3), search_response(5), search_response(2)]
+    assert len(opensearch.conn.msearch.call_args.kwargs["body"]) == 2
+
+    opensearch.conn.msearch.reset_mock()
+    assert execute_learn_searches(searches()[:1]) == [search_response(5)]
+    opensearch.conn.msearch.assert_not_called()
+
+
+@pytest.mark.usefixtures("search_cache")
+def test_execute_learn_searches_error(opensearch):
+    """
+    A search that fails should get an error entry without failing the rest of
+    the batch, and it shouldn't be cached
+    """
+
+    def searches():
+        # construct_search fills in default params, so build them for each call
+        return [
+            {"q": "math", "endpoint": LEARNING_RESOURCE},
+            {"q": "physics", "endpoint": LEARNING_RESOURCE},
+        ]
+
+    response = {"took": 3, "hits": {"total": {"value": 3}, "hits": []}}
+    opensearch.conn.msearch.return_value = {
+        "responses": [
+            {"error": {"type": "query_shard_exception"}, "status": 400},
+            response,
+        ]
+    }
+
+    assert execute_learn_searches(searches()) == [
+        {"error": "Unable to run search"},
+        response,
+    ]
+
+    opensearch.conn.msearch.reset_mock()
+    opensearch.conn.msearch.return_value = {"responses": [response]}
+    assert execute_learn_searches(searches()) == [response, response]
+    assert len(opensearch.conn.msearch.call_args.kwargs["body"]) == 2
+
+
+@pytest.mark.usefixtures("search_cache")
+def test_execute_learn_search_facet_cache(settings, opensearch):
+    """Facet-only searches should share a cache entry regardless of paging and sorting"""
+    settings.OPENSEARCH_SEARCH_CACHE_TTL = 0
+    settings.OPENSEARCH_FACET_CACHE_TTL = 300
+    opensearch.conn.search.return_value = {"aggregations": {}}
+    search_params = {
+        "aggregations": ["offered_by"],
+        "limit": 0,
+        "endpoint": LEARNING_RESOURCE,
+    }
+    execute_learn_search({**search_params, "offset": 10})
+    execute_learn_search({**search_params, "sortby": "new"})
+    execute_learn_search({**search_params, "view": "card"})
+    assert opensearch.conn.search.call_count == 1
+
+    execute_learn_search({**search_params, "offered_by": ["ocw"]})
+    assert opensearch.conn.search.call_count == 2
+
+    execute_learn_search({**search_params, "limit": 10})
+    execute_learn_search({**search_params, "limit": 10})
+    assert opensearch.conn.search.call_count == 4
+
+
+@pytest.mark.parametrize(
+    ("search_params", "total", "is_suggested"),
+    [
+        ({"q": "mathh"}, 0, True),
+        ({"q": "mathh"}, 1, True),
+        ({"q": "math"}, 2, False),
+        ({}, 0, False),
+        ({"q": "mathh", "limit": 0}, 0, False),
+    ],
+)
+def test_execute_learn_search_suggestions(
+    settings, opensearch, search_params, total, is_suggested
+):
+    """
+    Suggestions should only be requested, with a separate search, for text
+    searches with no more than OPENSEARCH_MAX_SUGGEST_HITS hits
+    """
+    settings.OPENSEARCH_MAX_SUGGEST_HITS = 1
+    suggest = {"title.trigram": [{"options": [{"text": "math"}]}]}
+    opensearch.conn.search.side_effect = [
+        {"hits": {"total": {"value": total}, "hits": []}},
+        {"hits": {"total": {"value": 0}, "hits": []}, "suggest": suggest},
+    ]
+    search_params = {**search_params, "endpoint": LEARNING_RESOURCE}
+    timer = SearchTimer()
+    response = execute_learn_search(search_params, timer=timer)
+
+    body = opensearch.conn.search.call_args_list[0].kwargs["body"]
+    assert "suggest" not in body
+    if is_suggested:
+        assert response["suggest"] == suggest
+        assert opensearch.conn.search.call_count == 2
+        suggest_call = opensearch.conn.search.call_args_list[1].kwargs
+        assert suggest_call == {
+            "body": {
+                "size": 0,
+                "suggest": generate_suggest_clause(search_params["q"]),
+            },
+            "index": opensearch.conn.search.call_args_list[0].kwargs["index"],
+        }
+        assert "suggest" in timer.timings
+    else:
+        assert "suggest" not in response
+        assert opensearch.conn.search.call_count == 1
+
+
+def test_execute_learn_searches_suggestions(opensearch):
+    """
+    execute_learn_searches should request the suggestions for the searches with
+    too few hits with one more multisearch request
+    """
+    suggest = {"title.trigram": [{"options": [{"text": "physics"}]}]}
+    opensearch.conn.msearch.side_effect = [
+        {
+            "responses": [
+                {"hits": {"total": {"value": 10}, "hits": []}},
+                {"hits": {"total": {"value": 0}, "hits": []}},
+            ]
+        },
+        {
+            "responses": [
+                {"hits": {"total": {"value": 0}, "hits": []}, "suggest": suggest}
+            ]
+        },
+    ]
+    responses = execute_learn_searches(
+        [
+            {"q": "math", "endpoint": LEARNING_RESOURCE},
+            {"q": "fysics", "resource_type": ["course"], "endpoint": LEARNING_RESOURCE},
+        ]
+    )
+    assert "suggest" not in responses[0]
+    assert responses[1]["suggest"] == suggest
+    assert opensearch.conn.msearch.call_args.kwargs["body"] == [
+        {"index": ["testindex_course_default"]},
+        {"size": 0, "suggest": generate_suggest_clause("fysics")},
+    ]
+
+
+@pytest.mark.parametrize("is_cached", [True, False])
+def test_execute_autocomplete_not_completion_field(
+    mocker, settings, search_cache, opensearch, is_cached
+):
+    """
+    execute_autocomplete should return no suggestions, and not cache them, if the
+    autocomplete field isn't mapped for completion yet
+    """
+    settings.OPENSEARCH_SEARCH_CACHE_TTL = 60 if is_cached else 0
+    mock_log = mocker.patch("learning_resources_search.api.log")
+    opensearch.conn.search.side_effect = RequestError(
+        400, "search_phase_execution_exception", {}
+    )
+
+    assert execute_autocomplete("intro", 5) == []
+    assert execute_autocomplete("intro", 5) == []
+
+    assert opensearch.conn.search.call_count == 2
+    assert mock_log.warning.call_count == 2
+
+
+@pytest.mark.parametrize("is_cached", [False, True])
+def test_execute_autocomplete(settings, search_cache, opensearch, is_cached):
+    """execute_autocomplete should return the completion suggestions for the text"""
+    settings.OPENSEARCH_SEARCH_CACHE_TTL = 60 if is_cached else 0
+    opensearch.conn.search.return_value = {
+        "suggest": {
+            "autocomplete": [
+                {
+                    "text": "intro",
+                    "options": [
+                        {"text": "Introduction to Algorithms", "_score": 4.0},
+                        {"text": "Introductory Biology", "_score": 4.0},
+                    ],
+                }
+            ]
+        }
+    }
+    expected = ["Introduction to Algorithms", "Introductory Biology"]
+    assert execute_autocomplete("intro", 5) == expected
+    assert execute_autocomplete("intro", 5) == expected
+
+    assert opensearch.conn.search.call_count == (1 if is_cached else 2)
+    opensearch.conn.search.assert_called_with(
+        body={
+            "_source": False,
+            "suggest": {
+                "autocomplete": {
+                    "prefix": "intro",
+                    "completion": {
+                        "field": "autocomplete",
+                        "size": 5,
+                        "skip_duplicates": True,
+                    },
+                }
+            },
+        },
+        index=[
+            f"testindex_{resource_type}_default"
+            for resource_type in LEARNING_RESOURCE_TYPES
+        ],
+    )
+
+
+@pytest.mark.django_db()
+def test_get_search_routing():
+    """Content file searches filtered to resources or runs should be routed to them"""
+    runs = LearningResourceRunFactory.create_batch(2)
+    resource_ids = sorted(run.learning_resource_id for run in runs)
+    routing = ",".join(str(resource_id) for resource_id in resource_ids)
+
+    assert get_search_routing({"q": "math", "endpoint": CONTENT_FILE_TYPE}) is None
+    assert (
+        get_search_routing({"resource_id": [5, 3, 5], "endpoint": CONTENT_FILE_TYPE})
+        == "3,5"
+    )
+    assert (
+        get_search_routing(
+            {"run_id": [run.id for run in runs], "endpoint": CONTENT_FILE_TYPE}
+        )
+        == routing
+    )
+    assert (
+        get_search_routing(
+            {
+                "resource_id": [3],
+                "run_id": [runs[0].id],
+                "endpoint": CONTENT_FILE_TYPE,
+            }
+        )
+        == "3"
+    )
+    assert get_search_routing({"run_id": [0], "endpoint": CONTENT_FILE_TYPE}) is None
+    assert get_search_routing({"id": [3], "endpoint": LEARNING_RESOURCE}) is None
+
+
+def test_execute_learn_search_routing(opensearch):
+    """Content file searches scoped to a resource should be sent with its routing"""
+    opensearch.conn.search.return_value = {"hits": {"total": {"value": 10}}}
+    search_params = {"q": "math", "resource_id": [3], "endpoint": CONTENT_FILE_TYPE}
+    timer = SearchTimer()
+    execute_learn_search(search_params, timer=timer)
+
+    assert opensearch.conn.search.call_args.kwargs["routing"] == "3"
+    assert timer.query["routing"] == "3"
+    assert (
+        construct_search(search_params).to_dict()
+        == (construct_search_body(search_params)[1])
+    )
+    assert construct_search(search_params)._params == {"routing": "3"}  # noqa: SLF001
+
+
+def test_execute_learn_search_cache_unavailable(mocker, settings, opensearch):
+    """The search should still run if the cache can't be read"""
+    settings.OPENSEARCH_SEARCH_CACHE_TTL = 60
+    mocker.patch(
+        "learning_resources_search.api.get_search_cache_key",
+        side_effect=ConnectionError,
+    )
     opensearch.conn.search.return_value = {
+        "hits": {"total": {"value": 10, "relation": "eq"}}
+    }
+    assert execute_learn_search({"q": "math", "endpoint": LEARNING_RESOURCE}) == {
+        "hits": {"total": {"value": 10, "relation": "eq"}}
+    }
+    opensearch.conn.search.assert_called_once()
+
+
+def test_execute_learn_search_cache_counter_unavailable(
+    mocker, search_cache, opensearch
+):
+    """A search cache hit shouldn't fail if its counter can't be incremented"""
+    response = {"hits": {"total": {"value": 10, "relation": "eq"}}}
+    opensearch.conn.search.return_value = response
+    opensearch.conn.msearch.return_value = {"responses": [response]}
+    execute_learn_search({"q": "math", "endpoint": LEARNING_RESOURCE})
+    mocker.patch.object(search_cache, "incr", side_effect=ConnectionError)
+
+    assert execute_learn_search({"q": "math", "endpoint": LEARNING_RESOURCE}) == (
+        response
+    )
+    assert execute_learn_searches([{"q": "math", "endpoint": LEARNING_RESOURCE}]) == [
+        response
+    ]
+    opensearch.conn.msearch.assert_not_called()
+
+
+def test_defer_search_cache_generation_bump(search_cache):
+    """The search cache generation should be bumped once at the end of the block"""
+    bump_search_cache_generation()
+    assert search_cache.get(SEARCH_CACHE_GENERATION_KEY) == 1
+
+    with defer_search_cache_generation_bump():
+        pass
+    assert search_cache.get(SEARCH_CACHE_GENERATION_KEY) == 1
+
+    with defer_search_cache_generation_bump():
+        bump_search_cache_generation()
+        with defer_search_cache_generation_bump():
+            bump_search_cache_generation()
+        assert search_cache.get(SEARCH_CACHE_GENERATION_KEY) == 1
+        bump_search_cache_generation()
+    assert search_cache.get(SEARCH_CACHE_GENERATION_KEY) == 2
+
+    bump_search_cache_generation()
+    assert search_cache.get(SEARCH_CACHE_GENERATION_KEY) == 3
+
+
+def similar_topics_response(topic_names_lists):
+    """Build a msearch response for similar topics queries"""
+    return {
         "hits": {
             "hits": [
-                {
-                    "_source": {
-                        "topics": [
-                            os_topic("topic a"),
-                            os_topic("topic b"),
-                            os_topic("topic d"),
-                        ]
-                    }
-                },
-                {"_source": {"topics": [os_topic("topic a"), os_topic("topic c")]}},
-                {"_source": {"topics": [os_topic("topic a"), os_topic("topic c")]}},
-                {"_source": {"topics": [os_topic("topic a"), os_topic("topic c")]}},
-                {"_source": {"topics": [os_topic("topic a"), os_topic("topic b")]}},
+                {"_source": {"topics": [os_topic(name) for name in topic_names]}}
+                for topic_names in topic_names_lists
             ]
         }
     }
 
+
+def test_get_similar_topics(settings, opensearch):
+    """Test get_similar_topics makes a query for similar document topics"""
+    settings.OPENSEARCH_SIMILAR_TOPICS_CACHE_TTL = 0
+    input_doc = {"title": "title text", "description": "description text"}
+
+    # topic d is least popular and should not show up, order does not matter
+    opensearch.conn.msearch.return_value = {
+        "responses": [
+            similar_topics_response(
+                [
+                    ["topic a", "topic b", "topic d"],
+                    ["topic a", "topic c"],
+                    ["topic a", "topic c"],
+                    ["topic a", "topic c"],
+                    ["topic a", "topic b"],
+                ]
+            )
+        ]
+    }
+
     # results should be top 3 in decreasing order of frequency
     assert get_similar_topics(input_doc, 3, 1, 15) == ["topic a", "topic c", "topic b"]
 
-    opensearch.conn.search.assert_called_once_with(
-        body={
-            "_source": {"includes": "topics"},
-            "query": {
-                "bool": {
-                    "filter": [{"term": {"resource_type": "course"}}],
-                    "must": [
-                        {
-                            "more_like_this": {
-                                "like": [
-                                    {
-                                        "doc": input_doc,
-                                        "fields": ["title", "description"],
-                                    }
-                                ],
-                                "fields": [
-                                    "course.course_numbers.value",
-                                    "title",
-                                    "description",
-                                    "full_description",
-                                ],
-                                "min_term_freq": 1,
-                                "min_doc_freq": 15,
+    opensearch.conn.msearch.assert_called_once_with(
+        body=[
+            {"index": [f"{settings.OPENSEARCH_INDEX}_{COURSE_TYPE}_default"]},
+            {
+                "_source": {"includes": "topics"},
+                "query": {
+                    "bool": {
+                        "filter": [{"term": {"resource_type": "course"}}],
+                        "must": [
+                            {
+                                "more_like_this": {
+                                    "like": [
+                                        {
+                                            "doc": input_doc,
+                                            "fields": ["title", "description"],
+                                        }
+                                    ],
+                                    "fields": [
+                                        "course.course_numbers.value",
+                                        "title",
+                                        "description",
+                                        "full_description",
+                                    ],
+                                    "min_term_freq": 1,
+                                    "min_doc_freq": 15,
+                                }
                             }
-                        }
-                    ],
-                }
+                        ],
+                    }
+                },
             },
-        },
-        index=[f"{settings.OPENSEARCH_INDEX}_{COURSE_TYPE}_default"],
+        ],
+        index=None,
     )
 
 
+def test_get_similar_topics_bulk(settings, opensearch, search_cache):
+    """
+    get_similar_topics_bulk should search for all uncached docs in one request
+    and serve repeated docs from the cache
+    """
+    settings.OPENSEARCH_SIMILAR_TOPICS_CACHE_TTL = 60
+    docs = [
+        {"title": f"title {i}", "description": f"description {i}"} for i in range(3)
+    ]
+    opensearch.conn.msearch.return_value = {
+        "responses": [
+            similar_topics_response([["topic a"], ["topic a", "topic b"]]),
+            similar_topics_response([]),
+        ]
+    }
+
+    assert get_similar_topics_bulk([docs[0], docs[1], docs[0]], 3, 1, 15) == [
+        ["topic a", "topic b"],
+        [],
+        ["topic a", "topic b"],
+    ]
+    opensearch.conn.msearch.assert_called_once()
+    assert len(opensearch.conn.msearch.call_args.kwargs["body"]) == 4
+
+    opensearch.conn.msearch.reset_mock()
+    opensearch.conn.msearch.return_value = {
+        "responses": [similar_topics_response([["topic c"]])]
+    }
+    assert get_similar_topics_bulk(docs, 3, 1, 15) == [
+        ["topic a", "topic b"],
+        [],
+        ["topic c"],
+    ]
+    opensearch.conn.msearch.assert_called_once()
+    assert (
+        opensearch.conn.msearch.call_args.kwargs["body"][1]["query"]["bool"]["must"][0][
+            "more_like_this"
+        ]["like"][0]["doc"]
+        == docs[2]
+    )
+    assert search_cache.get(get_similar_topics_cache_key(docs[1], 3, 1, 15)) == []
+
+    opensearch.conn.msearch.reset_mock()
+    opensearch.conn.msearch.return_value = {
+        "responses": [similar_topics_response([]), similar_topics_response([])]
+    }
+    assert get_similar_topics_bulk(docs[:2], 5, 1, 15) == [[], []]
+    opensearch.conn.msearch.assert_called_once()
+
+
+def test_get_similar_topics_bulk_error(settings, opensearch, search_cache):
+    """Docs whose similar topics query fails should get no topics, uncached"""
+    settings.OPENSEARCH_SIMILAR_TOPICS_CACHE_TTL = 60
+    docs = [{"title": "title 1"}, {"title": "title 2"}]
+    opensearch.conn.msearch.return_value = {
+        "responses": [
+            {"error": {"type": "search_phase_execution_exception"}},
+            similar_topics_response([["topic a"]]),
+        ]
+    }
+    assert get_similar_topics_bulk(docs, 3, 1, 15) == [[], ["topic a"]]
+    assert search_cache.get(get_similar_topics_cache_key(docs[0], 3, 1, 15)) is None
+    assert search_cache.get(get_similar_topics_cache_key(docs[1], 3, 1, 15)) == [
+        "topic a"
+    ]
+
+
 @pytest.mark.django_db()
 def test_document_percolation(opensearch, mocker):
     """
@@ -1757,6 +2339,67 @@ def test_document_percolation(opensearch, mocker):
     )
 
 
+@pytest.mark.django_db()
+def test_bulk_document_percolation(opensearch, mocker):
+    """
+    Test that a batch of documents is percolated with a single multi-search request
+    and the plugin handler is called with the matches of each document
+    """
+    mocker.patch(
+        "learning_resources_search.indexing_api.index_percolators", autospec=True
+    )
+    mocker.patch(
+        "learning_resources_search.indexing_api._update_document_by_id", autospec=True
+    )
+    resources = LearningResourceFactory.create_batch(3)
+    queries = [
+        PercolateQueryFactory.create(original_query={"q": str(i)}, query={"q": str(i)})
+        for i in range(3)
+    ]
+    unpublished = LearningResourceFactory.create(published=False)
+    matched = {resources[0].id: queries[:2], resources[2].id: queries[2:]}
+    opensearch.conn.msearch.return_value = {
+        "responses": [
+            {"error": {"type": "document_missing_exception"}}
+            if resource == resources[1]
+            else {
+                "_shards": {"failed": 0, "successful": 1, "total": 1},
+                "hits": {
+                    "hits": [
+                        {
+                            "_index": "test-index",
+                            "_id": str(query.id),
+                            "_source": {"id": query.id},
+                        }
+                        for query in matched[resource.id]
+                    ],
+                    "total": len(matched[resource.id]),
+                },
+                "timed_out": False,
+                "took": 1,
+            }
+            for resource in sorted(resources, key=lambda resource: resource.id)
+        ]
+    }
+    mock_percolated = mocker.patch(
+        "learning_resources_search.api.document_percolated_actions"
+    )
+
+    assert percolate_matches_for_documents(
+        [resource.id for resource in [*resources, unpublished]]
+    ) == {
+        resource_id: [query.id for query in matched_queries]
+        for resource_id, matched_queries in matched.items()
+    }
+
+    opensearch.conn.msearch.assert_called_once()
+    assert len(opensearch.conn.msearch.call_args.kwargs["body"]) == 6
+    assert mock_percolated.call_count == 2
+    for call in mock_percolated.call_args_list:
+        resource, percolate_queries = call.args
+        assert percolate_queries == matched[resource.id]
+
+
 @pytest.mark.parametrize(
     ("sortby", "q", "result"),
     [
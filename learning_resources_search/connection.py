@@ -2,17 +2,23 @@
 OpenSearch connection functionality
 """
 
+import logging
+import time
 import uuid
 from functools import partial
 
 from django.conf import settings
+from django.core.cache import caches
 from opensearch_dsl.connections import connections
+from opensearchpy.exceptions import NotFoundError
 
 from learning_resources_search.constants import (
     ALL_INDEX_TYPES,
     IndexestoUpdate,
 )
 
+log = logging.getLogger(__name__)
+
 
 def configure_connections():
     """
@@ -81,12 +87,85 @@ def make_alias_name(is_reindexing, object_type):
 get_default_alias_name = partial(make_alias_name, False)  # noqa: FBT003
 get_reindexing_alias_name = partial(make_alias_name, True)  # noqa: FBT003
 
+# Process-local cache of the aliases which exist in OpenSearch
+_existing_aliases_cache = {"aliases": None, "expires": 0, "generation": None}
+
+# Shared counter which invalidates the alias cache of every process
+ALIAS_CACHE_GENERATION_KEY = "opensearch_alias_cache_generation"
+
+
+def _get_alias_cache_generation():
+    """
+    Get the shared alias cache generation
+
+    Returns:
+        int: The generation, or None if it can't be read
+    """
+    try:
+        return caches["redis"].get_or_set(ALIAS_CACHE_GENERATION_KEY, 0, timeout=None)
+    except Exception:
+        log.exception("Unable to read the alias cache generation")
+        return None
+
+
+def clear_existing_aliases_cache():
+    """
+    Clear the cache of existing aliases in this and every other process. This
+    should be called whenever aliases are created, moved or deleted.
+    """
+    _existing_aliases_cache["aliases"] = None
+    _existing_aliases_cache["expires"] = 0
+    cache = caches["redis"]
+    try:
+        try:
+            cache.incr(ALIAS_CACHE_GENERATION_KEY)
+        except ValueError:
+            cache.set(ALIAS_CACHE_GENERATION_KEY, 1, timeout=None)
+    except Exception:
+        log.exception("Unable to bump the alias cache generation")
+
+
+def get_existing_aliases(conn):
+    """
+    Return the aliases which exist for this app's indexes. The result is cached
+    in-process for OPENSEARCH_ALIAS_CACHE_TTL seconds, or until any process clears
+    the cache, and is filled with a single GET _alias request. If the shared
+    cache generation can't be read, the aliases are looked up every time.
+
+    Args:
+        conn(opensearch.client.Opensearch): An Opensearch client
+
+    Returns:
+        set of str: Aliases which exist
+    """
+    now = time.monotonic()
+    generation = _get_alias_cache_generation()
+    if (
+        _existing_aliases_cache["aliases"] is None
+        or _existing_aliases_cache["expires"] <= now
+        or generation is None
+        or _existing_aliases_cache["generation"] != generation
+    ):
+        try:
+            indices = conn.indices.get_alias(name=f"{settings.OPENSEARCH_INDEX}_*")
+        except NotFoundError:
+            indices = {}
+        _existing_aliases_cache["aliases"] = {
+            alias
+            for index_data in indices.values()
+            for alias in index_data.get("aliases", {})
+        }
+        _existing_aliases_cache["expires"] = now + settings.OPENSEARCH_ALIAS_CACHE_TTL
+        _existing_aliases_cache["generation"] = generation
+    return _existing_aliases_cache["aliases"]
+
 
 def get_active_aliases(
     conn, *, object_types=None, index_types=IndexestoUpdate.all_indexes.value
 ):
     """
-    Return aliases which exist for specified object types
+    Return aliases which exist for specified object types. Existing aliases are
+    looked up through get_existing_aliases, so the result may be cached.
 
     Args:
         conn(opensearch.client.Opensearch): An Opensearch client
@@ -101,29 +180,23 @@ def get_active_aliases(
         object_types = ALL_INDEX_TYPES
 
     if index_types == IndexestoUpdate.all_indexes.value:
-        return [
+        aliases = [
             alias
             for alias_tuple in [
                 (get_default_alias_name(obj), get_reindexing_alias_name(obj))
                 for obj in object_types
             ]
             for alias in alias_tuple
-            if conn.indices.exists(alias)
         ]
-
     elif index_types == IndexestoUpdate.current_index.value:
-        return [
-            alias
-            for alias in [get_default_alias_name(obj) for obj in object_types]
-            if conn.indices.exists(alias)
-        ]
+        aliases = [get_default_alias_name(obj) for obj in object_types]
     elif index_types == IndexestoUpdate.reindexing_index.value:
-        return [
-            alias
-            for alias in [get_reindexing_alias_name(obj) for obj in object_types]
-            if conn.indices.exists(alias)
-        ]
-    return None
+        aliases = [get_reindexing_alias_name(obj) for obj in object_types]
+    else:
+        return None
+
+    existing_aliases = get_existing_aliases(conn)
+    return [alias for alias in aliases if alias in existing_aliases]
 
 
 def refresh_index(index):
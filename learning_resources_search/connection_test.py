@@ -3,9 +3,35 @@ Tests for the indexing API
 """
 
 import pytest
+from django.core.cache import caches
+from opensearchpy.exceptions import NotFoundError
 
-from learning_resources_search.connection import get_active_aliases
-from learning_resources_search.constants import COURSE_TYPE, IndexestoUpdate
+from learning_resources_search.connection import (
+    ALIAS_CACHE_GENERATION_KEY,
+    clear_existing_aliases_cache,
+    get_active_aliases,
+    get_default_alias_name,
+    get_existing_aliases,
+    get_reindexing_alias_name,
+)
+from learning_resources_search.constants import (
+    ALL_INDEX_TYPES,
+    COURSE_TYPE,
+    IndexestoUpdate,
+)
+
+
+def mock_alias_response(object_types):
+    """Return a mock GET _alias response with both aliases for each object type"""
+    return {
+        f"backing_{object_type}": {
+            "aliases": {
+                get_default_alias_name(object_type): {},
+                get_reindexing_alias_name(object_type): {},
+            }
+        }
+        for object_type in object_types
+    }
 
 
 @pytest.mark.parametrize(
@@ -21,7 +47,9 @@ from learning_resources_search.constants import COURSE_TYPE, IndexestoUpdate
 def test_get_active_aliases(mocker, index_types, indexes_exist, object_types):
     """Test for get_active_aliases"""
     conn = mocker.Mock()
-    conn.indices.exists.return_value = indexes_exist
+    conn.indices.get_alias.return_value = (
+        mock_alias_response(ALL_INDEX_TYPES) if indexes_exist else {}
+    )
 
     active_aliases = get_active_aliases(
         conn, object_types=object_types, index_types=index_types
@@ -81,3 +109,73 @@ def test_get_active_aliases(mocker, index_types, indexes_exist, object_types):
             ]
     else:
         assert active_aliases == []
+
+
+def test_get_active_aliases_single_request(mocker):
+    """get_active_aliases should look up all aliases with one request instead of one per alias"""
+    conn = mocker.Mock()
+    conn.indices.get_alias.return_value = mock_alias_response([COURSE_TYPE])
+
+    assert get_active_aliases(conn) == [
+        "testindex_course_default",
+        "testindex_course_reindexing",
+    ]
+    conn.indices.get_alias.assert_called_once_with(name="testindex_*")
+    assert conn.indices.exists.called is False
+
+
+def test_get_existing_aliases_cached(mocker, settings):
+    """get_existing_aliases should cache results until the TTL expires or the cache is cleared"""
+    settings.OPENSEARCH_ALIAS_CACHE_TTL = 10
+    mock_time = mocker.patch(
+        "learning_resources_search.connection.time.monotonic", return_value=100
+    )
+    conn = mocker.Mock()
+    conn.indices.get_alias.return_value = mock_alias_response([COURSE_TYPE])
+
+    expected = {"testindex_course_default", "testindex_course_reindexing"}
+    assert get_existing_aliases(conn) == expected
+    assert get_existing_aliases(conn) == expected
+    assert conn.indices.get_alias.call_count == 1
+
+    mock_time.return_value = 111
+    assert get_existing_aliases(conn) == expected
+    assert conn.indices.get_alias.call_count == 2
+
+    clear_existing_aliases_cache()
+    assert get_existing_aliases(conn) == expected
+    assert conn.indices.get_alias.call_count == 3
+
+
+def test_get_existing_aliases_cleared_elsewhere(mocker):
+    """The alias cache should be refreshed when another process clears it"""
+    conn = mocker.Mock()
+    conn.indices.get_alias.return_value = mock_alias_response([COURSE_TYPE])
+    get_existing_aliases(conn)
+    get_existing_aliases(conn)
+    assert conn.indices.get_alias.call_count == 1
+
+    # another process bumps the shared generation
+    caches["redis"].incr(ALIAS_CACHE_GENERATION_KEY)
+    get_existing_aliases(conn)
+    assert conn.indices.get_alias.call_count == 2
+
+
+def test_get_existing_aliases_no_generation(mocker):
+    """Aliases should be looked up every time if the cache generation can't be read"""
+    mocker.patch.object(caches["redis"], "get_or_set", side_effect=ConnectionError)
+    mock_log = mocker.patch("learning_resources_search.connection.log.exception")
+    conn = mocker.Mock()
+    conn.indices.get_alias.return_value = mock_alias_response([COURSE_TYPE])
+    get_existing_aliases(conn)
+    get_existing_aliases(conn)
+    assert conn.indices.get_alias.call_count == 2
+    assert mock_log.call_count == 2
+
+
+def test_get_existing_aliases_not_found(mocker):
+    """get_existing_aliases should return an empty set if no aliases match"""
+    conn = mocker.Mock()
+    conn.indices.get_alias.side_effect = NotFoundError
+
+    assert get_existing_aliases(conn) == set()
@@ -1,6 +1,7 @@
 """Constants for search"""
 
 from dataclasses import dataclass
+from datetime import timedelta
 from enum import Enum
 
 from opensearchpy.exceptions import ConnectionError as ESConnectionError
@@ -55,6 +56,9 @@ UPDATE_CONFLICT_SETTING = "proceed"
 class FilterConfig:
     path: str
     case_sensitive: bool = False
+    # nested values which never repeat within a document, so their facet counts
+    # don't need a reverse_nested aggregation to count each document once
+    unique_per_document: bool = False
 
 
 LEARNING_RESOURCE_SEARCH_FILTERS = {
@@ -67,11 +71,11 @@ LEARNING_RESOURCE_SEARCH_FILTERS = {
     "content_feature_type": FilterConfig("content_feature_type"),
     "run_id": FilterConfig("run_id", case_sensitive=True),
     "resource_id": FilterConfig("resource_id"),
-    "topic": FilterConfig("topics.name"),
+    "topic": FilterConfig("topics.name", unique_per_document=True),
     "level": FilterConfig("runs.level.code"),
-    "department": FilterConfig("departments.department_id"),
-    "platform": FilterConfig("platform.code"),
-    "offered_by": FilterConfig("offered_by.code"),
+    "department": FilterConfig("departments.department_id", unique_per_document=True),
+    "platform": FilterConfig("platform.code", unique_per_document=True),
+    "offered_by": FilterConfig("offered_by.code", unique_per_document=True),
     "learning_format": FilterConfig("learning_format.code"),
 }
 
@@ -99,6 +103,7 @@ ENGLISH_TEXT_FIELD_WITH_SUGGEST = {
 
 LEARNING_RESOURCE_MAP = {
     "resource_relations": {"type": "join", "relations": {"resource": "content_file"}},
+    "autocomplete": {"type": "completion", "analyzer": "folding"},
     "id": {"type": "long"},
     "certification": {"type": "boolean"},
     "free": {"type": "boolean"},
@@ -355,7 +360,52 @@ MAPPING = {
 
 SEARCH_CONN_EXCEPTIONS = (ESConnectionError, UrlTimeoutError)
 
+# update_index re-checks changes made this long before its watermark, to pick up
+# rows whose transactions committed after the previous run started
+UPDATE_INDEX_WATERMARK_OVERLAP = timedelta(minutes=5)
+
+# Content files are deleted from the database in batches of this size
+CONTENT_FILE_DELETE_BATCH_SIZE = 1000
+
+# The most searches a batch search request can run at once
+MAX_BATCH_SEARCHES = 10
+
+# The completion field holding the autocomplete inputs of learning resources
+AUTOCOMPLETE_FIELD = "autocomplete"
+
+# The most suggestions an autocomplete request can return
+MAX_AUTOCOMPLETE_SUGGESTIONS = 20
+
+# Autocomplete suggestions are ranked by the weight of the kind of input matched
+AUTOCOMPLETE_WEIGHTS = {
+    "title": 4,
+    "course_number": 3,
+    "topic": 2,
+    "instructor": 1,
+}
+
+# Search results with view=card only include the fields the result cards render
+CARD_VIEW = "card"
+SEARCH_VIEWS = ("full", CARD_VIEW)
+LEARNING_RESOURCE_CARD_FIELDS = [
+    "id",
+    "readable_id",
+    "title",
+    "url",
+    "resource_type",
+    "image",
+    "certification",
+    "professional",
+    "offered_by",
+    "platform",
+    "runs.id",
+    "runs.start_date",
+    "runs.end_date",
+    "learning_path.item_count",
+]
+
 SOURCE_EXCLUDED_FIELDS = [
+    "autocomplete",
     "created_on",
     "course.course_numbers.sort_coursenum",
     "course.course_numbers.primary",
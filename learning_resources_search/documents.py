@@ -0,0 +1,618 @@
+"""Set-based builder for learning resource search documents"""
+
+from collections import defaultdict
+from decimal import Decimal
+from functools import cache
+
+from django.contrib.admin.utils import flatten
+from django.db.models import Count, F
+from rest_framework import serializers
+
+from channels.models import FieldChannel
+from learning_resources import models
+from learning_resources.constants import (
+    LearningResourceRelationTypes,
+    LearningResourceType,
+)
+from learning_resources.serializers import (
+    CourseNumberSerializer,
+    CourseResourceSerializer,
+    CourseSerializer,
+    LearningPathSerializer,
+    LearningResourceBaseDepartmentSerializer,
+    LearningResourceBaseSchoolSerializer,
+    LearningResourceImageSerializer,
+    LearningResourceInstructorSerializer,
+    LearningResourceOfferorSerializer,
+    LearningResourcePlatformSerializer,
+    LearningResourceRunSerializer,
+    LearningResourceSerializer,
+    PodcastEpisodeSerializer,
+    PodcastSerializer,
+    ProgramSerializer,
+    VideoChannelSerializer,
+    VideoPlaylistSerializer,
+    VideoSerializer,
+)
+from learning_resources_search.serializers import (
+    SearchCourseNumberSerializer,
+    serialize_autocomplete_inputs,
+)
+
+RESOURCE_TYPE_SERIALIZERS = {
+    LearningResourceType.course.name: CourseSerializer,
+    LearningResourceType.program.name: ProgramSerializer,
+    LearningResourceType.learning_path.name: LearningPathSerializer,
+    LearningResourceType.podcast.name: PodcastSerializer,
+    LearningResourceType.podcast_episode.name: PodcastEpisodeSerializer,
+    LearningResourceType.video.name: VideoSerializer,
+    LearningResourceType.video_playlist.name: VideoPlaylistSerializer,
+}
+
+# Fields of the resource type models which aren't rendered straight from a column
+RESOURCE_TYPE_EXTRA_FIELDS = {
+    LearningResourceType.course.name: ["course_numbers"],
+    LearningResourceType.video_playlist.name: ["channel_id"],
+}
+
+
+@cache
+def _column_fields(serializer_cls):
+    """
+    Get the fields of a model serializer which are rendered straight from a column
+
+    Args:
+        serializer_cls(type): A ModelSerializer class
+
+    Returns:
+        dict: serializer fields keyed by name
+    """
+    columns = {
+        field.name
+        for field in serializer_cls.Meta.model._meta.concrete_fields  # noqa: SLF001
+        if not field.is_relation
+    }
+    return {
+        name: field
+        for name, field in serializer_cls().fields.items()
+        if field.source in columns and not isinstance(field, serializers.BaseSerializer)
+    }
+
+
+def _render(fields, row):
+    """
+    Render the values of a row the way a serializer with these fields would
+
+    Args:
+        fields(dict): serializer fields keyed by name
+        row(dict): The values of a model instance
+
+    Returns:
+        dict: The rendered values
+    """
+    return {
+        name: None if row[name] is None else field.to_representation(row[name])
+        for name, field in fields.items()
+    }
+
+
+def _render_columns(serializer_cls, row):
+    """
+    Render the column values of a row the way the serializer would
+
+    Args:
+        serializer_cls(type): A ModelSerializer class
+        row(dict): The column values of a model instance
+
+    Returns:
+        dict: The rendered values
+    """
+    return _render(_column_fields(serializer_cls), row)
+
+
+def _column_values(queryset, serializer_cls, *extra, **expressions):
+    """
+    Fetch the columns a serializer needs from a queryset
+
+    Args:
+        queryset(QuerySet): The queryset to fetch rows from
+        serializer_cls(type): A ModelSerializer class
+        extra(list of str): Any other fields to fetch
+        expressions(dict): Any other expressions to fetch
+
+    Returns:
+        QuerySet: The queryset of row dicts
+    """
+    return queryset.values(*_column_fields(serializer_cls), *extra, **expressions)
+
+
+def _channel_urls(detail_name, field_name, ids):
+    """
+    Map topics, departments or offerors to the url of their channel
+
+    Args:
+        detail_name(str): The FieldChannel related name of the channel detail model
+        field_name(str): The field of the channel detail model for the object
+        ids(set): The primary keys of the objects
+
+    Returns:
+        dict: channel urls keyed by object primary key
+    """
+    urls = {}
+    for object_id, channel_type, name in (
+        FieldChannel.objects.filter(**{f"{detail_name}__{field_name}__in": ids})
+        .order_by("id")
+        .values_list(f"{detail_name}__{field_name}", "channel_type", "name")
+    ):
+        urls.setdefault(
+            object_id, FieldChannel(channel_type=channel_type, name=name).channel_url
+        )
+    return urls
+
+
+@cache
+def _course_number_fields(serializer_cls):
+    """
+    Get the fields of a course number serializer, except for the department
+
+    Args:
+        serializer_cls(type): CourseNumberSerializer or a subclass of it
+
+    Returns:
+        dict: serializer fields keyed by name
+    """
+    return {
+        name: field
+        for name, field in serializer_cls().fields.items()
+        if name != "department"
+    }
+
+
+def _course_number(course_number, serializer_cls):
+    """
+    Render a course number the way the serializer would
+
+    Args:
+        course_number(dict): An item of Course.course_numbers
+        serializer_cls(type): CourseNumberSerializer or a subclass of it
+
+    Returns:
+        dict: The rendered course number
+    """
+    department = course_number["department"]
+    return {
+        **_render(_course_number_fields(serializer_cls), course_number),
+        "department": (
+            None
+            if department is None
+            else {
+                **_render_columns(LearningResourceBaseDepartmentSerializer, department),
+                # The department is a dict rather than a model instance here, so the
+                # serializer never finds a channel or school for it
+                "channel_url": None,
+                "school": None,
+            }
+        ),
+    }
+
+
+class LearningResourceDocumentBuilder:
+    """
+    Build the search documents for a chunk of learning resources.
+
+    Everything LearningResourceSerializer needs is fetched for the whole chunk with a
+    fixed number of queries and assembled into plain dicts, rather than running the
+    serializer (and its per-resource queries) once per resource.
+    """
+
+    def __init__(self, ids, *, nested=False):
+        """
+        Fetch the data for the learning resources
+
+        Args:
+            ids(list of int): The learning resource ids
+            nested(bool): Build the CourseResourceSerializer representation used
+                for the courses of a program, instead of the full search document
+        """
+        self.nested = nested
+        self.course_number_serializer = (
+            CourseNumberSerializer if nested else SearchCourseNumberSerializer
+        )
+        self.rows = {
+            row["id"]: row
+            for row in _column_values(
+                models.LearningResource.objects.filter(id__in=ids).order_by("id"),
+                CourseResourceSerializer,
+                "created_on",
+                "image_id",
+                "platform_id",
+                "offered_by_id",
+            )
+        }
+        ids = list(self.rows)
+        self.views = dict(
+            models.LearningResourceViewEvent.objects.filter(
+                learning_resource_id__in=ids
+            )
+            .order_by()
+            .values("learning_resource_id")
+            .annotate(count=Count("id"))
+            .values_list("learning_resource_id", "count")
+        )
+        self._load_relations(ids)
+        self._load_runs(ids)
+        self._load_resource_type_data()
+        self._load_images()
+
+    def _load_relations(self, ids):
+        """Fetch the topics, departments, content tags, offerors and platforms"""
+        self.topics = defaultdict(list)
+        for topic in models.LearningResourceTopic.objects.filter(
+            learningresource__id__in=ids
+        ).values("id", "name", "parent_id", resource_id=F("learningresource__id")):
+            self.topics[topic["resource_id"]].append(topic)
+
+        self.departments = defaultdict(list)
+        for department in _column_values(
+            models.LearningResourceDepartment.objects.filter(
+                learningresource__id__in=ids
+            ),
+            LearningResourceBaseDepartmentSerializer,
+            "school_id",
+            resource_id=F("learningresource__id"),
+        ):
+            self.departments[department["resource_id"]].append(department)
+        self.schools = {
+            school["id"]: _render_columns(LearningResourceBaseSchoolSerializer, school)
+            for school in _column_values(
+                models.LearningResourceSchool.objects.filter(
+                    id__in={
+                        department["school_id"]
+                        for departments in self.departments.values()
+                        for department in departments
+                    }
+                ),
+                LearningResourceBaseSchoolSerializer,
+            )
+        }
+
+        self.content_tags = defaultdict(list)
+        for resource_id, name in models.LearningResourceContentTag.objects.filter(
+            learningresource__id__in=ids
+        ).values_list("learningresource__id", "name"):
+            self.content_tags[resource_id].append(name)
+
+        self.offerors = {
+            offeror["code"]: _render_columns(LearningResourceOfferorSerializer, offeror)
+            for offeror in _column_values(
+                models.LearningResourceOfferor.objects.filter(
+                    code__in={row["offered_by_id"] for row in self.rows.values()}
+                ),
+                LearningResourceOfferorSerializer,
+            )
+        }
+        self.platforms = {
+            platform["code"]: _render_columns(
+                LearningResourcePlatformSerializer, platform
+            )
+            for platform in _column_values(
+                models.LearningResourcePlatform.objects.filter(
+                    code__in={row["platform_id"] for row in self.rows.values()}
+                ),
+                LearningResourcePlatformSerializer,
+            )
+        }
+
+        self.topic_channel_urls = _channel_urls(
+            "topic_detail",
+            "topic",
+            {topic["id"] for topics in self.topics.values() for topic in topics},
+        )
+        self.department_channel_urls = _channel_urls(
+            "department_detail",
+            "department",
+            {
+                department["department_id"]
+                for departments in self.departments.values()
+                for department in departments
+            },
+        )
+        self.offeror_channel_urls = _channel_urls(
+            "offeror_detail", "offeror", set(self.offerors)
+        )
+
+    def _load_runs(self, ids):
+        """Fetch the runs and their instructors"""
+        self.runs = defaultdict(list)
+        for run in _column_values(
+            models.LearningResourceRun.objects.filter(
+                learning_resource_id__in=ids
+            ).order_by("id"),
+            LearningResourceRunSerializer,
+            "learning_resource_id",
+            "image_id",
+        ):
+            self.runs[run["learning_resource_id"]].append(run)
+
+        self.instructors = defaultdict(list)
+        for instructor in _column_values(
+            models.LearningResourceInstructor.objects.filter(
+                runs__learning_resource_id__in=ids
+            ),
+            LearningResourceInstructorSerializer,
+            instructor_run_id=F("runs__id"),
+        ):
+            self.instructors[instructor["instructor_run_id"]].append(
+                _render_columns(LearningResourceInstructorSerializer, instructor)
+            )
+
+    def _load_resource_type_data(self):
+        """Fetch the resource type specific data"""
+        resource_type_ids = defaultdict(list)
+        for resource_id, row in self.rows.items():
+            resource_type_ids[self._resource_type(row)].append(resource_id)
+        self.resource_type_rows = {}
+        for resource_type, ids_for_type in resource_type_ids.items():
+            serializer_cls = RESOURCE_TYPE_SERIALIZERS.get(resource_type)
+            if serializer_cls is None:
+                continue
+            for row in _column_values(
+                serializer_cls.Meta.model.objects.filter(
+                    learning_resource_id__in=ids_for_type
+                ),
+                serializer_cls,
+                "learning_resource_id",
+                *RESOURCE_TYPE_EXTRA_FIELDS.get(resource_type, []),
+            ):
+                self.resource_type_rows[row["learning_resource_id"]] = row
+
+        self.video_channels = {
+            channel["channel_id"]: _render_columns(VideoChannelSerializer, channel)
+            for channel in _column_values(
+                models.VideoChannel.objects.filter(
+                    channel_id__in={
+                        row["channel_id"]
+                        for row in self.resource_type_rows.values()
+                        if "channel_id" in row
+                    }
+                ),
+                VideoChannelSerializer,
+            )
+        }
+
+        parent_ids = [
+            resource_id
+            for resource_id, row in self.rows.items()
+            if row["resource_type"]
+            in (
+                LearningResourceType.learning_path.name,
+                LearningResourceType.podcast.name,
+                LearningResourceType.video_playlist.name,
+            )
+            and not self.nested
+        ]
+        self.child_counts = defaultdict(dict)
+        for parent_id, relation_type, count in (
+            models.LearningResourceRelationship.objects.filter(parent_id__in=parent_ids)
+            .order_by()
+            .values("parent_id", "relation_type")
+            .annotate(count=Count("id"))
+            .values_list("parent_id", "relation_type", "count")
+        ):
+            self.child_counts[parent_id][relation_type] = count
+
+        program_courses = defaultdict(list)
+        for parent_id, child_id in (
+            models.LearningResourceRelationship.objects.filter(
+                parent_id__in=[
+                    resource_id
+                    for resource_id, row in self.rows.items()
+                    if row["resource_type"] == LearningResourceType.program.name
+                    and not self.nested
+                ],
+                child__published=True,
+            )
+            .order_by("child_id")
+            .values_list("parent_id", "child_id")
+            .distinct()
+        ):
+            program_courses[parent_id].append(child_id)
+        self.program_courses = program_courses
+        self.courses = (
+            LearningResourceDocumentBuilder(
+                {
+                    child_id
+                    for child_ids in program_courses.values()
+                    for child_id in child_ids
+                },
+                nested=True,
+            ).representations()
+            if program_courses
+            else {}
+        )
+
+    def _load_images(self):
+        """Fetch the images of the resources and their runs"""
+        image_ids = {
+            *(row["image_id"] for row in self.rows.values()),
+            *(run["image_id"] for runs in self.runs.values() for run in runs),
+        }
+        self.images = {
+            image["id"]: _render_columns(LearningResourceImageSerializer, image)
+            for image in _column_values(
+                models.LearningResourceImage.objects.filter(id__in=image_ids),
+                LearningResourceImageSerializer,
+            )
+        }
+
+    def _prices(self, row):
+        """Calculate the prices the way LearningResource.prices does"""
+        if row["resource_type"] in [
+            LearningResourceType.course.name,
+            LearningResourceType.program.name,
+        ]:
+            return list(
+                set(
+                    flatten(
+                        [
+                            (run["prices"] or [Decimal(0.0)])
+                            for run in self.runs[row["id"]]
+                        ]
+                    )
+                )
+            )
+        return [Decimal(0.00)]
+
+    def _run(self, run):
+        """Build the representation of a run"""
+        return {
+            **_render_columns(LearningResourceRunSerializer, run),
+            "instructors": self.instructors[run["id"]],
+            "image": self.images.get(run["image_id"]),
+        }
+
+    def _resource_type(self, row):
+        """
+        Get the resource type the resource is serialized as. The courses of a program
+        are always serialized with CourseResourceSerializer.
+        """
+        return LearningResourceType.course.name if self.nested else row["resource_type"]
+
+    def _resource_type_data(self, resource_type, row):
+        """Build the representation of the resource type specific model"""
+        data = _render_columns(
+            RESOURCE_TYPE_SERIALIZERS[resource_type],
+            self.resource_type_rows[row["id"]],
+        )
+        child_counts = self.child_counts[row["id"]]
+        if resource_type == LearningResourceType.course.name:
+            data["course_numbers"] = [
+                _course_number(course_number, self.course_number_serializer)
+                for course_number in (
+                    self.resource_type_rows[row["id"]]["course_numbers"] or []
+                )
+            ]
+        elif resource_type == LearningResourceType.program.name:
+            data["courses"] = [
+                self.courses[course_id]
+                for course_id in self.program_courses[row["id"]]
+                if course_id in self.courses
+            ]
+        elif resource_type == LearningResourceType.learning_path.name:
+            data["item_count"] = sum(child_counts.values())
+        elif resource_type == LearningResourceType.podcast.name:
+            data["episode_count"] = child_counts.get(
+                LearningResourceRelationTypes.PODCAST_EPISODES.value, 0
+            )
+        elif resource_type == LearningResourceType.video_playlist.name:
+            channel_id = self.resource_type_rows[row["id"]]["channel_id"]
+            data["channel"] = self.video_channels.get(channel_id)
+            data["video_count"] = child_counts.get(
+                LearningResourceRelationTypes.PLAYLIST_VIDEOS.value, 0
+            )
+        return data
+
+    def _representation(self, row):
+        """Build the LearningResourceSerializer representation of a resource"""
+        resource_id = row["id"]
+        resource_type = self._resource_type(row)
+        data = _render_columns(
+            LearningResourceSerializer.serializer_cls_mapping[resource_type], row
+        )
+        offeror = self.offerors.get(row["offered_by_id"])
+        data.update(
+            {
+                "topics": [
+                    {
+                        "id": topic["id"],
+                        "name": topic["name"],
+                        "parent": topic["parent_id"],
+                        "channel_url": self.topic_channel_urls.get(topic["id"]),
+                    }
+                    for topic in self.topics[resource_id]
+                ],
+                "offered_by": (
+                    None
+                    if offeror is None
+                    else {
+                        **offeror,
+                        "channel_url": self.offeror_channel_urls.get(offeror["code"]),
+                    }
+                ),
+                "platform": self.platforms.get(row["platform_id"]),
+                "course_feature": sorted(self.content_tags[resource_id]),
+                "departments": [
+                    {
+                        **_render_columns(
+                            LearningResourceBaseDepartmentSerializer, department
+                        ),
+                        "channel_url": self.department_channel_urls.get(
+                            department["department_id"]
+                        ),
+                        "school": self.schools.get(department["school_id"]),
+                    }
+                    for department in self.departments[resource_id]
+                ],
+                "prices": self._prices(row),
+                "runs": [
+                    self._run(run) for run in self.runs[resource_id] if run["published"]
+                ],
+                # LearningResourceBaseSerializer.get_image compares resource_type to
+                # the LearningResourceType value rather than its name, so learning
+                # paths never fall back to the image of their first item
+                "image": self.images.get(row["image_id"]),
+                "learning_path_parents": [],
+                "user_list_parents": [],
+                "views": self.views.get(resource_id, 0),
+            }
+        )
+        if resource_id in self.resource_type_rows:
+            data[resource_type] = self._resource_type_data(resource_type, row)
+        return data
+
+    def representations(self):
+        """
+        Build the LearningResourceSerializer representations of the resources
+
+        Returns:
+            dict: representations keyed by learning resource id
+        """
+        return {
+            resource_id: self._representation(row)
+            for resource_id, row in self.rows.items()
+        }
+
+    def documents(self):
+        """
+        Build the search documents for the resources
+
+        Returns:
+            generator of dict: The documents for bulk indexing
+        """
+        for resource_id, row in self.rows.items():
+            data = self._representation(row)
+            if row["resource_type"] in [
+                LearningResourceType.course.name,
+                LearningResourceType.program.name,
+            ]:
+                prices = data["prices"]
+                data["free"] = Decimal(0.00) in prices or not prices or prices == []
+            else:
+                data["free"] = True
+            data["autocomplete"] = serialize_autocomplete_inputs(data)
+            yield {
+                "_id": resource_id,
+                "resource_relations": {"name": "resource"},
+                "created_on": row["created_on"],
+                **data,
+            }
+
+
+def serialize_bulk_learning_resources(ids):
+    """
+    Serialize learning resource for bulk indexing
+
+    Args:
+        ids(list of int): List of learning_resource id's
+    """
+    yield from LearningResourceDocumentBuilder(ids).documents()
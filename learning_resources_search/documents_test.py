@@ -0,0 +1,131 @@
+"""Tests for the learning resource document builder"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from channels.factories import (
+    ChannelDepartmentDetailFactory,
+    ChannelOfferorDetailFactory,
+    ChannelTopicDetailFactory,
+)
+from learning_resources import factories
+from learning_resources.constants import LearningResourceType
+from learning_resources.etl.constants import CourseNumberType
+from learning_resources.models import LearningResource
+from learning_resources_search.documents import serialize_bulk_learning_resources
+from learning_resources_search.serializers import serialize_learning_resource_for_bulk
+
+RESOURCE_FACTORIES = {
+    LearningResourceType.course.name: factories.CourseFactory,
+    LearningResourceType.program.name: factories.ProgramFactory,
+    LearningResourceType.learning_path.name: factories.LearningPathFactory,
+    LearningResourceType.podcast.name: factories.PodcastFactory,
+    LearningResourceType.podcast_episode.name: factories.PodcastEpisodeFactory,
+    LearningResourceType.video.name: factories.VideoFactory,
+    LearningResourceType.video_playlist.name: factories.VideoPlaylistFactory,
+}
+
+
+def _sort_by_id(items):
+    """Sort a list of serialized objects by id"""
+    return sorted(items, key=lambda item: item["id"])
+
+
+def _normalize(document):
+    """Sort the lists in a document which the serializer returns in database order"""
+    document = {
+        **document,
+        "topics": _sort_by_id(document["topics"]),
+        "runs": _sort_by_id(document["runs"]),
+        "prices": sorted(document["prices"]),
+    }
+    if "program" in document:
+        document["program"] = {
+            "courses": _sort_by_id(
+                [_normalize(course) for course in document["program"]["courses"]]
+            )
+        }
+    return document
+
+
+def _create_resource(resource_type):
+    """Create a learning resource of the given type with channels and views"""
+    resource = RESOURCE_FACTORIES[resource_type].create().learning_resource
+    ChannelTopicDetailFactory.create(topic=resource.topics.first())
+    ChannelDepartmentDetailFactory.create(department=resource.departments.first())
+    if resource.offered_by:
+        ChannelOfferorDetailFactory.create(offeror=resource.offered_by)
+    factories.LearningResourceViewEventFactory.create_batch(
+        2, learning_resource=resource
+    )
+    return resource
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize("resource_type", LearningResourceType.names())
+def test_serialize_bulk_learning_resources(resource_type):
+    """
+    serialize_bulk_learning_resources should build the same documents as
+    serialize_learning_resource_for_bulk
+    """
+    resources = [_create_resource(resource_type) for _ in range(2)]
+    if resource_type == LearningResourceType.course.name:
+        course = resources[0].course
+        course.course_numbers = [
+            {
+                "value": "16.01",
+                "department": {"department_id": "16", "name": "Aeronautics"},
+                "listing_type": CourseNumberType.primary.value,
+                "primary": True,
+                "sort_coursenum": "16.01",
+            },
+            {
+                "value": "CMS.100",
+                "department": None,
+                "listing_type": CourseNumberType.cross_listed.value,
+                "primary": False,
+                "sort_coursenum": "CMS.100",
+            },
+        ]
+        course.save()
+        factories.LearningResourceRunFactory.create(
+            learning_resource=resources[0], published=False
+        )
+    if resource_type == LearningResourceType.learning_path.name:
+        resources[0].image = None
+        resources[0].save()
+        for position, relationship in enumerate(resources[0].children.order_by("-id")):
+            relationship.position = position
+            relationship.save()
+
+    documents = list(
+        serialize_bulk_learning_resources([resource.id for resource in resources])
+    )
+
+    assert [_normalize(document) for document in documents] == [
+        _normalize(serialize_learning_resource_for_bulk(resource))
+        for resource in LearningResource.objects.filter(
+            id__in=[resource.id for resource in resources]
+        ).order_by("id")
+    ]
+
+
+@pytest.mark.django_db()
+def test_serialize_bulk_learning_resources_query_count():
+    """
+    serialize_bulk_learning_resources should make the same number of queries no
+    matter how many resources there are in a chunk
+    """
+    query_counts = []
+    for num_resources in [1, 5]:
+        ids = [
+            _create_resource(resource_type).id
+            for resource_type in LearningResourceType.names()
+            for _ in range(num_resources)
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            list(serialize_bulk_learning_resources(ids))
+        query_counts.append(len(queries))
+
+    assert query_counts[0] == query_counts[1]
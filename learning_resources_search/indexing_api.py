@@ -2,17 +2,33 @@
 Functions and constants for OpenSearch indexing
 """
 
+import hashlib
 import json
 import logging
-from math import ceil
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db.models import Count, Q
+from django_redis import get_redis_connection
 from opensearchpy.exceptions import ConflictError, NotFoundError
-from opensearchpy.helpers import BulkIndexError, bulk
-
-from learning_resources.models import ContentFile, LearningResourceRun
+from opensearchpy.helpers import BulkIndexError, expand_action
+from opensearchpy.serializer import JSONSerializer
+from redis.exceptions import LockError
+
+from learning_resources.models import (
+    ContentFile,
+    LearningResource,
+    LearningResourceRun,
+)
+from learning_resources_search.api import (
+    bump_search_cache_generation,
+    defer_search_cache_generation_bump,
+)
 from learning_resources_search.connection import (
+    clear_existing_aliases_cache,
     get_active_aliases,
     get_conn,
     get_default_alias_name,
@@ -23,25 +39,31 @@ from learning_resources_search.connection import (
 from learning_resources_search.constants import (
     ALIAS_ALL_INDICES,
     ALL_INDEX_TYPES,
+    CONTENT_FILE_DELETE_BATCH_SIZE,
+    CONTENT_FILE_TYPE,
     COURSE_TYPE,
+    LEARNING_RESOURCE_TYPES,
     MAPPING,
     PERCOLATE_INDEX_TYPE,
     IndexestoUpdate,
 )
+from learning_resources_search.documents import serialize_bulk_learning_resources
 from learning_resources_search.exceptions import ReindexError
+from learning_resources_search.models import IndexedDocument
 from learning_resources_search.serializers import (
-    serialize_bulk_learning_resources,
+    serialize_bulk_content_files,
     serialize_bulk_learning_resources_for_deletion,
     serialize_bulk_percolators,
     serialize_bulk_percolators_for_deletion,
-    serialize_content_file_for_bulk,
     serialize_content_file_for_bulk_deletion,
 )
-from main.utils import chunks
+from main.utils import chunks, now_in_utc
 
 log = logging.getLogger(__name__)
 User = get_user_model()
 
+BULK_SERIALIZER = JSONSerializer()
+
 
 def _update_document_by_id(doc_id, body, object_type, *, retry_on_conflict=0, **kwargs):
     """
@@ -74,7 +96,31 @@ def _update_document_by_id(doc_id, body, object_type, *, retry_on_conflict=0, **
             )
 
 
-def clear_and_create_index(*, index_name=None, skip_mapping=False, object_type=None):
+def get_index_settings(*, bulk_load=False):
+    """
+    Get the dynamic settings for an index
+
+    Args:
+        bulk_load (bool): If true, get settings for an index that is being filled by
+            bulk requests and isn't searched yet: no replicas and no refreshes
+
+    Returns:
+        dict: The index settings
+    """
+    if bulk_load:
+        index_settings = {"number_of_replicas": 0, "refresh_interval": "-1"}
+        if settings.OPENSEARCH_BULK_LOAD_ASYNC_TRANSLOG:
+            index_settings["translog.durability"] = "async"
+        return index_settings
+    return {
+        "number_of_replicas": settings.OPENSEARCH_REPLICA_COUNT,
+        "refresh_interval": "60s",
+    }
+
+
+def clear_and_create_index(
+    *, index_name=None, skip_mapping=False, object_type=None, bulk_load=False
+):
     """
     Wipe and recreate index and mapping. No indexing is done.
 
@@ -82,6 +128,7 @@ def clear_and_create_index(*, index_name=None, skip_mapping=False, object_type=N
         index_name (str): The name of the index to clear
         skip_mapping (bool): If true, don't set any mapping
         object_type(str): The type of document (post, comment)
+        bulk_load (bool): If true, create the index with bulk load settings
     """
     if object_type not in ALL_INDEX_TYPES:
         msg = (
@@ -95,8 +142,7 @@ def clear_and_create_index(*, index_name=None, skip_mapping=False, object_type=N
         "settings": {
             "index": {
                 "number_of_shards": settings.OPENSEARCH_SHARD_COUNT,
-                "number_of_replicas": settings.OPENSEARCH_REPLICA_COUNT,
-                "refresh_interval": "60s",
+                **get_index_settings(bulk_load=bulk_load),
             },
             "analysis": {
                 "analyzer": {
@@ -175,59 +221,192 @@ def deindex_items(documents, object_type, index_types, **kwargs):
                 log.exception("Bulk deindex failed. Error: %s", str(message))
                 msg = f"Bulk deindex failed: {message}"
                 raise ReindexError(msg) from error
+        bump_search_cache_generation()
+
+
+def _serialize_bulk_document(document):
+    """
+    Serialize a document into the NDJSON lines for an OpenSearch bulk request
+
+    Args:
+        document (dict): An opensearch document or bulk action
+
+    Returns:
+        str: The action (and source, if any) lines for the document
+    """
+    action, data = expand_action(document)
+    lines = [BULK_SERIALIZER.dumps(action)]
+    if data is not None:
+        lines.append(BULK_SERIALIZER.dumps(data))
+    return "\n".join(lines) + "\n"
+
+
+def _bulk_payloads(documents, object_type):
+    """
+    Serialize documents into bulk request payloads, sizing each request as the
+    documents are serialized so that no payload exceeds
+    OPENSEARCH_INDEXING_CHUNK_SIZE documents or OPENSEARCH_MAX_REQUEST_SIZE bytes
+
+    Args:
+        documents (iterable of dict): An iterable with opensearch documents to index
+        object_type (str): the ES object type
+
+    Yields:
+        tuple of (str, int, int): The NDJSON payload, the number of documents in it
+            and its size in bytes
+    """
+    max_size = settings.OPENSEARCH_MAX_REQUEST_SIZE
+    lines = []
+    payload_size = 0
+    for document in documents:
+        line = _serialize_bulk_document(document)
+        line_size = len(line.encode("utf-8"))
+        if line_size > max_size:
+            log.error(
+                "Document id %s for object_type %s exceeds max size %d: %d",
+                document["_id"],
+                object_type,
+                max_size,
+                line_size,
+            )
+            continue
+        if lines and (
+            payload_size + line_size > max_size
+            or len(lines) >= settings.OPENSEARCH_INDEXING_CHUNK_SIZE
+        ):
+            yield "".join(lines), len(lines), payload_size
+            lines = []
+            payload_size = 0
+        lines.append(line)
+        payload_size += line_size
+    if lines:
+        yield "".join(lines), len(lines), payload_size
+
+
+def _send_bulk_payload(conn, payload, alias, **kwargs):
+    """
+    Send a bulk payload to an alias and raise an error for any failed items
+
+    Args:
+        conn (opensearch.client.Opensearch): An Opensearch client
+        payload (str): The NDJSON bulk request body
+        alias (str): The alias to send the request to
+        kwargs (dict): Optional query parameters for the bulk request (routing, etc)
+
+    Returns:
+        float: The seconds the bulk request took
+    """
+    start = time.monotonic()
+    response = conn.bulk(body=payload, index=alias, **kwargs)
+    elapsed = time.monotonic() - start
+    if not response.get("errors"):
+        return elapsed
+    errors = []
+    for item in response.get("items", []):
+        op_type, info = next(iter(item.items()))
+        if not 200 <= info.get("status", 500) < 300:  # noqa: PLR2004
+            errors.append({op_type: info})
+    if errors:
+        msg = f"{len(errors)} document(s) failed to index."
+        raise BulkIndexError(msg, errors)
+    return elapsed
+
+
+def _add_bulk_request_stats(futures, payloads, stats):
+    """
+    Wait for completed bulk requests and add their documents, bytes and seconds to
+    the stats of the alias they were sent to
+
+    Args:
+        futures (iterable of Future): Completed futures of _send_bulk_payload
+        payloads (dict): The alias, document count and size of each future's payload
+        stats (dict): The stats keyed by alias, updated in place
+    """
+    for future in futures:
+        alias, num_documents, payload_size = payloads.pop(future)
+        seconds = future.result()
+        stats[alias]["documents"] += num_documents
+        stats[alias]["bytes"] += payload_size
+        stats[alias]["seconds"] += seconds
 
 
 def index_items(documents, object_type, index_types, **kwargs):
     """
     Index items based on list of item ids
 
+    Each bulk payload is serialized once and sent to every active alias.
+    Up to OPENSEARCH_INDEXING_WORKERS requests are sent concurrently.
+
     Args:
         documents (iterable of dict): An iterable with opensearch documents to index
         object_type (str): the ES object type
         index_types (string): one of the values IndexestoUpdate. Whether the default
             index, the reindexing index or both need to be updated
+        kwargs (dict): Optional query parameters for the bulk requests (routing, etc)
+
+    Returns:
+        dict: The documents and bytes indexed, and the seconds spent in bulk
+            requests, keyed by alias
+
+    Raises:
+        ReindexError: If none of the requested aliases exist, so that documents
+            aren't silently dropped
     """
     conn = get_conn()
-    # bulk will also break an iterable into chunks. However we should do this here so
-    # that we can use the same documents when indexing to multiple aliases.
-    for chunk in chunks(documents, chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE):
-        documents_size = len(json.dumps(chunk, default=str))
-        # Keep chunking the chunks until either the size is acceptable or there's
-        # nothing left to chunk
-        if documents_size > settings.OPENSEARCH_MAX_REQUEST_SIZE:
-            if len(chunk) == 1:
-                log.error(
-                    "Document id %s for object_type %s exceeds max size %d: %d",
-                    chunk[0]["_id"],
-                    object_type,
-                    settings.OPENSEARCH_MAX_REQUEST_SIZE,
-                    documents_size,
-                )
-                continue
-            num_chunks = min(
-                ceil(
-                    len(chunk)
-                    / ceil(documents_size / settings.OPENSEARCH_MAX_REQUEST_SIZE)
-                ),
-                len(chunk) - 1,
-            )
-            for smaller_chunk in chunks(chunk, chunk_size=num_chunks):
-                index_items(smaller_chunk, object_type, index_types, **kwargs)
-        else:
-            for alias in get_active_aliases(
-                conn, object_types=[object_type], index_types=index_types
-            ):
-                _, errors = bulk(
-                    conn,
-                    chunk,
-                    index=alias,
-                    chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-                    **kwargs,
+    aliases = get_active_aliases(
+        conn, object_types=[object_type], index_types=index_types
+    )
+    if not aliases:
+        msg = f"No {index_types} alias exists to index {object_type} documents"
+        raise ReindexError(msg)
+    stats = {alias: {"documents": 0, "bytes": 0, "seconds": 0} for alias in aliases}
+
+    workers = max(1, settings.OPENSEARCH_INDEXING_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        payloads = {}
+        for payload, num_documents, payload_size in _bulk_payloads(
+            documents, object_type
+        ):
+            for alias in aliases:
+                future = executor.submit(
+                    _send_bulk_payload, conn, payload, alias, **kwargs
                 )
-                if len(errors) > 0:
-                    log.error(errors)
-                    msg = f"Error during bulk {object_type} insert: {errors}"
-                    raise ReindexError(msg)
+                payloads[future] = (alias, num_documents, payload_size)
+            # Keep a bounded number of payloads in flight so memory stays flat
+            while len(payloads) >= workers * len(aliases):
+                done, _ = wait(payloads, return_when=FIRST_COMPLETED)
+                _add_bulk_request_stats(done, payloads, stats)
+        _add_bulk_request_stats(list(payloads), payloads, stats)
+
+    for alias, alias_stats in stats.items():
+        log.info(
+            "Indexed %d %s documents (%d bytes) to %s in %.2f seconds (%.1f docs/sec)",
+            alias_stats["documents"],
+            object_type,
+            alias_stats["bytes"],
+            alias,
+            alias_stats["seconds"],
+            alias_stats["documents"] / alias_stats["seconds"]
+            if alias_stats["seconds"]
+            else 0,
+        )
+    if index_types != IndexestoUpdate.reindexing_index.value:
+        bump_search_cache_generation()
+    return stats
+
+
+def _add_index_stats(total, stats):
+    """
+    Add the stats returned by index_items to a running total
+
+    Args:
+        total (dict): The total stats keyed by alias, updated in place
+        stats (dict): The stats of one call to index_items
+    """
+    for alias, alias_stats in stats.items():
+        total_stats = total.setdefault(alias, dict.fromkeys(alias_stats, 0))
+        for key, value in alias_stats.items():
+            total_stats[key] += value
 
 
 def index_learning_resources(ids, resource_type, index_types):
@@ -240,8 +419,236 @@ def index_learning_resources(ids, resource_type, index_types):
         index_types (string): one of the values IndexestoUpdate. Whether the default
             index, the reindexing index or both need to be updated
 
+    Returns:
+        dict: Indexing throughput stats keyed by alias
+    """
+    return index_items(
+        serialize_bulk_learning_resources(ids), resource_type, index_types
+    )
+
+
+def _document_content_hash(document):
+    """
+    Hash the content of an opensearch document
+
+    Args:
+        document (dict): An opensearch document
+
+    Returns:
+        str: The hex sha256 digest of the document
+    """
+    return hashlib.sha256(
+        json.dumps(document, sort_keys=True, default=BULK_SERIALIZER.default).encode()
+    ).hexdigest()
+
+
+def changed_since_q(since):
+    """
+    Get a filter for learning resources whose own, offeror, run, instructor, topic,
+    department or child data changed, or that were viewed, after a point in time
+
+    Args:
+        since (datetime or None): The point in time, or None to match everything
+
+    Returns:
+        Q: The filter
+    """
+    if since is None:
+        return Q()
+    changed_q = Q(updated_on__gt=since) | Q(offered_by__updated_on__gt=since)
+    # the many-valued relations are matched with subqueries, so that joining
+    # them (views especially) doesn't multiply the rows of the outer query
+    for lookup in [
+        "runs__updated_on",
+        "runs__instructors__updated_on",
+        "topics__updated_on",
+        "departments__updated_on",
+        "children__updated_on",
+        "views__created_on",
+    ]:
+        changed_q |= Q(
+            id__in=LearningResource.objects.filter(**{f"{lookup}__gt": since}).values(
+                "id"
+            )
+        )
+    return changed_q
+
+
+def update_learning_resources(
+    ids, resource_type, index_types, *, since=None, force=False
+):
+    """
+    Index the learning resources of a list that changed since a point in time and
+    whose documents differ from the ones last sent by update_index, and record the
+    content hashes of the sent documents
+
+    Args:
+        ids(list of int): List of learning resource id's
+        resource_type: The resource type of the resources
+        index_types (string): one of the values IndexestoUpdate. Whether the default
+            index, the reindexing index or both need to be updated
+        since (datetime or None): Only consider resources changed after this time,
+            or which have no recorded content hash, like a course removed from the
+            blocklist or a resource indexed by recreate_index
+        force (bool): Send every document even if its content hash is unchanged
+
+    Returns:
+        dict: The number of documents sent and skipped
+    """
+    skipped = len(ids)
+    if since is not None:
+        indexed_ids = IndexedDocument.objects.filter(
+            object_type=resource_type, object_id__in=ids
+        ).values("object_id")
+        ids = list(
+            LearningResource.objects.filter(id__in=ids)
+            .filter(changed_since_q(since) | ~Q(id__in=indexed_ids))
+            .distinct()
+            .values_list("id", flat=True)
+        )
+    skipped -= len(ids)
+    indexed_hashes = dict(
+        IndexedDocument.objects.filter(
+            object_type=resource_type, object_id__in=ids
+        ).values_list("object_id", "content_hash")
+    )
+    documents = []
+    content_hashes = {}
+    for document in serialize_bulk_learning_resources(ids):
+        content_hash = _document_content_hash(document)
+        if not force and indexed_hashes.get(document["_id"]) == content_hash:
+            skipped += 1
+            continue
+        documents.append(document)
+        content_hashes[document["_id"]] = content_hash
+
+    if documents:
+        index_items(documents, resource_type, index_types)
+        IndexedDocument.objects.bulk_create(
+            [
+                IndexedDocument(
+                    object_type=resource_type,
+                    object_id=object_id,
+                    content_hash=content_hash,
+                )
+                for object_id, content_hash in content_hashes.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["object_type", "object_id"],
+            update_fields=["content_hash", "updated_on"],
+        )
+    return {"sent": len(documents), "skipped": skipped}
+
+
+def _upsert_queue_key(resource_type):
+    """
+    Get the redis key of the pending upsert set for a resource type
+
+    Args:
+        resource_type(str): The resource type
+
+    Returns:
+        str: The redis key
+    """
+    return f"{settings.OPENSEARCH_INDEX}_upsert_queue_{resource_type}"
+
+
+def queue_learning_resource_upserts(ids, resource_type):
+    """
+    Add learning resource ids to the pending upsert set for their resource type.
+    Repeated upserts of the same resource before the next flush are coalesced.
+
+    Args:
+        ids(list of int): List of learning resource ids
+        resource_type(str): The resource type of the resources
+    """
+    if ids:
+        get_redis_connection("redis").sadd(_upsert_queue_key(resource_type), *ids)
+
+
+def pop_queued_learning_resource_upserts(resource_type, count):
+    """
+    Atomically remove and return up to count pending learning resource ids
+
+    Args:
+        resource_type(str): The resource type of the resources
+        count(int): The maximum number of ids to return
+
+    Returns:
+        list of int: The learning resource ids
+    """
+    members = get_redis_connection("redis").spop(
+        _upsert_queue_key(resource_type), count
+    )
+    return [int(member) for member in members or []]
+
+
+def _percolate_queue_key(resource_type):
+    """
+    Get the redis key of the pending percolation set for a resource type
+
+    Args:
+        resource_type(str): The resource type
+
+    Returns:
+        str: The redis key
+    """
+    return f"{settings.OPENSEARCH_INDEX}_percolate_queue_{resource_type}"
+
+
+def queue_learning_resource_percolations(ids, resource_type):
+    """
+    Add learning resource ids to the pending percolation set for their resource
+    type, to be percolated in bulk once their queued upserts are indexed.
+
+    Args:
+        ids(list of int): List of learning resource ids
+        resource_type(str): The resource type of the resources
+    """
+    if ids:
+        get_redis_connection("redis").sadd(_percolate_queue_key(resource_type), *ids)
+
+
+def pop_queued_learning_resource_percolations(resource_type, count):
+    """
+    Atomically remove and return up to count learning resource ids pending percolation
+
+    Args:
+        resource_type(str): The resource type of the resources
+        count(int): The maximum number of ids to return
+
+    Returns:
+        list of int: The learning resource ids
+    """
+    members = get_redis_connection("redis").spop(
+        _percolate_queue_key(resource_type), count
+    )
+    return [int(member) for member in members or []]
+
+
+@contextmanager
+def learning_resource_upserts_flush_lock():
     """
-    index_items(serialize_bulk_learning_resources(ids), resource_type, index_types)
+    Hold a redis lock while flushing the queued learning resource upserts, so that
+    a flush never percolates resources whose upserts another flush has popped but
+    not indexed yet
+
+    Yields:
+        bool: True if the lock was acquired, False if another flush holds it
+    """
+    lock = get_redis_connection("redis").lock(
+        f"{settings.OPENSEARCH_INDEX}_upsert_flush_lock",
+        timeout=settings.OPENSEARCH_UPSERT_FLUSH_LOCK_TIMEOUT,
+    )
+    acquired = lock.acquire(blocking=False)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            try:
+                lock.release()
+            except LockError:
+                log.warning("The upsert flush lock expired before the flush finished")
 
 
 def deindex_learning_resources(ids, resource_type):
@@ -251,18 +658,41 @@ def deindex_learning_resources(ids, resource_type):
     Args:
         ids(list of int): List of learning resource ids
         resource_type: resource type
+
+    Returns:
+        tuple of (list of str, list of int): The ids of the delete_by_query tasks
+            deleting the content files of the resources, and the ids of the content
+            files to delete from the database once those tasks succeed
     """
     deindex_items(
         serialize_bulk_learning_resources_for_deletion(ids),
         resource_type,
         index_types=IndexestoUpdate.all_indexes.value,
     )
+    clear_indexed_documents(ids, resource_type)
 
     if resource_type == COURSE_TYPE:
-        for run_id in LearningResourceRun.objects.filter(
-            learning_resource_id__in=ids
-        ).values_list("id", flat=True):
-            deindex_run_content_files(run_id, unpublished_only=False)
+        content_files = ContentFile.objects.filter(run__learning_resource_id__in=ids)
+        if content_files.exists():
+            return _delete_content_files_after_query(
+                content_files, delete_content_files_by_query(ids)
+            )
+    return [], []
+
+
+def clear_indexed_documents(ids, object_type):
+    """
+    Forget the content hashes of deindexed documents, so update_index sends them
+    again if they are published again
+
+    Args:
+        ids(list of int): The ids of the deindexed objects
+        object_type(str): The object type
+    """
+    if object_type in LEARNING_RESOURCE_TYPES:
+        IndexedDocument.objects.filter(
+            object_type=object_type, object_id__in=ids
+        ).delete()
 
 
 def deindex_percolators(ids):
@@ -289,14 +719,17 @@ def index_percolators(ids, index_types):
     index_types (string): one of the values IndexestoUpdate. Whether the default
             index, the reindexing index or both need to be updated
 
+    Returns:
+        dict: Indexing throughput stats keyed by alias
     """
-    index_items(
+    return index_items(
         serialize_bulk_percolators(ids),
         PERCOLATE_INDEX_TYPE,
         index_types=index_types,
     )
 
 
+@defer_search_cache_generation_bump()
 def index_course_content_files(learning_resource_ids, index_types):
     """
     Index a list of content files by course ids
@@ -306,13 +739,18 @@ def index_course_content_files(learning_resource_ids, index_types):
         index_types (string): one of the values IndexestoUpdate. Whether the default
             index, the reindexing index or both need to be updated
 
+    Returns:
+        dict: Indexing throughput stats of all the runs keyed by alias
     """
+    stats = {}
     for run_id in LearningResourceRun.objects.filter(
         learning_resource_id__in=learning_resource_ids, published=True
     ).values_list("id", flat=True):
-        index_run_content_files(run_id, index_types)
+        _add_index_stats(stats, index_run_content_files(run_id, index_types))
+    return stats
 
 
+@defer_search_cache_generation_bump()
 def index_run_content_files(run_id, index_types):
     """
     Index a list of content files by run id
@@ -321,26 +759,43 @@ def index_run_content_files(run_id, index_types):
         run_id(int): Course run id
         index_types (string): one of the values IndexestoUpdate. Whether the default
             index, the reindexing index or both need to be updated
+
+    Returns:
+        dict: Indexing throughput stats of all the chunks keyed by alias
     """
-    run = LearningResourceRun.objects.get(pk=run_id)
+    # Load the run data shared by every content file document once
+    run = (
+        LearningResourceRun.objects.select_related(
+            "learning_resource__offered_by",
+            "learning_resource__platform",
+            "learning_resource__course",
+        )
+        .prefetch_related(
+            "learning_resource__topics",
+            "learning_resource__departments__school",
+        )
+        .get(pk=run_id)
+    )
     content_file_ids = run.content_files.filter(published=True).values_list(
         "id", flat=True
     )
 
+    stats = {}
     for ids_chunk in chunks(
         content_file_ids, chunk_size=settings.OPENSEARCH_DOCUMENT_INDEXING_CHUNK_SIZE
     ):
-        documents = (
-            serialize_content_file_for_bulk(content_file)
-            for content_file in ContentFile.objects.filter(pk__in=ids_chunk)
-        )
-
-        index_items(
-            documents,
-            COURSE_TYPE,
-            index_types=index_types,
-            routing=run.learning_resource.id,
+        documents = serialize_bulk_content_files(run, ids_chunk)
+
+        _add_index_stats(
+            stats,
+            index_items(
+                documents,
+                COURSE_TYPE,
+                index_types=index_types,
+                routing=run.learning_resource.id,
+            ),
         )
+    return stats
 
 
 def deindex_run_content_files(run_id, unpublished_only):
@@ -351,6 +806,10 @@ def deindex_run_content_files(run_id, unpublished_only):
         run_id(int): Course run id
         unpublished_only(bool): if true only delete  files with published=False
 
+    Returns:
+        tuple of (list of str, list of int): The ids of the delete_by_query tasks
+            deleting the content files of the run, and the ids of the content files
+            to delete from the database once those tasks succeed
     """
     run = LearningResourceRun.objects.get(id=run_id)
     if unpublished_only:
@@ -359,23 +818,165 @@ def deindex_run_content_files(run_id, unpublished_only):
         content_files = run.content_files.all()
 
     if not content_files.exists():
-        return
+        return [], []
 
-    documents = (
-        serialize_content_file_for_bulk_deletion(content_file)
-        for content_file in content_files
-    )
+    if not unpublished_only:
+        return _delete_content_files_after_query(
+            content_files,
+            delete_content_files_by_query([run.learning_resource_id], run_ids=[run.id]),
+        )
+
+    _deindex_content_files(content_files, run.learning_resource_id)
+    # Delete the content files now that they are deindexed
+    delete_content_files(content_files)
+    return [], []
+
+
+def _delete_content_files_after_query(content_files, task_ids):
+    """
+    Keep content files in the database until the delete_by_query tasks removing
+    their documents succeed, or delete them right away if no task was started
 
+    Args:
+        content_files(QuerySet): The content files being deindexed
+        task_ids(list of str): The ids of the delete_by_query tasks
+
+    Returns:
+        tuple of (list of str, list of int): The task ids, and the ids of the content
+            files to delete once the tasks succeed
+    """
+    if not task_ids:
+        delete_content_files(content_files)
+        return [], []
+    return task_ids, list(content_files.values_list("id", flat=True))
+
+
+def _deindex_content_files(content_files, resource_id):
+    """
+    Deindex content files of a learning resource with a delete action for each file
+
+    Args:
+        content_files(QuerySet): The content files to deindex
+        resource_id(int): The id of the learning resource the files belong to
+    """
     deindex_items(
-        documents,
+        (
+            serialize_content_file_for_bulk_deletion(content_file)
+            for content_file in content_files
+        ),
         COURSE_TYPE,
         index_types=IndexestoUpdate.all_indexes.value,
-        routing=run.learning_resource_id,
+        routing=resource_id,
     )
-    # Delete the content files now that they are deindexed
-    ContentFile.objects.filter(
-        pk__in=content_files.values_list("id", flat=True)
-    ).delete()
+
+
+def finish_deleting_content_files(content_file_ids, *, deindex):
+    """
+    Delete content files from the database after a delete_by_query over their
+    documents completed
+
+    Args:
+        content_file_ids(list of int): The ids of the content files
+        deindex(bool): If true the delete_by_query had failures, so deindex each
+            file with a bulk delete first
+    """
+    content_files = ContentFile.objects.filter(id__in=content_file_ids)
+    if deindex:
+        resource_ids = (
+            content_files.order_by()
+            .values_list("run__learning_resource_id", flat=True)
+            .distinct()
+        )
+        for resource_id in resource_ids:
+            _deindex_content_files(
+                content_files.filter(run__learning_resource_id=resource_id),
+                resource_id,
+            )
+    delete_content_files(content_files)
+
+
+def delete_content_files(content_files):
+    """
+    Delete content files from the database in batches of
+    CONTENT_FILE_DELETE_BATCH_SIZE, rather than in one huge delete
+
+    Args:
+        content_files(QuerySet): The content files to delete
+    """
+    content_file_ids = list(content_files.values_list("id", flat=True))
+    for ids_chunk in chunks(
+        content_file_ids, chunk_size=CONTENT_FILE_DELETE_BATCH_SIZE
+    ):
+        ContentFile.objects.filter(id__in=ids_chunk).delete()
+
+
+def delete_content_files_by_query(resource_ids, *, run_ids=None):
+    """
+    Start deleting the content file documents of learning resources from every
+    active course index with _delete_by_query, instead of sending a delete action
+    for each file. Content files are routed by their parent resource id, so only
+    the shards holding those resources are searched. The aliases are refreshed
+    first, so documents indexed since the last refresh are deleted too.
+
+    Args:
+        resource_ids(list of int): The ids of the resources the content files belong to
+        run_ids(list of int): If set, only delete the content files of these runs
+
+    Returns:
+        list of str: The ids of the OpenSearch tasks deleting the documents
+    """
+    resource_ids = sorted(set(resource_ids))
+    filters = [
+        {"term": {"resource_relations": CONTENT_FILE_TYPE}},
+        {"terms": {"resource_id": resource_ids}},
+    ]
+    if run_ids is not None:
+        filters.append({"terms": {"run_id": list(run_ids)}})
+
+    conn = get_conn()
+    task_ids = []
+    aliases = get_active_aliases(conn, object_types=[COURSE_TYPE])
+    if aliases:
+        # _delete_by_query only sees searchable documents, and the reindexing
+        # index isn't refreshed until it's finished
+        conn.indices.refresh(index=",".join(aliases))
+    for alias in aliases:
+        response = conn.delete_by_query(
+            index=alias,
+            body={"query": {"bool": {"filter": filters}}},
+            routing=",".join(str(resource_id) for resource_id in resource_ids),
+            conflicts="proceed",
+            wait_for_completion=False,
+        )
+        task_ids.append(response["task"])
+    return task_ids
+
+
+def get_delete_by_query_status(task_ids):
+    """
+    Get the combined status of delete_by_query tasks
+
+    Args:
+        task_ids(list of str): The ids of the OpenSearch tasks
+
+    Returns:
+        dict: Whether every task is completed, the number of documents deleted so far
+            and any failures
+    """
+    conn = get_conn()
+    status = {"completed": True, "deleted": 0, "failures": []}
+    for task_id in task_ids:
+        task = conn.tasks.get(task_id=task_id)
+        if not task["completed"]:
+            status["completed"] = False
+            status["deleted"] += task["task"]["status"]["deleted"]
+            continue
+        if "error" in task:
+            status["failures"].append(task["error"])
+        response = task.get("response", {})
+        status["deleted"] += response.get("deleted", 0)
+        status["failures"].extend(response.get("failures", []))
+    return status
 
 
 def deindex_document(doc_id, object_type, **kwargs):
@@ -387,6 +988,7 @@ def deindex_document(doc_id, object_type, **kwargs):
         object_type (str): The object type
         kwargs (dict): optional parameters for the request
     """
+    clear_indexed_documents([doc_id], object_type)
     conn = get_conn()
     for alias in get_active_aliases(conn, object_types=[object_type]):
         try:
@@ -414,7 +1016,11 @@ def create_backing_index(object_type):
     new_backing_index = make_backing_index_name(object_type)
 
     # Clear away temp alias so we can reuse it, and create mappings
-    clear_and_create_index(index_name=new_backing_index, object_type=object_type)
+    clear_and_create_index(
+        index_name=new_backing_index,
+        object_type=object_type,
+        bulk_load=settings.OPENSEARCH_BULK_LOAD_INDEXES,
+    )
     temp_alias = get_reindexing_alias_name(object_type)
     if conn.indices.exists_alias(name=temp_alias):
         # Deletes both alias and backing indexes
@@ -424,10 +1030,141 @@ def create_backing_index(object_type):
 
     # Point temp_alias toward new backing index
     conn.indices.put_alias(index=new_backing_index, name=temp_alias)
+    clear_existing_aliases_cache()
 
     return new_backing_index
 
 
+def reindexing_alias_exists(backing_index, object_type):
+    """
+    Check whether the reindexing alias of an object type still points to a backing index
+
+    Args:
+        backing_index (str): The backing index
+        object_type (str): The object type for the index (post, comment, etc)
+
+    Returns:
+        bool: True if the backing index is still being reindexed
+    """
+    return get_conn().indices.exists_alias(
+        name=get_reindexing_alias_name(object_type), index=backing_index
+    )
+
+
+def delete_backing_indices(backing_indices):
+    """
+    Delete the backing indexes of an unfinished recreate_index run. An index that
+    was already switched in as the default index is kept, and only loses its
+    reindexing alias.
+
+    Args:
+        backing_indices (dict): The backing indexes keyed by object type
+    """
+    conn = get_conn()
+    for object_type, backing_index in backing_indices.items():
+        try:
+            if conn.indices.exists_alias(
+                name=get_default_alias_name(object_type), index=backing_index
+            ):
+                log.info("Keeping index %s, which is in use", backing_index)
+                if reindexing_alias_exists(backing_index, object_type):
+                    conn.indices.delete_alias(
+                        name=get_reindexing_alias_name(object_type),
+                        index=backing_index,
+                    )
+            else:
+                log.info("Deleting index %s", backing_index)
+                conn.indices.delete(index=backing_index)
+        except NotFoundError:
+            log.info("Index %s is already deleted", backing_index)
+    clear_existing_aliases_cache()
+
+
+def get_recreate_index_progress(run):
+    """
+    Get the progress of a recreate_index run, with the time left estimated from the
+    rate chunks completed at since the run was last (re)started
+
+    Args:
+        run (RecreateIndexRun): The recreate_index run
+
+    Returns:
+        dict: The number of chunks, completed chunks and failed chunks, and the
+            estimated number of seconds left
+    """
+    progress = run.chunks.aggregate(
+        total=Count("id"),
+        completed=Count("id", filter=Q(completed_on__isnull=False)),
+        failed=Count("id", filter=Q(completed_on__isnull=True) & ~Q(error="")),
+        completed_since_start=Count("id", filter=Q(completed_on__gte=run.started_on)),
+    )
+    completed_since_start = progress.pop("completed_since_start")
+    elapsed = (now_in_utc() - run.started_on).total_seconds()
+    progress["eta_seconds"] = (
+        (progress["total"] - progress["completed"]) * elapsed / completed_since_start
+        if completed_since_start
+        else None
+    )
+    return progress
+
+
+def is_bulk_loading(backing_index):
+    """
+    Check whether a backing index still has the bulk load settings it was created with
+
+    Args:
+        backing_index (str): The backing index
+
+    Returns:
+        bool: True if refreshes are still disabled on the backing index
+    """
+    index_settings = get_conn().indices.get_settings(
+        index=backing_index, name="index.refresh_interval", flat_settings=True
+    )
+    return (
+        index_settings.get(backing_index, {})
+        .get("settings", {})
+        .get("index.refresh_interval")
+        == get_index_settings(bulk_load=True)["refresh_interval"]
+    )
+
+
+def finish_bulk_load(backing_index):
+    """
+    Prepare a backing index created with bulk load settings to be searched: merge
+    the segments left by the bulk requests while there are no replicas to copy them
+    to, restore the production settings, and wait for the replicas to be allocated.
+    Indexes which were not created for a bulk load, or were already finished, are
+    left alone.
+
+    Args:
+        backing_index (str): The backing index
+    """
+    if not is_bulk_loading(backing_index):
+        return
+    conn = get_conn()
+    timeout = settings.OPENSEARCH_BULK_LOAD_FINISH_TIMEOUT
+    conn.indices.refresh(index=backing_index)
+    conn.indices.forcemerge(index=backing_index, request_timeout=timeout)
+    conn.indices.put_settings(
+        index=backing_index,
+        body={"index": {**get_index_settings(), "translog.durability": "request"}},
+    )
+    health = conn.cluster.health(
+        index=backing_index,
+        wait_for_status="green",
+        timeout=f"{timeout}s",
+        request_timeout=timeout,
+    )
+    if health.get("timed_out"):
+        log.warning(
+            "Backing index %s is %s after waiting %d seconds for it to be green",
+            backing_index,
+            health.get("status"),
+            timeout,
+        )
+
+
 def switch_indices(backing_index, object_type):
     """
     Switch the default index to point to the backing index, and delete the reindex alias
@@ -443,7 +1180,12 @@ def switch_indices(backing_index, object_type):
     global_alias = get_default_alias_name(ALIAS_ALL_INDICES)
     if conn.indices.exists_alias(name=default_alias):
         # Should only be one backing index in normal circumstances
-        old_backing_indexes = list(conn.indices.get_alias(name=default_alias).keys())
+        # A retried switch finds the alias already pointing to the backing index
+        old_backing_indexes = [
+            index
+            for index in conn.indices.get_alias(name=default_alias)
+            if index != backing_index
+        ]
         for index in old_backing_indexes:
             actions.extend(
                 [
@@ -463,9 +1205,12 @@ def switch_indices(backing_index, object_type):
         conn.indices.delete(index)
 
     # Finally, remove the link to the reindexing alias
-    conn.indices.delete_alias(
-        name=get_reindexing_alias_name(object_type), index=backing_index
-    )
+    if reindexing_alias_exists(backing_index, object_type):
+        conn.indices.delete_alias(
+            name=get_reindexing_alias_name(object_type), index=backing_index
+        )
+    clear_existing_aliases_cache()
+    bump_search_cache_generation()
 
 
 def delete_orphaned_indices():
@@ -485,3 +1230,4 @@ def delete_orphaned_indices():
         if not keys:
             log.info("Deleting index %s", index)
             conn.indices.delete(index)
+    clear_existing_aliases_cache()
@@ -3,45 +3,89 @@ Tests for the indexing API
 """
 
 import json
+from datetime import timedelta
 from types import SimpleNamespace
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from opensearchpy.exceptions import NotFoundError
+from opensearchpy.helpers import BulkIndexError
+from redis.exceptions import LockError
 
 from learning_resources.factories import (
     ContentFileFactory,
     CourseFactory,
+    LearningResourceContentTagFactory,
+    LearningResourceDepartmentFactory,
+    LearningResourceFactory,
+    LearningResourceInstructorFactory,
     LearningResourceRunFactory,
+    LearningResourceTopicFactory,
+    LearningResourceViewEventFactory,
+)
+from learning_resources.models import (
+    ContentFile,
+    LearningResource,
+    LearningResourceDepartment,
+    LearningResourceInstructor,
+    LearningResourceOfferor,
+    LearningResourceRun,
+    LearningResourceTopic,
+    LearningResourceViewEvent,
 )
-from learning_resources.models import ContentFile
 from learning_resources_search import indexing_api
+from learning_resources_search.api import (
+    SEARCH_CACHE_GENERATION_KEY,
+    bump_search_cache_generation,
+)
 from learning_resources_search.connection import get_default_alias_name
 from learning_resources_search.constants import (
     ALIAS_ALL_INDICES,
     COURSE_TYPE,
+    PERCOLATE_INDEX_TYPE,
     PROGRAM_TYPE,
     IndexestoUpdate,
 )
 from learning_resources_search.exceptions import ReindexError
 from learning_resources_search.factories import PercolateQueryFactory
 from learning_resources_search.indexing_api import (
+    _document_content_hash,
+    changed_since_q,
     clear_and_create_index,
     create_backing_index,
     deindex_document,
+    deindex_items,
     deindex_learning_resources,
     deindex_percolators,
     deindex_run_content_files,
+    delete_backing_indices,
+    delete_content_files_by_query,
     delete_orphaned_indices,
+    finish_bulk_load,
+    finish_deleting_content_files,
+    get_delete_by_query_status,
+    get_recreate_index_progress,
     get_reindexing_alias_name,
     index_course_content_files,
     index_items,
     index_learning_resources,
     index_run_content_files,
+    learning_resource_upserts_flush_lock,
+    pop_queued_learning_resource_upserts,
+    queue_learning_resource_upserts,
     switch_indices,
+    update_learning_resources,
+)
+from learning_resources_search.models import (
+    IndexedDocument,
+    PercolateQuery,
+    RecreateIndexChunk,
+    RecreateIndexRun,
 )
-from learning_resources_search.models import PercolateQuery
+from learning_resources_search.serializers import serialize_learning_resource_for_bulk
 from learning_resources_search.utils import remove_child_queries
-from main.utils import chunks
+from main.utils import chunks, now_in_utc
 
 pytestmark = [pytest.mark.django_db, pytest.mark.usefixtures("mocked_es")]
 
@@ -58,6 +102,11 @@ def mocked_es(mocker, settings):
         return_value=conn,
     )
     mocker.patch("learning_resources_search.connection.get_conn", autospec=True)
+    mocker.patch(
+        "learning_resources_search.connection.get_existing_aliases",
+        autospec=True,
+        return_value=set(),
+    )
     default_alias = get_default_alias_name(COURSE_TYPE)
     reindex_alias = get_reindexing_alias_name(COURSE_TYPE)
     return SimpleNamespace(
@@ -70,6 +119,30 @@ def mocked_es(mocker, settings):
     )
 
 
+def ndjson_payload(documents):
+    """Return the NDJSON bulk request body expected for a list of documents"""
+    lines = []
+    for document in documents:
+        document = {**document}  # noqa: PLW2901
+        op_type = document.pop("_op_type", "index")
+        lines.append(
+            json.dumps({op_type: {"_id": document.pop("_id")}}, separators=(",", ":"))
+        )
+        if op_type != "delete":
+            lines.append(json.dumps(document, separators=(",", ":")))
+    return "".join(f"{line}\n" for line in lines)
+
+
+def bulk_response(*, errors, op_type="index", result="created", status=None):
+    """Return a mock bulk API response"""
+    if status is None:
+        status = 400 if errors else 200
+    return {
+        "errors": errors,
+        "items": [{op_type: {"_id": 1, "result": result, "status": status}}],
+    }
+
+
 @pytest.mark.parametrize("object_type", [COURSE_TYPE, PROGRAM_TYPE])
 @pytest.mark.parametrize("skip_mapping", [True, False])
 @pytest.mark.parametrize("already_exists", [True, False])
@@ -99,6 +172,78 @@ def test_clear_and_create_index(mocked_es, object_type, skip_mapping, already_ex
     assert "mappings" not in body if skip_mapping else "mappings" in body
 
 
+@pytest.mark.parametrize("async_translog", [True, False])
+def test_clear_and_create_index_bulk_load(mocked_es, settings, async_translog):
+    """clear_and_create_index should create a bulk load index without replicas or refreshes"""
+    settings.OPENSEARCH_BULK_LOAD_ASYNC_TRANSLOG = async_translog
+    mocked_es.conn.indices.exists.return_value = False
+
+    clear_and_create_index(index_name="index", object_type=COURSE_TYPE, bulk_load=True)
+
+    index_settings = mocked_es.conn.indices.create.call_args[1]["body"]["settings"][
+        "index"
+    ]
+    assert index_settings == {
+        "number_of_shards": settings.OPENSEARCH_SHARD_COUNT,
+        "number_of_replicas": 0,
+        "refresh_interval": "-1",
+        **({"translog.durability": "async"} if async_translog else {}),
+    }
+
+
+@pytest.mark.parametrize("timed_out", [True, False])
+def test_finish_bulk_load(mocked_es, mocker, settings, timed_out):
+    """finish_bulk_load should force merge the index, restore its settings and wait for green"""
+    settings.OPENSEARCH_REPLICA_COUNT = 2
+    settings.OPENSEARCH_BULK_LOAD_FINISH_TIMEOUT = 60
+    conn = mocked_es.conn
+    conn.indices.get_settings.return_value = {
+        "backing": {"settings": {"index.refresh_interval": "-1"}}
+    }
+    conn.cluster.health.return_value = {"status": "yellow", "timed_out": timed_out}
+    mock_log = mocker.patch("learning_resources_search.indexing_api.log")
+
+    finish_bulk_load("backing")
+
+    conn.indices.forcemerge.assert_called_once_with(index="backing", request_timeout=60)
+    conn.indices.put_settings.assert_called_once_with(
+        index="backing",
+        body={
+            "index": {
+                "number_of_replicas": 2,
+                "refresh_interval": "60s",
+                "translog.durability": "request",
+            }
+        },
+    )
+    conn.cluster.health.assert_called_once_with(
+        index="backing", wait_for_status="green", timeout="60s", request_timeout=60
+    )
+    assert mock_log.warning.called is timed_out
+
+
+@pytest.mark.parametrize("refresh_interval", ["60s", None])
+def test_finish_bulk_load_not_bulk_loading(mocked_es, refresh_interval):
+    """finish_bulk_load should leave an index without bulk load settings alone"""
+    conn = mocked_es.conn
+    conn.indices.get_settings.return_value = {
+        "backing": {
+            "settings": (
+                {"index.refresh_interval": refresh_interval} if refresh_interval else {}
+            )
+        }
+    }
+
+    finish_bulk_load("backing")
+
+    conn.indices.get_settings.assert_called_once_with(
+        index="backing", name="index.refresh_interval", flat_settings=True
+    )
+    conn.indices.forcemerge.assert_not_called()
+    conn.indices.put_settings.assert_not_called()
+    conn.cluster.health.assert_not_called()
+
+
 @pytest.mark.parametrize("object_type", [COURSE_TYPE, PROGRAM_TYPE])
 @pytest.mark.parametrize("default_exists", [True, False])
 def test_switch_indices(mocked_es, mocker, default_exists, object_type):
@@ -109,20 +254,25 @@ def test_switch_indices(mocked_es, mocker, default_exists, object_type):
     refresh_mock = mocker.patch(
         "learning_resources_search.indexing_api.refresh_index", autospec=True
     )
+    clear_cache_mock = mocker.patch(
+        "learning_resources_search.indexing_api.clear_existing_aliases_cache",
+        autospec=True,
+    )
+    bump_generation_mock = mocker.patch(
+        "learning_resources_search.indexing_api.bump_search_cache_generation",
+        autospec=True,
+    )
     conn_mock = mocked_es.conn
-    conn_mock.indices.exists_alias.return_value = default_exists
+    conn_mock.indices.exists_alias.side_effect = [default_exists, True]
     old_backing_index = "old_backing"
-    conn_mock.indices.get_alias.return_value.keys.return_value = [old_backing_index]
+    conn_mock.indices.get_alias.return_value = {old_backing_index: {}}
 
     backing_index = "backing"
     switch_indices(backing_index, object_type)
 
-    conn_mock.indices.delete_alias.assert_any_call(
-        name=get_reindexing_alias_name(object_type), index=backing_index
-    )
     default_alias = get_default_alias_name(object_type)
     all_alias = get_default_alias_name(ALIAS_ALL_INDICES)
-    conn_mock.indices.exists_alias.assert_called_once_with(name=default_alias)
+    conn_mock.indices.exists_alias.assert_any_call(name=default_alias)
 
     actions = []
     if default_exists:
@@ -148,10 +298,38 @@ def test_switch_indices(mocked_es, mocker, default_exists, object_type):
     conn_mock.indices.delete_alias.assert_called_once_with(
         name=get_reindexing_alias_name(object_type), index=backing_index
     )
+    clear_cache_mock.assert_called_once_with()
+    bump_generation_mock.assert_called_once_with()
+
+
+def test_switch_indices_already_switched(mocked_es, mocker):
+    """
+    A retried switch_indices should keep the backing index which the default alias
+    already points to, and skip the reindexing alias which was already removed
+    """
+    mocker.patch("learning_resources_search.indexing_api.refresh_index")
+    conn_mock = mocked_es.conn
+    conn_mock.indices.exists_alias.side_effect = [True, False]
+    conn_mock.indices.get_alias.return_value = {"backing": {}}
+
+    switch_indices("backing", COURSE_TYPE)
+
+    default_alias = get_default_alias_name(COURSE_TYPE)
+    all_alias = get_default_alias_name(ALIAS_ALL_INDICES)
+    conn_mock.indices.update_aliases.assert_called_once_with(
+        {
+            "actions": [
+                {"add": {"index": "backing", "alias": default_alias}},
+                {"add": {"index": "backing", "alias": all_alias}},
+            ]
+        }
+    )
+    conn_mock.indices.delete.assert_not_called()
+    conn_mock.indices.delete_alias.assert_not_called()
 
 
 @pytest.mark.parametrize("temp_alias_exists", [True, False])
-def test_create_backing_index(mocked_es, mocker, temp_alias_exists):
+def test_create_backing_index(mocked_es, mocker, settings, temp_alias_exists):
     """create_backing_index should make a new backing index and set the reindex alias to point to it"""
     reindexing_alias = get_reindexing_alias_name(COURSE_TYPE)
     backing_index = "backing_index"
@@ -168,6 +346,10 @@ def test_create_backing_index(mocked_es, mocker, temp_alias_exists):
         "learning_resources_search.indexing_api.make_backing_index_name",
         return_value=backing_index,
     )
+    clear_cache_mock = mocker.patch(
+        "learning_resources_search.indexing_api.clear_existing_aliases_cache",
+        autospec=True,
+    )
 
     assert create_backing_index(COURSE_TYPE) == backing_index
 
@@ -175,7 +357,9 @@ def test_create_backing_index(mocked_es, mocker, temp_alias_exists):
     get_conn_mock.assert_called_once_with()
     make_backing_index_mock.assert_called_once_with(COURSE_TYPE)
     clear_and_create_mock.assert_called_once_with(
-        index_name=backing_index, object_type=COURSE_TYPE
+        index_name=backing_index,
+        object_type=COURSE_TYPE,
+        bulk_load=settings.OPENSEARCH_BULK_LOAD_INDEXES,
     )
 
     conn_mock.indices.exists_alias.assert_called_once_with(name=reindexing_alias)
@@ -188,10 +372,11 @@ def test_create_backing_index(mocked_es, mocker, temp_alias_exists):
     conn_mock.indices.put_alias.assert_called_once_with(
         index=backing_index, name=reindexing_alias
     )
+    clear_cache_mock.assert_called_once_with()
 
 
 @pytest.mark.usefixtures("indexing_user")
-@pytest.mark.parametrize("errors", [(), "error"])
+@pytest.mark.parametrize("errors", [False, True])
 @pytest.mark.parametrize(
     "index_types",
     [
@@ -208,10 +393,10 @@ def test_index_learning_resources(
     index_types,
 ):
     """
-    index functions should call bulk with correct arguments
+    index functions should send each bulk payload once to every active alias
     """
     settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 3
-    documents = ["doc1", "doc2", "doc3", "doc4", "doc5"]
+    documents = [{"_id": idx, "title": f"doc{idx}"} for idx in range(5)]
     mock_get_aliases = mocker.patch(
         "learning_resources_search.indexing_api.get_active_aliases",
         autospec=True,
@@ -222,43 +407,141 @@ def test_index_learning_resources(
         autospec=True,
         return_value=(doc for doc in documents),
     )
-    bulk_mock = mocker.patch(
-        "learning_resources_search.indexing_api.bulk",
-        autospec=True,
-        return_value=(0, errors),
-    )
+    mocked_es.conn.bulk.return_value = bulk_response(errors=errors)
 
     if errors:
-        with pytest.raises(ReindexError):
+        with pytest.raises(BulkIndexError):
             index_learning_resources([1, 2, 3], COURSE_TYPE, index_types)
     else:
-        index_learning_resources([1, 2, 3], COURSE_TYPE, index_types)
-        mock_get_aliases.assert_called_with(
+        stats = index_learning_resources([1, 2, 3], COURSE_TYPE, index_types)
+        mock_get_aliases.assert_called_once_with(
             mocked_es.conn,
             object_types=[COURSE_TYPE],
             index_types=index_types,
         )
-
+        assert mocked_es.conn.bulk.call_count == 4
         for alias in mock_get_aliases.return_value:
             for chunk in chunks(
                 documents, chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE
             ):
-                bulk_mock.assert_any_call(
-                    mocked_es.conn,
-                    chunk,
-                    index=alias,
-                    chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+                mocked_es.conn.bulk.assert_any_call(
+                    body=ndjson_payload(chunk), index=alias
                 )
+            assert stats[alias]["documents"] == len(documents)
+
+
+@pytest.mark.parametrize("stale_indexed", [True, False])
+@pytest.mark.parametrize("force", [True, False])
+def test_update_learning_resources(mocked_es, mocker, force, stale_indexed):
+    """
+    update_learning_resources should only send documents that changed since the
+    watermark and since they were last sent, or which were never recorded as sent,
+    and record their content hashes
+    """
+    since = now_in_utc() - timedelta(hours=1)
+    stale, unchanged, changed, new = LearningResourceFactory.create_batch(
+        4, is_course=True
+    )
+    LearningResource.objects.filter(id=stale.id).update(
+        updated_on=since - timedelta(hours=1)
+    )
+    LearningResourceRun.objects.filter(learning_resource=stale).update(
+        updated_on=since - timedelta(hours=1)
+    )
+    stale.topics.update(updated_on=since - timedelta(hours=1))
+    stale.departments.update(updated_on=since - timedelta(hours=1))
+    LearningResourceOfferor.objects.filter(pk=stale.offered_by.pk).update(
+        updated_on=since - timedelta(hours=1)
+    )
+    LearningResourceInstructor.objects.filter(runs__learning_resource=stale).update(
+        updated_on=since - timedelta(hours=1)
+    )
+    mock_index_items = mocker.patch(
+        "learning_resources_search.indexing_api.index_items", autospec=True
+    )
+    ids = [stale.id, unchanged.id, changed.id, new.id]
+
+    update_learning_resources(
+        ids[0:3] if stale_indexed else ids[1:3],
+        COURSE_TYPE,
+        IndexestoUpdate.current_index.value,
+    )
+    changed.title = "New title"
+    changed.save()
+    result = update_learning_resources(
+        ids, COURSE_TYPE, IndexestoUpdate.current_index.value, since=since, force=force
+    )
+
+    expected_ids = {changed.id, new.id}
+    if force:
+        expected_ids.add(unchanged.id)
+    if not stale_indexed:
+        # e.g. a course removed from the blocklist, which was deindexed
+        expected_ids.add(stale.id)
+    assert result == {"sent": len(expected_ids), "skipped": 4 - len(expected_ids)}
+    sent_ids = {document["_id"] for document in mock_index_items.call_args[0][0]}
+    assert sent_ids == expected_ids
+    assert IndexedDocument.objects.filter(object_type=COURSE_TYPE).count() == 4
+    assert IndexedDocument.objects.get(
+        object_type=COURSE_TYPE, object_id=changed.id
+    ).content_hash == _document_content_hash(
+        serialize_learning_resource_for_bulk(changed)
+    )
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [None, "resource", "offeror", "run", "instructor", "department", "view"],
+)
+def test_changed_since_q(changed):
+    """changed_since_q should match resources with related data newer than since"""
+    resource = LearningResourceFactory.create(is_course=True)
+    run = LearningResourceRunFactory.create(learning_resource=resource)
+    instructor = LearningResourceInstructorFactory.create()
+    run.instructors.set([instructor])
+    department = LearningResourceDepartmentFactory.create()
+    resource.departments.set([department])
+    since = now_in_utc()
+    old = since - timedelta(hours=1)
+    for model in [
+        LearningResource,
+        LearningResourceRun,
+        LearningResourceInstructor,
+        LearningResourceTopic,
+        LearningResourceDepartment,
+        LearningResourceOfferor,
+    ]:
+        model.objects.update(updated_on=old)
+    LearningResourceViewEvent.objects.update(created_on=old)
+
+    if changed == "resource":
+        LearningResource.objects.update(updated_on=since + timedelta(minutes=1))
+    elif changed == "offeror":
+        resource.offered_by.save()
+    elif changed == "run":
+        run.save()
+    elif changed == "instructor":
+        instructor.save()
+    elif changed == "department":
+        department.save()
+    elif changed == "view":
+        LearningResourceViewEventFactory.create(learning_resource=resource)
+
+    assert list(
+        LearningResource.objects.filter(changed_since_q(since))
+        .distinct()
+        .values_list("id", flat=True)
+    ) == ([resource.id] if changed else [])
 
 
 @pytest.mark.usefixtures("indexing_user")
-@pytest.mark.parametrize("errors", [(), "error"])
+@pytest.mark.parametrize("errors", [False, True])
 def test_deindex_learning_resources(mocked_es, mocker, settings, errors):
     """
-    Deindex functions should call bulk with correct arguments
+    Deindex functions should send bulk delete actions to every active alias
     """
     settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 3
-    documents = ["doc1", "doc2", "doc3", "doc4", "doc5"]
+    documents = [{"_id": idx, "_op_type": "delete"} for idx in range(5)]
     mock_get_aliases = mocker.patch(
         "learning_resources_search.indexing_api.get_active_aliases",
         autospec=True,
@@ -269,10 +552,8 @@ def test_deindex_learning_resources(mocked_es, mocker, settings, errors):
         autospec=True,
         return_value=(doc for doc in documents),
     )
-    bulk_mock = mocker.patch(
-        "learning_resources_search.indexing_api.bulk",
-        autospec=True,
-        return_value=(0, errors),
+    mocked_es.conn.bulk.return_value = bulk_response(
+        errors=errors, op_type="delete", result="deleted"
     )
 
     if errors:
@@ -290,14 +571,56 @@ def test_deindex_learning_resources(mocked_es, mocker, settings, errors):
             for chunk in chunks(
                 documents, chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE
             ):
-                bulk_mock.assert_any_call(
-                    mocked_es.conn,
-                    chunk,
-                    index=alias,
-                    chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+                mocked_es.conn.bulk.assert_any_call(
+                    body=ndjson_payload(chunk), index=alias
                 )
 
 
+def test_deindex_items_not_found(mocked_es, mocker):
+    """deindex_items should ignore documents that were already missing from the index"""
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=["a"],
+    )
+    mocked_es.conn.bulk.return_value = bulk_response(
+        errors=True, op_type="delete", result="not_found", status=404
+    )
+    deindex_items(
+        [{"_id": 1, "_op_type": "delete"}],
+        COURSE_TYPE,
+        IndexestoUpdate.all_indexes.value,
+    )
+    assert mocked_es.conn.bulk.call_count == 1
+
+
+@pytest.mark.parametrize("acquired", [True, False])
+@pytest.mark.parametrize("expired", [True, False])
+def test_learning_resource_upserts_flush_lock(mocker, settings, acquired, expired):
+    """learning_resource_upserts_flush_lock should hold a redis lock while it is acquired"""
+    settings.OPENSEARCH_UPSERT_FLUSH_LOCK_TIMEOUT = 30
+    mock_redis = mocker.patch(
+        "learning_resources_search.indexing_api.get_redis_connection"
+    )
+    lock = mock_redis.return_value.lock.return_value
+    lock.acquire.return_value = acquired
+    if expired:
+        lock.release.side_effect = LockError
+    mock_log = mocker.patch("learning_resources_search.indexing_api.log")
+
+    with learning_resource_upserts_flush_lock() as result:
+        assert result is acquired
+        lock.release.assert_not_called()
+
+    mock_redis.assert_called_once_with("redis")
+    mock_redis.return_value.lock.assert_called_once_with(
+        f"{settings.OPENSEARCH_INDEX}_upsert_flush_lock", timeout=30
+    )
+    lock.acquire.assert_called_once_with(blocking=False)
+    assert lock.release.called is acquired
+    assert mock_log.warning.called is (acquired and expired)
+
+
 def test_deindex_document(mocked_es, mocker):
     """
     ES should try removing the specified document from the correct index
@@ -311,6 +634,32 @@ def test_deindex_document(mocked_es, mocker):
     mocked_es.conn.delete.assert_called_with(index="a", id=1, params={})
 
 
+@pytest.mark.parametrize(
+    ("object_type", "cleared"), [(COURSE_TYPE, True), (PERCOLATE_INDEX_TYPE, False)]
+)
+def test_deindex_document_clears_indexed_document(
+    mocked_es, mocker, object_type, cleared
+):
+    """deindex_document should forget the content hash of a deindexed resource"""
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=["a"],
+    )
+    IndexedDocument.objects.create(
+        object_type=object_type, object_id=1, content_hash="x"
+    )
+    IndexedDocument.objects.create(
+        object_type=object_type, object_id=2, content_hash="y"
+    )
+
+    deindex_document(1, object_type)
+
+    assert sorted(IndexedDocument.objects.values_list("object_id", flat=True)) == (
+        [2] if cleared else [1, 2]
+    )
+
+
 def test_deindex_document_not_found(mocked_es, mocker):
     """
     ES should try removing the specified document from the correct index
@@ -326,27 +675,191 @@ def test_deindex_document_not_found(mocked_es, mocker):
     assert patched_logger.debug.called is True
 
 
-@pytest.mark.parametrize(("max_size", "chunks"), [(10000, 2), (500, 4)])
+@pytest.mark.parametrize(("max_size", "requests"), [(10000, 2), (500, 4)])
 @pytest.mark.parametrize("exceeds_size", [True, False])
-def test_index_items_size_limits(settings, mocker, max_size, chunks, exceeds_size):
+def test_index_items_size_limits(  # noqa: PLR0913
+    mocked_es, settings, mocker, max_size, requests, exceeds_size
+):
     """
-    Chunks should get split into smaller chunks if necessary, log error if single-file chunks too big
+    Payloads should be split into smaller requests if necessary, log error if single documents are too big
     """
     settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 5
     settings.OPENSEARCH_MAX_REQUEST_SIZE = max_size
-    mock_aliases = mocker.patch(
+    mocker.patch(
         "learning_resources_search.indexing_api.get_active_aliases",
         autospec=True,
-        return_value=[],
+        return_value=["a"],
     )
+    mocked_es.conn.bulk.return_value = bulk_response(errors=False)
     mock_log = mocker.patch("learning_resources_search.indexing_api.log.error")
     documents = [
         {"_id": 1, "content": "a" * (max_size if exceeds_size else 100)}
         for _ in range(10)
     ]
     index_items(documents, "course", index_types=IndexestoUpdate.current_index.value)
-    assert mock_aliases.call_count == (chunks if not exceeds_size else 0)
+    assert mocked_es.conn.bulk.call_count == (requests if not exceeds_size else 0)
     assert mock_log.call_count == (10 if exceeds_size else 0)
+    for call in mocked_es.conn.bulk.call_args_list:
+        assert len(call.kwargs["body"].encode("utf-8")) <= max_size
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_index_items_workers(mocked_es, mocker, settings, workers):
+    """index_items should send every payload to every alias regardless of the worker count"""
+    settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 2
+    settings.OPENSEARCH_INDEXING_WORKERS = workers
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=["a", "b"],
+    )
+    mocked_es.conn.bulk.return_value = bulk_response(errors=False)
+    documents = [{"_id": idx} for idx in range(7)]
+    stats = index_items(
+        documents, COURSE_TYPE, IndexestoUpdate.all_indexes.value, routing=1
+    )
+    assert mocked_es.conn.bulk.call_count == 8
+    for alias in ["a", "b"]:
+        for chunk in chunks(documents, chunk_size=2):
+            mocked_es.conn.bulk.assert_any_call(
+                body=ndjson_payload(chunk), index=alias, routing=1
+            )
+        assert stats[alias]["documents"] == 7
+
+
+def test_index_items_stats_per_alias(mocked_es, mocker, settings):
+    """index_items should record the documents, bytes and seconds of each alias"""
+    settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 2
+    settings.OPENSEARCH_INDEXING_WORKERS = 1
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=["a", "b"],
+    )
+    request_seconds = {"a": 1, "b": 3}
+    clock = {"now": 0}
+    mock_time = mocker.patch("learning_resources_search.indexing_api.time")
+    mock_time.monotonic.side_effect = lambda: clock["now"]
+
+    def bulk(*, index, **kwargs):
+        """Make the requests to each alias take a different time"""
+        clock["now"] += request_seconds[index]
+        return bulk_response(errors=False)
+
+    mocked_es.conn.bulk.side_effect = bulk
+    documents = [{"_id": idx} for idx in range(5)]
+    payload_sizes = [
+        len(ndjson_payload(chunk).encode("utf-8"))
+        for chunk in chunks(documents, chunk_size=2)
+    ]
+
+    stats = index_items(documents, COURSE_TYPE, IndexestoUpdate.all_indexes.value)
+
+    assert stats == {
+        alias: {
+            "documents": 5,
+            "bytes": sum(payload_sizes),
+            "seconds": pytest.approx(3 * seconds),
+        }
+        for alias, seconds in request_seconds.items()
+    }
+
+
+@pytest.mark.parametrize(
+    ("index_types", "bumped"),
+    [
+        (IndexestoUpdate.all_indexes.value, True),
+        (IndexestoUpdate.current_index.value, True),
+        (IndexestoUpdate.reindexing_index.value, False),
+    ],
+)
+def test_index_items_bumps_search_cache(mocked_es, mocker, index_types, bumped):
+    """index_items should invalidate cached searches unless only the reindexing index changed"""
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=["a"],
+    )
+    bump_generation_mock = mocker.patch(
+        "learning_resources_search.indexing_api.bump_search_cache_generation",
+        autospec=True,
+    )
+    mocked_es.conn.bulk.return_value = bulk_response(errors=False)
+    index_items([{"_id": 1}], COURSE_TYPE, index_types)
+    assert bump_generation_mock.called is bumped
+
+
+@pytest.mark.parametrize("index_types", list(IndexestoUpdate))
+def test_index_items_no_aliases(mocked_es, mocker, index_types):
+    """
+    index_items should raise without serializing or sending anything if there
+    are no active aliases, instead of dropping the documents
+    """
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=[],
+    )
+    documents = mocker.MagicMock()
+    with pytest.raises(ReindexError):
+        index_items(documents, COURSE_TYPE, index_types.value)
+    assert documents.__iter__.called is False
+    assert mocked_es.conn.bulk.called is False
+
+
+def test_get_recreate_index_progress():
+    """get_recreate_index_progress should count chunks and estimate the time left"""
+    now = now_in_utc()
+    run = RecreateIndexRun.objects.create(
+        backing_indices={COURSE_TYPE: "backing"}, started_on=now - timedelta(minutes=2)
+    )
+    for kwargs in [
+        {"completed_on": now - timedelta(days=1)},
+        {"completed_on": now - timedelta(minutes=1)},
+        {"error": "error"},
+        {},
+        {},
+    ]:
+        RecreateIndexChunk.objects.create(
+            run=run, object_type=COURSE_TYPE, ids=[1], **kwargs
+        )
+
+    progress = get_recreate_index_progress(run)
+
+    assert progress.pop("eta_seconds") == pytest.approx(360, abs=5)
+    assert progress == {"total": 5, "completed": 2, "failed": 1}
+
+
+def test_delete_backing_indices(mocker, mocked_es):
+    """
+    delete_backing_indices should delete the backing indexes of a run, except one
+    that was switched in as the default index
+    """
+    mock_clear_cache = mocker.patch(
+        "learning_resources_search.indexing_api.clear_existing_aliases_cache",
+        autospec=True,
+    )
+    conn = mocked_es.conn
+    conn.indices.exists_alias.side_effect = lambda **kwargs: kwargs["index"] == "live"
+
+    def delete_index(index):
+        if index == "gone":
+            raise NotFoundError
+
+    conn.indices.delete.side_effect = delete_index
+
+    delete_backing_indices(
+        {COURSE_TYPE: "live", PROGRAM_TYPE: "stale", PERCOLATE_INDEX_TYPE: "gone"}
+    )
+
+    assert conn.indices.delete.call_args_list == [
+        mocker.call(index="stale"),
+        mocker.call(index="gone"),
+    ]
+    conn.indices.delete_alias.assert_called_once_with(
+        name=get_reindexing_alias_name(COURSE_TYPE), index="live"
+    )
+    mock_clear_cache.assert_called_once_with()
 
 
 def test_delete_orphaned_indices(mocker, mocked_es):
@@ -401,35 +914,188 @@ def test_delete_orphaned_indices(mocker, mocked_es):
 
 def test_bulk_content_file_deindex_on_course_deletion(mocker):
     """
-    OpenSearch should deindex content files on bulk  course deletion
+    OpenSearch should deindex content files on bulk course deletion with one
+    delete_by_query, and delete them from the database
     """
-    mock_deindex_run_content_files = mocker.patch(
-        "learning_resources_search.indexing_api.deindex_run_content_files",
+    mock_delete_by_query = mocker.patch(
+        "learning_resources_search.indexing_api.delete_content_files_by_query",
         autospec=True,
+        return_value=["node:1"],
     )
     mocker.patch("learning_resources_search.indexing_api.deindex_items", autospec=True)
 
     courses = CourseFactory.create_batch(2)
-    deindex_learning_resources(
-        [course.learning_resource_id for course in courses], COURSE_TYPE
-    )
     for course in courses:
-        for run in course.learning_resource.runs.all():
-            mock_deindex_run_content_files.assert_any_call(
-                run.id, unpublished_only=False
-            )
+        ContentFileFactory.create_batch(
+            2, run=course.learning_resource.runs.first(), published=True
+        )
+    ids = [course.learning_resource_id for course in courses]
+    task_ids, content_file_ids = deindex_learning_resources(ids, COURSE_TYPE)
+    assert task_ids == ["node:1"]
+    mock_delete_by_query.assert_called_once_with(ids)
+    # the content files are kept until the delete_by_query succeeds
+    assert sorted(content_file_ids) == sorted(
+        ContentFile.objects.values_list("id", flat=True)
+    )
+    assert ContentFile.objects.count() == 4
+
+
+def test_bulk_content_file_deindex_on_course_deletion_no_aliases(mocker):
+    """
+    deindex_learning_resources should delete the content files right away if no
+    delete_by_query was started
+    """
+    mocker.patch(
+        "learning_resources_search.indexing_api.delete_content_files_by_query",
+        autospec=True,
+        return_value=[],
+    )
+    mocker.patch("learning_resources_search.indexing_api.deindex_items", autospec=True)
+    course = CourseFactory.create()
+    ContentFileFactory.create_batch(2, run=course.learning_resource.runs.first())
+
+    assert deindex_learning_resources([course.learning_resource_id], COURSE_TYPE) == (
+        [],
+        [],
+    )
+    assert ContentFile.objects.count() == 0
+
+
+def test_bulk_content_file_deindex_on_course_deletion_no_files(mocker):
+    """
+    deindex_learning_resources should not start a delete_by_query if the courses
+    have no content files
+    """
+    mock_delete_by_query = mocker.patch(
+        "learning_resources_search.indexing_api.delete_content_files_by_query",
+        autospec=True,
+    )
+    mocker.patch("learning_resources_search.indexing_api.deindex_items", autospec=True)
+
+    courses = CourseFactory.create_batch(2)
+    assert deindex_learning_resources(
+        [course.learning_resource_id for course in courses], COURSE_TYPE
+    ) == ([], [])
+    mock_delete_by_query.assert_not_called()
 
 
 def test_deindex_run_content_files(mocker):
-    """deindex_run_content_files should remove them from index and db"""
+    """deindex_run_content_files should remove them from index and db in batches"""
+    mocker.patch(
+        "learning_resources_search.indexing_api.CONTENT_FILE_DELETE_BATCH_SIZE", 2
+    )
     mock_deindex = mocker.patch("learning_resources_search.indexing_api.deindex_items")
+    mock_delete_by_query = mocker.patch(
+        "learning_resources_search.indexing_api.delete_content_files_by_query",
+        autospec=True,
+        return_value=["node:1", "node:2"],
+    )
     run = LearningResourceRunFactory.create(published=True)
-    ContentFileFactory.create_batch(3, run=run, published=True)
+    content_files = ContentFileFactory.create_batch(3, run=run, published=True)
     assert ContentFile.objects.count() == 3
-    deindex_run_content_files(run.id, unpublished_only=False)
-    mock_deindex.assert_called_once()
-    run.refresh_from_db()
-    assert ContentFile.objects.count() == 0
+    task_ids, content_file_ids = deindex_run_content_files(
+        run.id, unpublished_only=False
+    )
+    assert task_ids == ["node:1", "node:2"]
+    assert sorted(content_file_ids) == sorted(
+        content_file.id for content_file in content_files
+    )
+    mock_delete_by_query.assert_called_once_with(
+        [run.learning_resource_id], run_ids=[run.id]
+    )
+    mock_deindex.assert_not_called()
+    assert ContentFile.objects.count() == 3
+
+
+@pytest.mark.parametrize("deindex", [True, False])
+def test_finish_deleting_content_files(mocker, deindex):
+    """
+    finish_deleting_content_files should delete the content files, after deindexing
+    them per resource if the delete_by_query had failures
+    """
+    mock_deindex = mocker.patch("learning_resources_search.indexing_api.deindex_items")
+    runs = LearningResourceRunFactory.create_batch(2, published=True)
+    content_files = [
+        content_file
+        for run in runs
+        for content_file in ContentFileFactory.create_batch(2, run=run)
+    ]
+    kept = ContentFileFactory.create(run=runs[0])
+
+    finish_deleting_content_files(
+        [content_file.id for content_file in content_files], deindex=deindex
+    )
+
+    assert list(ContentFile.objects.all()) == [kept]
+    if deindex:
+        assert mock_deindex.call_count == 2
+        for run in runs:
+            mock_deindex.assert_any_call(
+                mocker.ANY,
+                COURSE_TYPE,
+                index_types=IndexestoUpdate.all_indexes.value,
+                routing=run.learning_resource_id,
+            )
+    else:
+        mock_deindex.assert_not_called()
+
+
+@pytest.mark.parametrize("run_ids", [None, [5, 6]])
+def test_delete_content_files_by_query(mocked_es, mocker, run_ids):
+    """
+    delete_content_files_by_query should refresh the active course aliases, then
+    start a routed delete_by_query on each of them
+    """
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=["a", "b"],
+    )
+    mocked_es.conn.delete_by_query.side_effect = [
+        {"task": "node:1"},
+        {"task": "node:2"},
+    ]
+
+    assert delete_content_files_by_query([3, 1, 3], run_ids=run_ids) == [
+        "node:1",
+        "node:2",
+    ]
+
+    mocked_es.conn.indices.refresh.assert_called_once_with(index="a,b")
+    assert mocked_es.conn.method_calls[0] == mocker.call.indices.refresh(index="a,b")
+    filters = [
+        {"term": {"resource_relations": "content_file"}},
+        {"terms": {"resource_id": [1, 3]}},
+    ]
+    if run_ids:
+        filters.append({"terms": {"run_id": run_ids}})
+    for alias in ["a", "b"]:
+        mocked_es.conn.delete_by_query.assert_any_call(
+            index=alias,
+            body={"query": {"bool": {"filter": filters}}},
+            routing="1,3",
+            conflicts="proceed",
+            wait_for_completion=False,
+        )
+
+
+def test_get_delete_by_query_status(mocked_es):
+    """get_delete_by_query_status should combine the status of the tasks"""
+    tasks = {
+        "node:1": {
+            "completed": True,
+            "response": {"deleted": 5, "failures": [{"id": "x"}]},
+        },
+        "node:2": {"completed": False, "task": {"status": {"deleted": 2}}},
+        "node:3": {"completed": True, "error": {"type": "boom"}},
+    }
+    mocked_es.conn.tasks.get.side_effect = lambda task_id: tasks[task_id]
+
+    assert get_delete_by_query_status(list(tasks)) == {
+        "completed": False,
+        "deleted": 7,
+        "failures": [{"id": "x"}, {"type": "boom"}],
+    }
 
 
 def test_index_content_files(mocker):
@@ -460,11 +1126,6 @@ def test_index_content_files(mocker):
             {"_id": "doc", "_op_type": "deindex"},
             True,
         ],
-        [  # noqa: PT007
-            "deindex_run_content_files",
-            {"_id": "doc", "_op_type": "deindex"},
-            False,
-        ],
     ],
 )
 @pytest.mark.parametrize(
@@ -499,15 +1160,13 @@ def test_bulk_index_content_files(  # noqa: PLR0913
         autospec=True,
         return_value=["a", "b"],
     )
-    bulk_mock = mocker.patch(
-        "learning_resources_search.indexing_api.bulk",
-        autospec=True,
-        return_value=(0, errors),
+    mocked_es.conn.bulk.return_value = bulk_response(
+        errors=bool(errors), op_type=doc.get("_op_type", "index")
     )
     mocker.patch(
-        "learning_resources_search.indexing_api.serialize_content_file_for_bulk",
+        "learning_resources_search.indexing_api.serialize_bulk_content_files",
         autospec=True,
-        return_value=doc,
+        side_effect=lambda _run, ids: (doc for _ in ids),
     )
     mocker.patch(
         "learning_resources_search.indexing_api.serialize_content_file_for_bulk_deletion",
@@ -523,7 +1182,7 @@ def test_bulk_index_content_files(  # noqa: PLR0913
     if errors:
         index_func = getattr(indexing_api, indexing_func_name)
 
-        with pytest.raises(ReindexError):
+        with pytest.raises((BulkIndexError, ReindexError)):
             index_func(run.id, IndexestoUpdate.all_indexes.value)
     else:
         if indexing_func_name == "index_run_content_files":
@@ -538,15 +1197,71 @@ def test_bulk_index_content_files(  # noqa: PLR0913
 
         for alias in mock_get_aliases.return_value:
             for chunk in chunks([doc for _ in content_files], chunk_size=chunk_size):
-                bulk_mock.assert_any_call(
-                    mocked_es.conn,
-                    chunk,
+                mocked_es.conn.bulk.assert_any_call(
+                    body=ndjson_payload(chunk),
                     index=alias,
-                    chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
                     routing=course.learning_resource_id,
                 )
 
 
+@pytest.mark.django_db()
+def test_index_run_content_files_query_count(mocker, settings):
+    """
+    Indexing the content files of a run should make the same number of queries no
+    matter how many content files there are in a chunk
+    """
+    settings.OPENSEARCH_DOCUMENT_INDEXING_CHUNK_SIZE = 100
+    mocker.patch(
+        "learning_resources_search.indexing_api.index_items",
+        side_effect=lambda documents, *_args, **_kwargs: {
+            "alias": {"documents": len(list(documents))}
+        },
+    )
+    query_counts = []
+    for num_files in [1, 20]:
+        course = CourseFactory.create()
+        course.learning_resource.topics.set(
+            LearningResourceTopicFactory.create_batch(2)
+        )
+        course.learning_resource.departments.set(
+            LearningResourceDepartmentFactory.create_batch(2)
+        )
+        run = course.learning_resource.runs.first()
+        for content_file in ContentFileFactory.create_batch(num_files, run=run):
+            content_file.content_tags.set(
+                LearningResourceContentTagFactory.create_batch(2)
+            )
+        with CaptureQueriesContext(connection) as queries:
+            index_run_content_files(run.id, IndexestoUpdate.current_index.value)
+        query_counts.append(len(queries))
+
+    assert query_counts[0] == query_counts[1]
+
+
+@pytest.mark.django_db()
+def test_index_run_content_files_cache_generation(mocker, settings):
+    """
+    Indexing the content files of a run should bump the search cache generation
+    once, not once per chunk
+    """
+    settings.OPENSEARCH_SEARCH_CACHE_TTL = 60
+    settings.OPENSEARCH_DOCUMENT_INDEXING_CHUNK_SIZE = 2
+    mock_incr = mocker.patch(
+        "learning_resources_search.api._incr_search_cache_counter", autospec=True
+    )
+    mock_index_items = mocker.patch(
+        "learning_resources_search.indexing_api.index_items",
+        side_effect=lambda *_args, **_kwargs: bump_search_cache_generation() or {},
+    )
+    run = LearningResourceRunFactory.create(published=True)
+    ContentFileFactory.create_batch(5, run=run)
+
+    index_run_content_files(run.id, IndexestoUpdate.current_index.value)
+
+    assert mock_index_items.call_count == 3
+    mock_incr.assert_called_once_with(mocker.ANY, SEARCH_CACHE_GENERATION_KEY)
+
+
 @pytest.mark.parametrize("has_files", [True, False])
 def test_deindex_run_content_files_no_files(mocker, has_files):
     """deindex_run_content_files shouldn't do anything if there are no content files"""
@@ -622,3 +1337,19 @@ def test_index_percolate_query(mocker):
     mock_index_percolators.assert_any_call(
         [query.id], IndexestoUpdate.current_index.value
     )
+
+
+def test_queue_and_pop_learning_resource_upserts(mocker, settings):
+    """Queued upserts should be added to and popped from a per-type redis set"""
+    settings.OPENSEARCH_INDEX = "testindex"
+    mock_redis = mocker.patch(
+        "learning_resources_search.indexing_api.get_redis_connection"
+    ).return_value
+    mock_redis.spop.return_value = [b"3", b"7"]
+
+    queue_learning_resource_upserts([3, 7], COURSE_TYPE)
+    queue_learning_resource_upserts([], COURSE_TYPE)
+    mock_redis.sadd.assert_called_once_with("testindex_upsert_queue_course", 3, 7)
+
+    assert pop_queued_learning_resource_upserts(COURSE_TYPE, 10) == [3, 7]
+    mock_redis.spop.assert_called_once_with("testindex_upsert_queue_course", 10)
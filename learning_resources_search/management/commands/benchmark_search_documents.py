@@ -0,0 +1,93 @@
+"""Management command to compare the speed of the learning resource document builders"""
+
+from time import perf_counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from learning_resources.models import LearningResource
+from learning_resources_search.documents import serialize_bulk_learning_resources
+from learning_resources_search.serializers import serialize_learning_resource_for_bulk
+from main.utils import chunks
+
+
+def serialize_with_serializer(ids):
+    """
+    Serialize learning resources for bulk indexing with LearningResourceSerializer,
+    one resource at a time
+
+    Args:
+        ids(list of int): List of learning_resource id's
+    """
+    for learning_resource in (
+        LearningResource.objects.select_related(*LearningResource.related_selects)
+        .prefetch_related(*LearningResource.prefetches)
+        .filter(id__in=ids)
+    ):
+        yield serialize_learning_resource_for_bulk(learning_resource)
+
+
+class Command(BaseCommand):
+    """Compare the speed of the learning resource document builders"""
+
+    help = (
+        "Compare docs/sec of the set-based learning resource document builder"
+        " against LearningResourceSerializer"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            dest="count",
+            type=int,
+            default=1000,
+            help="The number of published learning resources to serialize",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            dest="chunk_size",
+            type=int,
+            default=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+            help="The number of learning resources to serialize at a time",
+        )
+        super().add_arguments(parser)
+
+    def benchmark(self, name, serialize, ids, chunk_size):
+        """Serialize the resources in chunks and report docs/sec and queries"""
+        documents = 0
+        with CaptureQueriesContext(connection) as queries:
+            start = perf_counter()
+            for ids_chunk in chunks(ids, chunk_size=chunk_size):
+                documents += sum(1 for _ in serialize(ids_chunk))
+            elapsed = perf_counter() - start
+        self.stdout.write(
+            f"{name}: {documents} documents in {elapsed:.2f}s,"
+            f" {documents / elapsed:.1f} docs/sec, {len(queries)} queries"
+        )
+        return elapsed
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        """Serialize the same learning resources with both builders"""
+        ids = list(
+            LearningResource.objects.filter(published=True)
+            .order_by("id")
+            .values_list("id", flat=True)[: options["count"]]
+        )
+        if not ids:
+            self.stdout.write("There are no published learning resources")
+            return
+        serializer_elapsed = self.benchmark(
+            "LearningResourceSerializer",
+            serialize_with_serializer,
+            ids,
+            options["chunk_size"],
+        )
+        builder_elapsed = self.benchmark(
+            "LearningResourceDocumentBuilder",
+            serialize_bulk_learning_resources,
+            ids,
+            options["chunk_size"],
+        )
+        self.stdout.write(f"Speedup: {serializer_elapsed / builder_elapsed:.1f}x")
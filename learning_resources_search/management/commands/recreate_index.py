@@ -3,7 +3,9 @@
 from django.core.management.base import BaseCommand, CommandError
 
 from learning_resources_search.constants import ALL_INDEX_TYPES
-from learning_resources_search.tasks import start_recreate_index
+from learning_resources_search.indexing_api import get_recreate_index_progress
+from learning_resources_search.models import RecreateIndexRun
+from learning_resources_search.tasks import resume_recreate_index, start_recreate_index
 from main.utils import now_in_utc
 
 
@@ -24,11 +26,52 @@ class Command(BaseCommand):
                 action="store_true",
                 help=f"Recreate the {object_type} index",
             )
+
+        parser.add_argument(
+            "--resume",
+            dest="resume",
+            action="store_true",
+            help="Resume the last unfinished recreate, indexing only incomplete chunks",
+        )
+        parser.add_argument(
+            "--status",
+            dest="status",
+            action="store_true",
+            help="Show the progress of the last recreate",
+        )
         super().add_arguments(parser)
 
+    def show_status(self):
+        """Show the progress and estimated time left of the last recreate_index run"""
+        run = RecreateIndexRun.objects.order_by("id").last()
+        if run is None:
+            self.stdout.write("recreate_index has not been run")
+            return
+        progress = get_recreate_index_progress(run)
+        self.stdout.write(
+            f"Run {run.id} for {', '.join(run.backing_indices)}:"
+            f" {progress['completed']} of {progress['total']} chunks completed,"
+            f" {progress['failed']} failed"
+        )
+        if run.finished_on:
+            self.stdout.write(f"Finished on {run.finished_on}")
+        elif progress["eta_seconds"] is not None:
+            self.stdout.write(
+                f"About {round(progress['eta_seconds'])} seconds left if it is running"
+            )
+
     def handle(self, *args, **options):  # noqa: ARG002
         """Index all LEARNING_RESOURCE_TYPES"""
-        if options["all"]:
+        if options["status"]:
+            self.show_status()
+            return
+
+        if options["resume"]:
+            task = resume_recreate_index.delay()
+            self.stdout.write(
+                f"Started celery task {task} to resume the last recreate_index run"
+            )
+        elif options["all"]:
             task = start_recreate_index.delay(list(ALL_INDEX_TYPES))
             self.stdout.write(
                 f"Started celery task {task} to index content for all indexes"
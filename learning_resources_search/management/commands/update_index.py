@@ -41,13 +41,22 @@ class Command(BaseCommand):
             help="Filter courses and course files update by etl_source.",
         )
 
+        parser.add_argument(
+            "--full",
+            dest="full",
+            action="store_true",
+            help="Send every learning resource, even if unchanged since the last run",
+        )
+
         super().add_arguments(parser)
 
     def handle(self, **options):
         """Index the comments and posts for the channels the user is subscribed to"""
 
         if options["all"]:
-            task = start_update_index.delay(valid_object_types, options["etl_source"])
+            task = start_update_index.delay(
+                valid_object_types, options["etl_source"], full=options["full"]
+            )
             self.stdout.write(
                 f"Started celery task {task} to update index content for all indexes"
             )
@@ -72,7 +81,9 @@ class Command(BaseCommand):
                     self.stdout.write(f"  --{object_type}s")
                 return
 
-            task = start_update_index.delay(indexes_to_update, options["etl_source"])
+            task = start_update_index.delay(
+                indexes_to_update, options["etl_source"], full=options["full"]
+            )
             self.stdout.write(
                 "".join(
                     [
@@ -94,11 +105,15 @@ class Command(BaseCommand):
 
         self.stdout.write("Waiting on task...")
         start = now_in_utc()
-        errors = task.get()
-        errors = [error for error in errors if error is not None]
+        result = task.get()
+        errors = [error for error in result["errors"] if error is not None]
         if errors:
             msg = f"Update index errored: {errors}"
             raise CommandError(msg)
 
         total_seconds = (now_in_utc() - start).total_seconds()
-        self.stdout.write(f"Update index finished, took {total_seconds} seconds")
+        self.stdout.write(
+            f"Update index finished, took {total_seconds} seconds. Sent"
+            f" {result['sent']} documents, skipped {result['skipped']} unchanged"
+            " documents"
+        )
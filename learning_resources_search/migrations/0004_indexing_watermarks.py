@@ -0,0 +1,55 @@
+# Generated by Django 4.2.11 on 2026-10-17 03:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_resources_search", "0003_alter_percolatequery_unique_together"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IndexingWatermark",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_on", models.DateTimeField(auto_now=True)),
+                ("object_type", models.CharField(max_length=128, unique=True)),
+                ("indexed_at", models.DateTimeField()),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="IndexedDocument",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_on", models.DateTimeField(auto_now=True)),
+                ("object_type", models.CharField(max_length=128)),
+                ("object_id", models.IntegerField()),
+                ("content_hash", models.CharField(max_length=64)),
+            ],
+            options={
+                "unique_together": {("object_type", "object_id")},
+            },
+        ),
+    ]
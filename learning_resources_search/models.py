@@ -28,3 +28,53 @@ class PercolateQuery(TimestampedModel):
 
     class Meta:
         unique_together = (("source_type", "original_query"),)
+
+
+class IndexingWatermark(TimestampedModel):
+    """The start time of the last successful update_index run for an object type"""
+
+    object_type = models.CharField(max_length=128, unique=True)
+    indexed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"Indexing watermark for {self.object_type}: {self.indexed_at}"
+
+
+class IndexedDocument(TimestampedModel):
+    """The content hash of a document as last sent to the index by update_index"""
+
+    object_type = models.CharField(max_length=128)
+    object_id = models.IntegerField()
+    content_hash = models.CharField(max_length=64)
+
+    def __str__(self):
+        return f"Indexed {self.object_type} {self.object_id}: {self.content_hash}"
+
+    class Meta:
+        unique_together = (("object_type", "object_id"),)
+
+
+class RecreateIndexRun(TimestampedModel):
+    """A recreate_index build of new backing indexes, which can be resumed"""
+
+    backing_indices = JSONField()
+    started_on = models.DateTimeField()
+    finished_on = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Recreate index run {self.id}: {', '.join(self.backing_indices)}"
+
+
+class RecreateIndexChunk(TimestampedModel):
+    """A chunk of objects to index into the backing indexes of a recreate_index run"""
+
+    run = models.ForeignKey(
+        RecreateIndexRun, related_name="chunks", on_delete=models.CASCADE
+    )
+    object_type = models.CharField(max_length=128)
+    ids = JSONField()
+    completed_on = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+
+    def __str__(self):
+        return f"Recreate index chunk {self.id}: {len(self.ids)} {self.object_type}s"
@@ -6,10 +6,15 @@ from celery import chain
 from django.apps import apps
 
 from learning_resources_search import tasks
-from learning_resources_search.api import get_similar_topics
+from learning_resources_search.api import get_similar_topics_bulk
 from learning_resources_search.constants import (
     COURSE_TYPE,
     PERCOLATE_INDEX_TYPE,
+    IndexestoUpdate,
+)
+from learning_resources_search.indexing_api import (
+    queue_learning_resource_percolations,
+    queue_learning_resource_upserts,
 )
 from main import settings
 from main.utils import chunks
@@ -67,16 +72,81 @@ class SearchIndexPlugin:
 
         Args:
             resource(LearningResource): The Learning Resource that was upserted
+            percolate(bool): Whether to percolate the resource after indexing it
         """
+        if settings.OPENSEARCH_COALESCE_UPSERTS:
+            try:
+                queue_learning_resource_upserts([resource.id], resource.resource_type)
+                if percolate:
+                    queue_learning_resource_percolations(
+                        [resource.id], resource.resource_type
+                    )
+            except Exception:
+                log.exception(
+                    "Unable to queue upsert for resource %s, indexing it now",
+                    resource.id,
+                )
+            else:
+                return
+
         upsert_task = tasks.upsert_learning_resource
         if percolate:
             upsert_task = chain(
                 tasks.upsert_learning_resource.si(resource.id),
-                tasks.percolate_learning_resource.si(resource.id),
+                tasks.percolate_learning_resources.si([resource.id]),
             )
 
         try_with_retry_as_task(upsert_task, resource.id)
 
+    @hookimpl
+    def bulk_resources_upserted(self, resource_ids, resource_type, percolate_ids):
+        """
+        Upsert multiple created/modified resources to the search index
+
+        Args:
+            resource_ids(list): The Learning Resource ids that were upserted
+            resource_type(str): The Learning Resource type that was upserted
+            percolate_ids(list): The upserted ids to percolate after indexing them
+        """
+        if settings.OPENSEARCH_COALESCE_UPSERTS:
+            try:
+                queue_learning_resource_upserts(resource_ids, resource_type)
+                queue_learning_resource_percolations(percolate_ids, resource_type)
+            except Exception:
+                log.exception(
+                    "Unable to queue upserts for %s resources, indexing them now",
+                    resource_type,
+                )
+            else:
+                return
+
+        # each chunk is percolated after it is indexed, since percolation
+        # looks the indexed documents up by id
+        percolate_ids = set(percolate_ids)
+        for ids in chunks(
+            resource_ids,
+            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+        ):
+            chunk_percolate_ids = [
+                resource_id for resource_id in ids if resource_id in percolate_ids
+            ]
+            if chunk_percolate_ids:
+                try_with_retry_as_task(
+                    chain(
+                        tasks.index_learning_resources.si(
+                            ids, resource_type, IndexestoUpdate.all_indexes.value
+                        ),
+                        tasks.percolate_learning_resources.si(chunk_percolate_ids),
+                    )
+                )
+            else:
+                try_with_retry_as_task(
+                    tasks.index_learning_resources,
+                    ids,
+                    resource_type,
+                    IndexestoUpdate.all_indexes.value,
+                )
+
     @hookimpl
     def resource_unpublished(self, resource):
         """
@@ -106,19 +176,39 @@ class SearchIndexPlugin:
         Returns:
             list: The similar topics
         """
-        text_doc = {
-            "title": resource.title,
-            "description": resource.description,
-            "full_description": resource.full_description,
-        }
+        return self.bulk_resources_similar_topics([resource])[0]
+
+    @hookimpl
+    def bulk_resources_similar_topics(self, resources) -> list[list[dict]]:
+        """
+        Get similar topics for multiple resources with one batched lookup
+
+        Args:
+            resources(list of LearningResource): The Learning Resources to get
+                similar topics for
+
+        Returns:
+            list of list: The similar topics for each resource
+        """
+        text_docs = [
+            {
+                "title": resource.title,
+                "description": resource.description,
+                "full_description": resource.full_description,
+            }
+            for resource in resources
+        ]
 
-        topic_names = get_similar_topics(
-            text_doc,
+        topic_names_lists = get_similar_topics_bulk(
+            text_docs,
             settings.OPEN_VIDEO_MAX_TOPICS,
             settings.OPEN_VIDEO_MIN_TERM_FREQ,
             settings.OPEN_VIDEO_MIN_DOC_FREQ,
         )
-        return [{"name": topic_name} for topic_name in topic_names]
+        return [
+            [{"name": topic_name} for topic_name in topic_names]
+            for topic_names in topic_names_lists
+        ]
 
     @hookimpl
     def bulk_resources_unpublished(self, resource_ids, resource_type):
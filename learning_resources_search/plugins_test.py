@@ -9,7 +9,11 @@ from learning_resources.factories import (
     LearningResourceRunFactory,
 )
 from learning_resources.models import LearningResource, LearningResourceRun
-from learning_resources_search.constants import COURSE_TYPE, PROGRAM_TYPE
+from learning_resources_search.constants import (
+    COURSE_TYPE,
+    PROGRAM_TYPE,
+    IndexestoUpdate,
+)
 from learning_resources_search.plugins import SearchIndexPlugin
 
 
@@ -50,6 +54,116 @@ def test_search_index_plugin_resource_upserted(
     )
 
 
+@pytest.mark.django_db()
+def test_search_index_plugin_resource_upserted_percolate(
+    mocker, mock_search_index_helpers
+):
+    """The resource should be percolated in a batch after it is upserted"""
+    mock_percolate = mocker.patch(
+        "learning_resources_search.plugins.tasks.percolate_learning_resources"
+    )
+    mock_chain = mocker.patch("learning_resources_search.plugins.chain")
+    resource = LearningResourceFactory.create()
+    SearchIndexPlugin().resource_upserted(resource, percolate=True)
+
+    mock_upsert = mock_search_index_helpers.mock_upsert_learning_resource
+    mock_upsert.si.assert_called_once_with(resource.id)
+    mock_percolate.si.assert_called_once_with([resource.id])
+    mock_chain.assert_called_once_with(
+        mock_upsert.si.return_value, mock_percolate.si.return_value
+    )
+    mock_chain.return_value.assert_called_once_with(resource.id)
+    mock_upsert.assert_not_called()
+    mock_percolate.assert_not_called()
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize("percolate", [True, False])
+@pytest.mark.parametrize("queue_error", [True, False])
+def test_search_index_plugin_resource_upserted_coalesced(
+    mocker, mock_search_index_helpers, percolate, queue_error
+):
+    """Upserts and percolations should be queued for the next bulk flush if enabled"""
+    mocker.patch(
+        "learning_resources_search.plugins.settings.OPENSEARCH_COALESCE_UPSERTS",
+        new=True,
+    )
+    mock_queue = mocker.patch(
+        "learning_resources_search.plugins.queue_learning_resource_upserts",
+        side_effect=ConnectionError if queue_error else None,
+    )
+    mock_queue_percolations = mocker.patch(
+        "learning_resources_search.plugins.queue_learning_resource_percolations"
+    )
+    mock_chain = mocker.patch("learning_resources_search.plugins.chain")
+    resource = LearningResourceFactory.create()
+    SearchIndexPlugin().resource_upserted(resource, percolate=percolate)
+
+    mock_queue.assert_called_once_with([resource.id], resource.resource_type)
+    if percolate and not queue_error:
+        mock_queue_percolations.assert_called_once_with(
+            [resource.id], resource.resource_type
+        )
+    else:
+        mock_queue_percolations.assert_not_called()
+    if queue_error and percolate:
+        mock_chain.return_value.assert_called_once_with(resource.id)
+    else:
+        mock_chain.assert_not_called()
+    assert mock_search_index_helpers.mock_upsert_learning_resource.call_count == int(
+        queue_error and not percolate
+    )
+
+
+@pytest.mark.parametrize("coalesce", [True, False])
+def test_search_index_plugin_bulk_resources_upserted(mocker, coalesce):
+    """The plugin function should index and percolate the resources in chunks"""
+    mocker.patch(
+        "learning_resources_search.plugins.settings.OPENSEARCH_INDEXING_CHUNK_SIZE",
+        new=2,
+    )
+    mocker.patch(
+        "learning_resources_search.plugins.settings.OPENSEARCH_COALESCE_UPSERTS",
+        new=coalesce,
+    )
+    mock_queue = mocker.patch(
+        "learning_resources_search.plugins.queue_learning_resource_upserts"
+    )
+    mock_queue_percolations = mocker.patch(
+        "learning_resources_search.plugins.queue_learning_resource_percolations"
+    )
+    mock_index = mocker.patch(
+        "learning_resources_search.plugins.tasks.index_learning_resources"
+    )
+    mock_percolate = mocker.patch(
+        "learning_resources_search.plugins.tasks.percolate_learning_resources"
+    )
+    mock_chain = mocker.patch("learning_resources_search.plugins.chain")
+    SearchIndexPlugin().bulk_resources_upserted([1, 2, 3], COURSE_TYPE, [3])
+
+    if coalesce:
+        mock_queue.assert_called_once_with([1, 2, 3], COURSE_TYPE)
+        mock_queue_percolations.assert_called_once_with([3], COURSE_TYPE)
+        mock_index.assert_not_called()
+        mock_chain.assert_not_called()
+    else:
+        mock_queue.assert_not_called()
+        # the chunk without resources to percolate is indexed on its own
+        mock_index.assert_called_once_with(
+            [1, 2], COURSE_TYPE, IndexestoUpdate.all_indexes.value
+        )
+        # the other chunk is percolated in a chain after it is indexed
+        mock_index.si.assert_called_once_with(
+            [3], COURSE_TYPE, IndexestoUpdate.all_indexes.value
+        )
+        mock_percolate.si.assert_called_once_with([3])
+        mock_chain.assert_called_once_with(
+            mock_index.si.return_value, mock_percolate.si.return_value
+        )
+        mock_chain.return_value.assert_called_once_with()
+    mock_percolate.assert_not_called()
+
+
 @pytest.mark.django_db()
 @pytest.mark.parametrize("resource_type", [COURSE_TYPE, PROGRAM_TYPE])
 def test_search_index_plugin_resource_unpublished(
@@ -125,18 +239,47 @@ def test_resource_similar_topics(mocker, settings):
     """The plugin function should return expected topics for a resource"""
     expected_topics = ["topic1", "topic2"]
     mock_similar_topics = mocker.patch(
-        "learning_resources_search.plugins.get_similar_topics",
-        return_value=expected_topics,
+        "learning_resources_search.plugins.get_similar_topics_bulk",
+        return_value=[expected_topics],
     )
     resource = LearningResourceFactory.create()
     topics = SearchIndexPlugin().resource_similar_topics(resource)
     assert topics == [{"name": topic} for topic in expected_topics]
     mock_similar_topics.assert_called_once_with(
-        {
-            "title": resource.title,
-            "description": resource.description,
-            "full_description": resource.full_description,
-        },
+        [
+            {
+                "title": resource.title,
+                "description": resource.description,
+                "full_description": resource.full_description,
+            }
+        ],
+        settings.OPEN_VIDEO_MAX_TOPICS,
+        settings.OPEN_VIDEO_MIN_TERM_FREQ,
+        settings.OPEN_VIDEO_MIN_DOC_FREQ,
+    )
+
+
+@pytest.mark.django_db()
+def test_bulk_resources_similar_topics(mocker, settings):
+    """The plugin function should look up topics for all resources at once"""
+    mock_similar_topics = mocker.patch(
+        "learning_resources_search.plugins.get_similar_topics_bulk",
+        return_value=[["topic1"], []],
+    )
+    resources = LearningResourceFactory.create_batch(2)
+    assert SearchIndexPlugin().bulk_resources_similar_topics(resources) == [
+        [{"name": "topic1"}],
+        [],
+    ]
+    mock_similar_topics.assert_called_once_with(
+        [
+            {
+                "title": resource.title,
+                "description": resource.description,
+                "full_description": resource.full_description,
+            }
+            for resource in resources
+        ],
         settings.OPEN_VIDEO_MAX_TOPICS,
         settings.OPEN_VIDEO_MIN_TERM_FREQ,
         settings.OPEN_VIDEO_MIN_DOC_FREQ,
@@ -10,7 +10,8 @@ from django.core.exceptions import ValidationError
 from drf_spectacular.plumbing import build_choice_description_list
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
-from rest_framework.utils.urls import replace_query_param
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from learning_resources.constants import (
     DEPARTMENTS,
@@ -21,21 +22,30 @@ from learning_resources.constants import (
     OfferedBy,
     PlatformType,
 )
-from learning_resources.models import LearningResource
+from learning_resources.models import ContentFile, LearningResource
 from learning_resources.serializers import (
     ContentFileSerializer,
     CourseNumberSerializer,
     LearningResourceSerializer,
 )
-from learning_resources_search.api import gen_content_file_id
+from learning_resources_search.api import (
+    decode_search_cursor,
+    encode_search_cursor,
+    gen_content_file_id,
+)
 from learning_resources_search.constants import (
+    AUTOCOMPLETE_WEIGHTS,
     CONTENT_FILE_TYPE,
+    MAX_AUTOCOMPLETE_SUGGESTIONS,
+    MAX_BATCH_SEARCHES,
+    SEARCH_VIEWS,
 )
 from learning_resources_search.models import PercolateQuery
 from learning_resources_search.utils import remove_child_queries
 from main.serializers import (
     COMMON_IGNORED_FIELDS,
 )
+from main.utils import filter_dict_keys
 
 log = logging.getLogger()
 
@@ -47,6 +57,36 @@ class SearchCourseNumberSerializer(CourseNumberSerializer):
     sort_coursenum = serializers.CharField()
 
 
+def serialize_autocomplete_inputs(data):
+    """
+    Build the autocomplete completion inputs for a learning resource: its
+    title, course numbers, topics and instructors, weighted by kind
+
+    Args:
+        data(dict): The serialized learning resource
+
+    Returns:
+        list of dict: The completion inputs and their weights
+    """
+    course_numbers = (data.get("course") or {}).get("course_numbers") or []
+    inputs = {
+        "title": [data.get("title")],
+        "course_number": [course_number["value"] for course_number in course_numbers],
+        "topic": [topic["name"] for topic in data.get("topics") or []],
+        "instructor": [
+            instructor.get("full_name")
+            for run in data.get("runs") or []
+            for instructor in run.get("instructors") or []
+        ],
+    }
+    completions = []
+    for kind, values in inputs.items():
+        values = sorted({value for value in values if value})  # noqa: PLW2901
+        if values:
+            completions.append({"input": values, "weight": AUTOCOMPLETE_WEIGHTS[kind]})
+    return completions
+
+
 def serialize_learning_resource_for_update(
     learning_resource_obj: LearningResource,
 ) -> dict:
@@ -76,6 +116,7 @@ def serialize_learning_resource_for_update(
             SearchCourseNumberSerializer(instance=num).data
             for num in learning_resource_obj.course.course_numbers
         ]
+    serialized_data["autocomplete"] = serialize_autocomplete_inputs(serialized_data)
     return {
         "resource_relations": {"name": "resource"},
         "created_on": learning_resource_obj.created_on,
@@ -122,7 +163,10 @@ class StringArrayField(serializers.ListField):
         super().__init__(*args, **kwargs)
 
     def to_internal_value(self, data):
-        normalized = ",".join(data).split(",")
+        # JSON request bodies can pass a single value or non-string values
+        if not isinstance(data, list):
+            data = [data]
+        normalized = ",".join(str(value) for value in data).split(",")
 
         return super().to_internal_value(normalized)
 
@@ -176,6 +220,15 @@ class SearchRequestSerializer(serializers.Serializer):
     limit = serializers.IntegerField(
         required=False, help_text="Number of results to return per page"
     )
+    cursor = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        help_text=(
+            "Cursor for paging through all results at a constant cost per page. "
+            "Pass an empty cursor for the first page and follow the next url "
+            "after that. offset is ignored when a cursor is given"
+        ),
+    )
     offered_by_choices = [(e.name.lower(), e.value) for e in OfferedBy]
     offered_by = StringArrayField(
         required=False,
@@ -200,11 +253,24 @@ class SearchRequestSerializer(serializers.Serializer):
         help_text="The topic name. To see a list of options go to api/v1/topics/",
     )
 
-    def validate(self, attrs):
-        unknown = set(self.initial_data) - set(self.fields)
+    def validate_cursor(self, value):
+        try:
+            decode_search_cursor(value)
+        except ValueError as error:
+            msg = "Invalid cursor"
+            raise ValidationError(msg) from error
+        return value
+
+    def to_internal_value(self, data):
+        # Check the raw data here rather than initial_data, so unknown fields
+        # are also rejected when this is nested in a batch search request
+        attrs = super().to_internal_value(data)
+        unknown = set(data) - set(self.fields)
         if unknown:
             error_message = "Unknown field(s): {}".format(", ".join(unknown))
-            raise ValidationError(error_message)
+            raise serializers.ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [error_message]}
+            )
         return attrs
 
 
@@ -222,6 +288,14 @@ class LearningResourcesSearchRequestSerializer(SearchRequestSerializer):
         ],
         help_text="If the parameter starts with '-' the sort is in descending order",
     )
+    view = serializers.ChoiceField(
+        required=False,
+        choices=SEARCH_VIEWS,
+        help_text=(
+            "The fields to return for each result. card only returns the fields "
+            "the result cards render"
+        ),
+    )
     resource_choices = [(e.name, e.value.lower()) for e in LearningResourceType]
     resource_type = StringArrayField(
         required=False,
@@ -285,6 +359,35 @@ class LearningResourcesSearchRequestSerializer(SearchRequestSerializer):
     )
 
 
+class LearningResourcesBatchSearchRequestSerializer(serializers.Serializer):
+    searches = LearningResourcesSearchRequestSerializer(
+        many=True,
+        min_length=1,
+        max_length=MAX_BATCH_SEARCHES,
+        help_text="The params for each learning resource search to run",
+    )
+
+
+class AutocompleteRequestSerializer(serializers.Serializer):
+    q = serializers.CharField(
+        max_length=100, help_text="The text to autocomplete, matched as a prefix"
+    )
+    limit = serializers.IntegerField(
+        required=False,
+        default=10,
+        min_value=1,
+        max_value=MAX_AUTOCOMPLETE_SUGGESTIONS,
+        help_text="Number of suggestions to return",
+    )
+
+
+class AutocompleteResponseSerializer(serializers.Serializer):
+    suggestions = serializers.ListField(
+        child=serializers.CharField(),
+        help_text="Titles, course numbers, topics and instructors matching the text",
+    )
+
+
 class ContentFileSearchRequestSerializer(SearchRequestSerializer):
     id = StringArrayField(
         required=False,
@@ -319,6 +422,15 @@ class ContentFileSearchRequestSerializer(SearchRequestSerializer):
     )
 
 
+class ResourceContentFileSearchRequestSerializer(ContentFileSearchRequestSerializer):
+    """
+    Search params for the content files of one learning resource, which is
+    given by the url instead
+    """
+
+    resource_id = None
+
+
 class AggregationValue(TypedDict):
     key: str
     doc_count: int
@@ -408,7 +520,27 @@ class SearchResponseSerializer(serializers.Serializer):
     results = serializers.SerializerMethodField()
     metadata = serializers.SerializerMethodField()
 
+    def construct_cursor_url(self, instance, request):
+        """
+        Return the url of the next page of a search paginated with a cursor
+        """
+        hits = instance.get("hits", {}).get("hits", [])
+        limit = int(
+            request.query_params.get("limit", settings.OPENSEARCH_DEFAULT_PAGE_SIZE)
+        )
+        if limit > 0 and len(hits) >= limit and hits[-1].get("sort"):
+            url = remove_query_param(request.build_absolute_uri(), "offset")
+            url = replace_query_param(url, "limit", limit)
+            return replace_query_param(
+                url, "cursor", encode_search_cursor(hits[-1]["sort"])
+            )
+        return None
+
     def construct_pagination_url(self, instance, request, link_type="next"):
+        if request and "cursor" in request.query_params:
+            if link_type == "next":
+                return self.construct_cursor_url(instance, request)
+            return None
         if request:
             url = request.build_absolute_uri()
             total_record_count = self.get_count(instance)
@@ -421,7 +553,7 @@ class SearchResponseSerializer(serializers.Serializer):
                 offset -= limit
             else:
                 offset += limit
-            if offset >= 0 and offset < total_record_count:
+            if limit > 0 and offset >= 0 and offset < total_record_count:
                 return replace_query_param(url, "offset", offset)
         return None
 
@@ -496,21 +628,6 @@ def serialize_content_file_for_update(content_file_obj):
     }
 
 
-def serialize_bulk_learning_resources(ids):
-    """
-    Serialize learning resource for bulk indexing
-
-    Args:
-        ids(list of int): List of learning_resource id's
-    """
-    for learning_resource in (
-        LearningResource.objects.select_related(*LearningResource.related_selects)
-        .prefetch_related(*LearningResource.prefetches)
-        .filter(id__in=ids)
-    ):
-        yield serialize_learning_resource_for_bulk(learning_resource)
-
-
 def serialize_bulk_percolators(ids):
     """
     Serialize percolators for bulk indexing
@@ -617,6 +734,53 @@ def serialize_content_file_for_bulk(content_file_obj):
     }
 
 
+# ContentFileSerializer fields which only depend on the run and its learning resource
+CONTENT_FILE_RUN_FIELDS = (
+    "run_id",
+    "run_readable_id",
+    "run_title",
+    "run_slug",
+    "semester",
+    "year",
+    "topics",
+    "resource_id",
+    "departments",
+    "resource_readable_id",
+    "course_number",
+    "offered_by",
+    "platform",
+)
+
+
+def serialize_bulk_content_files(run, ids):
+    """
+    Serialize content files of a run for bulk indexing. The run and learning resource
+    data is serialized once and shared by the documents of every file.
+
+    Args:
+        run(LearningResourceRun): The run, with its learning resource data preloaded
+        ids(list of int): List of content file id's of the run
+    """
+    file_serializer = ContentFileSerializer()
+    for field_name in CONTENT_FILE_RUN_FIELDS:
+        del file_serializer.fields[field_name]
+    run_data = None
+    for content_file in ContentFile.objects.prefetch_related("content_tags").filter(
+        run_id=run.id, id__in=ids
+    ):
+        content_file.run = run
+        if run_data is None:
+            run_data = filter_dict_keys(
+                serialize_content_file_for_update(content_file),
+                ["resource_relations", *CONTENT_FILE_RUN_FIELDS],
+            )
+        yield {
+            "_id": gen_content_file_id(content_file.id),
+            **run_data,
+            **file_serializer.to_representation(content_file),
+        }
+
+
 def serialize_content_file_for_bulk_deletion(content_file_obj):
     """
     Serialize a content file for bulk API request
@@ -14,10 +14,10 @@ from rest_framework.test import APIRequestFactory
 from learning_resources import factories
 from learning_resources.constants import DEPARTMENTS, LearningResourceType
 from learning_resources.etl.constants import CourseNumberType
-from learning_resources.models import LearningResource
 from learning_resources.serializers import LearningResourceSerializer
 from learning_resources_search import serializers
-from learning_resources_search.api import gen_content_file_id
+from learning_resources_search.api import encode_search_cursor, gen_content_file_id
+from learning_resources_search.constants import AUTOCOMPLETE_WEIGHTS
 from learning_resources_search.factories import PercolateQueryFactory
 from learning_resources_search.serializers import (
     ContentFileSearchRequestSerializer,
@@ -42,25 +42,6 @@ def get_request_object(url):
     return Request(api_request)
 
 
-@pytest.mark.django_db()
-def test_serialize_bulk_learning_resources(mocker):
-    """
-    Test that serialize_bulk_learning_resource calls serialize_learning_resource_for_bulk for
-    every existing learning resource
-    """
-    mock_serialize_program = mocker.patch(
-        "learning_resources_search.serializers.serialize_learning_resource_for_bulk"
-    )
-    resources = factories.LearningResourceFactory.create_batch(5)
-    list(
-        serializers.serialize_bulk_learning_resources(
-            [resource.id for resource in LearningResource.objects.all()]
-        )
-    )
-    for resource in resources:
-        mock_serialize_program.assert_any_call(resource)
-
-
 @pytest.mark.django_db()
 @pytest.mark.parametrize(
     "resource_type",
@@ -76,12 +57,14 @@ def test_serialize_learning_resource_for_bulk(resource_type):
         "free": resource_type
         not in [LearningResourceType.program.name, LearningResourceType.course.name]
     }
+    serialized_data = LearningResourceSerializer(resource).data
     assert serializers.serialize_learning_resource_for_bulk(resource) == {
         "_id": resource.id,
         "resource_relations": {"name": "resource"},
         "created_on": resource.created_on,
         **free_dict,
-        **LearningResourceSerializer(resource).data,
+        **serialized_data,
+        "autocomplete": serializers.serialize_autocomplete_inputs(serialized_data),
     }
 
 
@@ -138,10 +121,42 @@ def test_serialize_course_numbers_for_bulk(
         "primary": False,
         "sort_coursenum": sorted_extra_num,
     }
+    expected_data["autocomplete"] = serializers.serialize_autocomplete_inputs(
+        expected_data
+    )
+    assert {
+        "input": sorted([readable_id, extra_num]),
+        "weight": AUTOCOMPLETE_WEIGHTS["course_number"],
+    } in expected_data["autocomplete"]
 
     assert serializers.serialize_learning_resource_for_bulk(resource) == expected_data
 
 
+def test_serialize_autocomplete_inputs():
+    """
+    serialize_autocomplete_inputs should weight the unique titles, course numbers,
+    topics and instructors of a resource by kind, skipping any that are empty
+    """
+    data = {
+        "title": "Introduction to Algorithms",
+        "course": {"course_numbers": [{"value": "6.006"}, {"value": "18.410"}]},
+        "topics": [{"name": "Computer Science"}, {"name": "Algorithms"}],
+        "runs": [
+            {"instructors": [{"full_name": "Erik Demaine"}, {"full_name": None}]},
+            {"instructors": [{"full_name": "Erik Demaine"}]},
+        ],
+    }
+    assert serializers.serialize_autocomplete_inputs(data) == [
+        {"input": ["Introduction to Algorithms"], "weight": 4},
+        {"input": ["18.410", "6.006"], "weight": 3},
+        {"input": ["Algorithms", "Computer Science"], "weight": 2},
+        {"input": ["Erik Demaine"], "weight": 1},
+    ]
+    assert serializers.serialize_autocomplete_inputs(
+        {"title": "Podcast", "course": None, "topics": [], "runs": []}
+    ) == [{"input": ["Podcast"], "weight": 4}]
+
+
 @pytest.mark.django_db()
 def test_serialize_bulk_learning_resources_for_deletion():
     """
@@ -169,6 +184,27 @@ def test_serialize_content_file_for_bulk():
     }
 
 
+@pytest.mark.django_db()
+def test_serialize_bulk_content_files():
+    """
+    Test that serialize_bulk_content_files yields the same documents as
+    serialize_content_file_for_bulk
+    """
+    course = factories.CourseFactory.create()
+    run = course.learning_resource.runs.first()
+    content_files = factories.ContentFileFactory.create_batch(3, run=run)
+
+    assert sorted(
+        serializers.serialize_bulk_content_files(
+            run, [content_file.id for content_file in content_files]
+        ),
+        key=lambda document: document["id"],
+    ) == [
+        serializers.serialize_content_file_for_bulk(content_file)
+        for content_file in sorted(content_files, key=lambda cf: cf.id)
+    ]
+
+
 @pytest.mark.django_db()
 def test_serialize_content_file_for_bulk_deletion():
     """
@@ -806,6 +842,95 @@ def test_learning_resources_search_response_serializer(
     ) == JSONRenderer().render(response)
 
 
+@pytest.mark.parametrize("cursor", ["", encode_search_cursor([1.5, 10])])
+def test_search_request_serializer_cursor(cursor):
+    """Valid cursors should be accepted"""
+    serialized = LearningResourcesSearchRequestSerializer(data={"cursor": cursor})
+    assert serialized.is_valid() is True
+    assert serialized.data["cursor"] == cursor
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor", encode_search_cursor({"a": 1})])
+def test_search_request_serializer_invalid_cursor(cursor):
+    """Invalid cursors should be rejected"""
+    serialized = LearningResourcesSearchRequestSerializer(data={"cursor": cursor})
+    assert serialized.is_valid() is False
+    assert serialized.errors == {"cursor": ["Invalid cursor"]}
+
+
+def test_learning_resources_batch_search_request_serializer():
+    """Each search should be cleaned the same as a search request's query params"""
+    searches = [
+        {"q": "text", "limit": 6, "id": [1, 2], "free": True, "offered_by": "ocw"},
+        {"resource_type": ["course", "program"], "aggregations": ["topic"]},
+    ]
+    serialized = serializers.LearningResourcesBatchSearchRequestSerializer(
+        data={"searches": searches}
+    )
+    assert serialized.is_valid() is True
+    expected = [
+        LearningResourcesSearchRequestSerializer(data=QueryDict(query_string))
+        for query_string in [
+            "q=text&limit=6&id=1&id=2&free=true&offered_by=ocw",
+            "resource_type=course&resource_type=program&aggregations=topic",
+        ]
+    ]
+    assert all(search.is_valid() for search in expected)
+    assert serialized.data["searches"] == [search.data for search in expected]
+
+
+@pytest.mark.parametrize(
+    ("searches", "errors"),
+    [
+        ([], {"non_field_errors": ["Ensure this field has at least 1 elements."]}),
+        (
+            [{}] * 11,
+            {"non_field_errors": ["Ensure this field has no more than 10 elements."]},
+        ),
+        (
+            [{"q": "text"}, {"monkey": 22}],
+            [{}, {"non_field_errors": ["Unknown field(s): monkey"]}],
+        ),
+    ],
+)
+def test_learning_resources_batch_search_request_serializer_invalid(searches, errors):
+    """Batch searches should be rejected if there are too few, too many or bad ones"""
+    serialized = serializers.LearningResourcesBatchSearchRequestSerializer(
+        data={"searches": searches}
+    )
+    assert serialized.is_valid() is False
+    assert serialized.errors == {"searches": errors}
+
+
+@pytest.mark.parametrize("num_hits", [2, 3])
+def test_search_response_serializer_cursor_pagination(settings, num_hits):
+    """Searches with a cursor should link to the next page by cursor only"""
+    settings.OPENSEARCH_MAX_SUGGEST_HITS = 10
+    url = "/api/v1/learning_resources_search/"
+    request = Request(
+        APIRequestFactory().get(
+            url,
+            {"cursor": "", "limit": 3, "offset": 20},
+        )
+    )
+    raw_data = {
+        "hits": {
+            "total": {"value": 100},
+            "hits": [
+                {"_source": {"id": idx}, "sort": [1.0, idx]} for idx in range(num_hits)
+            ],
+        }
+    }
+    data = SearchResponseSerializer(raw_data, context={"request": request}).data
+    assert data["previous"] is None
+    if num_hits == 3:
+        assert data["next"] == (
+            f"http://testserver{url}?cursor={encode_search_cursor([1.0, 2])}&limit=3"
+        )
+    else:
+        assert data["next"] is None
+
+
 @pytest.mark.django_db()
 @factory.django.mute_signals(signals.post_delete, signals.post_save)
 def test_percolate_serializer():
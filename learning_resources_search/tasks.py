@@ -1,7 +1,9 @@
 """Indexing tasks"""
 
 import logging
+from collections import Counter
 from contextlib import contextmanager
+from datetime import datetime
 
 import celery
 from celery.exceptions import Ignore
@@ -19,24 +21,35 @@ from learning_resources.models import (
 from learning_resources.utils import load_course_blocklist
 from learning_resources_search import indexing_api as api
 from learning_resources_search.api import (
+    bump_search_cache_generation,
+    defer_search_cache_generation_bump,
     gen_content_file_id,
     percolate_matches_for_document,
+    percolate_matches_for_documents,
 )
+from learning_resources_search.connection import get_reindexing_alias_name
 from learning_resources_search.constants import (
     CONTENT_FILE_TYPE,
     COURSE_TYPE,
     LEARNING_PATH_TYPE,
+    LEARNING_RESOURCE_TYPES,
     PERCOLATE_INDEX_TYPE,
     PODCAST_EPISODE_TYPE,
     PODCAST_TYPE,
     PROGRAM_TYPE,
     SEARCH_CONN_EXCEPTIONS,
+    UPDATE_INDEX_WATERMARK_OVERLAP,
     VIDEO_PLAYLIST_TYPE,
     VIDEO_TYPE,
     IndexestoUpdate,
 )
 from learning_resources_search.exceptions import ReindexError, RetryError
-from learning_resources_search.models import PercolateQuery
+from learning_resources_search.models import (
+    IndexingWatermark,
+    PercolateQuery,
+    RecreateIndexChunk,
+    RecreateIndexRun,
+)
 from learning_resources_search.serializers import (
     serialize_bulk_percolators,
     serialize_content_file_for_update,
@@ -44,7 +57,7 @@ from learning_resources_search.serializers import (
     serialize_percolate_query_for_update,
 )
 from main.celery import app
-from main.utils import chunks, merge_strings
+from main.utils import chunks, merge_strings, now_in_utc
 
 User = get_user_model()
 log = logging.getLogger(__name__)
@@ -131,6 +144,131 @@ def index_learning_resources(ids, resource_type, index_types):
         return error
 
 
+@app.task(autoretry_for=(RetryError,), retry_backoff=True, rate_limit="600/m")
+def update_learning_resources(ids, resource_type, since=None, *, force=False):
+    """
+    Index the learning resources that changed since the last update_index run
+
+    Args:
+        ids(list of int): List of learning resource id's
+        resource_type (string): resource_type value for the learning resource objects
+        since (str or None): ISO timestamp, only resources changed after it are sent
+        force (bool): Send every document even if its content hash is unchanged
+
+    Returns:
+        dict or str: The number of documents sent and skipped, or an error message
+    """
+    try:
+        with wrap_retry_exception(*SEARCH_CONN_EXCEPTIONS):
+            return api.update_learning_resources(
+                ids,
+                resource_type,
+                IndexestoUpdate.current_index.value,
+                since=datetime.fromisoformat(since) if since else None,
+                force=force,
+            )
+    except (RetryError, Ignore):
+        raise
+    except:  # noqa: E722
+        error = "update_learning_resources threw an error"
+        log.exception(error)
+        return error
+
+
+def _flush_queued_upserts(resource_type):
+    """
+    Bulk index the queued learning resources of a resource type
+
+    Args:
+        resource_type(str): The resource type
+
+    Returns:
+        int: The number of learning resources indexed
+    """
+    count = 0
+    while ids := api.pop_queued_learning_resource_upserts(
+        resource_type, settings.OPENSEARCH_INDEXING_CHUNK_SIZE
+    ):
+        published_ids = list(
+            LearningResource.objects.filter(id__in=ids, published=True).values_list(
+                "id", flat=True
+            )
+        )
+        try:
+            if published_ids:
+                with wrap_retry_exception(*SEARCH_CONN_EXCEPTIONS):
+                    api.index_learning_resources(
+                        published_ids,
+                        resource_type,
+                        IndexestoUpdate.all_indexes.value,
+                    )
+        except:
+            # put the ids back so the next flush picks them up
+            api.queue_learning_resource_upserts(ids, resource_type)
+            raise
+        count += len(published_ids)
+    return count
+
+
+def _flush_queued_upserts_and_percolations(resource_type):
+    """
+    Bulk index the queued learning resources of a resource type, then percolate
+    the queued newly created ones
+
+    Args:
+        resource_type(str): The resource type
+
+    Returns:
+        int: The number of learning resources indexed
+    """
+    # take the pending percolations before indexing, so that every one of them
+    # has had its upsert queued ahead of it and indexed by the time it runs
+    percolate_ids = []
+    while ids := api.pop_queued_learning_resource_percolations(
+        resource_type, settings.OPENSEARCH_INDEXING_CHUNK_SIZE
+    ):
+        percolate_ids.extend(ids)
+    try:
+        indexed = _flush_queued_upserts(resource_type)
+        while percolate_ids:
+            with wrap_retry_exception(*SEARCH_CONN_EXCEPTIONS):
+                percolate_matches_for_documents(
+                    percolate_ids[: settings.OPENSEARCH_INDEXING_CHUNK_SIZE]
+                )
+            percolate_ids = percolate_ids[settings.OPENSEARCH_INDEXING_CHUNK_SIZE :]
+    except:
+        # put the ids back so the next flush picks them up
+        api.queue_learning_resource_percolations(percolate_ids, resource_type)
+        raise
+    return indexed
+
+
+@app.task(autoretry_for=(RetryError,), retry_backoff=True, rate_limit="600/m")
+@defer_search_cache_generation_bump()
+def flush_learning_resource_upserts():
+    """
+    Bulk index the learning resources queued by the search index plugin since
+    the last flush, one bulk request per resource type and chunk, then percolate
+    the newly created ones with one multi-search request per chunk
+
+    Returns:
+        dict: The number of learning resources indexed, keyed by resource type
+    """
+    with api.learning_resource_upserts_flush_lock() as acquired:
+        if not acquired:
+            # the queued ids are left for the next scheduled flush
+            log.info("Skipping flush, another flush of upserts is running")
+            return {}
+        counts = {}
+        for resource_type in LEARNING_RESOURCE_TYPES:
+            indexed = _flush_queued_upserts_and_percolations(resource_type)
+            if indexed:
+                counts[resource_type] = indexed
+    if counts:
+        log.info("Flushed queued learning resource upserts: %s", counts)
+    return counts
+
+
 @app.task(autoretry_for=(RetryError,), retry_backoff=True, rate_limit="600/m")
 def percolate_learning_resource(resource_id):
     """
@@ -140,6 +278,16 @@ def percolate_learning_resource(resource_id):
     percolate_matches_for_document(resource_id)
 
 
+@app.task(autoretry_for=(RetryError,), retry_backoff=True, rate_limit="600/m")
+def percolate_learning_resources(resource_ids):
+    """
+    Task that percolates a batch of documents following a bulk index operation
+    """
+    log.info("percolating documents %s", resource_ids)
+    with wrap_retry_exception(*SEARCH_CONN_EXCEPTIONS):
+        percolate_matches_for_documents(resource_ids)
+
+
 @app.task(autoretry_for=(RetryError,), retry_backoff=True, rate_limit="600/m")
 def bulk_deindex_learning_resources(ids, resource_type):
     """
@@ -152,7 +300,11 @@ def bulk_deindex_learning_resources(ids, resource_type):
     """
     try:
         with wrap_retry_exception(*SEARCH_CONN_EXCEPTIONS):
-            api.deindex_learning_resources(ids, resource_type)
+            task_ids, content_file_ids = api.deindex_learning_resources(
+                ids, resource_type
+            )
+        if task_ids:
+            wait_for_delete_by_query.delay(task_ids, content_file_ids)
     except (RetryError, Ignore):
         raise
     except:  # noqa: E722
@@ -231,6 +383,7 @@ def index_course_content_files(course_ids, index_types):
 
 
 @app.task(autoretry_for=(RetryError,), retry_backoff=True, rate_limit="600/m")
+@defer_search_cache_generation_bump()
 def index_run_content_files(run_id, index_types=IndexestoUpdate.all_indexes.value):
     """
     Index content files for a LearningResourceRun
@@ -265,7 +418,11 @@ def deindex_run_content_files(run_id, unpublished_only):
     """
     try:
         with wrap_retry_exception(*SEARCH_CONN_EXCEPTIONS):
-            api.deindex_run_content_files(run_id, unpublished_only=unpublished_only)
+            task_ids, content_file_ids = api.deindex_run_content_files(
+                run_id, unpublished_only=unpublished_only
+            )
+        if task_ids:
+            wait_for_delete_by_query.delay(task_ids, content_file_ids)
     except (RetryError, Ignore):
         raise
     except:  # noqa: E722
@@ -274,6 +431,47 @@ def deindex_run_content_files(run_id, unpublished_only):
         return error
 
 
+@app.task(bind=True, autoretry_for=(RetryError,), retry_backoff=True)
+def wait_for_delete_by_query(self, task_ids, content_file_ids=None):
+    """
+    Poll the delete_by_query tasks deindexing content files until they finish, then
+    delete the content files from the database and invalidate cached search
+    responses. If the tasks had failures, the content files are deindexed one by one
+    before they are deleted.
+
+    Args:
+        task_ids(list of str): The ids of the OpenSearch tasks
+        content_file_ids(list of int): The ids of the content files being deindexed
+
+    Returns:
+        dict: The final status of the tasks
+    """
+    with wrap_retry_exception(*SEARCH_CONN_EXCEPTIONS):
+        status = api.get_delete_by_query_status(task_ids)
+        if status["completed"] and content_file_ids:
+            api.finish_deleting_content_files(
+                content_file_ids, deindex=bool(status["failures"])
+            )
+    if not status["completed"]:
+        raise self.retry(
+            countdown=settings.OPENSEARCH_DELETE_BY_QUERY_POLL_INTERVAL,
+            max_retries=None,
+        )
+    if status["failures"]:
+        log.error(
+            "delete_by_query tasks %s had failures, deindexed the content files"
+            " one by one instead: %s",
+            task_ids,
+            status["failures"],
+        )
+    else:
+        log.info(
+            "delete_by_query tasks %s deleted %d documents", task_ids, status["deleted"]
+        )
+    bump_search_cache_generation()
+    return status
+
+
 @contextmanager
 def wrap_retry_exception(*exception_classes):
     """
@@ -293,93 +491,171 @@ def wrap_retry_exception(*exception_classes):
         raise
 
 
+def _index_recreate_index_chunk(chunk):
+    """
+    Index the objects of a recreate_index chunk into the reindexing index
+
+    Args:
+        chunk (RecreateIndexChunk): The chunk to index
+
+    Raises:
+        ReindexError: If nothing was written to the reindexing alias although the
+            chunk has objects to index
+    """
+    index_types = IndexestoUpdate.reindexing_index.value
+    if chunk.object_type == PERCOLATE_INDEX_TYPE:
+        index_type = PERCOLATE_INDEX_TYPE
+        stats = api.index_percolators(chunk.ids, index_types)
+        has_documents = PercolateQuery.objects.filter(id__in=chunk.ids).exists()
+    elif chunk.object_type == CONTENT_FILE_TYPE:
+        # content file chunks hold the ids of their courses
+        index_type = COURSE_TYPE
+        stats = api.index_course_content_files(chunk.ids, index_types)
+        has_documents = ContentFile.objects.filter(
+            run__learning_resource_id__in=chunk.ids,
+            run__published=True,
+            published=True,
+        ).exists()
+    else:
+        index_type = chunk.object_type
+        stats = api.index_learning_resources(chunk.ids, chunk.object_type, index_types)
+        has_documents = LearningResource.objects.filter(
+            id__in=chunk.ids, published=True
+        ).exists()
+    alias = get_reindexing_alias_name(index_type)
+    if has_documents and not stats.get(alias, {}).get("documents"):
+        msg = f"No documents were written to {alias} for chunk {chunk.id}"
+        raise ReindexError(msg)
+
+
+@app.task(autoretry_for=(RetryError,), retry_backoff=True, rate_limit="600/m")
+def index_recreate_index_chunk(chunk_id):
+    """
+    Index a chunk of a recreate_index run into the reindexing indexes, and record
+    that it completed so a resumed run skips it
+
+    Args:
+        chunk_id (int): The RecreateIndexChunk id
+
+    Returns:
+        str: An error message, if indexing the chunk failed
+    """
+    chunk = RecreateIndexChunk.objects.get(id=chunk_id)
+    try:
+        with wrap_retry_exception(*SEARCH_CONN_EXCEPTIONS):
+            _index_recreate_index_chunk(chunk)
+    except (RetryError, Ignore):
+        raise
+    except:  # noqa: E722
+        error = f"index_recreate_index_chunk threw an error for chunk {chunk_id}"
+        log.exception(error)
+        chunk.error = error
+        chunk.save()
+        return error
+
+    chunk.completed_on = now_in_utc()
+    chunk.error = ""
+    chunk.save()
+    return None
+
+
+def get_recreate_index_chunks(indexes):
+    """
+    Get the chunks of objects to index into new backing indexes
+
+    Args:
+        indexes (list of str): The object types being recreated
+
+    Yields:
+        tuple of (str, list of int): The object type and ids of each chunk
+    """
+    if PERCOLATE_INDEX_TYPE in indexes:
+        for percolate_ids in chunks(
+            PercolateQuery.objects.order_by("id").values_list("id", flat=True),
+            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+        ):
+            yield PERCOLATE_INDEX_TYPE, percolate_ids
+
+    if COURSE_TYPE in indexes:
+        blocklisted_ids = load_course_blocklist()
+        for ids in chunks(
+            Course.objects.filter(learning_resource__published=True)
+            .exclude(learning_resource__readable_id=blocklisted_ids)
+            .order_by("learning_resource_id")
+            .values_list("learning_resource_id", flat=True),
+            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+        ):
+            yield COURSE_TYPE, ids
+        for ids in chunks(
+            Course.objects.filter(learning_resource__published=True)
+            .filter(learning_resource__etl_source__in=RESOURCE_FILE_ETL_SOURCES)
+            .exclude(learning_resource__readable_id=blocklisted_ids)
+            .order_by("learning_resource_id")
+            .values_list("learning_resource_id", flat=True),
+            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+        ):
+            yield CONTENT_FILE_TYPE, ids
+
+    for resource_type in [
+        PROGRAM_TYPE,
+        PODCAST_TYPE,
+        PODCAST_EPISODE_TYPE,
+        LEARNING_PATH_TYPE,
+        VIDEO_TYPE,
+        VIDEO_PLAYLIST_TYPE,
+    ]:
+        if resource_type in indexes:
+            for ids in chunks(
+                LearningResource.objects.filter(
+                    published=True, resource_type=resource_type
+                )
+                .order_by("id")
+                .values_list("id", flat=True),
+                chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+            ):
+                yield resource_type, ids
+
+
 @app.task(bind=True)
 def start_recreate_index(self, indexes):
     """
     Wipe and recreate index and mapping, and index all items.
     """
     try:
+        # Unfinished runs for these indexes can't be resumed once new backing
+        # indexes replace theirs
+        stale_runs = [
+            run
+            for run in RecreateIndexRun.objects.filter(finished_on=None)
+            if set(run.backing_indices) & set(indexes)
+        ]
+        for stale_run in stale_runs:
+            api.delete_backing_indices(stale_run.backing_indices)
+            stale_run.delete()
+
         new_backing_indices = {
             obj_type: api.create_backing_index(obj_type) for obj_type in indexes
         }
+        run = RecreateIndexRun.objects.create(
+            backing_indices=new_backing_indices, started_on=now_in_utc()
+        )
+        RecreateIndexChunk.objects.bulk_create(
+            RecreateIndexChunk(run=run, object_type=object_type, ids=ids)
+            for object_type, ids in get_recreate_index_chunks(indexes)
+        )
 
         # Do the indexing on the temp index
-        log.info("starting to index %s objects...", ", ".join(indexes))
-
-        index_tasks = []
-
-        if PERCOLATE_INDEX_TYPE in indexes:
-            index_tasks = index_tasks + [
-                bulk_index_percolate_queries.si(
-                    percolate_ids, IndexestoUpdate.reindexing_index.value
-                )
-                for percolate_ids in chunks(
-                    PercolateQuery.objects.order_by("id").values_list("id", flat=True),
-                    chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-                )
+        log.info(
+            "starting to index %s objects in %d chunks...",
+            ", ".join(indexes),
+            run.chunks.count(),
+        )
+        index_tasks = celery.group(
+            [
+                index_recreate_index_chunk.si(chunk_id)
+                for chunk_id in run.chunks.order_by("id").values_list("id", flat=True)
             ]
-
-        if COURSE_TYPE in indexes:
-            blocklisted_ids = load_course_blocklist()
-            index_tasks = (
-                index_tasks
-                + [
-                    index_learning_resources.si(
-                        ids,
-                        COURSE_TYPE,
-                        index_types=IndexestoUpdate.reindexing_index.value,
-                    )
-                    for ids in chunks(
-                        Course.objects.filter(learning_resource__published=True)
-                        .exclude(learning_resource__readable_id=blocklisted_ids)
-                        .order_by("learning_resource_id")
-                        .values_list("learning_resource_id", flat=True),
-                        chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-                    )
-                ]
-                + [
-                    index_course_content_files.si(
-                        ids, index_types=IndexestoUpdate.reindexing_index.value
-                    )
-                    for ids in chunks(
-                        Course.objects.filter(learning_resource__published=True)
-                        .filter(
-                            learning_resource__etl_source__in=RESOURCE_FILE_ETL_SOURCES
-                        )
-                        .exclude(learning_resource__readable_id=blocklisted_ids)
-                        .order_by("learning_resource_id")
-                        .values_list("learning_resource_id", flat=True),
-                        chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-                    )
-                ]
-            )
-
-        for resource_type in [
-            PROGRAM_TYPE,
-            PODCAST_TYPE,
-            PODCAST_EPISODE_TYPE,
-            LEARNING_PATH_TYPE,
-            VIDEO_TYPE,
-            VIDEO_PLAYLIST_TYPE,
-        ]:
-            if resource_type in indexes:
-                index_tasks = index_tasks + [
-                    index_learning_resources.si(
-                        ids,
-                        resource_type,
-                        index_types=IndexestoUpdate.reindexing_index.value,
-                    )
-                    for ids in chunks(
-                        LearningResource.objects.filter(
-                            published=True, resource_type=resource_type
-                        )
-                        .order_by("id")
-                        .values_list("id", flat=True),
-                        chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-                    )
-                ]
-
-        index_tasks = celery.group(index_tasks)
+        )
     except:  # noqa: E722
         error = "start_recreate_index threw an error"
         log.exception(error)
@@ -388,18 +664,63 @@ def start_recreate_index(self, indexes):
     # Use self.replace so that code waiting on this task will also wait on the indexing
     #  and finish tasks
     raise self.replace(
-        celery.chain(index_tasks, finish_recreate_index.s(new_backing_indices))
+        celery.chain(index_tasks, finish_recreate_index.s(new_backing_indices, run.id))
     )
 
 
 @app.task(bind=True)
-def start_update_index(self, indexes, etl_source):
+def resume_recreate_index(self):
     """
-    Wipe and recreate index and mapping, and index all items.
+    Continue the last unfinished recreate_index run against the same backing indexes,
+    indexing only the chunks which haven't completed yet
+    """
+    try:
+        run = RecreateIndexRun.objects.filter(finished_on=None).order_by("id").last()
+        if run is None:
+            return "There is no unfinished recreate_index run to resume"
+        for object_type, backing_index in run.backing_indices.items():
+            if not api.reindexing_alias_exists(backing_index, object_type):
+                return (
+                    f"The {object_type} backing index {backing_index} is no longer"
+                    " being reindexed, recreate_index has to start over"
+                )
+
+        run.started_on = now_in_utc()
+        run.save()
+        chunk_ids = list(
+            run.chunks.filter(completed_on=None)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        log.info(
+            "resuming recreate_index run %d with %d remaining chunks...",
+            run.id,
+            len(chunk_ids),
+        )
+        index_tasks = celery.group(
+            [index_recreate_index_chunk.si(chunk_id) for chunk_id in chunk_ids]
+        )
+    except:  # noqa: E722
+        error = "resume_recreate_index threw an error"
+        log.exception(error)
+        return error
+
+    raise self.replace(
+        celery.chain(index_tasks, finish_recreate_index.s(run.backing_indices, run.id))
+    )
+
+
+@app.task(bind=True)
+def start_update_index(self, indexes, etl_source, *, full=False):
+    """
+    Index the learning resources changed since the last run and their content files
+    and percolators, and remove unpublished items from the index.
     """
     try:
         log.info("starting to index %s objects...", ", ".join(indexes))
 
+        started_at = now_in_utc()
+        watermarks = {} if full else get_update_index_watermarks(indexes)
         index_tasks = []
 
         if COURSE_TYPE in indexes or CONTENT_FILE_TYPE in indexes:
@@ -407,7 +728,10 @@ def start_update_index(self, indexes, etl_source):
 
         if COURSE_TYPE in indexes:
             index_tasks = index_tasks + get_update_courses_tasks(
-                blocklisted_ids, etl_source
+                blocklisted_ids,
+                etl_source,
+                since=watermarks.get(COURSE_TYPE),
+                force=full,
             )
 
         if CONTENT_FILE_TYPE in indexes:
@@ -427,16 +751,83 @@ def start_update_index(self, indexes, etl_source):
         ]:
             if resource_type in indexes:
                 index_tasks = index_tasks + get_update_learning_resource_tasks(
-                    resource_type
+                    resource_type, since=watermarks.get(resource_type), force=full
                 )
 
+        # an etl_source filtered run doesn't cover all courses
+        watermark_types = [
+            resource_type
+            for resource_type in LEARNING_RESOURCE_TYPES
+            if resource_type in indexes
+            and not (resource_type == COURSE_TYPE and etl_source)
+        ]
         index_tasks = celery.group(index_tasks)
     except:  # noqa: E722
         error = "start_update_index threw an error"
         log.exception(error)
-        return [error]
+        return {"errors": [error], "sent": 0, "skipped": 0}
+
+    raise self.replace(
+        celery.chain(
+            index_tasks,
+            finish_update_index.s(watermark_types, started_at.isoformat()),
+        )
+    )
+
+
+def get_update_index_watermarks(object_types):
+    """
+    Get the times after which changes need to be indexed for object types, based on
+    when update_index last ran successfully for them
+
+    Args:
+        object_types(list of str): The object types
+
+    Returns:
+        dict: ISO timestamps keyed by object type, for object types with a watermark
+    """
+    return {
+        watermark.object_type: (
+            watermark.indexed_at - UPDATE_INDEX_WATERMARK_OVERLAP
+        ).isoformat()
+        for watermark in IndexingWatermark.objects.filter(object_type__in=object_types)
+    }
+
+
+@app.task
+def finish_update_index(results, object_types, started_at):
+    """
+    Advance the update_index watermarks if every indexing task succeeded
 
-    raise self.replace(index_tasks)
+    Args:
+        results (list): Results of the indexing tasks, error messages or counts of
+            documents sent and skipped
+        object_types (list of str): The object types whose watermarks to advance
+        started_at (str): ISO timestamp of when update_index started
+
+    Returns:
+        dict: The errors and the total numbers of documents sent and skipped
+    """
+    errors = []
+    counts = Counter()
+    for result in merge_strings(results):
+        if isinstance(result, dict):
+            counts.update(result)
+        else:
+            errors.append(result)
+
+    if not errors:
+        for object_type in object_types:
+            IndexingWatermark.objects.update_or_create(
+                object_type=object_type,
+                defaults={"indexed_at": datetime.fromisoformat(started_at)},
+            )
+    log.info(
+        "update_index sent %d documents and skipped %d unchanged documents",
+        counts["sent"],
+        counts["skipped"],
+    )
+    return {"errors": errors, "sent": counts["sent"], "skipped": counts["skipped"]}
 
 
 def get_update_resource_files_tasks(blocklisted_ids, etl_source):
@@ -474,12 +865,14 @@ def get_update_resource_files_tasks(blocklisted_ids, etl_source):
         return []
 
 
-def get_update_courses_tasks(blocklisted_ids, etl_source):
+def get_update_courses_tasks(blocklisted_ids, etl_source, since=None, *, force=False):
     """
     Get list of tasks to update courses
     Args:
         blocklisted_ids(list of int): List of course id's to exclude
         etl_source(str): Etl source filter for the task
+        since(str): ISO timestamp, only courses changed after it are updated
+        force(bool): Send every document even if its content hash is unchanged
     """
 
     course_update_query = (
@@ -490,7 +883,10 @@ def get_update_courses_tasks(blocklisted_ids, etl_source):
 
     course_deletion_query = (
         LearningResource.objects.filter(resource_type=COURSE_TYPE)
-        .filter(Q(published=False) | Q(readable_id__in=blocklisted_ids))
+        .filter(
+            (Q(published=False) & _changed_since_filter(since))
+            | Q(readable_id__in=blocklisted_ids)
+        )
         .order_by("id")
     )
 
@@ -499,9 +895,7 @@ def get_update_courses_tasks(blocklisted_ids, etl_source):
         course_deletion_query = course_deletion_query.filter(etl_source=etl_source)
 
     index_tasks = [
-        index_learning_resources.si(
-            ids, COURSE_TYPE, index_types=IndexestoUpdate.current_index.value
-        )
+        update_learning_resources.si(ids, COURSE_TYPE, since, force=force)
         for ids in chunks(
             course_update_query.values_list("id", flat=True),
             chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
@@ -517,6 +911,25 @@ def get_update_courses_tasks(blocklisted_ids, etl_source):
     ]
 
 
+def _changed_since_filter(since):
+    """
+    Get a filter for learning resources changed after a point in time
+
+    Args:
+        since(str): ISO timestamp, or None to match all learning resources
+
+    Returns:
+        Q: The filter
+    """
+    if not since:
+        return Q()
+    return Q(
+        id__in=LearningResource.objects.filter(
+            api.changed_since_q(datetime.fromisoformat(since))
+        ).values("id")
+    )
+
+
 def get_update_percolator_tasks():
     """
     Get list of tasks to update percolators
@@ -540,14 +953,16 @@ def get_update_percolator_tasks():
     ]
 
 
-def get_update_learning_resource_tasks(resource_type):
+def get_update_learning_resource_tasks(resource_type, since=None, *, force=False):
     """
     Get list of tasks to update non-course learning resources
+    Args:
+        resource_type(str): The resource type
+        since(str): ISO timestamp, only resources changed after it are updated
+        force(bool): Send every document even if its content hash is unchanged
     """
     index_tasks = [
-        index_learning_resources.si(
-            ids, resource_type, index_types=IndexestoUpdate.current_index.value
-        )
+        update_learning_resources.si(ids, resource_type, since, force=force)
         for ids in chunks(
             LearningResource.objects.filter(published=True, resource_type=resource_type)
             .order_by("id")
@@ -560,7 +975,9 @@ def get_update_learning_resource_tasks(resource_type):
         bulk_deindex_learning_resources.si(ids, resource_type)
         for ids in chunks(
             LearningResource.objects.filter(
-                published=False, resource_type=resource_type
+                _changed_since_filter(since),
+                published=False,
+                resource_type=resource_type,
             )
             .order_by("id")
             .values_list("id", flat=True),
@@ -570,29 +987,35 @@ def get_update_learning_resource_tasks(resource_type):
 
 
 @app.task(autoretry_for=(RetryError,), retry_backoff=True, rate_limit="600/m")
-def finish_recreate_index(results, backing_indices):
+def finish_recreate_index(results, backing_indices, run_id=None):
     """
     Swap reindex backing index with default backing index
 
     Args:
         results (list or bool): Results saying whether the error exists
         backing_indices (dict): The backing OpenSearch indices keyed by object type
+        run_id (int): The RecreateIndexRun id
     """
     errors = merge_strings(results)
     if errors:
-        try:
-            api.delete_orphaned_indices()
-        except RequestError as ex:
-            raise RetryError(str(ex)) from ex
-        msg = f"Errors occurred during recreate_index: {errors}"
+        # Keep the backing indices so the run can be resumed
+        msg = (
+            f"Errors occurred during recreate_index: {errors}. Run recreate_index"
+            " --resume to retry the chunks which did not complete"
+        )
         raise ReindexError(msg)
 
     log.info(
         "Done with temporary index. Pointing default aliases to newly created backing indexes..."  # noqa: E501
     )
-    for obj_type, backing_index in backing_indices.items():
-        try:
+    try:
+        # Every backing index is ready to be searched before any alias is switched,
+        # so a failure here leaves all default aliases on the old indexes
+        for backing_index in backing_indices.values():
+            api.finish_bulk_load(backing_index)
+        for obj_type, backing_index in backing_indices.items():
             api.switch_indices(backing_index, obj_type)
-        except RequestError as ex:
-            raise RetryError(str(ex)) from ex
+    except RequestError as ex:
+        raise RetryError(str(ex)) from ex
+    RecreateIndexRun.objects.filter(id=run_id).update(finished_on=now_in_utc())
     log.info("recreate_index has finished successfully!")
@@ -1,5 +1,7 @@
 """Search task tests"""
 
+from datetime import timedelta
+
 import pytest
 from celery.exceptions import Retry
 from django.conf import settings
@@ -13,15 +15,29 @@ from learning_resources.factories import (
     LearningResourceFactory,
     ProgramFactory,
 )
+from learning_resources.models import (
+    LearningResource,
+    LearningResourceInstructor,
+    LearningResourceOfferor,
+)
 from learning_resources_search.api import gen_content_file_id
 from learning_resources_search.constants import (
     CONTENT_FILE_TYPE,
     COURSE_TYPE,
     LEARNING_RESOURCE_TYPES,
+    PERCOLATE_INDEX_TYPE,
     PROGRAM_TYPE,
+    UPDATE_INDEX_WATERMARK_OVERLAP,
+    VIDEO_TYPE,
     IndexestoUpdate,
 )
 from learning_resources_search.exceptions import ReindexError, RetryError
+from learning_resources_search.factories import PercolateQueryFactory
+from learning_resources_search.models import (
+    IndexingWatermark,
+    RecreateIndexChunk,
+    RecreateIndexRun,
+)
 from learning_resources_search.serializers import (
     serialize_content_file_for_update,
     serialize_learning_resource_for_update,
@@ -31,16 +47,23 @@ from learning_resources_search.tasks import (
     deindex_document,
     deindex_run_content_files,
     finish_recreate_index,
+    finish_update_index,
+    flush_learning_resource_upserts,
     index_course_content_files,
     index_learning_resources,
+    index_recreate_index_chunk,
     index_run_content_files,
+    percolate_learning_resources,
+    resume_recreate_index,
     start_recreate_index,
     start_update_index,
     upsert_content_file,
     upsert_learning_resource,
+    wait_for_delete_by_query,
     wrap_retry_exception,
 )
 from main.test_utils import assert_not_raises
+from main.utils import now_in_utc
 
 pytestmark = pytest.mark.django_db
 
@@ -131,11 +154,8 @@ def test_start_recreate_index(mocker, mocked_celery, user, indexes):
             key=lambda program: program.learning_resource_id,
         )
 
-    index_learning_resources_mock = mocker.patch(
-        "learning_resources_search.tasks.index_learning_resources", autospec=True
-    )
-    index_course_files_mock = mocker.patch(
-        "learning_resources_search.tasks.index_course_content_files", autospec=True
+    index_chunk_mock = mocker.patch(
+        "learning_resources_search.tasks.index_recreate_index_chunk", autospec=True
     )
 
     backing_index = "backing"
@@ -158,56 +178,230 @@ def test_start_recreate_index(mocker, mocked_celery, user, indexes):
             finish_recreate_index_dict[doctype] = backing_index
             create_backing_index_mock.assert_any_call(doctype)
 
-    finish_recreate_index_mock.s.assert_called_once_with(finish_recreate_index_dict)
+    run = RecreateIndexRun.objects.get()
+    assert run.backing_indices == finish_recreate_index_dict
+    assert run.finished_on is None
+    finish_recreate_index_mock.s.assert_called_once_with(
+        finish_recreate_index_dict, run.id
+    )
     assert mocked_celery.group.call_count == 1
 
-    # Celery's 'group' function takes a generator as an argument. In order to make assertions about the items
-    # in that generator, 'list' is being called to force iteration through all of those items.
-    list(mocked_celery.group.call_args[0][0])
+    chunks = list(run.chunks.order_by("id").values_list("object_type", "ids"))
+    assert [call.args for call in index_chunk_mock.si.call_args_list] == [
+        (chunk_id,)
+        for chunk_id in run.chunks.order_by("id").values_list("id", flat=True)
+    ]
 
     if COURSE_TYPE in indexes:
         mock_blocklist.assert_called_once()
-        assert index_learning_resources_mock.si.call_count == 3
-        index_learning_resources_mock.si.assert_any_call(
-            [courses[0].learning_resource_id, courses[1].learning_resource_id],
-            COURSE_TYPE,
-            index_types=IndexestoUpdate.reindexing_index.value,
-        )
-        index_learning_resources_mock.si.assert_any_call(
-            [courses[2].learning_resource_id, courses[3].learning_resource_id],
-            COURSE_TYPE,
-            index_types=IndexestoUpdate.reindexing_index.value,
-        )
-        index_learning_resources_mock.si.assert_any_call(
-            [courses[4].learning_resource_id, courses[5].learning_resource_id],
-            COURSE_TYPE,
-            index_types=IndexestoUpdate.reindexing_index.value,
-        )
-
-        index_course_files_mock.si.assert_any_call(
-            [ocw_courses[0].learning_resource_id, ocw_courses[1].learning_resource_id],
-            index_types=IndexestoUpdate.reindexing_index.value,
-        )
-        index_course_files_mock.si.assert_any_call(
-            [ocw_courses[2].learning_resource_id, ocw_courses[3].learning_resource_id],
-            index_types=IndexestoUpdate.reindexing_index.value,
-        )
+        assert chunks == [
+            (
+                COURSE_TYPE,
+                [courses[0].learning_resource_id, courses[1].learning_resource_id],
+            ),
+            (
+                COURSE_TYPE,
+                [courses[2].learning_resource_id, courses[3].learning_resource_id],
+            ),
+            (
+                COURSE_TYPE,
+                [courses[4].learning_resource_id, courses[5].learning_resource_id],
+            ),
+            (
+                CONTENT_FILE_TYPE,
+                [courses[0].learning_resource_id, courses[1].learning_resource_id],
+            ),
+            (
+                CONTENT_FILE_TYPE,
+                [courses[2].learning_resource_id, courses[3].learning_resource_id],
+            ),
+            (
+                CONTENT_FILE_TYPE,
+                [courses[4].learning_resource_id, courses[5].learning_resource_id],
+            ),
+        ]
 
     if PROGRAM_TYPE in indexes:
-        assert index_learning_resources_mock.si.call_count == 2
-        index_learning_resources_mock.si.assert_any_call(
-            [programs[0].learning_resource_id, programs[1].learning_resource_id],
+        assert chunks == [
+            (
+                PROGRAM_TYPE,
+                [programs[0].learning_resource_id, programs[1].learning_resource_id],
+            ),
+            (
+                PROGRAM_TYPE,
+                [programs[2].learning_resource_id, programs[3].learning_resource_id],
+            ),
+        ]
+
+    assert mocked_celery.replace.call_count == 1
+    assert mocked_celery.replace.call_args[0][1] == mocked_celery.chain.return_value
+
+
+def test_start_recreate_index_replaces_unfinished_run(mocker, mocked_celery):
+    """
+    start_recreate_index should drop an unfinished run for the same indexes and the
+    backing indexes it left behind, without touching other runs
+    """
+    stale_backing_indices = {PROGRAM_TYPE: "old", VIDEO_TYPE: "old_video"}
+    stale_run = RecreateIndexRun.objects.create(
+        backing_indices=stale_backing_indices, started_on=now_in_utc()
+    )
+    other_run = RecreateIndexRun.objects.create(
+        backing_indices={COURSE_TYPE: "other"}, started_on=now_in_utc()
+    )
+    mock_delete_backing_indices = mocker.patch(
+        "learning_resources_search.indexing_api.delete_backing_indices"
+    )
+    mocker.patch(
+        "learning_resources_search.indexing_api.create_backing_index",
+        autospec=True,
+        return_value="new",
+    )
+
+    with pytest.raises(mocked_celery.replace_exception_class):
+        start_recreate_index.delay([PROGRAM_TYPE])
+
+    mock_delete_backing_indices.assert_called_once_with(stale_backing_indices)
+    assert not RecreateIndexRun.objects.filter(id=stale_run.id).exists()
+    assert RecreateIndexRun.objects.filter(id=other_run.id).exists()
+
+
+def _recreate_index_chunk_ids(object_type):
+    """Create an object to index for a chunk of an object type, and return its ids"""
+    if object_type == PERCOLATE_INDEX_TYPE:
+        return [PercolateQueryFactory.create(original_query={"q": "math"}, query={}).id]
+    if object_type == CONTENT_FILE_TYPE:
+        content_file = ContentFileFactory.create(published=True, run__published=True)
+        return [content_file.run.learning_resource_id]
+    return [ProgramFactory.create().learning_resource.id]
+
+
+@pytest.mark.parametrize(
+    ("object_type", "api_function", "expected_args", "alias"),
+    [
+        (
+            PERCOLATE_INDEX_TYPE,
+            "index_percolators",
+            (),
+            "testindex_percolator_reindexing",
+        ),
+        (
+            CONTENT_FILE_TYPE,
+            "index_course_content_files",
+            (),
+            "testindex_course_reindexing",
+        ),
+        (
             PROGRAM_TYPE,
-            index_types=IndexestoUpdate.reindexing_index.value,
+            "index_learning_resources",
+            (PROGRAM_TYPE,),
+            "testindex_program_reindexing",
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    ("with_error", "has_objects", "written", "completed"),
+    [
+        (True, True, 0, False),
+        (False, True, 1, True),
+        (False, True, 0, False),
+        (False, False, 0, True),
+    ],
+)
+def test_index_recreate_index_chunk(  # noqa: PLR0913
+    mocker,
+    settings,
+    object_type,
+    api_function,
+    expected_args,
+    alias,
+    with_error,
+    has_objects,
+    written,
+    completed,
+):
+    """
+    index_recreate_index_chunk should index the chunk, and only record that it
+    completed if its documents were written to the reindexing alias
+    """
+    settings.OPENSEARCH_INDEX = "testindex"
+    mocker.patch("learning_resources_search.plugins.tasks.upsert_percolate_query")
+    run = RecreateIndexRun.objects.create(
+        backing_indices={object_type: "backing"}, started_on=now_in_utc()
+    )
+    ids = _recreate_index_chunk_ids(object_type) if has_objects else [12345]
+    chunk = RecreateIndexChunk.objects.create(run=run, object_type=object_type, ids=ids)
+    index_mock = mocker.patch(
+        f"learning_resources_search.indexing_api.{api_function}",
+        side_effect=TabError if with_error else None,
+        return_value={alias: {"documents": written}} if written else {},
+    )
+
+    result = index_recreate_index_chunk.delay(chunk.id).get()
+
+    index_mock.assert_called_once_with(
+        ids, *expected_args, IndexestoUpdate.reindexing_index.value
+    )
+    chunk.refresh_from_db()
+    if completed:
+        assert result is None
+        assert chunk.completed_on is not None
+    else:
+        assert result == chunk.error
+        assert chunk.completed_on is None
+
+
+@pytest.mark.parametrize("alias_exists", [True, False])
+def test_resume_recreate_index(mocker, mocked_celery, alias_exists):
+    """resume_recreate_index should only index the incomplete chunks of the last unfinished run"""
+    backing_indices = {PROGRAM_TYPE: "backing"}
+    RecreateIndexRun.objects.create(
+        backing_indices={PROGRAM_TYPE: "finished"},
+        started_on=now_in_utc(),
+        finished_on=now_in_utc(),
+    )
+    run = RecreateIndexRun.objects.create(
+        backing_indices=backing_indices, started_on=now_in_utc() - timedelta(days=1)
+    )
+    completed, failed, pending = (
+        RecreateIndexChunk.objects.create(
+            run=run, object_type=PROGRAM_TYPE, ids=[idx], **kwargs
         )
-        index_learning_resources_mock.si.assert_any_call(
-            [programs[2].learning_resource_id, programs[3].learning_resource_id],
-            PROGRAM_TYPE,
-            index_types=IndexestoUpdate.reindexing_index.value,
+        for idx, kwargs in enumerate(
+            [{"completed_on": now_in_utc()}, {"error": "error"}, {}]
         )
+    )
+    mocker.patch(
+        "learning_resources_search.indexing_api.reindexing_alias_exists",
+        return_value=alias_exists,
+    )
+    index_chunk_mock = mocker.patch(
+        "learning_resources_search.tasks.index_recreate_index_chunk", autospec=True
+    )
+    finish_recreate_index_mock = mocker.patch(
+        "learning_resources_search.tasks.finish_recreate_index", autospec=True
+    )
 
-    assert mocked_celery.replace.call_count == 1
-    assert mocked_celery.replace.call_args[0][1] == mocked_celery.chain.return_value
+    if alias_exists:
+        with pytest.raises(mocked_celery.replace_exception_class):
+            resume_recreate_index.delay()
+        assert [call.args for call in index_chunk_mock.si.call_args_list] == [
+            (failed.id,),
+            (pending.id,),
+        ]
+        finish_recreate_index_mock.s.assert_called_once_with(backing_indices, run.id)
+        run.refresh_from_db()
+        assert run.started_on > now_in_utc() - timedelta(hours=1)
+    else:
+        assert "has to start over" in resume_recreate_index.delay().get()
+        index_chunk_mock.si.assert_not_called()
+
+
+def test_resume_recreate_index_no_run():
+    """resume_recreate_index should return an error if there is nothing to resume"""
+    assert resume_recreate_index.delay().get() == (
+        "There is no unfinished recreate_index run to resume"
+    )
 
 
 @pytest.mark.parametrize("with_error", [True, False])
@@ -215,53 +409,62 @@ def test_finish_recreate_index(mocker, with_error):
     """
     finish_recreate_index should attach the backing index to the default alias
     """
-    backing_indices = {"course": "backing", "program": "backing"}
+    backing_indices = {"course": "course_backing", "program": "program_backing"}
+    run = RecreateIndexRun.objects.create(
+        backing_indices=backing_indices, started_on=now_in_utc()
+    )
     results = ["error"] if with_error else []
+    calls = mocker.Mock()
     switch_indices_mock = mocker.patch(
         "learning_resources_search.indexing_api.switch_indices", autospec=True
     )
+    finish_bulk_load_mock = mocker.patch(
+        "learning_resources_search.indexing_api.finish_bulk_load", autospec=True
+    )
+    calls.attach_mock(switch_indices_mock, "switch_indices")
+    calls.attach_mock(finish_bulk_load_mock, "finish_bulk_load")
     mock_delete_orphans = mocker.patch(
         "learning_resources_search.indexing_api.delete_orphaned_indices"
     )
 
     if with_error:
         with pytest.raises(ReindexError):
-            finish_recreate_index.delay(results, backing_indices)
+            finish_recreate_index.delay(results, backing_indices, run.id)
         switch_indices_mock.assert_not_called()
-        mock_delete_orphans.assert_called_once()
+        finish_bulk_load_mock.assert_not_called()
     else:
-        finish_recreate_index.delay(results, backing_indices)
-        switch_indices_mock.assert_any_call("backing", COURSE_TYPE)
-        switch_indices_mock.assert_any_call("backing", PROGRAM_TYPE)
-        mock_delete_orphans.assert_not_called()
-
-
-@pytest.mark.parametrize("with_error", [True, False])
-def test_finish_recreate_index_retry_exceptions(mocker, with_error):
+        finish_recreate_index.delay(results, backing_indices, run.id)
+        # all backing indexes are finished before any alias is switched
+        assert calls.mock_calls == [
+            mocker.call.finish_bulk_load("course_backing"),
+            mocker.call.finish_bulk_load("program_backing"),
+            mocker.call.switch_indices("course_backing", COURSE_TYPE),
+            mocker.call.switch_indices("program_backing", PROGRAM_TYPE),
+        ]
+    # the backing indices are kept so a failed run can be resumed
+    mock_delete_orphans.assert_not_called()
+    run.refresh_from_db()
+    assert (run.finished_on is None) is with_error
+
+
+def test_finish_recreate_index_retry_exceptions(mocker):
     """
     finish_recreate_index should be retried on RequestErrors
     """
     backing_indices = {"course": "backing", "program": "backing"}
-    results = ["error"] if with_error else []
     mock_error = RequestError(429, "oops", {})
     switch_indices_mock = mocker.patch(
         "learning_resources_search.indexing_api.switch_indices",
         autospec=True,
         side_effect=[mock_error, None],
     )
-    mock_delete_orphans = mocker.patch(
-        "learning_resources_search.indexing_api.delete_orphaned_indices",
-        side_effect=[mock_error, None],
+    mocker.patch(
+        "learning_resources_search.indexing_api.finish_bulk_load", autospec=True
     )
 
     with pytest.raises(Retry):
-        finish_recreate_index.delay(results, backing_indices)
-    if with_error:
-        switch_indices_mock.assert_not_called()
-        mock_delete_orphans.assert_called_once()
-    else:
-        mock_delete_orphans.assert_not_called()
-        switch_indices_mock.assert_called_once()
+        finish_recreate_index.delay([], backing_indices)
+    switch_indices_mock.assert_called_once()
 
 
 @pytest.mark.usefixtures("_wrap_retry_mock")
@@ -300,10 +503,15 @@ def test_deindex_document(mocker):
 
 @pytest.mark.usefixtures("_wrap_retry_mock")
 @pytest.mark.parametrize("with_error", [True, False])
-def test_bulk_deindex_learning_resources(mocker, with_error):
+@pytest.mark.parametrize("task_ids", [[], ["node:1"]])
+def test_bulk_deindex_learning_resources(mocker, with_error, task_ids):
     """deindex_learning_resources task should call corresponding indexing api function"""
     indexing_api_deindex_mock = mocker.patch(
-        "learning_resources_search.indexing_api.deindex_learning_resources"
+        "learning_resources_search.indexing_api.deindex_learning_resources",
+        return_value=(task_ids, [5] if task_ids else []),
+    )
+    wait_mock = mocker.patch(
+        "learning_resources_search.tasks.wait_for_delete_by_query.delay"
     )
 
     if with_error:
@@ -314,6 +522,133 @@ def test_bulk_deindex_learning_resources(mocker, with_error):
     )
 
     indexing_api_deindex_mock.assert_called_once_with([1], COURSE_TYPE)
+    if task_ids and not with_error:
+        wait_mock.assert_called_once_with(task_ids, [5])
+    else:
+        wait_mock.assert_not_called()
+
+
+@pytest.fixture()
+def mock_flush_lock(mocker):
+    """Mock the redis lock held while flushing queued upserts"""
+    lock = mocker.patch(
+        "learning_resources_search.indexing_api.learning_resource_upserts_flush_lock"
+    )
+    lock.return_value.__enter__.return_value = True
+    return lock
+
+
+@pytest.mark.usefixtures("mock_flush_lock")
+@pytest.mark.parametrize("with_error", [True, False])
+def test_flush_learning_resource_upserts(mocker, settings, with_error):
+    """flush_learning_resource_upserts should bulk index the queued published resources"""
+    settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 2
+    courses = LearningResourceFactory.create_batch(3, is_course=True)
+    unpublished = LearningResourceFactory.create(is_course=True, published=False)
+    queued = {
+        COURSE_TYPE: [
+            [courses[0].id, courses[1].id],
+            [courses[2].id, unpublished.id],
+            [],
+        ]
+    }
+    mock_pop = mocker.patch(
+        "learning_resources_search.indexing_api.pop_queued_learning_resource_upserts",
+        side_effect=lambda resource_type, _count: (
+            queued[resource_type].pop(0) if resource_type in queued else []
+        ),
+    )
+    mock_queue = mocker.patch(
+        "learning_resources_search.indexing_api.queue_learning_resource_upserts"
+    )
+    mock_index = mocker.patch(
+        "learning_resources_search.indexing_api.index_learning_resources",
+        side_effect=ConnectionTimeout("N/A", "timeout", None) if with_error else None,
+    )
+    mocker.patch(
+        "learning_resources_search.indexing_api.pop_queued_learning_resource_percolations",
+        return_value=[],
+    )
+    mock_queue_percolations = mocker.patch(
+        "learning_resources_search.indexing_api.queue_learning_resource_percolations"
+    )
+    mock_percolate = mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents"
+    )
+
+    if with_error:
+        with pytest.raises(Retry):
+            flush_learning_resource_upserts.delay()
+        mock_queue.assert_called_once_with([courses[0].id, courses[1].id], COURSE_TYPE)
+        mock_queue_percolations.assert_called_once_with([], COURSE_TYPE)
+    else:
+        result = flush_learning_resource_upserts.delay().get()
+        assert result == {COURSE_TYPE: 3}
+        assert mock_index.call_count == 2
+        assert sorted(mock_index.call_args_list[1].args[0]) == [courses[2].id]
+        mock_pop.assert_any_call(COURSE_TYPE, 2)
+        mock_queue.assert_not_called()
+    mock_percolate.assert_not_called()
+
+
+@pytest.mark.usefixtures("mock_flush_lock")
+@pytest.mark.parametrize("with_error", [True, False])
+def test_flush_learning_resource_upserts_percolate(mocker, settings, with_error):
+    """flush_learning_resource_upserts should percolate queued resources in bulk after indexing them"""
+    settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 2
+    queued = {COURSE_TYPE: [[1, 2], [3], []]}
+    mocker.patch(
+        "learning_resources_search.indexing_api.pop_queued_learning_resource_percolations",
+        side_effect=lambda resource_type, _count: (
+            queued[resource_type].pop(0) if resource_type in queued else []
+        ),
+    )
+    mocker.patch(
+        "learning_resources_search.indexing_api.pop_queued_learning_resource_upserts",
+        return_value=[],
+    )
+    mock_queue_percolations = mocker.patch(
+        "learning_resources_search.indexing_api.queue_learning_resource_percolations"
+    )
+    mock_percolate = mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents",
+        side_effect=[None, ConnectionTimeout("N/A", "timeout", None)]
+        if with_error
+        else None,
+    )
+
+    if with_error:
+        with pytest.raises(Retry):
+            flush_learning_resource_upserts.delay()
+        mock_queue_percolations.assert_called_once_with([3], COURSE_TYPE)
+    else:
+        assert flush_learning_resource_upserts.delay().get() == {}
+        mock_queue_percolations.assert_not_called()
+    assert [call.args[0] for call in mock_percolate.call_args_list] == [[1, 2], [3]]
+
+
+def test_flush_learning_resource_upserts_locked(mocker, mock_flush_lock):
+    """flush_learning_resource_upserts should leave the queues alone while another flush runs"""
+    mock_flush_lock.return_value.__enter__.return_value = False
+    mock_pop = mocker.patch(
+        "learning_resources_search.indexing_api.pop_queued_learning_resource_upserts"
+    )
+    mock_pop_percolations = mocker.patch(
+        "learning_resources_search.indexing_api.pop_queued_learning_resource_percolations"
+    )
+
+    assert flush_learning_resource_upserts.delay().get() == {}
+    mock_pop.assert_not_called()
+    mock_pop_percolations.assert_not_called()
+
+
+def test_percolate_learning_resources(mocker):
+    """percolate_learning_resources should percolate the resources with one bulk request"""
+    mock_percolate = mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents"
+    )
+    percolate_learning_resources.delay([1, 2, 3])
+    mock_percolate.assert_called_once_with([1, 2, 3])
 
 
 @pytest.mark.parametrize(
@@ -366,10 +701,10 @@ def test_start_update_index(mocker, mocked_celery, indexes, etl_source, settings
         )
         unpublished_program = ProgramFactory.create(is_unpublished=True)
 
-    index_learning_resources_mock = mocker.patch(
-        "learning_resources_search.tasks.index_learning_resources", autospec=True
+    update_learning_resources_mock = mocker.patch(
+        "learning_resources_search.tasks.update_learning_resources", autospec=True
     )
-    deindex_learning_resources_mock = mocker.patch(
+    deupdate_learning_resources_mock = mocker.patch(
         "learning_resources_search.tasks.bulk_deindex_learning_resources", autospec=True
     )
 
@@ -390,49 +725,52 @@ def test_start_update_index(mocker, mocked_celery, indexes, etl_source, settings
         mock_blocklist.assert_called_once()
 
         if etl_source:
-            assert index_learning_resources_mock.si.call_count == 1
+            assert update_learning_resources_mock.si.call_count == 1
             course = next(
                 course
                 for course in courses
                 if course.learning_resource.etl_source == etl_source
             )
-            index_learning_resources_mock.si.assert_any_call(
+            update_learning_resources_mock.si.assert_any_call(
                 [course.learning_resource_id],
                 COURSE_TYPE,
-                index_types=IndexestoUpdate.current_index.value,
+                None,
+                force=False,
             )
 
-            assert deindex_learning_resources_mock.si.call_count == 1
+            assert deupdate_learning_resources_mock.si.call_count == 1
             unpublished_course = next(
                 course
                 for course in unpublished_courses
                 if course.learning_resource.etl_source == etl_source
             )
-            deindex_learning_resources_mock.si.assert_any_call(
+            deupdate_learning_resources_mock.si.assert_any_call(
                 [unpublished_course.learning_resource_id], COURSE_TYPE
             )
         else:
-            assert index_learning_resources_mock.si.call_count == 2
-            index_learning_resources_mock.si.assert_any_call(
+            assert update_learning_resources_mock.si.call_count == 2
+            update_learning_resources_mock.si.assert_any_call(
                 [courses[0].learning_resource_id, courses[1].learning_resource_id],
                 COURSE_TYPE,
-                index_types=IndexestoUpdate.current_index.value,
+                None,
+                force=False,
             )
-            index_learning_resources_mock.si.assert_any_call(
+            update_learning_resources_mock.si.assert_any_call(
                 [courses[2].learning_resource_id, courses[3].learning_resource_id],
                 COURSE_TYPE,
-                index_types=IndexestoUpdate.current_index.value,
+                None,
+                force=False,
             )
 
-            assert deindex_learning_resources_mock.si.call_count == 2
-            deindex_learning_resources_mock.si.assert_any_call(
+            assert deupdate_learning_resources_mock.si.call_count == 2
+            deupdate_learning_resources_mock.si.assert_any_call(
                 [
                     unpublished_courses[0].learning_resource_id,
                     unpublished_courses[1].learning_resource_id,
                 ],
                 COURSE_TYPE,
             )
-            deindex_learning_resources_mock.si.assert_any_call(
+            deupdate_learning_resources_mock.si.assert_any_call(
                 [
                     unpublished_courses[2].learning_resource_id,
                     unpublished_courses[3].learning_resource_id,
@@ -441,20 +779,22 @@ def test_start_update_index(mocker, mocked_celery, indexes, etl_source, settings
             )
 
     if PROGRAM_TYPE in indexes:
-        assert index_learning_resources_mock.si.call_count == 2
-        index_learning_resources_mock.si.assert_any_call(
+        assert update_learning_resources_mock.si.call_count == 2
+        update_learning_resources_mock.si.assert_any_call(
             [programs[0].learning_resource_id, programs[1].learning_resource_id],
             PROGRAM_TYPE,
-            index_types=IndexestoUpdate.current_index.value,
+            None,
+            force=False,
         )
-        index_learning_resources_mock.si.assert_any_call(
+        update_learning_resources_mock.si.assert_any_call(
             [programs[2].learning_resource_id, programs[3].learning_resource_id],
             PROGRAM_TYPE,
-            index_types=IndexestoUpdate.current_index.value,
+            None,
+            force=False,
         )
 
-        assert deindex_learning_resources_mock.si.call_count == 1
-        deindex_learning_resources_mock.si.assert_any_call(
+        assert deupdate_learning_resources_mock.si.call_count == 1
+        deupdate_learning_resources_mock.si.assert_any_call(
             [unpublished_program.learning_resource_id], PROGRAM_TYPE
         )
 
@@ -478,7 +818,95 @@ def test_start_update_index(mocker, mocked_celery, indexes, etl_source, settings
             assert index_course_content_mock.si.call_count == 2
 
     assert mocked_celery.replace.call_count == 1
-    assert mocked_celery.replace.call_args[0][1] == mocked_celery.group.return_value
+    assert mocked_celery.replace.call_args[0][1] == mocked_celery.chain.return_value
+
+
+@pytest.mark.parametrize("full", [True, False])
+def test_start_update_index_since_watermark(mocker, mocked_celery, settings, full):
+    """
+    start_update_index should only deindex the unpublished resources changed since the
+    last update_index run, and pass the watermark on to the update tasks
+    """
+    settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 10
+    indexed_at = now_in_utc() - timedelta(days=1)
+    IndexingWatermark.objects.create(object_type=PROGRAM_TYPE, indexed_at=indexed_at)
+    programs = sorted(
+        ProgramFactory.create_batch(2), key=lambda program: program.learning_resource_id
+    )
+    old_unpublished, new_unpublished = ProgramFactory.create_batch(
+        2, is_unpublished=True
+    )
+    old_resource = old_unpublished.learning_resource
+    for queryset in [
+        LearningResource.objects.filter(id=old_resource.id),
+        old_resource.runs.all(),
+        old_resource.topics.all(),
+        old_resource.children.all(),
+        old_resource.departments.all(),
+        LearningResourceOfferor.objects.filter(learningresource=old_resource),
+        LearningResourceInstructor.objects.filter(runs__learning_resource=old_resource),
+    ]:
+        queryset.update(updated_on=indexed_at - timedelta(days=1))
+    update_mock = mocker.patch(
+        "learning_resources_search.tasks.update_learning_resources", autospec=True
+    )
+    deindex_mock = mocker.patch(
+        "learning_resources_search.tasks.bulk_deindex_learning_resources", autospec=True
+    )
+    finish_mock = mocker.patch(
+        "learning_resources_search.tasks.finish_update_index", autospec=True
+    )
+    mocker.patch("learning_resources_search.tasks.now_in_utc", return_value=indexed_at)
+
+    with pytest.raises(mocked_celery.replace_exception_class):
+        start_update_index.delay([PROGRAM_TYPE], None, full=full)
+
+    since = None if full else (indexed_at - UPDATE_INDEX_WATERMARK_OVERLAP).isoformat()
+    update_mock.si.assert_called_once_with(
+        [program.learning_resource_id for program in programs],
+        PROGRAM_TYPE,
+        since,
+        force=full,
+    )
+    deindex_mock.si.assert_called_once_with(
+        sorted(
+            [new_unpublished.learning_resource_id]
+            + ([old_unpublished.learning_resource_id] if full else [])
+        ),
+        PROGRAM_TYPE,
+    )
+    finish_mock.s.assert_called_once_with([PROGRAM_TYPE], indexed_at.isoformat())
+
+
+@pytest.mark.parametrize("with_error", [True, False])
+def test_finish_update_index(with_error):
+    """finish_update_index should total the counts and advance the watermarks if there were no errors"""
+    started_at = now_in_utc()
+    IndexingWatermark.objects.create(
+        object_type=COURSE_TYPE, indexed_at=started_at - timedelta(days=1)
+    )
+    results = [
+        {"sent": 2, "skipped": 3},
+        [None, {"sent": 1, "skipped": 0}],
+        *(["update_learning_resources threw an error"] if with_error else []),
+    ]
+
+    result = finish_update_index.delay(
+        results, [COURSE_TYPE, PROGRAM_TYPE], started_at.isoformat()
+    ).get()
+
+    assert result == {
+        "errors": ["update_learning_resources threw an error"] if with_error else [],
+        "sent": 3,
+        "skipped": 3,
+    }
+    watermarks = dict(
+        IndexingWatermark.objects.values_list("object_type", "indexed_at")
+    )
+    if with_error:
+        assert watermarks == {COURSE_TYPE: started_at - timedelta(days=1)}
+    else:
+        assert watermarks == {COURSE_TYPE: started_at, PROGRAM_TYPE: started_at}
 
 
 def test_upsert_content_file_task(mocked_api):
@@ -548,8 +976,13 @@ def test_index_run_content_files(mocker, with_error, index_types):
 @pytest.mark.parametrize("unpublished_only", [True, False])
 def test_delete_run_content_files(mocker, with_error, unpublished_only):
     """deindex_run_content_files should call the api function of the same name"""
+    task_ids = [] if unpublished_only else ["node:1"]
     deindex_run_content_files_mock = mocker.patch(
-        "learning_resources_search.indexing_api.deindex_run_content_files"
+        "learning_resources_search.indexing_api.deindex_run_content_files",
+        return_value=(task_ids, [5] if task_ids else []),
+    )
+    wait_mock = mocker.patch(
+        "learning_resources_search.tasks.wait_for_delete_by_query.delay"
     )
     if with_error:
         deindex_run_content_files_mock.side_effect = TabError
@@ -561,3 +994,58 @@ def test_delete_run_content_files(mocker, with_error, unpublished_only):
     assert result == (
         "deindex_run_content_files threw an error" if with_error else None
     )
+    if task_ids and not with_error:
+        wait_mock.assert_called_once_with(task_ids, [5])
+    else:
+        wait_mock.assert_not_called()
+
+
+@pytest.mark.usefixtures("_wrap_retry_mock")
+@pytest.mark.parametrize("content_file_ids", [None, [1, 2]])
+@pytest.mark.parametrize("failures", [[], [{"id": "x"}]])
+def test_wait_for_delete_by_query(mocker, failures, content_file_ids):
+    """
+    wait_for_delete_by_query should delete the content files, deindexing them one by
+    one if the tasks had failures, and return the status of completed tasks and bump
+    the search cache generation
+    """
+    status = {"completed": True, "deleted": 3, "failures": failures}
+    status_mock = mocker.patch(
+        "learning_resources_search.indexing_api.get_delete_by_query_status",
+        return_value=status,
+    )
+    finish_mock = mocker.patch(
+        "learning_resources_search.indexing_api.finish_deleting_content_files"
+    )
+    bump_mock = mocker.patch(
+        "learning_resources_search.tasks.bump_search_cache_generation"
+    )
+
+    assert wait_for_delete_by_query.delay(["node:1"], content_file_ids).get() == status
+    status_mock.assert_called_once_with(["node:1"])
+    if content_file_ids:
+        finish_mock.assert_called_once_with(content_file_ids, deindex=bool(failures))
+    else:
+        finish_mock.assert_not_called()
+    bump_mock.assert_called_once_with()
+
+
+@pytest.mark.usefixtures("_wrap_retry_mock")
+def test_wait_for_delete_by_query_incomplete(mocker, settings):
+    """wait_for_delete_by_query should poll again later if the tasks are running"""
+    settings.OPENSEARCH_DELETE_BY_QUERY_POLL_INTERVAL = 30
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_delete_by_query_status",
+        return_value={"completed": False, "deleted": 1, "failures": []},
+    )
+    finish_mock = mocker.patch(
+        "learning_resources_search.indexing_api.finish_deleting_content_files"
+    )
+    bump_mock = mocker.patch(
+        "learning_resources_search.tasks.bump_search_cache_generation"
+    )
+
+    with pytest.raises(Retry, match="Retry in 30s"):
+        wait_for_delete_by_query.delay(["node:1"], [1]).get()
+    finish_mock.assert_not_called()
+    bump_mock.assert_not_called()
@@ -0,0 +1,136 @@
+"""Per-phase latency instrumentation for search requests"""
+
+import json
+import logging
+import random
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+log = logging.getLogger(__name__)
+
+# Server-Timing metric names, in the order the phases of a search happen
+VALIDATE_PHASE = "validate"
+CACHE_PHASE = "cache"
+CONSTRUCT_PHASE = "construct"
+OPENSEARCH_PHASE = "opensearch"
+OPENSEARCH_TOOK = "took"
+NETWORK_PHASE = "network"
+SUGGEST_PHASE = "suggest"
+SERIALIZE_PHASE = "serialize"
+RENDER_PHASE = "render"
+TOTAL = "total"
+
+
+class SearchTimer:
+    """
+    Collects how long each phase of a search request takes, in milliseconds
+    """
+
+    def __init__(self):
+        self.start = time.monotonic()
+        self.timings = {}
+        self.query = None
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time a phase of the search, adding to its time if it runs more than once
+
+        Args:
+            name (str): The name of the phase
+        """
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, (time.monotonic() - start) * 1000)
+
+    def record(self, name, milliseconds):
+        """
+        Record a timing that was measured elsewhere
+
+        Args:
+            name (str): The name of the timing
+            milliseconds (float): The time taken in milliseconds
+        """
+        self.timings[name] = self.timings.get(name, 0) + milliseconds
+
+    def record_opensearch_response(self, response):
+        """
+        Split the time spent waiting on OpenSearch into the time it reported
+        searching for and the network/transport overhead around it
+
+        Args:
+            response (dict): The opensearch response dict
+        """
+        took = response.get("took") if isinstance(response, dict) else None
+        if took is None or OPENSEARCH_PHASE not in self.timings:
+            return
+        self.record(OPENSEARCH_TOOK, took)
+        self.record(NETWORK_PHASE, max(0, self.timings[OPENSEARCH_PHASE] - took))
+
+    @property
+    def total(self):
+        """The milliseconds elapsed since the timer was created"""
+        return (time.monotonic() - self.start) * 1000
+
+    def fields(self):
+        """
+        Get the timings as structured log fields
+
+        Returns:
+            dict: The milliseconds each phase took, plus the total
+        """
+        return {
+            **{name: round(value, 2) for name, value in self.timings.items()},
+            TOTAL: round(self.total, 2),
+        }
+
+    def server_timing(self):
+        """
+        Get the timings as a Server-Timing header value
+
+        Returns:
+            str: The Server-Timing header value
+        """
+        return ", ".join(f"{name};dur={value}" for name, value in self.fields().items())
+
+
+def log_search_timings(timer, endpoint, response_bytes=None):
+    """
+    Log the timings of a search, and the query it ran for a sample of the
+    searches slower than OPENSEARCH_SLOW_QUERY_THRESHOLD_MS
+
+    Args:
+        timer (SearchTimer): The timer for the search
+        endpoint (str): The search endpoint
+        response_bytes (int): The size of the rendered response, if known
+    """
+    fields = timer.fields()
+    log.info(
+        "Search timings for %s: %s, %s response bytes",
+        endpoint,
+        fields,
+        response_bytes,
+        extra={
+            "search_endpoint": endpoint,
+            "search_timings": fields,
+            "search_response_bytes": response_bytes,
+        },
+    )
+    threshold = settings.OPENSEARCH_SLOW_QUERY_THRESHOLD_MS
+    if (
+        threshold
+        and fields[TOTAL] >= threshold
+        and timer.query is not None
+        and random.randrange(100) < settings.OPENSEARCH_SLOW_QUERY_SAMPLE_PERCENT  # noqa: S311
+    ):
+        log.warning(
+            "Slow search for %s took %.2f ms: %s",
+            endpoint,
+            fields[TOTAL],
+            json.dumps(timer.query, default=str),
+            extra={"search_endpoint": endpoint, "search_timings": fields},
+        )
@@ -0,0 +1,99 @@
+"""Tests for search timing instrumentation"""
+
+import pytest
+
+from learning_resources_search import timing
+from learning_resources_search.timing import SearchTimer, log_search_timings
+
+
+@pytest.fixture()
+def mock_clock(mocker):
+    """Mock the clock used to time search phases"""
+    return mocker.patch("learning_resources_search.timing.time.monotonic")
+
+
+def test_search_timer(mock_clock):
+    """SearchTimer should record each phase and split OpenSearch time by took"""
+    mock_clock.side_effect = [
+        10.0,
+        10.001,
+        10.003,
+        10.004,
+        10.024,
+        10.025,
+        10.035,
+        10.035,
+    ]
+    timer = SearchTimer()
+    with timer.phase(timing.VALIDATE_PHASE):
+        pass
+    with timer.phase(timing.OPENSEARCH_PHASE):
+        pass
+    timer.record_opensearch_response({"took": 15})
+    with timer.phase(timing.SERIALIZE_PHASE):
+        pass
+
+    assert timer.fields() == {
+        "validate": 2.0,
+        "opensearch": 20.0,
+        "took": 15,
+        "network": 5.0,
+        "serialize": 10.0,
+        "total": 35.0,
+    }
+    mock_clock.side_effect = [10.035]
+    assert timer.server_timing() == (
+        "validate;dur=2.0, opensearch;dur=20.0, took;dur=15, network;dur=5.0,"
+        " serialize;dur=10.0, total;dur=35.0"
+    )
+
+
+def test_search_timer_cached_response():
+    """SearchTimer should skip took and network if OpenSearch wasn't called"""
+    timer = SearchTimer()
+    timer.record_opensearch_response({"took": 15})
+    assert list(timer.fields()) == ["total"]
+
+
+@pytest.mark.parametrize(
+    ("total", "sample", "is_logged"),
+    [(1500, 5, True), (1500, 50, False), (500, 5, False)],
+)
+def test_log_search_timings(mocker, settings, total, sample, is_logged):
+    """Slow searches should be sampled into the slow search log with their query"""
+    settings.OPENSEARCH_SLOW_QUERY_THRESHOLD_MS = 1000
+    settings.OPENSEARCH_SLOW_QUERY_SAMPLE_PERCENT = 10
+    mocker.patch(
+        "learning_resources_search.timing.random.randrange", return_value=sample
+    )
+    mock_log = mocker.patch("learning_resources_search.timing.log")
+    timer = SearchTimer()
+    timer.query = {"index": ["course"], "body": {"query": {"match_all": {}}}}
+    mocker.patch.object(SearchTimer, "total", total)
+
+    log_search_timings(timer, "learning_resource", response_bytes=2048)
+
+    mock_log.info.assert_called_once_with(
+        "Search timings for %s: %s, %s response bytes",
+        "learning_resource",
+        {"total": total},
+        2048,
+        extra={
+            "search_endpoint": "learning_resource",
+            "search_timings": {"total": total},
+            "search_response_bytes": 2048,
+        },
+    )
+    if is_logged:
+        mock_log.warning.assert_called_once_with(
+            "Slow search for %s took %.2f ms: %s",
+            "learning_resource",
+            total,
+            '{"index": ["course"], "body": {"query": {"match_all": {}}}}',
+            extra={
+                "search_endpoint": "learning_resource",
+                "search_timings": {"total": total},
+            },
+        )
+    else:
+        mock_log.warning.assert_not_called()
@@ -5,7 +5,10 @@ from rest_framework.routers import SimpleRouter
 
 from learning_resources_search.views import (
     ContentFileSearchView,
+    LearningResourcesAutocompleteView,
+    LearningResourcesBatchSearchView,
     LearningResourcesSearchView,
+    ResourceContentFileSearchView,
     UserSearchSubscriptionViewSet,
 )
 
@@ -23,6 +26,21 @@ v1_urls = [
         LearningResourcesSearchView.as_view(),
         name="learning_resources_search",
     ),
+    path(
+        r"learning_resources_search/batch/",
+        LearningResourcesBatchSearchView.as_view(),
+        name="learning_resources_search_batch",
+    ),
+    path(
+        r"learning_resources_search/autocomplete/",
+        LearningResourcesAutocompleteView.as_view(),
+        name="learning_resources_search_autocomplete",
+    ),
+    path(
+        r"content_file_search/<int:resource_id>/",
+        ResourceContentFileSearchView.as_view(),
+        name="resource_content_file_search",
+    ),
     re_path(
         r"content_file_search/",
         ContentFileSearchView.as_view(),
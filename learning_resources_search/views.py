@@ -16,24 +16,60 @@ from rest_framework.views import APIView
 from authentication.decorators import blocked_ip_exempt
 from learning_resources_search.api import (
     adjust_original_query_for_percolate,
+    execute_autocomplete,
     execute_learn_search,
+    execute_learn_searches,
     subscribe_user_to_search_query,
     unsubscribe_user_from_percolate_query,
 )
-from learning_resources_search.constants import CONTENT_FILE_TYPE, LEARNING_RESOURCE
+from learning_resources_search.constants import (
+    CARD_VIEW,
+    CONTENT_FILE_TYPE,
+    LEARNING_RESOURCE,
+)
 from learning_resources_search.models import PercolateQuery
 from learning_resources_search.serializers import (
+    AutocompleteRequestSerializer,
+    AutocompleteResponseSerializer,
     ContentFileSearchRequestSerializer,
     ContentFileSearchResponseSerializer,
+    LearningResourcesBatchSearchRequestSerializer,
     LearningResourceSearchResponseSerializer,
     LearningResourcesSearchRequestSerializer,
     PercolateQuerySerializer,
+    ResourceContentFileSearchRequestSerializer,
     SearchResponseSerializer,
 )
+from learning_resources_search.timing import (
+    RENDER_PHASE,
+    SERIALIZE_PHASE,
+    VALIDATE_PHASE,
+    SearchTimer,
+    log_search_timings,
+)
 
 log = logging.getLogger(__name__)
 
 
+def flatten_errors(errors):
+    """
+    Flatten the errors for list params, which are keyed by list index, into a
+    list of unique errors for each param
+
+    Args:
+        errors (dict): The search request serializer errors
+
+    Returns:
+        dict: The errors for each param
+    """
+    return {
+        key: errors_obj
+        if isinstance(errors_obj, list)
+        else list(set(chain(*errors_obj.values())))
+        for key, errors_obj in errors.items()
+    }
+
+
 class ESView(APIView):
     """
     Parent class for views that execute ES searches
@@ -47,6 +83,54 @@ class ESView(APIView):
             return Response(status=exc.status_code)
         raise exc
 
+    def timed_response(self, data, endpoint, timer):
+        """
+        Build the response for a search, recording how long each phase took,
+        including rendering, in a Server-Timing header and the logs along with
+        the size of the rendered response
+
+        Args:
+            data (dict or list): The serialized search response data
+            endpoint (str): The search endpoint to log the timings for
+            timer (SearchTimer): The timer for the search
+
+        Returns:
+            Response: The search response
+        """
+        response = Response(data)
+        render_start = timer.total
+
+        def log_rendered(rendered):
+            timer.record(RENDER_PHASE, timer.total - render_start)
+            rendered["Server-Timing"] = timer.server_timing()
+            log_search_timings(timer, endpoint, response_bytes=len(rendered.content))
+
+        response.add_post_render_callback(log_rendered)
+        return response
+
+    def timed_search_response(self, request, search_params, endpoint, timer):
+        """
+        Execute a search and serialize its results, recording how long each
+        phase took in a Server-Timing header and the logs
+
+        Args:
+            request (Request): The search request
+            search_params (dict): The validated search request serializer data
+            endpoint (str): The search endpoint
+            timer (SearchTimer): The timer for the search
+
+        Returns:
+            Response: The serialized search response
+        """
+        response = execute_learn_search(
+            search_params | {"endpoint": endpoint}, timer=timer
+        )
+        with timer.phase(SERIALIZE_PHASE):
+            data = SearchResponseSerializer(response, context={"request": request}).data
+        if search_params.get("view") == CARD_VIEW:
+            endpoint = f"{endpoint}_{CARD_VIEW}"
+        return self.timed_response(data, endpoint, timer)
+
 
 @method_decorator(blocked_ip_exempt, name="dispatch")
 @extend_schema_view(
@@ -65,25 +149,108 @@ class LearningResourcesSearchView(ESView):
 
     @extend_schema(summary="Search")
     def get(self, request):
-        request_data = LearningResourcesSearchRequestSerializer(data=request.GET)
+        timer = SearchTimer()
+        with timer.phase(VALIDATE_PHASE):
+            request_data = LearningResourcesSearchRequestSerializer(data=request.GET)
+            is_valid = request_data.is_valid()
 
-        if request_data.is_valid():
-            response = execute_learn_search(
-                request_data.data | {"endpoint": LEARNING_RESOURCE}
-            )
-            return Response(
-                SearchResponseSerializer(response, context={"request": request}).data
+        if is_valid:
+            return self.timed_search_response(
+                request, request_data.data, LEARNING_RESOURCE, timer
             )
         else:
-            errors = {}
-            for key, errors_obj in request_data.errors.items():
-                if isinstance(errors_obj, list):
-                    errors[key] = errors_obj
-                else:
-                    errors[key] = list(set(chain(*errors_obj.values())))
+            errors = flatten_errors(request_data.errors)
             return Response(errors, status=400)
 
 
+@method_decorator(blocked_ip_exempt, name="dispatch")
+@extend_schema_view(
+    post=extend_schema(
+        request=LearningResourcesBatchSearchRequestSerializer(),
+        responses=LearningResourceSearchResponseSerializer(many=True),
+    ),
+)
+@action(methods=["POST"], detail=False, name="Batch Search Learning Resources")
+class LearningResourcesBatchSearchView(ESView):
+    """
+    Run several learning resource searches at once
+    """
+
+    permission_classes = ()
+
+    @extend_schema(summary="Batch search")
+    def post(self, request):
+        """
+        Run each search with one multisearch request. The results have no
+        next/previous links, pages are requested from the search endpoint. A
+        search that fails has an error in place of its results.
+        """
+        timer = SearchTimer()
+        with timer.phase(VALIDATE_PHASE):
+            request_data = LearningResourcesBatchSearchRequestSerializer(
+                data=request.data
+            )
+            is_valid = request_data.is_valid()
+
+        if is_valid:
+            responses = execute_learn_searches(
+                [
+                    search_params | {"endpoint": LEARNING_RESOURCE}
+                    for search_params in request_data.data["searches"]
+                ],
+                timer=timer,
+            )
+            with timer.phase(SERIALIZE_PHASE):
+                data = [
+                    response
+                    if "error" in response
+                    else SearchResponseSerializer(response).data
+                    for response in responses
+                ]
+            return self.timed_response(data, f"{LEARNING_RESOURCE}_batch", timer)
+        else:
+            errors = request_data.errors.get("searches")
+            if isinstance(errors, list):
+                errors = [flatten_errors(search_errors) for search_errors in errors]
+            return Response({"searches": errors}, status=400)
+
+
+@method_decorator(blocked_ip_exempt, name="dispatch")
+@extend_schema_view(
+    get=extend_schema(
+        parameters=[AutocompleteRequestSerializer()],
+        responses=AutocompleteResponseSerializer(),
+    ),
+)
+@action(methods=["GET"], detail=False, name="Autocomplete Learning Resources")
+class LearningResourcesAutocompleteView(ESView):
+    """
+    Suggest learning resource titles, course numbers, topics and instructors
+    starting with some text
+    """
+
+    permission_classes = ()
+
+    @extend_schema(summary="Autocomplete")
+    def get(self, request):
+        timer = SearchTimer()
+        with timer.phase(VALIDATE_PHASE):
+            request_data = AutocompleteRequestSerializer(data=request.GET)
+            is_valid = request_data.is_valid()
+
+        if is_valid:
+            suggestions = execute_autocomplete(
+                request_data.validated_data["q"],
+                request_data.validated_data["limit"],
+                timer=timer,
+            )
+            return self.timed_response(
+                {"suggestions": suggestions}, "autocomplete", timer
+            )
+        else:
+            return Response(request_data.errors, status=400)
+
+
 @extend_schema_view(
     list=extend_schema(
         summary="List subscribed queries",
@@ -162,12 +329,7 @@ class UserSearchSubscriptionViewSet(mixins.ListModelMixin, viewsets.GenericViewS
             )
             return Response(PercolateQuerySerializer(percolate_query).data)
         else:
-            errors = {}
-            for key, errors_obj in request_data.errors.items():
-                if isinstance(errors_obj, list):
-                    errors[key] = errors_obj
-                else:
-                    errors[key] = list(set(chain(*errors_obj.values())))
+            errors = flatten_errors(request_data.errors)
             return Response(errors, status=400)
 
     @extend_schema(
@@ -218,20 +380,55 @@ class ContentFileSearchView(ESView):
 
     @extend_schema(summary="Search")
     def get(self, request):
-        request_data = ContentFileSearchRequestSerializer(data=request.GET)
-        if request_data.is_valid():
-            response = execute_learn_search(
-                request_data.data | {"endpoint": CONTENT_FILE_TYPE}
-            )
-            return Response(
-                SearchResponseSerializer(response, context={"request": request}).data
+        timer = SearchTimer()
+        with timer.phase(VALIDATE_PHASE):
+            request_data = ContentFileSearchRequestSerializer(data=request.GET)
+            is_valid = request_data.is_valid()
+        if is_valid:
+            return self.timed_search_response(
+                request, request_data.data, CONTENT_FILE_TYPE, timer
             )
         else:
-            errors = {}
-            for key, errors_obj in request_data.errors.items():
-                if isinstance(errors_obj, list):
-                    errors[key] = errors_obj
-                else:
-                    errors[key] = list(set(chain(*errors_obj.values())))
+            errors = flatten_errors(request_data.errors)
+
+            return Response(errors, status=400)
+
+
+@method_decorator(blocked_ip_exempt, name="dispatch")
+@extend_schema_view(
+    get=extend_schema(
+        operation_id="content_file_search_resource_retrieve",
+        parameters=[
+            OpenApiParameter(
+                name="resource_id", type=int, location=OpenApiParameter.PATH
+            ),
+            ResourceContentFileSearchRequestSerializer(),
+        ],
+        responses=ContentFileSearchResponseSerializer(),
+    ),
+)
+@action(methods=["GET"], detail=False, name="Search Content Files of a Resource")
+class ResourceContentFileSearchView(ESView):
+    """
+    Search for the content files of a learning resource. The search is routed
+    to the shard holding the resource's content files.
+    """
+
+    permission_classes = ()
 
+    @extend_schema(summary="Search within a learning resource")
+    def get(self, request, resource_id):
+        timer = SearchTimer()
+        with timer.phase(VALIDATE_PHASE):
+            request_data = ResourceContentFileSearchRequestSerializer(data=request.GET)
+            is_valid = request_data.is_valid()
+        if is_valid:
+            return self.timed_search_response(
+                request,
+                request_data.data | {"resource_id": [resource_id]},
+                CONTENT_FILE_TYPE,
+                timer,
+            )
+        else:
+            errors = flatten_errors(request_data.errors)
             return Response(errors, status=400)
@@ -37,6 +37,20 @@ def learning_resources_search_view():
     return SimpleNamespace(url=reverse("lr_search:v1:learning_resources_search"))
 
 
+@pytest.fixture()
+def learning_resources_batch_search_view():
+    """Fixture with relevant properties for testing the batch search view"""
+    return SimpleNamespace(url=reverse("lr_search:v1:learning_resources_search_batch"))
+
+
+@pytest.fixture()
+def learning_resources_autocomplete_view():
+    """Fixture with relevant properties for testing the autocomplete view"""
+    return SimpleNamespace(
+        url=reverse("lr_search:v1:learning_resources_search_autocomplete")
+    )
+
+
 @pytest.fixture()
 def content_file_search_view():
     """Fixture with relevant properties for testing the search view"""
@@ -77,8 +91,10 @@ def test_learn_resources_search(mocker, client, learning_resources_search_view):
     resp = client.get(learning_resources_search_view.url, params)
     search_mock.assert_called_once_with(
         LearningResourcesSearchRequestSerializer(params).data
-        | {"endpoint": LEARNING_RESOURCE}
+        | {"endpoint": LEARNING_RESOURCE},
+        timer=mocker.ANY,
     )
+    assert resp["Server-Timing"].startswith("validate;dur=")
     assert JSONRenderer().render(resp.json()) == JSONRenderer().render(
         SearchResponseSerializer(FAKE_SEARCH_RESPONSE).data
     )
@@ -177,6 +193,54 @@ def test_learn_resources_search_next_pagination_link_empty_on_last_page(
     assert response_next_url is None
 
 
+def test_learn_resources_search_no_pagination_for_facets(
+    mocker, client, learning_resources_search_view
+):
+    """Facet-only searches (limit=0) should not have next or previous urls"""
+    mock_response = dict(FAKE_SEARCH_RESPONSE)
+
+    mock_response["hits"]["total"]["value"] = 29
+
+    mocker.patch(
+        "learning_resources_search.views.execute_learn_search",
+        autospec=True,
+        return_value=mock_response,
+    )
+    params = {"offset": 10, "limit": 0}
+
+    resp = client.get(learning_resources_search_view.url, params)
+    assert resp.json()["next"] is None
+    assert resp.json()["previous"] is None
+
+
+@pytest.mark.parametrize(
+    ("view", "endpoint"),
+    [(None, "learning_resource"), ("card", "learning_resource_card")],
+)
+def test_learn_search_logs_response_size(
+    mocker, client, learning_resources_search_view, view, endpoint
+):
+    """The timings should be logged per view with the size of the rendered response"""
+    search_mock = mocker.patch(
+        "learning_resources_search.views.execute_learn_search",
+        autospec=True,
+        return_value=FAKE_SEARCH_RESPONSE,
+    )
+    log_mock = mocker.patch(
+        "learning_resources_search.views.log_search_timings", autospec=True
+    )
+    params = {"q": "math"}
+    if view:
+        params["view"] = view
+    resp = client.get(learning_resources_search_view.url, params)
+
+    assert search_mock.call_args.args[0].get("view") == view
+    log_mock.assert_called_once_with(
+        mocker.ANY, endpoint, response_bytes=len(resp.content)
+    )
+    assert "render;dur=" in resp["Server-Timing"]
+
+
 def test_learn_search_with_invalid_params(
     mocker, client, learning_resources_search_view
 ):
@@ -209,6 +273,115 @@ def test_learn_search_with_extra_params(mocker, client, learning_resources_searc
     )
 
 
+def test_learn_resources_batch_search(
+    mocker, client, learning_resources_batch_search_view
+):
+    """Each set of search params should be validated and run in one batch"""
+    search_mock = mocker.patch(
+        "learning_resources_search.views.execute_learn_searches",
+        autospec=True,
+        return_value=[FAKE_SEARCH_RESPONSE, FAKE_SEARCH_RESPONSE],
+    )
+    searches = [{"resource_type": ["course"], "limit": 6}, {"q": "math"}]
+    resp = client.post(
+        learning_resources_batch_search_view.url,
+        {"searches": searches},
+        content_type="application/json",
+    )
+    search_mock.assert_called_once_with(
+        [
+            LearningResourcesSearchRequestSerializer(params).data
+            | {"endpoint": LEARNING_RESOURCE}
+            for params in searches
+        ],
+        timer=mocker.ANY,
+    )
+    assert JSONRenderer().render(resp.json()) == JSONRenderer().render(
+        SearchResponseSerializer(
+            [FAKE_SEARCH_RESPONSE, FAKE_SEARCH_RESPONSE], many=True
+        ).data
+    )
+    assert resp["Server-Timing"].startswith("validate;dur=")
+
+
+def test_learn_resources_batch_search_error(
+    mocker, client, learning_resources_batch_search_view
+):
+    """A search that failed should have an error in place of its results"""
+    mocker.patch(
+        "learning_resources_search.views.execute_learn_searches",
+        autospec=True,
+        return_value=[{"error": "Unable to run search"}, FAKE_SEARCH_RESPONSE],
+    )
+    resp = client.post(
+        learning_resources_batch_search_view.url,
+        {"searches": [{"q": "math"}, {"q": "physics"}]},
+        content_type="application/json",
+    )
+    assert resp.status_code == 200
+    assert resp.json()[0] == {"error": "Unable to run search"}
+    assert JSONRenderer().render(resp.json()[1]) == JSONRenderer().render(
+        SearchResponseSerializer(FAKE_SEARCH_RESPONSE).data
+    )
+
+
+def test_learn_resources_batch_search_invalid_params(
+    mocker, client, learning_resources_batch_search_view
+):
+    """Return the errors for each search if any of them are invalid"""
+    search_mock = mocker.patch(
+        "learning_resources_search.views.execute_learn_searches", autospec=True
+    )
+    resp = client.post(
+        learning_resources_batch_search_view.url,
+        {"searches": [{"q": "math"}, {"resource_type": ["bogus"], "monkey": 22}]},
+        content_type="application/json",
+    )
+    search_mock.assert_not_called()
+    assert resp.status_code == 400
+    assert resp.json() == {
+        "searches": [{}, {"resource_type": ['"bogus" is not a valid choice.']}]
+    }
+
+
+def test_learn_resources_autocomplete(
+    mocker, client, learning_resources_autocomplete_view
+):
+    """The autocomplete view should return the suggestions for the text"""
+    autocomplete_mock = mocker.patch(
+        "learning_resources_search.views.execute_autocomplete",
+        autospec=True,
+        return_value=["Introduction to Algorithms", "6.006"],
+    )
+    resp = client.get(learning_resources_autocomplete_view.url, {"q": "intro"})
+    autocomplete_mock.assert_called_once_with("intro", 10, timer=mocker.ANY)
+    assert resp.json() == {"suggestions": ["Introduction to Algorithms", "6.006"]}
+    assert resp["Server-Timing"].startswith("validate;dur=")
+
+
+@pytest.mark.parametrize(
+    ("params", "errors"),
+    [
+        ({}, {"q": ["This field is required."]}),
+        (
+            {"q": "intro", "limit": 50},
+            {"limit": ["Ensure this value is less than or equal to 20."]},
+        ),
+    ],
+)
+def test_learn_resources_autocomplete_invalid_params(
+    mocker, client, learning_resources_autocomplete_view, params, errors
+):
+    """Return an error if there are invalid parameters"""
+    autocomplete_mock = mocker.patch(
+        "learning_resources_search.views.execute_autocomplete", autospec=True
+    )
+    resp = client.get(learning_resources_autocomplete_view.url, params)
+    autocomplete_mock.assert_not_called()
+    assert resp.status_code == 400
+    assert resp.json() == errors
+
+
 def test_content_file_search(mocker, client, content_file_search_view):
     """The query params should be passed from the front end to execute_learn_search to run the search"""
     request_factory = APIRequestFactory()
@@ -222,8 +395,10 @@ def test_content_file_search(mocker, client, content_file_search_view):
     resp = client.get(content_file_search_view.url, params)
     search_mock.assert_called_once_with(
         ContentFileSearchRequestSerializer(params).data
-        | {"endpoint": CONTENT_FILE_TYPE}
+        | {"endpoint": CONTENT_FILE_TYPE},
+        timer=mocker.ANY,
     )
+    assert resp["Server-Timing"].startswith("validate;dur=")
     assert JSONRenderer().render(resp.json()) == JSONRenderer().render(
         SearchResponseSerializer(
             FAKE_SEARCH_RESPONSE, context={"request": request}
@@ -231,6 +406,29 @@ def test_content_file_search(mocker, client, content_file_search_view):
     )
 
 
+def test_resource_content_file_search(mocker, client):
+    """The resource's id from the url should be added to the search params"""
+    search_mock = mocker.patch(
+        "learning_resources_search.views.execute_learn_search",
+        autospec=True,
+        return_value=FAKE_SEARCH_RESPONSE,
+    )
+    url = reverse("lr_search:v1:resource_content_file_search", args=[12])
+    params = {"q": "text", "run_id": [5]}
+    resp = client.get(url, params)
+    search_mock.assert_called_once_with(
+        ContentFileSearchRequestSerializer(params).data
+        | {"resource_id": [12], "endpoint": CONTENT_FILE_TYPE},
+        timer=mocker.ANY,
+    )
+    assert resp.status_code == 200
+
+    search_mock.reset_mock()
+    resp = client.get(url, {"q": "text", "resource_id": [5]})
+    search_mock.assert_not_called()
+    assert resp.json() == {"non_field_errors": ["Unknown field(s): resource_id"]}
+
+
 def test_content_file_search_with_invalid_params(
     mocker, client, content_file_search_view
 ):
@@ -344,7 +542,7 @@ def test_user_subscribed_to_search(client, user):
 @pytest.mark.django_db()
 @factory.django.mute_signals(signals.post_delete, signals.post_save)
 def test_user_sort_limit_ordering_params_generate_same_query(client, user):
-    """Test that the sortby, limit, and offset params lead to the same percolate query"""
+    """Test that the sortby, limit, offset and view params lead to the same percolate query"""
     client.force_login(user)
 
     url = reverse("lr_search:v1:learning_resources_user_subscription-subscribe")
@@ -358,6 +556,9 @@ def test_user_sort_limit_ordering_params_generate_same_query(client, user):
     params = {"q": "monkey", "offset": 0}
     client.post(url, json.dumps(params), content_type="application/json")
 
+    params = {"q": "monkey", "view": "card"}
+    client.post(url, json.dumps(params), content_type="application/json")
+
     assert user.percolate_queries.count() == 1
 
 
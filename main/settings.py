@@ -545,7 +545,40 @@ OPENSEARCH_MAX_SUGGEST_HITS = get_int("OPENSEARCH_MAX_SUGGEST_HITS", 1)
 OPENSEARCH_MAX_SUGGEST_RESULTS = get_int("OPENSEARCH_MAX_SUGGEST_RESULTS", 1)
 OPENSEARCH_SHARD_COUNT = get_int("OPENSEARCH_SHARD_COUNT", 2)
 OPENSEARCH_REPLICA_COUNT = get_int("OPENSEARCH_REPLICA_COUNT", 2)
+OPENSEARCH_BULK_LOAD_INDEXES = get_bool(
+    "OPENSEARCH_BULK_LOAD_INDEXES",
+    True,  # noqa: FBT003
+)
+OPENSEARCH_BULK_LOAD_ASYNC_TRANSLOG = get_bool(
+    "OPENSEARCH_BULK_LOAD_ASYNC_TRANSLOG",
+    False,  # noqa: FBT003
+)
+OPENSEARCH_BULK_LOAD_FINISH_TIMEOUT = get_int(
+    "OPENSEARCH_BULK_LOAD_FINISH_TIMEOUT", 1800
+)
 OPENSEARCH_MAX_REQUEST_SIZE = get_int("OPENSEARCH_MAX_REQUEST_SIZE", 10485760)
+OPENSEARCH_DELETE_BY_QUERY_POLL_INTERVAL = get_int(
+    "OPENSEARCH_DELETE_BY_QUERY_POLL_INTERVAL", 10
+)
+OPENSEARCH_INDEXING_WORKERS = get_int("OPENSEARCH_INDEXING_WORKERS", 1)
+OPENSEARCH_ALIAS_CACHE_TTL = get_int("OPENSEARCH_ALIAS_CACHE_TTL", 10)
+OPENSEARCH_SEARCH_CACHE_TTL = get_int("OPENSEARCH_SEARCH_CACHE_TTL", 0)
+OPENSEARCH_FACET_CACHE_TTL = get_int("OPENSEARCH_FACET_CACHE_TTL", 0)
+OPENSEARCH_FACET_BUCKET_SIZE = get_int("OPENSEARCH_FACET_BUCKET_SIZE", 1000)
+OPENSEARCH_SIMILAR_TOPICS_CACHE_TTL = get_int(
+    "OPENSEARCH_SIMILAR_TOPICS_CACHE_TTL", 60 * 60 * 24
+)
+OPENSEARCH_SLOW_QUERY_THRESHOLD_MS = get_int("OPENSEARCH_SLOW_QUERY_THRESHOLD_MS", 1000)
+OPENSEARCH_SLOW_QUERY_SAMPLE_PERCENT = get_int(
+    "OPENSEARCH_SLOW_QUERY_SAMPLE_PERCENT", 10
+)
+OPENSEARCH_COALESCE_UPSERTS = get_bool(
+    "OPENSEARCH_COALESCE_UPSERTS",
+    False,  # noqa: FBT003
+)
+OPENSEARCH_UPSERT_FLUSH_LOCK_TIMEOUT = get_int(
+    "OPENSEARCH_UPSERT_FLUSH_LOCK_TIMEOUT", 60 * 10
+)
 INDEXING_API_USERNAME = get_string("INDEXING_API_USERNAME", None)
 if not INDEXING_API_USERNAME:
     msg = "Missing setting INDEXING_API_USERNAME"
@@ -21,6 +21,12 @@ CELERY_WORKER_MAX_MEMORY_PER_CHILD = get_int(
 )
 
 CELERY_BEAT_SCHEDULE = {
+    "flush-learning-resource-upserts": {
+        "task": "learning_resources_search.tasks.flush_learning_resource_upserts",
+        "schedule": get_int(
+            "OPENSEARCH_UPSERT_FLUSH_SECONDS", 15
+        ),  # default is every 15 seconds
+    },
     "update_next-start-date-every-1-days": {
         "task": "learning_resources.tasks.update_next_start_date",
         "schedule": crontab(minute=0, hour=4),  # midnight EST
@@ -35,6 +41,10 @@ CELERY_BEAT_SCHEDULE = {
             minute=0, hour=16, day_of_week=1
         ),  # 12:00 PM EST on Mondays
     },
+    "evict-tika-extraction-cache-every-1-days": {
+        "task": "learning_resources.tasks.evict_tika_extraction_cache",
+        "schedule": crontab(minute=0, hour=9),  # 5:00am EST
+    },
     "update-micromasters-programs-every-1-days": {
         "task": "learning_resources.tasks.get_micromasters_data",
         "schedule": crontab(minute=30, hour=16),
@@ -43,6 +43,14 @@ PROLEARN_CATALOG_API_URL = get_string("PROLEARN_CATALOG_API_URL", None)
 # Iterator chunk size for MITx and xPRO courses
 LEARNING_COURSE_ITERATOR_CHUNK_SIZE = get_int("LEARNING_COURSE_ITERATOR_CHUNK_SIZE", 20)
 
+# Number of courses or programs loaded into the database per transaction
+ETL_LOADER_BATCH_SIZE = get_int("ETL_LOADER_BATCH_SIZE", 100)
+
+# Threads per stage of the edx_content queue's course archive pipeline
+EDX_CONTENT_DOWNLOAD_WORKERS = get_int("EDX_CONTENT_DOWNLOAD_WORKERS", 4)
+EDX_CONTENT_EXTRACT_WORKERS = get_int("EDX_CONTENT_EXTRACT_WORKERS", 2)
+EDX_CONTENT_TIKA_WORKERS = get_int("EDX_CONTENT_TIKA_WORKERS", 4)
+
 # xPRO settings for course/resource ingestion
 XPRO_LEARNING_COURSE_BUCKET_NAME = get_string("XPRO_LEARNING_COURSE_BUCKET_NAME", None)
 XPRO_CATALOG_API_URL = get_string("XPRO_CATALOG_API_URL", None)
@@ -86,3 +94,6 @@ OPEN_PODCAST_DATA_BRANCH = get_string("OPEN_PODCAST_DATA_BRANCH", "master")
 TIKA_ACCESS_TOKEN = get_string("TIKA_ACCESS_TOKEN", None)
 TIKA_TIMEOUT = get_int("TIKA_TIMEOUT", 60)
 TIKA_OCR_STRATEGY = get_string("TIKA_OCR_STRATEGY", "no_ocr")
+TIKA_EXTRACTION_CACHE_ENABLED = get_bool("TIKA_EXTRACTION_CACHE_ENABLED", True)  # noqa: FBT003
+TIKA_EXTRACTION_CACHE_MAX_AGE_DAYS = get_int("TIKA_EXTRACTION_CACHE_MAX_AGE_DAYS", 180)
+TIKA_EXTRACTION_CACHE_MAX_SIZE_MB = get_int("TIKA_EXTRACTION_CACHE_MAX_SIZE_MB", 2048)
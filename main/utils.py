@@ -3,6 +3,7 @@
 import datetime
 import logging
 import os
+from collections import deque
 from enum import Flag, auto
 from itertools import islice
 
@@ -84,6 +85,27 @@ def chunks(iterable, *, chunk_size=20):
         chunk = list(islice(iterable, chunk_size))
 
 
+def prefetch(iterable, *, size):
+    """
+    Yield the elements of an iterable, pulling up to size elements ahead of
+    the consumer. Pulling an element ahead starts whatever work producing it
+    does, like submitting a future, so this bounds how much work is in flight.
+
+    Args:
+        iterable (iterable): iterable of elements to prefetch
+        size (int): Max number of elements to pull ahead
+
+    Yields:
+        any: The elements of the iterable, in order
+    """
+    pending = deque()
+    for item in iterable:
+        pending.append(item)
+        if len(pending) > size:
+            yield pending.popleft()
+    yield from pending
+
+
 def merge_strings(list_or_str):
     """
     Recursively go through through nested lists of strings and merge into a flattened list.
@@ -19,6 +19,7 @@ from main.utils import (
     merge_strings,
     normalize_to_start_of_day,
     now_in_utc,
+    prefetch,
     prefetched_iterator,
     write_to_file,
 )
@@ -56,6 +57,22 @@ def test_normalize_to_start_of_day():
     )
 
 
+@pytest.mark.parametrize("size", [0, 2, 10])
+def test_prefetch(size):
+    """Prefetch should yield every element in order, pulling at most size ahead"""
+    pulled = []
+
+    def _elements():
+        for element in range(5):
+            pulled.append(element)
+            yield element
+
+    for element in prefetch(_elements(), size=size):
+        assert len(pulled) <= min(element + size + 1, 5)
+        assert element == pulled[element]
+    assert pulled == list(range(5))
+
+
 def test_chunks():
     """
     test for chunks